@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Evaluation script: hybrid vs vector-only research search.
+
+Runs a fixed query set through UnifiedSearchService.search() in both modes
+against the live research_embeddings table and reports recall@k and latency.
+
+Relevance is exact-term: a row is relevant to a query when its title or
+content contains the query string (case-insensitive). That is the case hybrid
+retrieval targets (feature names, error strings). Queries with no literal
+match anywhere are listed but excluded from recall.
+
+Query embeddings are computed once up front (and then served from the
+service's query cache), so latency compares the database side of each mode.
+
+Requires migration 030 (content_tsv) for the hybrid mode.
+
+Usage:
+    python scripts/evaluate_research_search.py
+    python scripts/evaluate_research_search.py --k 10 --repeats 5 --source-types coda_page,coda_theme
+    python scripts/evaluate_research_search.py --queries my_queries.txt
+"""
+
+import argparse
+import logging
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.db.connection import get_connection
+from src.research.unified_search import SEARCH_MODES, UnifiedSearchService
+
+logging.basicConfig(level=logging.WARNING, format="%(asctime)s %(levelname)s: %(message)s")
+logger = logging.getLogger(__name__)
+
+DEFAULT_QUERIES_PATH = Path(__file__).parent / "research_search_eval_queries.txt"
+
+
+def load_queries(path: Path) -> list:
+    lines = (line.strip() for line in path.read_text().splitlines())
+    return [line for line in lines if line and not line.startswith("#")]
+
+
+def relevant_ids(query: str, source_types) -> set:
+    """Rows whose title or content contains the query verbatim."""
+    pattern = "%" + query.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+    sql = """
+        SELECT id FROM research_embeddings
+        WHERE (title ILIKE %s OR content ILIKE %s)
+    """
+    params = [pattern, pattern]
+    if source_types:
+        sql += " AND source_type = ANY(%s)"
+        params.append(source_types)
+    with get_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(sql, params)
+            return {row[0] for row in cur.fetchall()}
+
+
+def evaluate_mode(service, mode, queries, relevant, k, repeats, min_similarity, source_types) -> dict:
+    recalls = []
+    latencies_ms = []
+    for query in queries:
+        for _ in range(repeats):
+            start = time.perf_counter()
+            results = service.search(
+                query=query,
+                limit=k,
+                source_types=source_types,
+                min_similarity=min_similarity,
+                mode=mode,
+            )
+            latencies_ms.append((time.perf_counter() - start) * 1000)
+
+        expected = relevant[query]
+        if expected:
+            found = len({r.id for r in results} & expected)
+            recalls.append(found / min(k, len(expected)))
+
+    latencies_ms.sort()
+    return {
+        "mode": mode,
+        "recall": statistics.mean(recalls) if recalls else 0.0,
+        "p50_ms": statistics.median(latencies_ms),
+        "p95_ms": latencies_ms[int(0.95 * (len(latencies_ms) - 1))],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare hybrid and vector-only research search")
+    parser.add_argument("--queries", type=Path, default=DEFAULT_QUERIES_PATH, help="Query file (one per line)")
+    parser.add_argument("--k", type=int, default=10, help="Results per query (default: 10)")
+    parser.add_argument("--repeats", type=int, default=3, help="Timed runs per query and mode (default: 3)")
+    parser.add_argument("--min-similarity", type=float, default=0.2, help="API default: 0.2")
+    parser.add_argument("--source-types", help="Comma-separated source types (default: all)")
+    args = parser.parse_args()
+
+    queries = load_queries(args.queries)
+    source_types = args.source_types.split(",") if args.source_types else None
+
+    service = UnifiedSearchService()
+    service.get_embeddings(queries)  # Warm the query cache so both modes time the DB only
+
+    relevant = {query: relevant_ids(query, source_types) for query in queries}
+    no_match = [query for query in queries if not relevant[query]]
+
+    print(f"{len(queries)} queries, recall@{args.k} over {len(queries) - len(no_match)} with exact matches")
+    if no_match:
+        print(f"No literal matches (excluded from recall): {', '.join(no_match)}")
+    print(f"{'mode':<8} {'recall':>7} {'p50 ms':>8} {'p95 ms':>8}")
+    for mode in SEARCH_MODES:
+        result = evaluate_mode(
+            service, mode, queries, relevant, args.k, args.repeats, args.min_similarity, source_types
+        )
+        print(f"{result['mode']:<8} {result['recall']:>7.2f} {result['p50_ms']:>8.1f} {result['p95_ms']:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
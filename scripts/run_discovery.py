@@ -102,6 +102,10 @@ def main():
         "--no-auto-pull", action="store_true",
         help="Skip auto-pull of target repo before exploration",
     )
+    parser.add_argument(
+        "--explorer-timeout", type=float, default=900.0,
+        help="Per-explorer time limit in seconds for Stage 0 (default: 900)",
+    )
     parser.add_argument(
         "--verbose", "-v", action="store_true",
         help="Enable debug logging",
@@ -210,6 +214,7 @@ def main():
         scope_dirs=args.scope_dirs,
         doc_paths=args.doc_paths,
         auto_pull=not args.no_auto_pull,
+        explorer_timeout_seconds=args.explorer_timeout,
     )
 
     start_time = time.time()
@@ -4,6 +4,7 @@ Run PM/Tech Lead review on all valid groups from theme extraction.
 
 Outputs decisions for each group to help calibrate confidence thresholds.
 """
+import asyncio
 import json
 import os
 import sys
@@ -14,12 +15,13 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 from dotenv import load_dotenv
 load_dotenv(Path(__file__).parent.parent / ".env")
 
-from openai import OpenAI
+from openai import AsyncOpenAI
 
 INPUT_FILE = Path(__file__).parent.parent / "data" / "theme_extraction_results.jsonl"
 OUTPUT_FILE = Path(__file__).parent.parent / "data" / "pm_review_results.json"
 MIN_GROUP_SIZE = 3
 SKIP_SIGNATURES = {"unclassified_needs_review"}  # Known catch-all, skip
+CONCURRENCY = int(os.getenv("PM_REVIEW_CONCURRENCY", "8"))  # Concurrent LLM requests
 
 # Product context for PM
 PRODUCT_CONTEXT = """
@@ -109,7 +111,7 @@ def format_conversations(conversations: list[dict], max_convos: int = 60) -> str
     return "\n".join(lines)
 
 
-def run_pm_review(client: OpenAI, signature: str, conversations: list[dict]) -> dict:
+async def run_pm_review(client: AsyncOpenAI, signature: str, conversations: list[dict]) -> dict:
     """Run PM review for a single group."""
     prompt = PM_REVIEW_PROMPT.format(
         product_context=PRODUCT_CONTEXT,
@@ -118,7 +120,7 @@ def run_pm_review(client: OpenAI, signature: str, conversations: list[dict]) ->
         conversations=format_conversations(conversations)
     )
 
-    response = client.chat.completions.create(
+    response = await client.chat.completions.create(
         model="gpt-4o",
         messages=[{"role": "user", "content": prompt}],
         temperature=0.2,
@@ -129,58 +131,74 @@ def run_pm_review(client: OpenAI, signature: str, conversations: list[dict]) ->
     return result
 
 
-def main():
-    print(f"Loading groups from: {INPUT_FILE}")
-    groups = load_groups()
+async def review_all(valid_groups: dict[str, list[dict]]) -> list[dict]:
+    """Review groups concurrently; results keep largest-group-first order."""
+    client = AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+    semaphore = asyncio.Semaphore(CONCURRENCY)
 
-    # Filter to valid groups only
-    valid_groups = {
-        sig: convs for sig, convs in groups.items()
-        if len(convs) >= MIN_GROUP_SIZE and sig not in SKIP_SIGNATURES
-    }
+    async def review(sig: str, convs: list[dict]) -> tuple[dict, Exception | None]:
+        async with semaphore:
+            try:
+                return await run_pm_review(client, sig, convs), None
+            except Exception as e:
+                return {}, e
 
-    print(f"Found {len(valid_groups)} valid groups to review")
-    print("-" * 60)
+    ordered = sorted(valid_groups.items(), key=lambda x: -len(x[1]))
+    reviews = await asyncio.gather(*(review(sig, convs) for sig, convs in ordered))
 
-    client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
     results = []
-
-    for sig, convs in sorted(valid_groups.items(), key=lambda x: -len(x[1])):
+    for (sig, convs), (review, error) in zip(ordered, reviews):
         print(f"\nReviewing: {sig} ({len(convs)} conversations)...")
 
-        try:
-            review = run_pm_review(client, sig, convs)
-
-            result = {
-                "signature": sig,
-                "conversation_count": len(convs),
-                "decision": review.get("decision"),
-                "reasoning": review.get("reasoning"),
-                "sub_groups": review.get("sub_groups", []),
-                "sub_group_count": len(review.get("sub_groups", []))
-            }
-            results.append(result)
-
-            # Print summary
-            decision_icon = "KEEP" if review.get("decision") == "keep_together" else "SPLIT"
-            print(f"  Decision: {decision_icon}")
-            print(f"  Reasoning: {review.get('reasoning', 'N/A')[:100]}...")
-
-            if review.get("sub_groups"):
-                print(f"  Sub-groups: {len(review['sub_groups'])}")
-                for sg in review["sub_groups"]:
-                    print(f"    - {sg.get('suggested_signature')}: {len(sg.get('conversation_ids', []))} convos")
-
-        except Exception as e:
-            print(f"  ERROR: {e}")
+        if error is not None:
+            print(f"  ERROR: {error}")
             results.append({
                 "signature": sig,
                 "conversation_count": len(convs),
                 "decision": "error",
-                "reasoning": str(e),
+                "reasoning": str(error),
                 "sub_groups": [],
                 "sub_group_count": 0
             })
+            continue
+
+        result = {
+            "signature": sig,
+            "conversation_count": len(convs),
+            "decision": review.get("decision"),
+            "reasoning": review.get("reasoning"),
+            "sub_groups": review.get("sub_groups", []),
+            "sub_group_count": len(review.get("sub_groups", []))
+        }
+        results.append(result)
+
+        # Print summary
+        decision_icon = "KEEP" if review.get("decision") == "keep_together" else "SPLIT"
+        print(f"  Decision: {decision_icon}")
+        print(f"  Reasoning: {review.get('reasoning', 'N/A')[:100]}...")
+
+        if review.get("sub_groups"):
+            print(f"  Sub-groups: {len(review['sub_groups'])}")
+            for sg in review["sub_groups"]:
+                print(f"    - {sg.get('suggested_signature')}: {len(sg.get('conversation_ids', []))} convos")
+
+    return results
+
+
+def main():
+    print(f"Loading groups from: {INPUT_FILE}")
+    groups = load_groups()
+
+    # Filter to valid groups only
+    valid_groups = {
+        sig: convs for sig, convs in groups.items()
+        if len(convs) >= MIN_GROUP_SIZE and sig not in SKIP_SIGNATURES
+    }
+
+    print(f"Found {len(valid_groups)} valid groups to review ({CONCURRENCY} concurrent)")
+    print("-" * 60)
+
+    results = asyncio.run(review_all(valid_groups))
 
     # Save results
     with open(OUTPUT_FILE, "w") as f:
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Timing script: native async vs thread-wrapped theme extraction.
+
+Compares ThemeExtractor.extract_async (AsyncOpenAI) against the previous
+approach of running the sync extract() through asyncio.to_thread, at several
+concurrency levels. OpenAI calls are simulated with a fixed latency so the
+numbers measure scheduling overhead rather than API variance; no DB or API
+key is needed.
+
+Canonicalization is serialized (Issue #152) in both paths, so with
+--canonicalize the second LLM call bounds throughput at 1/latency themes/s
+regardless of mode. The default measures the theme extraction call alone.
+
+Usage:
+    python scripts/timing_theme_extraction_async.py
+    python scripts/timing_theme_extraction_async.py --count 200 --latency 0.5 --concurrency 10 20 50
+    python scripts/timing_theme_extraction_async.py --canonicalize
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+os.environ.setdefault("OPENAI_API_KEY", "timing-script")
+
+from src.db.models import Conversation
+from src.theme_extractor import ThemeExtractor
+
+logging.basicConfig(level=logging.WARNING, format="%(asctime)s %(levelname)s: %(message)s")
+logger = logging.getLogger(__name__)
+
+EXTRACTION_PAYLOAD = {
+    "issue_signature": "scheduler_posts_not_publishing",
+    "product_area": "scheduling",
+    "component": "publisher",
+    "user_intent": "Publish scheduled posts",
+    "symptoms": ["posts stuck in queue"],
+    "matched_existing": False,
+    "match_confidence": "high",
+}
+CANONICALIZATION_PAYLOAD = {"signature": "scheduler_posts_not_publishing", "matched_existing": True}
+
+
+def _response(payload: dict) -> MagicMock:
+    response = MagicMock()
+    response.choices = [MagicMock()]
+    response.choices[0].message.content = json.dumps(payload)
+    return response
+
+
+def _payload_for(kwargs: dict) -> dict:
+    if "normalize issue signatures" in kwargs["messages"][0]["content"]:
+        return CANONICALIZATION_PAYLOAD
+    return EXTRACTION_PAYLOAD
+
+
+def build_extractor(latency: float) -> ThemeExtractor:
+    """Extractor whose sync and async clients sleep for `latency` per call."""
+    with patch("src.theme_extractor.OpenAI"):
+        extractor = ThemeExtractor(use_vocabulary=False)
+    extractor._product_context = "Product context"
+    extractor._signature_catalog = MagicMock()
+    extractor._signature_catalog.signatures.return_value = [{
+        "signature": "scheduler_posts_not_publishing",
+        "product_area": "scheduling",
+        "component": "publisher",
+        "count": 10,
+    }]
+
+    def create(**kwargs):
+        time.sleep(latency)
+        return _response(_payload_for(kwargs))
+
+    async def create_async(**kwargs):
+        await asyncio.sleep(latency)
+        return _response(_payload_for(kwargs))
+
+    extractor.client.chat.completions.create.side_effect = create
+    extractor._async_client = MagicMock()
+    extractor._async_client.chat.completions.create.side_effect = create_async
+    return extractor
+
+
+async def run_mode(
+    mode: str, count: int, concurrency: int, latency: float, canonicalize: bool
+) -> dict:
+    """Extract `count` conversations with `concurrency` in flight; return metrics."""
+    extractor = build_extractor(latency)
+    semaphore = asyncio.Semaphore(concurrency)
+    conversations = [
+        Conversation(
+            id=f"conv_{i:05d}",
+            created_at=datetime.now(timezone.utc),
+            source_body="My scheduled posts are not publishing",
+            issue_type="bug_report",
+            sentiment="frustrated",
+            priority="normal",
+            churn_risk=False,
+        )
+        for i in range(count)
+    ]
+    peak_threads = threading.active_count()
+
+    async def extract_one(conv):
+        nonlocal peak_threads
+        async with semaphore:
+            if mode == "to_thread":
+                theme = await asyncio.to_thread(
+                    extractor.extract, conv, canonicalize=canonicalize
+                )
+            else:
+                theme = await extractor.extract_async(conv, canonicalize=canonicalize)
+            peak_threads = max(peak_threads, threading.active_count())
+            return theme
+
+    start = time.perf_counter()
+    themes = await asyncio.gather(*(extract_one(conv) for conv in conversations))
+    elapsed = time.perf_counter() - start
+
+    return {
+        "mode": mode,
+        "concurrency": concurrency,
+        "themes": len(themes),
+        "seconds": elapsed,
+        "per_second": len(themes) / elapsed,
+        "peak_threads": peak_threads,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time native async vs to_thread theme extraction")
+    parser.add_argument("--count", type=int, default=200, help="Conversations per run (default: 200)")
+    parser.add_argument("--latency", type=float, default=0.5, help="Simulated seconds per LLM call (default: 0.5)")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[10, 20, 50])
+    parser.add_argument("--canonicalize", action="store_true", help="Include the (serialized) canonicalization call")
+    args = parser.parse_args()
+
+    calls = 2 if args.canonicalize else 1
+    print(f"{args.count} conversations, {args.latency}s per LLM call ({calls} per theme)")
+    print(f"{'mode':<10} {'conc':>5} {'seconds':>9} {'themes/s':>9} {'threads':>8}")
+    for concurrency in args.concurrency:
+        for mode in ("to_thread", "native"):
+            result = asyncio.run(
+                run_mode(mode, args.count, concurrency, args.latency, args.canonicalize)
+            )
+            print(
+                f"{result['mode']:<10} {result['concurrency']:>5} {result['seconds']:>9.2f} "
+                f"{result['per_second']:>9.1f} {result['peak_threads']:>8}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -5,21 +5,20 @@ Provides database connections and other shared dependencies
 for API endpoints using FastAPI's dependency injection system.
 """
 
-from contextlib import contextmanager
 from typing import Generator
 
-import psycopg2
 from psycopg2.extras import RealDictCursor
 
-from src.db.connection import get_connection_string
+from src.db.connection import get_connection
 
 
 def get_db() -> Generator:
     """
     FastAPI dependency for database connections.
 
-    Yields a database connection with RealDictCursor for dict-style row access.
-    Automatically commits on success, rolls back on error, and closes connection.
+    Yields a pooled database connection with RealDictCursor for dict-style
+    row access. Automatically commits on success, rolls back on error, and
+    returns the connection to the pool.
 
     Usage in endpoints:
         @router.get("/items")
@@ -28,18 +27,8 @@ def get_db() -> Generator:
                 cur.execute("SELECT * FROM items")
                 return cur.fetchall()
     """
-    conn = psycopg2.connect(
-        get_connection_string(),
-        cursor_factory=RealDictCursor
-    )
-    try:
+    with get_connection(cursor_factory=RealDictCursor) as conn:
         yield conn
-        conn.commit()
-    except Exception:
-        conn.rollback()
-        raise
-    finally:
-        conn.close()
 
 
 def get_db_cursor() -> Generator:
@@ -54,16 +43,6 @@ def get_db_cursor() -> Generator:
             cursor.execute("SELECT COUNT(*) FROM items")
             return cursor.fetchone()
     """
-    conn = psycopg2.connect(
-        get_connection_string(),
-        cursor_factory=RealDictCursor
-    )
-    try:
+    with get_connection(cursor_factory=RealDictCursor) as conn:
         with conn.cursor() as cur:
             yield cur
-            conn.commit()
-    except Exception:
-        conn.rollback()
-        raise
-    finally:
-        conn.close()
@@ -63,6 +63,7 @@ from fastapi.middleware.cors import CORSMiddleware
 
 from src.api.routers import analytics, discovery, health, labels, pipeline, research, stories, sync, themes
 from src.db.connection import get_connection
+from src.db.pool import close_pool, get_pool, is_pool_enabled
 
 logger = logging.getLogger(__name__)
 
@@ -111,8 +112,15 @@ def cleanup_stale_pipeline_runs() -> int:
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan manager for startup/shutdown tasks."""
+    if is_pool_enabled():
+        try:
+            get_pool().warm()
+        except Exception as e:
+            # Not fatal: the pool opens connections lazily on first checkout
+            logger.warning(f"Could not pre-warm database connection pool: {e}")
     cleanup_stale_pipeline_runs()
     yield
+    close_pool()
 
 
 # Create FastAPI application
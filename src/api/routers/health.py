@@ -12,6 +12,7 @@ from fastapi import APIRouter, Depends
 from pydantic import BaseModel
 
 from src.api.deps import get_db
+from src.db.pool import get_pool_stats
 
 
 router = APIRouter(tags=["health"])
@@ -28,6 +29,7 @@ class DatabaseHealthResponse(BaseModel):
     connected: bool
     latency_ms: Optional[float] = None
     error: Optional[str] = None
+    pool: Optional[dict] = None
 
 
 class FullHealthResponse(BaseModel):
@@ -57,7 +59,7 @@ def database_health_check(db=Depends(get_db)):
     Database connectivity check.
 
     Executes a simple query to verify database is reachable.
-    Returns connection status and latency.
+    Returns connection status, latency, and connection pool metrics.
     """
     import time
 
@@ -70,12 +72,14 @@ def database_health_check(db=Depends(get_db)):
 
         return DatabaseHealthResponse(
             connected=True,
-            latency_ms=round(latency, 2)
+            latency_ms=round(latency, 2),
+            pool=get_pool_stats(),
         )
     except Exception as e:
         return DatabaseHealthResponse(
             connected=False,
-            error=str(e)
+            error=str(e),
+            pool=get_pool_stats(),
         )
 
 
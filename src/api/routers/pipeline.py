@@ -74,6 +74,15 @@ THEME_EXTRACTION_ALWAYS_ALLOWED = {'product_issue', 'feature_request', 'how_to_q
 # Types that require actionable keywords to pass filter
 THEME_EXTRACTION_CONDITIONAL = {'account_issue', 'configuration_help'}
 
+# Themes per DB write from the theme extraction writer task
+THEME_STORE_BATCH_SIZE = 25
+
+# Overlapped stage DAG (PIPELINE_OVERLAP_STAGES=true): stored conversations per
+# downstream micro-batch, and micro-batches buffered per stage before the
+# dispatcher waits (backpressure on a slow stage)
+OVERLAP_STAGE_BATCH_SIZE = 25
+OVERLAP_STAGE_QUEUE_SIZE = 4
+
 # Keywords indicating actionable technical issues (not general account support)
 # Organized by category for maintainability
 # PR review fix: Include common variants with digits/underscores (oauth2, api_key, etc.)
@@ -376,6 +385,7 @@ _ALLOWED_PHASE_FIELDS = frozenset({
     "conversations_classified", "conversations_stored", "conversations_filtered",
     "embeddings_generated", "embeddings_failed",  # #106: Embedding generation phase
     "facets_extracted", "facets_failed",  # #107: Facet extraction phase
+    "embedding_cache_hits", "embedding_cache_misses",
     "warnings", "errors",  # #104: Structured error tracking
 })
 
@@ -478,7 +488,8 @@ async def _run_embedding_generation_async(
     """
     Generate embeddings for classified conversations from this pipeline run.
 
-    Returns dict with embeddings_generated and embeddings_failed counts.
+    Returns dict with embeddings_generated and embeddings_failed counts, plus
+    embedding_cache_hits/embedding_cache_misses from the content-hash cache.
 
     Issue #106: Pipeline step for embedding generation.
     Embeddings are generated for actionable conversation types:
@@ -486,7 +497,6 @@ async def _run_embedding_generation_async(
     """
     from src.db.connection import get_connection
     from src.services.embedding_service import EmbeddingService
-    from src.db.embedding_storage import store_embeddings_batch
     from psycopg2.extras import RealDictCursor
 
     logger.info(f"Run {run_id}: Starting embedding generation")
@@ -513,7 +523,12 @@ async def _run_embedding_generation_async(
 
     if not rows:
         logger.info(f"Run {run_id}: No actionable conversations for embedding generation")
-        return {"embeddings_generated": 0, "embeddings_failed": 0}
+        return {
+            "embeddings_generated": 0,
+            "embeddings_failed": 0,
+            "embedding_cache_hits": 0,
+            "embedding_cache_misses": 0,
+        }
 
     # Prepare conversations for embedding service (Issue #139: include digest)
     conversations = [
@@ -527,8 +542,28 @@ async def _run_embedding_generation_async(
 
     logger.info(f"Run {run_id}: Generating embeddings for {len(conversations)} conversations")
 
-    # Generate embeddings
-    service = EmbeddingService()
+    # Text embedded in an earlier run is served from cache
+    return await _generate_and_store_embeddings(
+        EmbeddingService(use_cache=True), conversations, run_id, stop_checker
+    )
+
+
+async def _generate_and_store_embeddings(
+    service,
+    conversations: list[dict],
+    run_id: int,
+    stop_checker: Callable[[], bool],
+) -> dict:
+    """
+    Embed a set of conversations and store the successful embeddings.
+
+    Shared by the sequential embedding phase and the overlapped stage DAG,
+    which calls it once per micro-batch.
+
+    Returns dict with embeddings_generated, embeddings_failed and cache counts.
+    """
+    from src.db.embedding_storage import store_embeddings_batch
+
     result = await service.generate_conversation_embeddings_async(
         conversations=conversations,
         stop_checker=stop_checker,
@@ -536,13 +571,12 @@ async def _run_embedding_generation_async(
 
     # Store successful embeddings
     if result.successful:
-        stored_count = store_embeddings_batch(
+        stored_count = await asyncio.to_thread(
+            store_embeddings_batch,
             results=result.successful,
             pipeline_run_id=run_id,
         )
         logger.info(f"Run {run_id}: Stored {stored_count} embeddings")
-    else:
-        stored_count = 0
 
     # Log failures for observability
     if result.failed:
@@ -554,12 +588,15 @@ async def _run_embedding_generation_async(
 
     logger.info(
         f"Run {run_id}: Embedding generation complete. "
-        f"Generated: {result.total_success}, Failed: {result.total_failed}"
+        f"Generated: {result.total_success}, Failed: {result.total_failed}, "
+        f"Cache hits: {result.cache_hits}, Cache misses: {result.cache_misses}"
     )
 
     return {
         "embeddings_generated": result.total_success,
         "embeddings_failed": result.total_failed,
+        "embedding_cache_hits": result.cache_hits,
+        "embedding_cache_misses": result.cache_misses,
     }
 
 
@@ -598,7 +635,6 @@ async def _run_facet_extraction_async(
     """
     from src.db.connection import get_connection
     from src.services.facet_service import FacetExtractionService
-    from src.db.facet_storage import store_facets_batch
     from psycopg2.extras import RealDictCursor
 
     logger.info(f"Run {run_id}: Starting facet extraction")
@@ -639,8 +675,27 @@ async def _run_facet_extraction_async(
 
     logger.info(f"Run {run_id}: Extracting facets for {len(conversations)} conversations")
 
-    # Extract facets
-    service = FacetExtractionService()
+    return await _extract_and_store_facets(
+        FacetExtractionService(), conversations, run_id, stop_checker
+    )
+
+
+async def _extract_and_store_facets(
+    service,
+    conversations: list[dict],
+    run_id: int,
+    stop_checker: Callable[[], bool],
+) -> dict:
+    """
+    Extract facets for a set of conversations and store the successful ones.
+
+    Shared by the sequential facet phase and the overlapped stage DAG,
+    which calls it once per micro-batch.
+
+    Returns dict with facets_extracted and facets_failed counts.
+    """
+    from src.db.facet_storage import store_facets_batch
+
     result = await service.extract_facets_batch_async(
         conversations=conversations,
         stop_checker=stop_checker,
@@ -648,13 +703,12 @@ async def _run_facet_extraction_async(
 
     # Store successful facets
     if result.successful:
-        stored_count = store_facets_batch(
+        stored_count = await asyncio.to_thread(
+            store_facets_batch,
             results=result.successful,
             pipeline_run_id=run_id,
         )
         logger.info(f"Run {run_id}: Stored {stored_count} facets")
-    else:
-        stored_count = 0
 
     # Log failures for observability
     if result.failed:
@@ -690,39 +744,158 @@ def _run_facet_extraction(run_id: int, stop_checker: Callable[[], bool]) -> dict
     return asyncio.run(_run_facet_extraction_async(run_id, stop_checker))
 
 
-async def _run_theme_extraction_async(
-    run_id: int,
-    stop_checker: Callable[[], bool],
-    concurrency: int = 20,
-) -> dict:
+def _store_theme_batch(themes: list, run_id: int) -> tuple[int, int, List[str]]:
     """
-    Run theme extraction with semaphore-controlled concurrency (Issue #148).
-
-    Parallelizes theme extraction to reduce processing time from ~60 min
-    (sequential) to ~5-10 min (parallel) for 500 conversations.
+    Quality-gate and upsert one batch of extracted themes.
 
-    Args:
-        run_id: Pipeline run ID
-        stop_checker: Callback to check for stop signal
-        concurrency: Max parallel extractions (default 20, matches OpenAI rate limits)
+    Runs on a worker thread from the theme extraction writer task. Themes are
+    upserted with a single execute_values ... RETURNING statement, followed by
+    their context usage logs, and committed per batch.
 
     Returns:
-        dict with themes_extracted, themes_new, themes_filtered counts and warnings
+        (themes stored, themes filtered by quality gates, quality gate warnings)
     """
+    from psycopg2.extras import Json, execute_values
     from src.db.connection import get_connection
-    from src.theme_extractor import ThemeExtractor
-    from src.theme_quality import filter_themes_by_quality
-    from src.db.models import Conversation
-    from psycopg2.extras import RealDictCursor
+    from src.theme_quality import check_theme_quality, filter_themes_by_quality
+    from src.utils.normalize import normalize_product_area, canonicalize_component
 
-    logger.info(f"Run {run_id}: Starting async theme extraction (concurrency={concurrency})")
+    high_quality_themes, low_quality_themes, warnings = filter_themes_by_quality(themes)
+    if not high_quality_themes:
+        return 0, len(low_quality_themes), warnings
+
+    # One upsert can't touch a row twice: keep the last theme per conversation
+    themes_by_conversation = {theme.conversation_id: theme for theme in high_quality_themes}
+
+    rows = []
+    for theme in themes_by_conversation.values():
+        quality_result = check_theme_quality(
+            issue_signature=theme.issue_signature,
+            matched_existing=theme.matched_existing,
+            match_confidence=theme.match_confidence or "low",
+        )
+
+        product_area_raw = theme.product_area
+        component_raw = theme.component
+        product_area_normalized = normalize_product_area(product_area_raw)
+        component_canonical = canonicalize_component(component_raw, product_area_normalized)
+
+        rows.append((
+            theme.conversation_id,
+            product_area_normalized,
+            component_canonical,
+            theme.issue_signature,
+            theme.user_intent,
+            Json(theme.symptoms) if theme.symptoms else None,
+            theme.affected_flow,
+            theme.root_cause_hypothesis,
+            run_id,
+            quality_result.quality_score,
+            Json(asdict(quality_result)),
+            product_area_raw,
+            component_raw,
+            theme.diagnostic_summary,
+            Json(theme.key_excerpts) if theme.key_excerpts else None,
+            theme.resolution_action,
+            theme.root_cause,
+            theme.solution_provided,
+            theme.resolution_category,
+        ))
+
+    with get_connection() as conn:
+        with conn.cursor() as cur:
+            returned = execute_values(
+                cur,
+                """
+                INSERT INTO themes (
+                    conversation_id, product_area, component, issue_signature,
+                    user_intent, symptoms, affected_flow, root_cause_hypothesis,
+                    pipeline_run_id, quality_score, quality_details,
+                    product_area_raw, component_raw,
+                    diagnostic_summary, key_excerpts,
+                    resolution_action, root_cause, solution_provided, resolution_category
+                ) VALUES %s
+                ON CONFLICT (conversation_id) DO UPDATE SET
+                    product_area = EXCLUDED.product_area,
+                    component = EXCLUDED.component,
+                    issue_signature = EXCLUDED.issue_signature,
+                    user_intent = EXCLUDED.user_intent,
+                    symptoms = EXCLUDED.symptoms,
+                    affected_flow = EXCLUDED.affected_flow,
+                    root_cause_hypothesis = EXCLUDED.root_cause_hypothesis,
+                    pipeline_run_id = EXCLUDED.pipeline_run_id,
+                    quality_score = EXCLUDED.quality_score,
+                    quality_details = EXCLUDED.quality_details,
+                    product_area_raw = EXCLUDED.product_area_raw,
+                    component_raw = EXCLUDED.component_raw,
+                    diagnostic_summary = EXCLUDED.diagnostic_summary,
+                    key_excerpts = EXCLUDED.key_excerpts,
+                    resolution_action = EXCLUDED.resolution_action,
+                    root_cause = EXCLUDED.root_cause,
+                    solution_provided = EXCLUDED.solution_provided,
+                    resolution_category = EXCLUDED.resolution_category,
+                    extracted_at = NOW()
+                RETURNING id, conversation_id
+                """,
+                rows,
+                page_size=len(rows),
+                fetch=True,
+            )
+            theme_ids = {conversation_id: theme_id for theme_id, conversation_id in returned}
+
+            # Collect context usage logs for batch insert
+            context_logs_to_insert: list[tuple] = []
+            for theme in themes_by_conversation.values():
+                if (theme.context_used or theme.context_gaps) and theme.conversation_id in theme_ids:
+                    context_logs_to_insert.append((
+                        theme_ids[theme.conversation_id],
+                        theme.conversation_id,
+                        run_id,
+                        Json(theme.context_used) if theme.context_used else None,
+                        Json(theme.context_gaps) if theme.context_gaps else None,
+                    ))
+
+            if context_logs_to_insert:
+                execute_values(
+                    cur,
+                    """
+                    INSERT INTO context_usage_logs (theme_id, conversation_id, pipeline_run_id, context_used, context_gaps)
+                    VALUES %s
+                    ON CONFLICT (theme_id) DO UPDATE SET
+                        context_used = EXCLUDED.context_used,
+                        context_gaps = EXCLUDED.context_gaps
+                    """,
+                    context_logs_to_insert,
+                )
+
+        conn.commit()
+
+    return len(rows), len(low_quality_themes), warnings
+
+
+def _fetch_theme_candidate_rows(
+    run_id: int,
+    conversation_ids: Optional[List[str]] = None,
+) -> list[dict]:
+    """
+    Load conversations from this run whose type may need downstream work.
+
+    Returns all potentially-actionable types (Issue #165); callers filter in
+    Python. When conversation_ids is given, only those conversations are
+    loaded (used by the overlapped stage DAG for each stored batch).
+    """
+    from src.db.connection import get_connection
+    from psycopg2.extras import RealDictCursor
 
-    # Get conversations classified in this run (Issue #165: expanded types)
-    # Fetch all potentially-actionable types, then filter in Python
     all_allowed_types = THEME_EXTRACTION_ALWAYS_ALLOWED | THEME_EXTRACTION_CONDITIONAL
+    id_filter = "AND c.id = ANY(%s)" if conversation_ids is not None else ""
+    params: list = [run_id, run_id, list(all_allowed_types)]
+    if conversation_ids is not None:
+        params.append(list(conversation_ids))
+
     with get_connection() as conn:
         with conn.cursor(cursor_factory=RealDictCursor) as cur:
-            cur.execute("""
+            cur.execute(f"""
                 SELECT c.id, c.created_at, c.source_body, c.source_url,
                        COALESCE(c.stage2_type, c.stage1_type) as issue_type,
                        c.sentiment, c.priority, c.churn_risk,
@@ -734,13 +907,24 @@ async def _run_theme_extraction_async(
                 WHERE (c.pipeline_run_id = %s
                        OR (c.pipeline_run_id IS NULL AND c.classified_at >= pr.started_at))
                   AND COALESCE(c.stage2_type, c.stage1_type) = ANY(%s)
+                  {id_filter}
                 ORDER BY c.created_at DESC
-            """, (run_id, run_id, list(all_allowed_types)))
-            rows = cur.fetchall()
+            """, params)
+            return cur.fetchall()
 
-    if not rows:
-        logger.info(f"Run {run_id}: No actionable conversations to extract themes from")
-        return {"themes_extracted": 0, "themes_new": 0, "themes_filtered": 0, "conditional_filtered": 0, "warnings": []}
+
+def _build_theme_inputs(
+    rows: list[dict],
+    stop_checker: Callable[[], bool],
+) -> Optional[tuple[list, dict, dict, int]]:
+    """
+    Turn conversation rows into theme extraction inputs.
+
+    Returns:
+        (conversations, customer digests by id, full texts by id,
+        conditional_filtered count), or None if a stop was requested
+    """
+    from src.db.models import Conversation
 
     # Map new classifier types to legacy IssueType for Conversation model
     # Issue #165: Added account_issue and configuration_help mappings
@@ -760,8 +944,7 @@ async def _run_theme_extraction_async(
 
     for row in rows:
         if stop_checker():
-            logger.info(f"Run {run_id}: Stop signal received during theme extraction setup")
-            return {"themes_extracted": 0, "themes_new": 0, "themes_filtered": 0, "conditional_filtered": 0, "warnings": []}
+            return None
 
         new_type = row["issue_type"]
 
@@ -798,6 +981,45 @@ async def _run_theme_extraction_async(
         if row.get("full_conversation"):
             conversation_full_texts[row["id"]] = row["full_conversation"]
 
+    return conversations, conversation_digests, conversation_full_texts, conditional_filtered_count
+
+
+async def _run_theme_extraction_async(
+    run_id: int,
+    stop_checker: Callable[[], bool],
+    concurrency: int = 20,
+) -> dict:
+    """
+    Run theme extraction with semaphore-controlled concurrency (Issue #148).
+
+    Parallelizes theme extraction to reduce processing time from ~60 min
+    (sequential) to ~5-10 min (parallel) for 500 conversations.
+
+    Args:
+        run_id: Pipeline run ID
+        stop_checker: Callback to check for stop signal
+        concurrency: Max parallel extractions (default 20, matches OpenAI rate limits)
+
+    Returns:
+        dict with themes_extracted, themes_new, themes_filtered counts and warnings
+    """
+    from src.theme_extractor import ThemeExtractor
+
+    logger.info(f"Run {run_id}: Starting async theme extraction (concurrency={concurrency})")
+
+    # Get conversations classified in this run (Issue #165: expanded types)
+    rows = _fetch_theme_candidate_rows(run_id)
+
+    if not rows:
+        logger.info(f"Run {run_id}: No actionable conversations to extract themes from")
+        return {"themes_extracted": 0, "themes_new": 0, "themes_filtered": 0, "conditional_filtered": 0, "warnings": []}
+
+    inputs = _build_theme_inputs(rows, stop_checker)
+    if inputs is None:
+        logger.info(f"Run {run_id}: Stop signal received during theme extraction setup")
+        return {"themes_extracted": 0, "themes_new": 0, "themes_filtered": 0, "conditional_filtered": 0, "warnings": []}
+    conversations, conversation_digests, conversation_full_texts, conditional_filtered_count = inputs
+
     if conditional_filtered_count > 0:
         logger.info(
             f"Run {run_id}: Filtered {conditional_filtered_count} non-actionable "
@@ -816,7 +1038,55 @@ async def _run_theme_extraction_async(
     extractor = ThemeExtractor()
     extractor.clear_session_signatures()
 
-    async def extract_one(conv: Conversation) -> Optional[tuple]:
+    result = await _extract_and_store_themes(
+        run_id,
+        conversations,
+        conversation_digests,
+        conversation_full_texts,
+        extractor,
+        semaphore,
+        stop_checker,
+    )
+    result["conditional_filtered"] = conditional_filtered_count  # PR review fix: surface #165 filtering
+    result["llm_usage"] = _theme_llm_usage(run_id, extractor)
+    return result
+
+
+def _theme_llm_usage(run_id: int, extractor) -> dict:
+    """Log and return the extractor's per-stage token usage, incl. prompt-cache hits."""
+    usage = extractor.usage_stats()
+    for stage, counts in usage.items():
+        prompt_tokens = counts["prompt_tokens"]
+        logger.info(
+            f"Run {run_id}: {stage} LLM usage: {counts['calls']} calls, "
+            f"{prompt_tokens} prompt tokens ({counts['cached_tokens']} cached, "
+            f"{counts['cached_tokens'] / prompt_tokens * 100 if prompt_tokens else 0:.0f}%), "
+            f"{counts['completion_tokens']} completion tokens"
+        )
+    return usage
+
+
+async def _extract_and_store_themes(
+    run_id: int,
+    conversations: list,
+    conversation_digests: dict,
+    conversation_full_texts: dict,
+    extractor,
+    semaphore: asyncio.Semaphore,
+    stop_checker: Callable[[], bool],
+) -> dict:
+    """
+    Extract themes for a set of conversations and store them as they complete.
+
+    Shared by the sequential theme phase and the overlapped stage DAG, which
+    calls it once per micro-batch with a long-lived extractor and semaphore.
+
+    Returns:
+        dict with themes_extracted, themes_new, themes_filtered,
+        extraction_failed counts and quality gate warnings
+    """
+
+    async def extract_one(conv) -> Optional[tuple]:
         """Extract theme for one conversation with semaphore control."""
         if stop_checker():
             return None
@@ -834,12 +1104,11 @@ async def _run_theme_extraction_async(
                     use_full_conversation=True,
                 )
 
-                # Check if new theme
+                # Check if new theme (O(1) lookup against the run's signature catalog)
                 is_new = False
                 if not theme.issue_signature.startswith("unclassified"):
-                    existing = extractor.get_existing_signatures(theme.product_area)
-                    is_new = not any(
-                        s["signature"] == theme.issue_signature for s in existing
+                    is_new = not extractor.has_signature(
+                        theme.issue_signature, theme.product_area
                     )
 
                 logger.debug(f"Extracted theme: {theme.issue_signature} for conv {conv.id}")
@@ -850,145 +1119,87 @@ async def _run_theme_extraction_async(
                 logger.warning(f"Failed to extract theme for {conv.id}: {e}", exc_info=True)
                 return None
 
+    # Themes are stored by a single writer task while extraction is still
+    # running: each batch is quality-gated and upserted on a worker thread,
+    # so a crash loses at most one batch and there is no end-of-stage write spike.
+    store_queue: asyncio.Queue = asyncio.Queue()
+    done = object()  # Extraction-complete sentinel
+    stored = {"passed": 0, "filtered": 0, "warnings": []}
+
+    async def flush(batch: list) -> None:
+        if not batch:
+            return
+        passed, filtered, batch_warnings = await asyncio.to_thread(
+            _store_theme_batch, batch, run_id
+        )
+        stored["passed"] += passed
+        stored["filtered"] += filtered
+        stored["warnings"].extend(batch_warnings)
+
+    async def writer() -> None:
+        batch: list = []
+        while True:
+            theme = await store_queue.get()
+            if theme is done:
+                await flush(batch)
+                return
+            batch.append(theme)
+            if len(batch) >= THEME_STORE_BATCH_SIZE:
+                await flush(batch)
+                batch = []
+
+    async def extract_and_queue(conv) -> Optional[tuple]:
+        result = await extract_one(conv)
+        if result is not None:
+            await store_queue.put(result[0])
+        return result
+
+    # Research context for the whole set in batched searches instead of one
+    # embedding request and vector query per conversation (no-op without a
+    # search service)
+    await asyncio.to_thread(
+        extractor.prefetch_research_context,
+        conversations,
+        conversation_digests,
+        conversation_full_texts,
+    )
+
     # Run all extractions in parallel with semaphore control
-    tasks = [extract_one(conv) for conv in conversations]
-    results = await asyncio.gather(*tasks)
+    writer_task = asyncio.create_task(writer())
+    try:
+        results = await asyncio.gather(*(extract_and_queue(conv) for conv in conversations))
+    finally:
+        await store_queue.put(done)
+        await writer_task
+        extractor.clear_prefetched_research()
 
     # Collect results and track failures (Issue #148 fix: Q2/R2)
-    all_themes = []
     themes_new = 0
     extraction_failed = 0
     for result in results:
         if result is not None:
-            theme, is_new = result
-            all_themes.append(theme)
-            if is_new:
+            if result[1]:
                 themes_new += 1
         else:
             extraction_failed += 1
 
     logger.info(
-        f"Run {run_id}: Extracted {len(all_themes)} themes ({themes_new} new), "
+        f"Run {run_id}: Extracted {len(results) - extraction_failed} themes ({themes_new} new), "
         f"{extraction_failed} failed"
     )
 
-    # Apply quality gates
-    high_quality_themes, low_quality_themes, warnings = filter_themes_by_quality(all_themes)
-
-    if low_quality_themes:
+    if stored["filtered"]:
         logger.info(
-            f"Run {run_id}: Quality gates filtered {len(low_quality_themes)} of "
-            f"{len(all_themes)} themes"
+            f"Run {run_id}: Quality gates filtered {stored['filtered']} of "
+            f"{stored['passed'] + stored['filtered']} themes"
         )
 
-    # Store themes in database
-    from psycopg2.extras import Json, execute_values
-    from src.theme_quality import check_theme_quality
-    from src.utils.normalize import normalize_product_area, canonicalize_component
-
-    context_logs_to_insert: list[tuple] = []
-
-    with get_connection() as conn:
-        with conn.cursor() as cur:
-            for theme in high_quality_themes:
-                quality_result = check_theme_quality(
-                    issue_signature=theme.issue_signature,
-                    matched_existing=theme.matched_existing,
-                    match_confidence=theme.match_confidence or "low",
-                )
-
-                product_area_raw = theme.product_area
-                component_raw = theme.component
-                product_area_normalized = normalize_product_area(product_area_raw)
-                component_canonical = canonicalize_component(component_raw, product_area_normalized)
-
-                cur.execute("""
-                    INSERT INTO themes (
-                        conversation_id, product_area, component, issue_signature,
-                        user_intent, symptoms, affected_flow, root_cause_hypothesis,
-                        pipeline_run_id, quality_score, quality_details,
-                        product_area_raw, component_raw,
-                        diagnostic_summary, key_excerpts,
-                        resolution_action, root_cause, solution_provided, resolution_category
-                    ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                    ON CONFLICT (conversation_id) DO UPDATE SET
-                        product_area = EXCLUDED.product_area,
-                        component = EXCLUDED.component,
-                        issue_signature = EXCLUDED.issue_signature,
-                        user_intent = EXCLUDED.user_intent,
-                        symptoms = EXCLUDED.symptoms,
-                        affected_flow = EXCLUDED.affected_flow,
-                        root_cause_hypothesis = EXCLUDED.root_cause_hypothesis,
-                        pipeline_run_id = EXCLUDED.pipeline_run_id,
-                        quality_score = EXCLUDED.quality_score,
-                        quality_details = EXCLUDED.quality_details,
-                        product_area_raw = EXCLUDED.product_area_raw,
-                        component_raw = EXCLUDED.component_raw,
-                        diagnostic_summary = EXCLUDED.diagnostic_summary,
-                        key_excerpts = EXCLUDED.key_excerpts,
-                        resolution_action = EXCLUDED.resolution_action,
-                        root_cause = EXCLUDED.root_cause,
-                        solution_provided = EXCLUDED.solution_provided,
-                        resolution_category = EXCLUDED.resolution_category,
-                        extracted_at = NOW()
-                    RETURNING id
-                """, (
-                    theme.conversation_id,
-                    product_area_normalized,
-                    component_canonical,
-                    theme.issue_signature,
-                    theme.user_intent,
-                    Json(theme.symptoms) if theme.symptoms else None,
-                    theme.affected_flow,
-                    theme.root_cause_hypothesis,
-                    run_id,
-                    quality_result.quality_score,
-                    Json(asdict(quality_result)),
-                    product_area_raw,
-                    component_raw,
-                    theme.diagnostic_summary,
-                    Json(theme.key_excerpts) if theme.key_excerpts else None,
-                    theme.resolution_action,
-                    theme.root_cause,
-                    theme.solution_provided,
-                    theme.resolution_category,
-                ))
-
-                theme_id = cur.fetchone()[0]
-
-                # Collect context usage logs for batch insert
-                if theme.context_used or theme.context_gaps:
-                    context_logs_to_insert.append((
-                        theme_id,
-                        theme.conversation_id,
-                        run_id,
-                        Json(theme.context_used) if theme.context_used else None,
-                        Json(theme.context_gaps) if theme.context_gaps else None,
-                    ))
-
-            # Batch insert context usage logs
-            if context_logs_to_insert:
-                execute_values(
-                    cur,
-                    """
-                    INSERT INTO context_usage_logs (theme_id, conversation_id, pipeline_run_id, context_used, context_gaps)
-                    VALUES %s
-                    ON CONFLICT (theme_id) DO UPDATE SET
-                        context_used = EXCLUDED.context_used,
-                        context_gaps = EXCLUDED.context_gaps
-                    """,
-                    context_logs_to_insert,
-                )
-
-        conn.commit()
-
     return {
-        "themes_extracted": len(high_quality_themes),
+        "themes_extracted": stored["passed"],
         "themes_new": themes_new,
-        "themes_filtered": len(low_quality_themes),
-        "conditional_filtered": conditional_filtered_count,  # PR review fix: surface #165 filtering
+        "themes_filtered": stored["filtered"],
         "extraction_failed": extraction_failed,  # Issue #148 fix: Q2/R2
-        "warnings": warnings,
+        "warnings": stored["warnings"],
     }
 
 
@@ -1340,6 +1551,197 @@ def _try_hybrid_clustering_story_creation(
         return None
 
 
+def _stage_conversations(rows: list[dict]) -> list[dict]:
+    """Embedding/facet inputs for the rows of always-actionable types (Issue #139: include digest)."""
+    return [
+        {
+            "id": row["id"],
+            "source_body": row["source_body"],
+            "customer_digest": row["customer_digest"],
+        }
+        for row in rows
+        if row["issue_type"] in THEME_EXTRACTION_ALWAYS_ALLOWED
+    ]
+
+
+async def _run_overlapped_pipeline_async(
+    run_id: int,
+    stop_checker: Callable[[], bool],
+    concurrency: int,
+    **classification_kwargs,
+) -> tuple[dict, dict, dict, dict]:
+    """
+    Run classification, embeddings, facets and themes as a streaming DAG.
+
+    Instead of a barrier after each phase, every batch the classifier stores is
+    handed to the downstream stages straight away:
+
+        classification ──► dispatcher ──┬──► embedding worker
+                                        ├──► facet worker
+                                        └──► theme worker
+
+    Stage queues are bounded (OVERLAP_STAGE_QUEUE_SIZE micro-batches), so a slow
+    stage applies backpressure instead of buffering the whole run. Embeddings
+    and facets run concurrently with each other and with classification.
+
+    After classification finishes, a final sweep dispatches any run
+    conversations not seen yet (stored before a resume, or by the coda
+    recovery path), so the stage outputs match the sequential phases.
+
+    Progress is reported per micro-batch via _update_phase.
+
+    Returns:
+        (classification result, embedding result, facet result, theme result)
+    """
+    from src.classification_pipeline import _run_stage_tasks, run_pipeline_async
+    from src.services.embedding_service import EmbeddingService
+    from src.services.facet_service import FacetExtractionService
+    from src.theme_extractor import ThemeExtractor
+
+    logger.info(f"Run {run_id}: Running pipeline stages overlapped")
+
+    stored_ids: asyncio.Queue = asyncio.Queue()
+    stage_queues = {
+        stage: asyncio.Queue(maxsize=OVERLAP_STAGE_QUEUE_SIZE)
+        for stage in ("embedding", "facet", "theme")
+    }
+    done = object()  # End-of-stream sentinel
+    dispatched: set = set()
+
+    embedding_result = {
+        "embeddings_generated": 0,
+        "embeddings_failed": 0,
+        "embedding_cache_hits": 0,
+        "embedding_cache_misses": 0,
+    }
+    facet_result = {"facets_extracted": 0, "facets_failed": 0}
+    theme_result = {
+        "themes_extracted": 0,
+        "themes_new": 0,
+        "themes_filtered": 0,
+        "extraction_failed": 0,
+        "conditional_filtered": 0,
+        "warnings": [],
+    }
+
+    async def report_progress() -> None:
+        await asyncio.to_thread(
+            _update_phase,
+            run_id,
+            "overlapped_stages",
+            embeddings_generated=embedding_result["embeddings_generated"],
+            embeddings_failed=embedding_result["embeddings_failed"],
+            facets_extracted=facet_result["facets_extracted"],
+            facets_failed=facet_result["facets_failed"],
+            themes_extracted=theme_result["themes_extracted"],
+            themes_new=theme_result["themes_new"],
+            themes_filtered=theme_result["themes_filtered"],
+        )
+
+    async def classify() -> dict:
+        try:
+            return await run_pipeline_async(
+                stop_checker=stop_checker,
+                concurrency=concurrency,
+                pipeline_run_id=run_id,
+                on_stored=stored_ids.put_nowait,
+                **classification_kwargs,
+            )
+        finally:
+            stored_ids.put_nowait(done)
+
+    async def dispatch(rows: list[dict]) -> None:
+        rows = [row for row in rows if row["id"] not in dispatched]
+        dispatched.update(row["id"] for row in rows)
+        for i in range(0, len(rows), OVERLAP_STAGE_BATCH_SIZE):
+            chunk = rows[i:i + OVERLAP_STAGE_BATCH_SIZE]
+            for queue in stage_queues.values():
+                await queue.put(chunk)
+
+    async def dispatcher() -> None:
+        pending: list = []
+        while True:
+            ids = await stored_ids.get()
+            if ids is done:
+                break
+            pending.extend(ids)
+            if len(pending) >= OVERLAP_STAGE_BATCH_SIZE:
+                await dispatch(await asyncio.to_thread(_fetch_theme_candidate_rows, run_id, pending))
+                pending = []
+        if pending:
+            await dispatch(await asyncio.to_thread(_fetch_theme_candidate_rows, run_id, pending))
+
+        # Final sweep: conversations of this run that never came through on_stored
+        if not stop_checker():
+            await dispatch(await asyncio.to_thread(_fetch_theme_candidate_rows, run_id))
+
+        for queue in stage_queues.values():
+            await queue.put(done)
+
+    async def embedding_worker() -> None:
+        # Text embedded in an earlier run is served from cache
+        service = EmbeddingService(use_cache=True)
+        while (rows := await stage_queues["embedding"].get()) is not done:
+            conversations = _stage_conversations(rows)
+            if not conversations or stop_checker():
+                continue
+            batch = await _generate_and_store_embeddings(service, conversations, run_id, stop_checker)
+            for key, value in batch.items():
+                embedding_result[key] += value
+            await report_progress()
+
+    async def facet_worker() -> None:
+        service = FacetExtractionService()
+        while (rows := await stage_queues["facet"].get()) is not done:
+            conversations = _stage_conversations(rows)
+            if not conversations or stop_checker():
+                continue
+            batch = await _extract_and_store_facets(service, conversations, run_id, stop_checker)
+            for key, value in batch.items():
+                facet_result[key] += value
+            await report_progress()
+
+    async def theme_worker() -> None:
+        # One extractor and semaphore for the whole run, as in the sequential phase
+        extractor = ThemeExtractor()
+        extractor.clear_session_signatures()
+        semaphore = asyncio.Semaphore(concurrency)
+        while (rows := await stage_queues["theme"].get()) is not done:
+            inputs = _build_theme_inputs(rows, stop_checker)
+            if inputs is None:
+                continue
+            conversations, digests, full_texts, conditional_filtered = inputs
+            theme_result["conditional_filtered"] += conditional_filtered
+            if not conversations:
+                continue
+            batch = await _extract_and_store_themes(
+                run_id, conversations, digests, full_texts, extractor, semaphore, stop_checker
+            )
+            for key, value in batch.items():
+                theme_result[key] += value
+            await report_progress()
+        theme_result["llm_usage"] = _theme_llm_usage(run_id, extractor)
+
+    classify_task = asyncio.create_task(classify())
+    await _run_stage_tasks([
+        classify_task,
+        asyncio.create_task(dispatcher()),
+        asyncio.create_task(embedding_worker()),
+        asyncio.create_task(facet_worker()),
+        asyncio.create_task(theme_worker()),
+    ])
+
+    logger.info(
+        f"Run {run_id}: Overlapped stages complete. "
+        f"Conversations: {len(dispatched)}, "
+        f"Embeddings: {embedding_result['embeddings_generated']}, "
+        f"Facets: {facet_result['facets_extracted']}, "
+        f"Themes: {theme_result['themes_extracted']}"
+    )
+
+    return classify_task.result(), embedding_result, facet_result, theme_result
+
+
 async def _run_pipeline_async(
     run_id: int,
     days: int,
@@ -1384,6 +1786,108 @@ async def _run_pipeline_async(
     )
 
 
+def _store_classification_results(run_id: int, result: dict) -> None:
+    """Persist classification counts and warnings.
+
+    Issue #202: Stats include proper totals (new + skipped from previous run),
+    so direct SET is correct and counters won't regress on resume.
+    """
+    from src.db.connection import get_connection
+    from psycopg2.extras import Json
+
+    classification_warnings = result.get("warnings", [])
+    with get_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute("""
+                UPDATE pipeline_runs SET
+                    conversations_fetched = %s,
+                    conversations_filtered = %s,
+                    conversations_classified = %s,
+                    conversations_stored = %s,
+                    warnings = COALESCE(warnings, '[]'::jsonb) || %s::jsonb
+                WHERE id = %s
+            """, (
+                result.get("fetched", 0),
+                result.get("filtered", 0),
+                result.get("classified", 0),
+                result.get("stored", 0),
+                Json(classification_warnings) if classification_warnings else Json([]),
+                run_id,
+            ))
+
+
+def _store_embedding_results(run_id: int, embedding_result: dict) -> None:
+    """Persist embedding generation counts (#106)."""
+    from src.db.connection import get_connection
+
+    with get_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute("""
+                UPDATE pipeline_runs SET
+                    embeddings_generated = %s,
+                    embeddings_failed = %s,
+                    embedding_cache_hits = %s,
+                    embedding_cache_misses = %s
+                WHERE id = %s
+            """, (
+                embedding_result.get("embeddings_generated", 0),
+                embedding_result.get("embeddings_failed", 0),
+                embedding_result.get("embedding_cache_hits", 0),
+                embedding_result.get("embedding_cache_misses", 0),
+                run_id,
+            ))
+
+
+def _store_facet_results(run_id: int, facet_result: dict) -> None:
+    """Persist facet extraction counts (#107)."""
+    from src.db.connection import get_connection
+
+    with get_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute("""
+                UPDATE pipeline_runs SET
+                    facets_extracted = %s,
+                    facets_failed = %s
+                WHERE id = %s
+            """, (
+                facet_result.get("facets_extracted", 0),
+                facet_result.get("facets_failed", 0),
+                run_id,
+            ))
+
+
+def _store_theme_results(run_id: int, theme_result: dict) -> None:
+    """Persist theme extraction counts and quality gate warnings."""
+    from src.db.connection import get_connection
+    from psycopg2.extras import Json
+
+    # Fix #104: stories_ready only TRUE when themes_extracted > 0
+    themes_extracted = theme_result.get("themes_extracted", 0)
+    themes_filtered = theme_result.get("themes_filtered", 0)
+    theme_warnings = theme_result.get("warnings", [])
+
+    with get_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute("""
+                UPDATE pipeline_runs SET
+                    themes_extracted = %s,
+                    themes_new = %s,
+                    themes_filtered = %s,
+                    stories_ready = %s,
+                    warnings = COALESCE(warnings, '[]'::jsonb) || %s::jsonb,
+                    llm_usage = %s
+                WHERE id = %s
+            """, (
+                themes_extracted,
+                theme_result.get("themes_new", 0),
+                themes_filtered,
+                themes_extracted > 0,  # Fix: only ready if themes exist
+                Json(theme_warnings),
+                Json(theme_result.get("llm_usage", {})),
+                run_id,
+            ))
+
+
 def _run_pipeline_task(
     run_id: int,
     days: int,
@@ -1407,6 +1911,9 @@ def _run_pipeline_task(
     Updates the pipeline_runs table with progress and results.
     Checks for stop signal between phases and exits gracefully if stopping.
 
+    With PIPELINE_OVERLAP_STAGES=true, phases 1-4 run as one streaming DAG
+    (see _run_overlapped_pipeline_async) instead of one after another.
+
     Issue #202: Added checkpoint and date override params for resume support.
     When resuming, checkpoint contains the cursor to continue from, and
     date overrides ensure we use the original run's date range.
@@ -1446,6 +1953,8 @@ def _run_pipeline_task(
         result = {"fetched": 0, "filtered": 0, "classified": 0, "stored": 0}
         theme_result = {"themes_extracted": 0, "themes_new": 0}
         story_result = {"stories_created": 0, "orphans_created": 0}
+        embedding_result = None
+        facet_result = None
         # ==== PHASE 1: Classification ====
         if stop_checker():
             _finalize_stopped_run(run_id, result, theme_result, story_result)
@@ -1453,47 +1962,46 @@ def _run_pipeline_task(
 
         _update_phase(run_id, "classification")
 
-        # Run the async classification pipeline
-        # Issue #202: Pass checkpoint and date overrides for resume support
-        result = asyncio.run(run_pipeline_async(
-            days=days,
-            max_conversations=max_conversations,
-            dry_run=dry_run,
-            concurrency=concurrency,
-            stop_checker=stop_checker,
-            pipeline_run_id=run_id,
-            checkpoint=checkpoint,
-            date_from_override=date_from_override,
-            date_to_override=date_to_override,
-        ))
+        # Opt-in: run embeddings, facets and themes alongside classification
+        overlap_stages = (
+            os.getenv("PIPELINE_OVERLAP_STAGES", "false").lower() == "true" and not dry_run
+        )
+
+        if overlap_stages:
+            result, embedding_result, facet_result, theme_result = asyncio.run(
+                _run_overlapped_pipeline_async(
+                    run_id,
+                    stop_checker,
+                    concurrency,
+                    days=days,
+                    max_conversations=max_conversations,
+                    dry_run=dry_run,
+                    checkpoint=checkpoint,
+                    date_from_override=date_from_override,
+                    date_to_override=date_to_override,
+                )
+            )
+        else:
+            # Run the async classification pipeline
+            # Issue #202: Pass checkpoint and date overrides for resume support
+            result = asyncio.run(run_pipeline_async(
+                days=days,
+                max_conversations=max_conversations,
+                dry_run=dry_run,
+                concurrency=concurrency,
+                stop_checker=stop_checker,
+                pipeline_run_id=run_id,
+                checkpoint=checkpoint,
+                date_from_override=date_from_override,
+                date_to_override=date_to_override,
+            ))
 
         if stop_checker():
-            _finalize_stopped_run(run_id, result, theme_result, story_result)
+            _finalize_stopped_run(run_id, result, theme_result, story_result, embedding_result, facet_result)
             return
 
         # Update classification results
-        # Issue #202: Stats now include proper totals (new + skipped from previous run),
-        # so direct SET is correct and counters won't regress on resume.
-        from psycopg2.extras import Json
-        classification_warnings = result.get("warnings", [])
-        with get_connection() as conn:
-            with conn.cursor() as cur:
-                cur.execute("""
-                    UPDATE pipeline_runs SET
-                        conversations_fetched = %s,
-                        conversations_filtered = %s,
-                        conversations_classified = %s,
-                        conversations_stored = %s,
-                        warnings = COALESCE(warnings, '[]'::jsonb) || %s::jsonb
-                    WHERE id = %s
-                """, (
-                    result.get("fetched", 0),
-                    result.get("filtered", 0),
-                    result.get("classified", 0),
-                    result.get("stored", 0),
-                    Json(classification_warnings) if classification_warnings else Json([]),
-                    run_id,
-                ))
+        _store_classification_results(run_id, result)
 
         # Skip subsequent phases if dry run or no conversations stored
         if dry_run or result.get("stored", 0) == 0:
@@ -1507,104 +2015,68 @@ def _run_pipeline_task(
             _finalize_completed_run(run_id, result, theme_result, story_result)
             return
 
-        # ==== PHASE 2: Embedding Generation (#106) ====
-        embedding_result = {"embeddings_generated": 0, "embeddings_failed": 0}
+        if overlap_stages:
+            # Embedding, facet and theme work already ran alongside classification
+            _store_embedding_results(run_id, embedding_result)
+            _store_facet_results(run_id, facet_result)
+            _store_theme_results(run_id, theme_result)
 
-        if stop_checker():
-            _finalize_stopped_run(run_id, result, theme_result, story_result, embedding_result)
-            return
+            if stop_checker():
+                _finalize_stopped_run(run_id, result, theme_result, story_result, embedding_result, facet_result)
+                return
+        else:
+            # ==== PHASE 2: Embedding Generation (#106) ====
+            embedding_result = {"embeddings_generated": 0, "embeddings_failed": 0}
 
-        _update_phase(run_id, "embedding_generation")
-
-        embedding_result = _run_embedding_generation(run_id, stop_checker)
-
-        # Update embedding results in database
-        with get_connection() as conn:
-            with conn.cursor() as cur:
-                cur.execute("""
-                    UPDATE pipeline_runs SET
-                        embeddings_generated = %s,
-                        embeddings_failed = %s
-                    WHERE id = %s
-                """, (
-                    embedding_result.get("embeddings_generated", 0),
-                    embedding_result.get("embeddings_failed", 0),
-                    run_id,
-                ))
+            if stop_checker():
+                _finalize_stopped_run(run_id, result, theme_result, story_result, embedding_result)
+                return
 
-        if stop_checker():
-            _finalize_stopped_run(run_id, result, theme_result, story_result, embedding_result)
-            return
+            _update_phase(run_id, "embedding_generation")
 
-        # ==== PHASE 3: Facet Extraction (#107) ====
-        facet_result = {"facets_extracted": 0, "facets_failed": 0}
+            embedding_result = _run_embedding_generation(run_id, stop_checker)
 
-        if stop_checker():
-            _finalize_stopped_run(run_id, result, theme_result, story_result, embedding_result, facet_result)
-            return
+            # Update embedding results in database
+            _store_embedding_results(run_id, embedding_result)
 
-        _update_phase(run_id, "facet_extraction")
-
-        facet_result = _run_facet_extraction(run_id, stop_checker)
-
-        # Update facet results in database
-        with get_connection() as conn:
-            with conn.cursor() as cur:
-                cur.execute("""
-                    UPDATE pipeline_runs SET
-                        facets_extracted = %s,
-                        facets_failed = %s
-                    WHERE id = %s
-                """, (
-                    facet_result.get("facets_extracted", 0),
-                    facet_result.get("facets_failed", 0),
-                    run_id,
-                ))
+            if stop_checker():
+                _finalize_stopped_run(run_id, result, theme_result, story_result, embedding_result)
+                return
 
-        if stop_checker():
-            _finalize_stopped_run(run_id, result, theme_result, story_result, embedding_result, facet_result)
-            return
+            # ==== PHASE 3: Facet Extraction (#107) ====
+            facet_result = {"facets_extracted": 0, "facets_failed": 0}
 
-        # ==== PHASE 4: Theme Extraction ====
-        if stop_checker():
-            _finalize_stopped_run(run_id, result, theme_result, story_result, embedding_result, facet_result)
-            return
+            if stop_checker():
+                _finalize_stopped_run(run_id, result, theme_result, story_result, embedding_result, facet_result)
+                return
 
-        _update_phase(run_id, "theme_extraction")
-
-        # Issue #148: Pass concurrency for parallel theme extraction
-        theme_result = _run_theme_extraction(run_id, stop_checker, concurrency=concurrency)
-
-        # Update theme extraction results
-        # Fix #104: stories_ready only TRUE when themes_extracted > 0
-        themes_extracted = theme_result.get("themes_extracted", 0)
-        themes_filtered = theme_result.get("themes_filtered", 0)
-        theme_warnings = theme_result.get("warnings", [])
-
-        from psycopg2.extras import Json
-
-        with get_connection() as conn:
-            with conn.cursor() as cur:
-                cur.execute("""
-                    UPDATE pipeline_runs SET
-                        themes_extracted = %s,
-                        themes_new = %s,
-                        themes_filtered = %s,
-                        stories_ready = %s,
-                        warnings = COALESCE(warnings, '[]'::jsonb) || %s::jsonb
-                    WHERE id = %s
-                """, (
-                    themes_extracted,
-                    theme_result.get("themes_new", 0),
-                    themes_filtered,
-                    themes_extracted > 0,  # Fix: only ready if themes exist
-                    Json(theme_warnings),
-                    run_id,
-                ))
+            _update_phase(run_id, "facet_extraction")
 
-        if stop_checker():
-            _finalize_stopped_run(run_id, result, theme_result, story_result, embedding_result, facet_result)
-            return
+            facet_result = _run_facet_extraction(run_id, stop_checker)
+
+            # Update facet results in database
+            _store_facet_results(run_id, facet_result)
+
+            if stop_checker():
+                _finalize_stopped_run(run_id, result, theme_result, story_result, embedding_result, facet_result)
+                return
+
+            # ==== PHASE 4: Theme Extraction ====
+            if stop_checker():
+                _finalize_stopped_run(run_id, result, theme_result, story_result, embedding_result, facet_result)
+                return
+
+            _update_phase(run_id, "theme_extraction")
+
+            # Issue #148: Pass concurrency for parallel theme extraction
+            theme_result = _run_theme_extraction(run_id, stop_checker, concurrency=concurrency)
+
+            # Update theme extraction results
+            _store_theme_results(run_id, theme_result)
+
+            if stop_checker():
+                _finalize_stopped_run(run_id, result, theme_result, story_result, embedding_result, facet_result)
+                return
 
         # ==== PHASE 5: PM Review + Story Creation (optional) ====
         if auto_create_stories and theme_result.get("themes_extracted", 0) > 0:
@@ -2040,12 +2512,13 @@ def get_pipeline_status(run_id: int, db=Depends(get_db)):
                    conversations_fetched, conversations_filtered,
                    conversations_classified, conversations_stored,
                    embeddings_generated, embeddings_failed,
+                   embedding_cache_hits, embedding_cache_misses,
                    facets_extracted, facets_failed,
                    current_phase, auto_create_stories,
                    themes_extracted, themes_new, themes_filtered,
                    stories_created, orphans_created, stories_ready,
                    status, error_message, errors, warnings,
-                   checkpoint
+                   checkpoint, llm_usage
             FROM pipeline_runs
             WHERE id = %s
         """, (run_id,))
@@ -2079,6 +2552,8 @@ def get_pipeline_status(run_id: int, db=Depends(get_db)):
         conversations_stored=row["conversations_stored"] or 0,
         embeddings_generated=row.get("embeddings_generated") or 0,  # #106
         embeddings_failed=row.get("embeddings_failed") or 0,  # #106
+        embedding_cache_hits=row.get("embedding_cache_hits") or 0,
+        embedding_cache_misses=row.get("embedding_cache_misses") or 0,
         facets_extracted=row.get("facets_extracted") or 0,  # #107
         facets_failed=row.get("facets_failed") or 0,  # #107
         themes_extracted=row["themes_extracted"] or 0,
@@ -2091,6 +2566,7 @@ def get_pipeline_status(run_id: int, db=Depends(get_db)):
         error_message=row["error_message"],
         errors=errors,  # #104
         warnings=warnings,  # #104
+        llm_usage=row.get("llm_usage") or {},
         duration_seconds=round(duration, 1) if duration else None,
         checkpoint=row.get("checkpoint"),  # #202 - Expose for observability
     )
@@ -5,7 +5,7 @@ Endpoints for unified search and RAG capabilities.
 """
 
 import logging
-from typing import List, Optional
+from typing import List, Literal, Optional
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, BackgroundTasks
@@ -42,6 +42,7 @@ class SearchResponse(BaseModel):
     results: List[UnifiedSearchResult]
     total: int
     query: str
+    mode: str = "vector"
 
 
 class SimilarResponse(BaseModel):
@@ -74,6 +75,10 @@ def search(
         le=1.0,
         description="Minimum similarity threshold"
     ),
+    mode: Literal["vector", "hybrid"] = Query(
+        default="vector",
+        description="vector: cosine similarity only; hybrid: full-text + vector, rank-fused"
+    ),
     service: UnifiedSearchService = Depends(get_search_service),
 ):
     """
@@ -82,6 +87,12 @@ def search(
     Returns semantically similar content to the query, ranked by similarity.
     Supports filtering by source type.
 
+    **Modes:**
+    - `vector` (default): pgvector cosine similarity
+    - `hybrid`: full-text and vector candidates merged by reciprocal-rank
+      fusion; better for exact feature names and error strings.
+      `min_similarity` applies to the vector candidates only.
+
     **Source Types:**
     - `coda_page`: Coda research pages and AI summaries
     - `coda_theme`: Extracted themes from synthesis tables
@@ -90,6 +101,7 @@ def search(
     **Examples:**
     - `/api/research/search?q=scheduling+confusion`
     - `/api/research/search?q=pin+not+posting&source_types=coda_page,coda_theme`
+    - `/api/research/search?q=Error+403+board+access+denied&mode=hybrid`
     """
     # Parse source types
     parsed_sources = None
@@ -110,12 +122,14 @@ def search(
         offset=offset,
         source_types=parsed_sources,
         min_similarity=min_similarity,
+        mode=mode,
     )
 
     return SearchResponse(
         results=results,
         total=len(results),
         query=q,
+        mode=mode,
     )
 
 
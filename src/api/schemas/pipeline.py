@@ -5,7 +5,7 @@ Pydantic models for pipeline run requests and responses.
 """
 
 from datetime import datetime
-from typing import List, Optional, Literal
+from typing import Dict, List, Optional, Literal
 
 from pydantic import BaseModel, Field
 
@@ -82,7 +82,8 @@ class PipelineStatus(BaseModel):
     auto_create_stories: bool = False
 
     # Phase tracking
-    current_phase: str = "classification"  # classification, embedding_generation, facet_extraction, theme_extraction, pm_review, story_creation, completed
+    current_phase: str = "classification"  # classification, embedding_generation, facet_extraction, theme_extraction, overlapped_stages, pm_review, story_creation, completed
+    # overlapped_stages replaces the embedding, facet and theme phases when PIPELINE_OVERLAP_STAGES=true
 
     # Progress/results - Classification phase
     conversations_fetched: int = 0
@@ -93,6 +94,8 @@ class PipelineStatus(BaseModel):
     # Progress/results - Embedding generation phase (#106)
     embeddings_generated: int = 0
     embeddings_failed: int = 0
+    embedding_cache_hits: int = 0  # Served from embedding_cache (migration 028)
+    embedding_cache_misses: int = 0
 
     # Progress/results - Facet extraction phase (#107)
     facets_extracted: int = 0
@@ -102,6 +105,8 @@ class PipelineStatus(BaseModel):
     themes_extracted: int = 0
     themes_new: int = 0
     themes_filtered: int = 0  # Themes filtered by quality gates (#104)
+    # Token usage per LLM stage incl. prompt-cache hits (migration 029)
+    llm_usage: Dict[str, Dict[str, int]] = {}
 
     # Progress/results - Story creation phase
     stories_created: int = 0
@@ -20,7 +20,7 @@ import asyncio
 import logging
 import os
 from datetime import datetime, timedelta
-from typing import Optional, List, Dict, Any
+from typing import Callable, Optional, List, Dict, Any
 import sys
 from pathlib import Path
 
@@ -49,6 +49,7 @@ from digest_extractor import (
     build_full_conversation_text,
 )
 from src.context_provider import get_context_provider
+from src.llm_response_cache import get_response_cache, response_cache_key
 
 # Async OpenAI client for parallel processing
 async_client = AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY"))
@@ -86,6 +87,10 @@ def _parse_env_int(name: str, default: int, min_val: int, max_val: int) -> int:
 # When enabled, processes in batches with cursor-based checkpoint/resume
 PIPELINE_STREAMING_BATCH_ENABLED = os.getenv("PIPELINE_STREAMING_BATCH", "false").lower() == "true"
 PIPELINE_STREAMING_BATCH_SIZE = _parse_env_int("PIPELINE_STREAMING_BATCH_SIZE", 50, 10, 500)
+# Bounded queues between fetch/classify/store stages within a batch (backpressure)
+PIPELINE_STREAMING_QUEUE_SIZE = _parse_env_int("PIPELINE_STREAMING_QUEUE_SIZE", 100, 1, 1000)
+# Results per DB write from the streaming writer task
+PIPELINE_STREAMING_STORE_CHUNK = _parse_env_int("PIPELINE_STREAMING_STORE_CHUNK", 25, 1, 500)
 
 
 def _save_classification_checkpoint(
@@ -284,21 +289,20 @@ async def classify_stage1_async(
         )
 
         try:
-            response = await asyncio.wait_for(
-                async_client.chat.completions.create(
-                    model="gpt-4o-mini",
-                    messages=[
-                        {"role": "system", "content": "You are a customer support classifier. Respond with valid JSON only."},
-                        {"role": "user", "content": prompt}
-                    ],
-                    temperature=0.3,
-                    max_tokens=500,
-                    response_format={"type": "json_object"}
-                ),
-                timeout=30.0  # 30 second timeout
+            content = await _chat_completion_content(
+                STAGE1_PROMPT,
+                messages=[
+                    {"role": "system", "content": "You are a customer support classifier. Respond with valid JSON only."},
+                    {"role": "user", "content": prompt}
+                ],
+                timeout=30.0,  # 30 second timeout
+                model="gpt-4o-mini",
+                temperature=0.3,
+                max_tokens=500,
+                response_format={"type": "json_object"},
             )
 
-            result = json_module.loads(response.choices[0].message.content)
+            result = json_module.loads(content)
 
             # Add derived fields
             result["routing_priority"] = "high" if result.get("urgency") in ("critical", "high") else "normal"
@@ -361,21 +365,20 @@ async def classify_stage2_async(
         )
 
         try:
-            response = await asyncio.wait_for(
-                async_client.chat.completions.create(
-                    model="gpt-4o-mini",
-                    messages=[
-                        {"role": "system", "content": "You are a customer support analyst. Respond with valid JSON only."},
-                        {"role": "user", "content": prompt}
-                    ],
-                    temperature=0.1,
-                    max_tokens=800,
-                    response_format={"type": "json_object"}
-                ),
-                timeout=30.0  # 30 second timeout
+            content = await _chat_completion_content(
+                STAGE2_PROMPT,
+                messages=[
+                    {"role": "system", "content": "You are a customer support analyst. Respond with valid JSON only."},
+                    {"role": "user", "content": prompt}
+                ],
+                timeout=30.0,  # 30 second timeout
+                model="gpt-4o-mini",
+                temperature=0.1,
+                max_tokens=800,
+                response_format={"type": "json_object"},
             )
 
-            result = json_module.loads(response.choices[0].message.content)
+            result = json_module.loads(content)
             result["changed_from_stage_1"] = result.get("conversation_type") != stage1_type
 
             return result
@@ -397,6 +400,71 @@ async def classify_stage2_async(
             }
 
 
+async def _chat_completion_content(
+    template: str,
+    messages: List[Dict[str, str]],
+    timeout: float,
+    **params: Any,
+) -> str:
+    """
+    Run a chat completion and return the message content.
+
+    When LLM_RESPONSE_CACHE_PATH is set, identical requests (same template,
+    model, parameters and rendered messages) are answered from the persistent
+    response cache. Responses are cached only after they parse as JSON, so
+    timeouts and malformed output are always retried. Cache I/O runs in a
+    worker thread so SQLite never blocks the event loop.
+    """
+    import json as json_module
+
+    cache = get_response_cache()
+    key = response_cache_key(template, params["model"], messages, params) if cache is not None else None
+    if cache is not None:
+        cached = await asyncio.to_thread(cache.get, key)
+        if cached is not None:
+            return cached
+
+    response = await asyncio.wait_for(
+        async_client.chat.completions.create(messages=messages, **params),
+        timeout=timeout,
+    )
+    content = response.choices[0].message.content
+
+    if cache is not None:
+        try:
+            json_module.loads(content)
+        except (TypeError, ValueError):
+            return content
+        await asyncio.to_thread(cache.put, key, content)
+    return content
+
+
+def _log_response_cache_stats() -> None:
+    """Log LLM response cache hit rate (no-op when the cache is disabled)."""
+    cache = get_response_cache()
+    if cache is not None:
+        stats = cache.stats()
+        logger.info(
+            "LLM response cache:       %d hits, %d misses (%.0f%% hit rate)",
+            stats["hits"], stats["misses"], stats["hit_rate"] * 100,
+        )
+
+
+def _log_intercom_fetch_stats(client: "IntercomClient") -> None:
+    """Log Intercom rate limiter waits and conversation archive hit rate."""
+    stats = client.rate_limiter.stats()
+    logger.info(
+        "Intercom requests:        %d granted, %d waited (%.1fs), %d rate limited (429)",
+        stats["granted"], stats["waited"], stats["wait_seconds"], stats["throttled"],
+    )
+    if client.archive is not None:
+        stats = client.archive.stats()
+        logger.info(
+            "Conversation archive:     %d hits, %d misses (%.0f%% hit rate)",
+            stats["hits"], stats["misses"], stats["hit_rate"] * 100,
+        )
+
+
 def _get_routing_team(conversation_type: str) -> str:
     """Get routing team based on conversation type."""
     routing_map = {
@@ -489,6 +557,21 @@ def _accumulate_stats(cumulative: Dict[str, Any], batch: Dict[str, Any]) -> None
         cumulative.setdefault("warnings", []).extend(batch["warnings"])
 
 
+async def _run_stage_tasks(tasks: List[asyncio.Task]) -> None:
+    """Await pipeline stage tasks, cancelling the rest if any one fails.
+
+    Without this, a failed writer would leave producers blocked forever on a
+    full queue.
+    """
+    try:
+        await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
 async def _process_streaming_batch(
     batch: List[tuple],
     recovery_candidates: List[tuple],
@@ -498,11 +581,31 @@ async def _process_streaming_batch(
     concurrency: int,
     dry_run: bool,
     pipeline_run_id: Optional[int],
+    queue_size: Optional[int] = None,
+    store_chunk_size: Optional[int] = None,
+    on_stored: Optional[Callable[[List[str]], None]] = None,
 ) -> Dict[str, Any]:
-    """Process a single batch: fetch details → evaluate recovery → classify → store.
+    """Process a single batch as a pipeline: fetch details → evaluate recovery → classify → store.
 
     Issue #209: Used in streaming batch mode.
 
+    Conversations flow through bounded queues instead of phase barriers, so a
+    slow detail fetch or LLM call only delays its own conversation:
+
+        fetch workers ──► classify_queue ──► classify workers ──► store_queue ──► writer
+
+    - Fetch workers pull details (bounded by `concurrency`) and evaluate
+      recovery candidates BEFORE they are queued for classification (Issue #164 parity).
+    - Classify workers run two-stage classification (LLM concurrency bounded by `semaphore`).
+    - A single writer task flushes results in chunks via
+      store_classification_results_batch on a worker thread, keeping the
+      synchronous DB write off the event loop.
+    - Queue bounds provide backpressure: fetchers pause when classification
+      falls behind, classifiers pause when storage falls behind.
+
+    The function returns only after every conversation in the batch is stored,
+    so the caller's checkpoint-after-storage invariant is unchanged.
+
     Args:
         batch: List of (parsed, raw_conv) tuples for quality conversations
         recovery_candidates: List of (parsed, raw_conv, had_template) tuples for recovery
@@ -512,6 +615,9 @@ async def _process_streaming_batch(
         concurrency: Max parallel detail fetches
         dry_run: If True, don't store to database
         pipeline_run_id: Pipeline run ID for storage
+        queue_size: Max items buffered between stages (default PIPELINE_STREAMING_QUEUE_SIZE)
+        store_chunk_size: Results per DB write (default PIPELINE_STREAMING_STORE_CHUNK)
+        on_stored: Optional callback receiving conversation IDs after each DB write
 
     Returns:
         Batch statistics dictionary
@@ -530,62 +636,96 @@ async def _process_streaming_batch(
     if not batch and not recovery_candidates:
         return batch_stats
 
-    # Step 1: Fetch details for batch + recovery candidates (parallel)
-    all_to_fetch = list(batch) + [(p, r) for p, r, _ in recovery_candidates]
-    detail_semaphore = asyncio.Semaphore(concurrency)
+    queue_size = queue_size or PIPELINE_STREAMING_QUEUE_SIZE
+    store_chunk_size = store_chunk_size or PIPELINE_STREAMING_STORE_CHUNK
 
-    async def fetch_detail(parsed, raw_conv):
-        async with detail_semaphore:
+    # Work items: (parsed, raw_conv, had_template) - had_template is None for
+    # regular batch items, bool for recovery candidates
+    work_items = [(p, r, None) for p, r in batch] + list(recovery_candidates)
+    work_iter = iter(work_items)
+    num_fetchers = max(1, min(concurrency, len(work_items)))
+    num_classifiers = max(1, min(concurrency, len(work_items)))
+
+    classify_queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+    store_queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+    done = object()  # Stage-complete sentinel
+
+    async def fetch_worker():
+        # A shared iterator hands each item to exactly one worker
+        for parsed, raw_conv, had_template in work_iter:
             try:
-                full_conv = await client.get_conversation_async(session, parsed.id)
-                return (parsed, full_conv)
+                full_conv = await client.get_conversation_async(
+                    session, parsed.id, updated_at=raw_conv.get("updated_at")
+                )
             except Exception as e:
                 logger.warning(f"Failed to fetch details for {parsed.id}: {e}")
-                return (parsed, raw_conv)
-
-    tasks = [fetch_detail(p, r) for p, r in all_to_fetch]
-    all_results = await asyncio.gather(*tasks)  # Returns list, no conversion needed
-
-    # Split back into batch and recovery
-    batch_with_details = all_results[:len(batch)]
-    recovery_with_details = all_results[len(batch):]
-
-    # Step 2: Evaluate recovery BEFORE classification (Issue #164 parity)
-    for i, (parsed, full_conv) in enumerate(recovery_with_details):
-        _, _, had_template = recovery_candidates[i]
-        parts = full_conv.get("conversation_parts", {}).get("conversation_parts", [])
-        if client.should_recover_conversation(parts, had_template_opener=had_template):
-            batch_with_details.append((parsed, full_conv))
-            batch_stats["recovered"] += 1
-
-    if not batch_with_details:
-        return batch_stats
-
-    # Step 3: Classify (NO stop check here - only at batch boundaries)
-    classify_tasks = [
-        classify_conversation_async(parsed, raw_conv, semaphore)
-        for parsed, raw_conv in batch_with_details
-    ]
-    results = await asyncio.gather(*classify_tasks, return_exceptions=True)
-
-    valid_results = []
-    for i, r in enumerate(results):
-        if isinstance(r, Exception):
-            conv_id = batch_with_details[i][0].id if i < len(batch_with_details) else "unknown"
-            logger.error(f"Classification error for {conv_id}: {r}")
-            continue
-        valid_results.append(r)
-        if r.get("stage2_result"):
-            batch_stats["stage2_run"] += 1
-            if r["stage2_result"].get("changed_from_stage_1"):
-                batch_stats["classification_changed"] += 1
-
-    batch_stats["classified"] = len(valid_results)
-
-    # Step 4: Store
-    if not dry_run and valid_results:
-        stored = store_classification_results_batch(valid_results, pipeline_run_id=pipeline_run_id)
-        batch_stats["stored"] = stored
+                full_conv = raw_conv
+
+            if had_template is not None:
+                # Recovery candidate: only classify if it qualifies for recovery
+                parts = full_conv.get("conversation_parts", {}).get("conversation_parts", [])
+                if not client.should_recover_conversation(parts, had_template_opener=had_template):
+                    continue
+                batch_stats["recovered"] += 1
+
+            await classify_queue.put((parsed, full_conv))
+
+    async def classify_worker():
+        # NO stop check here - only at batch boundaries
+        while True:
+            item = await classify_queue.get()
+            if item is done:
+                return
+            parsed, full_conv = item
+            try:
+                result = await classify_conversation_async(parsed, full_conv, semaphore)
+            except Exception as e:
+                logger.error(f"Classification error for {parsed.id}: {e}")
+                continue
+
+            batch_stats["classified"] += 1
+            if result.get("stage2_result"):
+                batch_stats["stage2_run"] += 1
+                if result["stage2_result"].get("changed_from_stage_1"):
+                    batch_stats["classification_changed"] += 1
+            await store_queue.put(result)
+
+    async def flush(chunk: List[Dict[str, Any]]) -> None:
+        if dry_run or not chunk:
+            return
+        stored = await asyncio.to_thread(
+            store_classification_results_batch, chunk, pipeline_run_id=pipeline_run_id
+        )
+        batch_stats["stored"] += stored
+        if on_stored:
+            on_stored([r["conversation_id"] for r in chunk])
+
+    async def writer():
+        chunk: List[Dict[str, Any]] = []
+        while True:
+            item = await store_queue.get()
+            if item is done:
+                await flush(chunk)
+                return
+            chunk.append(item)
+            if len(chunk) >= store_chunk_size:
+                await flush(chunk)
+                chunk = []
+
+    async def run_fetchers():
+        await _run_stage_tasks([asyncio.create_task(fetch_worker()) for _ in range(num_fetchers)])
+        for _ in range(num_classifiers):
+            await classify_queue.put(done)
+
+    async def run_classifiers():
+        await _run_stage_tasks([asyncio.create_task(classify_worker()) for _ in range(num_classifiers)])
+        await store_queue.put(done)
+
+    await _run_stage_tasks([
+        asyncio.create_task(run_fetchers()),
+        asyncio.create_task(run_classifiers()),
+        asyncio.create_task(writer()),
+    ])
 
     return batch_stats
 
@@ -602,6 +742,7 @@ async def _run_streaming_batch_pipeline_async(
     stop_checker: callable,
     pipeline_run_id: Optional[int],
     checkpoint: Optional[Dict[str, Any]],
+    on_stored: Optional[Callable[[List[str]], None]] = None,
 ) -> Dict[str, int]:
     """Streaming batch pipeline: fetch → classify → store → checkpoint per batch.
 
@@ -764,6 +905,7 @@ async def _run_streaming_batch_pipeline_async(
                     concurrency=concurrency,
                     dry_run=dry_run,
                     pipeline_run_id=pipeline_run_id,
+                    on_stored=on_stored,
                 )
                 _accumulate_stats(stats, batch_stats)
 
@@ -812,6 +954,7 @@ async def _run_streaming_batch_pipeline_async(
                 concurrency=concurrency,
                 dry_run=dry_run,
                 pipeline_run_id=pipeline_run_id,
+                on_stored=on_stored,
             )
             _accumulate_stats(stats, batch_stats)
 
@@ -845,6 +988,8 @@ async def _run_streaming_batch_pipeline_async(
         logger.info(f"Stored to database:       {stats['stored']}")
     logger.info(f"Total time:               {elapsed:.1f}s")
     logger.info(f"Throughput:               {throughput:.1f} conv/sec")
+    _log_response_cache_stats()
+    _log_intercom_fetch_stats(client)
     if stats['warnings']:
         logger.info(f"Warnings:                 {len(stats['warnings'])}")
     logger.info("")
@@ -864,6 +1009,7 @@ async def run_pipeline_async(
     checkpoint: Optional[Dict[str, Any]] = None,
     date_from_override: Optional[datetime] = None,
     date_to_override: Optional[datetime] = None,
+    on_stored: Optional[Callable[[List[str]], None]] = None,
 ) -> Dict[str, int]:
     """
     Run the two-stage classification pipeline with async parallelization.
@@ -882,6 +1028,8 @@ async def run_pipeline_async(
         checkpoint: Issue #202 - Optional checkpoint dict to resume from
         date_from_override: Issue #202 - Override date range start (for resume)
         date_to_override: Issue #202 - Override date range end (for resume)
+        on_stored: Optional callback receiving conversation IDs as each batch is
+            durably stored (Intercom source), so downstream stages can start early
 
     Returns:
         Statistics dictionary
@@ -945,6 +1093,7 @@ async def run_pipeline_async(
             stop_checker=should_stop,
             pipeline_run_id=pipeline_run_id,
             checkpoint=checkpoint,
+            on_stored=on_stored,
         )
 
     # Issue #202: Track warnings for observability
@@ -1019,7 +1168,9 @@ async def run_pipeline_async(
             async def fetch_detail(parsed, raw_conv):
                 async with detail_semaphore:
                     try:
-                        full_conv = await client.get_conversation_async(session, parsed.id)
+                        full_conv = await client.get_conversation_async(
+                            session, parsed.id, updated_at=raw_conv.get("updated_at")
+                        )
                         return (parsed, full_conv)
                     except Exception as e:
                         logger.warning(f"Failed to fetch details for {parsed.id}: {e}")
@@ -1139,6 +1290,8 @@ async def run_pipeline_async(
             stored = store_classification_results_batch(batch, pipeline_run_id=pipeline_run_id)
             stats["stored"] += stored
             logger.info("  Stored batch %d: %d rows", i // batch_size + 1, stored)
+            if on_stored:
+                on_stored([r["conversation_id"] for r in batch])
 
             # Issue #202 C2 fix: Save checkpoint AFTER storage, not during fetch.
             # This prevents data loss: checkpoint only advances after data is durably stored.
@@ -1174,6 +1327,8 @@ async def run_pipeline_async(
         logger.info("Stored to database:       %d", stats['stored'])
     logger.info("Total time:               %.1fs", elapsed)
     logger.info("Throughput:               %.1f conv/sec", stats['classified'] / elapsed if elapsed > 0 else 0)
+    _log_response_cache_stats()
+    _log_intercom_fetch_stats(client)
     logger.info("")
 
     # For dry runs, include results for preview (Issue #75)
@@ -1421,7 +1576,7 @@ def run_pipeline(
         stats["fetched"] += 1
 
         # Get full conversation details (includes parts)
-        full_conv = client.get_conversation(parsed.id)
+        full_conv = client.get_conversation(parsed.id, updated_at=raw_conv.get("updated_at"))
 
         # Classify
         result = classify_conversation(parsed, full_conv)
@@ -1475,6 +1630,7 @@ def run_pipeline(
     logger.info("Classifications changed:  %d", stats['classification_changed'])
     if not dry_run:
         logger.info("Stored to database:       %d", stats['stored'])
+    _log_response_cache_stats()
     logger.info("")
 
     return stats
@@ -14,6 +14,10 @@ Confidence signals (updated based on PM review calibration 2026-01-08):
 - Component match (10%): All conversations same component
 - Platform uniformity (5%): All conversations about same platform (Pinterest/IG/FB)
 
+Embeddings: excerpt vectors are reused from conversation_embeddings when the
+pipeline has already stored them; the remaining excerpts and all intents are
+embedded in one batched API call per group and kept in a bounded LRU cache.
+
 Usage:
     from confidence_scorer import ConfidenceScorer
 
@@ -22,9 +26,11 @@ Usage:
     # Returns list of ScoredGroup objects sorted by confidence_score descending
 """
 import json
+import logging
 import os
 import re
-from collections import defaultdict
+import threading
+from collections import OrderedDict, defaultdict
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
@@ -32,9 +38,15 @@ from typing import Optional
 import numpy as np
 from openai import OpenAI
 
+logger = logging.getLogger(__name__)
+
 # Constants
 MIN_GROUP_SIZE = 3  # Decision from architecture doc
 
+MAX_EMBEDDING_TEXT_CHARS = 8000
+MAX_EMBEDDING_BATCH = 2048  # OpenAI inputs per embeddings request
+DEFAULT_EMBEDDING_CACHE_SIZE = 10000  # Texts kept in the in-process LRU cache
+
 # Platforms to detect for uniformity check
 PLATFORMS = {'pinterest', 'instagram', 'facebook', 'twitter', 'linkedin', 'tiktok'}
 
@@ -58,10 +70,27 @@ class ScoredGroup:
 class ConfidenceScorer:
     """Scores conversation groupings for coherence."""
 
-    def __init__(self, embedding_model: str = "text-embedding-3-small"):
+    def __init__(
+        self,
+        embedding_model: str = "text-embedding-3-small",
+        use_stored_embeddings: bool = True,
+        embedding_cache_size: int = DEFAULT_EMBEDDING_CACHE_SIZE,
+    ):
+        """
+        Args:
+            embedding_model: OpenAI embedding model
+            use_stored_embeddings: Reuse conversation vectors from
+                conversation_embeddings (disabled automatically if the DB is
+                unreachable)
+            embedding_cache_size: Max texts kept in the LRU embedding cache
+        """
         self.client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
         self.embedding_model = embedding_model
-        self._embedding_cache: dict[str, list[float]] = {}
+        self.use_stored_embeddings = use_stored_embeddings
+        self.embedding_cache_size = embedding_cache_size
+        # Shared by concurrent story-creation workers
+        self._cache_lock = threading.Lock()
+        self._embedding_cache: OrderedDict[str, np.ndarray] = OrderedDict()
 
     def score_groups(
         self,
@@ -110,7 +139,8 @@ class ConfidenceScorer:
             )
 
         # Calculate each signal
-        embedding_sim = self._calc_embedding_similarity(conversations)
+        stored_embeddings = self._prefetch_embeddings(conversations)
+        embedding_sim = self._calc_embedding_similarity(conversations, stored_embeddings)
         symptom_overlap = self._calc_symptom_overlap(conversations)
         intent_sim, intent_homogeneity = self._calc_intent_metrics(conversations)
         platform_uniformity = self._calc_platform_uniformity(conversations)
@@ -141,29 +171,103 @@ class ConfidenceScorer:
             component_match=component_match,
         )
 
-    def _get_embedding(self, text: str) -> list[float]:
-        """Get embedding for text, with caching."""
-        if text in self._embedding_cache:
-            return self._embedding_cache[text]
+    def _prefetch_embeddings(self, conversations: list[dict]) -> dict[str, np.ndarray]:
+        """
+        Make every vector the group needs available with at most one API call.
 
-        # Truncate very long text
-        text = text[:8000] if len(text) > 8000 else text
+        Excerpt vectors come from conversation_embeddings where stored; the
+        remaining excerpts and the intents not in the cache are embedded in
+        one batch.
 
-        response = self.client.embeddings.create(
-            model=self.embedding_model,
-            input=text
-        )
-        embedding = response.data[0].embedding
-        self._embedding_cache[text] = embedding
-        return embedding
+        Returns:
+            Dict of conversation id -> stored embedding
+        """
+        stored = self._load_stored_embeddings(conversations)
 
-    def _cosine_similarity(self, vec1: list[float], vec2: list[float]) -> float:
-        """Calculate cosine similarity between two vectors."""
-        a = np.array(vec1)
-        b = np.array(vec2)
-        return float(np.dot(a, b) / (np.linalg.norm(a) * np.linalg.norm(b)))
+        texts = []
+        for conv in conversations:
+            if str(conv.get("id", "")) not in stored:
+                texts.append(self._excerpt_text(conv))
+            texts.append(conv.get("user_intent", ""))
+
+        self._embed_missing(texts)
+        return stored
+
+    def _load_stored_embeddings(self, conversations: list[dict]) -> dict[str, np.ndarray]:
+        """Bulk-load pipeline embeddings for the group's conversation ids."""
+        if not self.use_stored_embeddings:
+            return {}
+
+        conversation_ids = [str(conv["id"]) for conv in conversations if conv.get("id")]
+        if not conversation_ids:
+            return {}
+
+        try:
+            from src.db.embedding_storage import load_latest_embeddings
+
+            return load_latest_embeddings(conversation_ids, self.embedding_model)
+        except Exception as e:
+            logger.warning(f"Stored embeddings unavailable, embedding excerpts instead: {e}")
+            self.use_stored_embeddings = False
+            return {}
+
+    def _embed_missing(self, texts: list[str]) -> None:
+        """Embed the texts that are not cached yet, in batched API calls."""
+        missing = list(dict.fromkeys(
+            self._truncate(text) for text in texts if text
+        ))
+        with self._cache_lock:
+            missing = [text for text in missing if text not in self._embedding_cache]
+
+        for i in range(0, len(missing), MAX_EMBEDDING_BATCH):
+            batch = missing[i:i + MAX_EMBEDDING_BATCH]
+            response = self.client.embeddings.create(
+                model=self.embedding_model,
+                input=batch,
+            )
+            for item in sorted(response.data, key=lambda d: d.index):
+                self._cache_put(batch[item.index], np.asarray(item.embedding, dtype=np.float32))
 
-    def _calc_embedding_similarity(self, conversations: list[dict]) -> float:
+    def _get_embedding(self, text: str) -> np.ndarray:
+        """Get embedding for text, with caching."""
+        text = self._truncate(text)
+        with self._cache_lock:
+            embedding = self._embedding_cache.get(text)
+            if embedding is not None:
+                self._embedding_cache.move_to_end(text)
+                return embedding
+
+        self._embed_missing([text])
+        with self._cache_lock:
+            return self._embedding_cache[text]
+
+    def _cache_put(self, text: str, embedding: np.ndarray) -> None:
+        with self._cache_lock:
+            self._embedding_cache[text] = embedding
+            self._embedding_cache.move_to_end(text)
+            while len(self._embedding_cache) > self.embedding_cache_size:
+                self._embedding_cache.popitem(last=False)
+
+    @staticmethod
+    def _truncate(text: str) -> str:
+        return text[:MAX_EMBEDDING_TEXT_CHARS]
+
+    @staticmethod
+    def _excerpt_text(conv: dict) -> str:
+        return conv.get("excerpt", "") or conv.get("source_body", "")
+
+    @staticmethod
+    def _pairwise_similarities(embeddings: list[np.ndarray]) -> np.ndarray:
+        """Upper-triangle cosine similarities of all embedding pairs."""
+        matrix = np.vstack(embeddings).astype(np.float64)
+        matrix /= np.linalg.norm(matrix, axis=1, keepdims=True)
+        return (matrix @ matrix.T)[np.triu_indices(len(embeddings), k=1)]
+
+    def _calc_embedding_similarity(
+        self,
+        conversations: list[dict],
+        stored_embeddings: Optional[dict[str, np.ndarray]] = None,
+    ) -> float:
         """
         Calculate average pairwise cosine similarity of conversation excerpts.
         Returns 0-1 score.
@@ -171,24 +275,23 @@ class ConfidenceScorer:
         if len(conversations) < 2:
             return 1.0
 
-        # Get embeddings for excerpts
+        stored_embeddings = stored_embeddings or {}
+
+        # Stored conversation embedding if the pipeline has one, else the excerpt's
         embeddings = []
         for conv in conversations:
-            text = conv.get("excerpt", "") or conv.get("source_body", "")
+            stored = stored_embeddings.get(str(conv.get("id", "")))
+            if stored is not None:
+                embeddings.append(stored)
+                continue
+            text = self._excerpt_text(conv)
             if text:
                 embeddings.append(self._get_embedding(text))
 
         if len(embeddings) < 2:
             return 1.0
 
-        # Calculate pairwise similarities
-        similarities = []
-        for i in range(len(embeddings)):
-            for j in range(i + 1, len(embeddings)):
-                sim = self._cosine_similarity(embeddings[i], embeddings[j])
-                similarities.append(sim)
-
-        return sum(similarities) / len(similarities) if similarities else 1.0
+        return float(self._pairwise_similarities(embeddings).mean())
 
     def _calc_symptom_overlap(self, conversations: list[dict]) -> float:
         """
@@ -249,17 +352,10 @@ class ConfidenceScorer:
             return 1.0, 1.0
 
         # Calculate pairwise similarities
-        similarities = []
-        for i in range(len(embeddings)):
-            for j in range(i + 1, len(embeddings)):
-                sim = self._cosine_similarity(embeddings[i], embeddings[j])
-                similarities.append(sim)
-
-        if not similarities:
-            return 1.0, 1.0
+        similarities = self._pairwise_similarities(embeddings)
 
         # Intent similarity = mean
-        mean_sim = sum(similarities) / len(similarities)
+        mean_sim = float(similarities.mean())
 
         # Intent homogeneity = penalize high variance
         # High mean + low std = homogeneous (good)
@@ -0,0 +1,178 @@
+"""
+Local archive of raw Intercom conversation JSON.
+
+Every classification run (including resumes and historical backfills) used to
+call GET /conversations/{id} for each conversation, so reprocessing was bound
+by Intercom API quota. The archive keeps the last fetched version of each
+conversation on disk, zlib-compressed, keyed by conversation id and Intercom's
+`updated_at`. IntercomClient reads from it first and only fetches conversations
+that are missing or have changed since they were archived.
+
+Opt-in via environment:
+    INTERCOM_ARCHIVE_PATH   SQLite file path (unset = archive disabled)
+
+A conversation that gains a reply gets a newer `updated_at` in search results,
+which no longer matches the archived copy, so it is re-fetched and replaced.
+
+Concurrency: one connection per archive guarded by a lock (detail fetches run
+from many coroutines), WAL mode and a busy timeout so several pipeline
+processes can share the same file.
+
+The archive is only a cache: read/write failures (locked or corrupt file,
+undecodable body) are logged and treated as a miss or a skipped write, never
+raised to the caller.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class ConversationArchive:
+    """SQLite-backed store of compressed raw conversations with hit-rate stats."""
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path: SQLite database file (created if missing)
+        """
+        self.path = path
+
+        self._lock = threading.Lock()
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path, timeout=30.0, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS raw_conversations (
+                conversation_id TEXT PRIMARY KEY,
+                updated_at INTEGER NOT NULL,
+                body BLOB NOT NULL,
+                archived_at REAL NOT NULL
+            )
+        """)
+        self._conn.commit()
+
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, conversation_id: str, updated_at: int) -> Optional[Dict[str, Any]]:
+        """
+        Return the archived conversation if it is at least as new as updated_at.
+
+        Args:
+            conversation_id: Intercom conversation ID
+            updated_at: `updated_at` from the search result (Unix seconds)
+        """
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT updated_at, body FROM raw_conversations WHERE conversation_id = ?",
+                    (conversation_id,),
+                ).fetchone()
+            conversation = None
+            if row is not None and row[0] >= updated_at:
+                conversation = json.loads(zlib.decompress(row[1]))
+        except (sqlite3.Error, zlib.error, json.JSONDecodeError) as e:
+            logger.warning(f"Conversation archive read failed for {conversation_id}: {e}")
+            conversation = None
+
+        with self._lock:
+            if conversation is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return conversation
+
+    def put(self, conversation: Dict[str, Any]) -> bool:
+        """
+        Archive a raw conversation, replacing any older version.
+
+        Returns:
+            False if the conversation has no id/updated_at or could not be
+            written, and was not archived
+        """
+        conversation_id = conversation.get("id")
+        updated_at = conversation.get("updated_at")
+        if conversation_id is None or not isinstance(updated_at, int):
+            return False
+
+        try:
+            body = zlib.compress(json.dumps(conversation, separators=(",", ":")).encode("utf-8"))
+            with self._lock:
+                self._write(str(conversation_id), updated_at, body)
+        except (sqlite3.Error, zlib.error, TypeError, ValueError) as e:
+            logger.warning(f"Conversation archive write skipped for {conversation_id}: {e}")
+            return False
+        return True
+
+    def _write(self, conversation_id: str, updated_at: int, body: bytes) -> None:
+        """Upsert one row; caller holds the lock."""
+        try:
+            self._conn.execute(
+                """
+                INSERT INTO raw_conversations (conversation_id, updated_at, body, archived_at)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT (conversation_id) DO UPDATE SET
+                    updated_at = excluded.updated_at,
+                    body = excluded.body,
+                    archived_at = excluded.archived_at
+                WHERE excluded.updated_at >= raw_conversations.updated_at
+            """,
+                (conversation_id, updated_at, body, time.time()),
+            )
+            self._conn.commit()
+        except sqlite3.Error:
+            self._conn.rollback()
+            raise
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM raw_conversations").fetchone()[0]
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit-rate statistics since this archive was opened."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_archive: Optional[ConversationArchive] = None
+_archive_lock = threading.Lock()
+
+
+def get_conversation_archive() -> Optional[ConversationArchive]:
+    """
+    Process-wide archive configured from the environment.
+
+    Returns None when INTERCOM_ARCHIVE_PATH is unset (the default).
+    """
+    global _archive
+    path = os.getenv("INTERCOM_ARCHIVE_PATH")
+    if not path:
+        return None
+
+    with _archive_lock:
+        if _archive is None or _archive.path != path:
+            try:
+                _archive = ConversationArchive(path)
+            except sqlite3.Error as e:
+                logger.warning(f"Conversation archive disabled, cannot open {path}: {e}")
+                return None
+            logger.info(f"Conversation archive enabled at {path}")
+        return _archive
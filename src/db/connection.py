@@ -15,6 +15,7 @@ import psycopg2
 from psycopg2.extras import RealDictCursor
 
 from .models import Conversation, PipelineRun
+from .pool import get_pool, is_pool_enabled
 
 
 def get_connection_string() -> str:
@@ -26,17 +27,49 @@ def get_connection_string() -> str:
 
 
 @contextmanager
-def get_connection() -> Generator:
-    """Get a database connection context manager."""
-    conn = psycopg2.connect(get_connection_string())
+def get_connection(cursor_factory: Optional[type] = None) -> Generator:
+    """
+    Get a database connection context manager.
+
+    Connections come from the process-wide pool (see src/db/pool.py) unless
+    DB_POOL_ENABLED=false, in which case a fresh connection is opened and
+    closed per call. Commits on success, rolls back on error.
+
+    Args:
+        cursor_factory: Optional default cursor class for the connection
+            (e.g. RealDictCursor). Reset when the connection is returned.
+    """
+    if not is_pool_enabled():
+        conn = psycopg2.connect(get_connection_string())
+        if cursor_factory is not None:
+            conn.cursor_factory = cursor_factory
+        try:
+            yield conn
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
+        return
+
+    pool = get_pool()
+    conn = pool.getconn()
+    broken = False
+    if cursor_factory is not None:
+        conn.cursor_factory = cursor_factory
     try:
         yield conn
         conn.commit()
     except Exception:
-        conn.rollback()
+        try:
+            conn.rollback()
+        except Exception:
+            # Connection is unusable (e.g. server went away); don't pool it
+            broken = True
         raise
     finally:
-        conn.close()
+        pool.putconn(conn, discard=broken)
 
 
 def init_db() -> None:
@@ -1,21 +1,66 @@
 """
 Database storage for conversation embeddings.
 
-Stores embeddings in the conversation_embeddings table (migration 012).
-Uses batch inserts for efficiency.
+Stores embeddings in the conversation_embeddings table (migration 012) and
+the content-addressed embedding_cache shared across runs (migration 028).
+Batch writes and run loads use pgvector's binary wire format
+(int16 dim, int16 unused, dim x big-endian float4) so vectors go straight
+between bytes and NumPy without per-float Python objects or text parsing.
 """
 
+import io
 import logging
+import struct
+import uuid
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 
-from psycopg2.extras import execute_values
+import numpy as np
 
 from src.db.connection import get_connection
 from src.services.embedding_service import EmbeddingResult, EMBEDDING_DIMENSIONS
 
 logger = logging.getLogger(__name__)
 
+# Rows per round-trip when streaming a run's embeddings from a server-side cursor
+LOAD_FETCH_SIZE = 2000
+
+_VECTOR_HEADER = struct.Struct(">HH")
+_PGCOPY_HEADER = b"PGCOPY\n\xff\r\n\x00" + struct.pack(">ii", 0, 0)
+_PGCOPY_TRAILER = struct.pack(">h", -1)
+
+
+def encode_vector(embedding) -> bytes:
+    """Encode an embedding in pgvector's binary format."""
+    values = np.asarray(embedding, dtype=">f4")
+    return _VECTOR_HEADER.pack(len(values), 0) + values.tobytes()
+
+
+def decode_vector(data) -> np.ndarray:
+    """Decode pgvector's binary format (e.g. vector_send output) to float32."""
+    dim, _ = _VECTOR_HEADER.unpack_from(data)
+    return np.frombuffer(data, dtype=">f4", count=dim, offset=_VECTOR_HEADER.size).astype(np.float32)
+
+
+def _copy_field(value) -> bytes:
+    """One field of a binary COPY tuple (length-prefixed, -1 for NULL)."""
+    if value is None:
+        return struct.pack(">i", -1)
+    return struct.pack(">i", len(value)) + value
+
+
+def _copy_buffer(rows: Iterable[Tuple[Optional[bytes], ...]]) -> io.BytesIO:
+    """Build a binary COPY stream from tuples of already-encoded fields."""
+    buffer = io.BytesIO()
+    buffer.write(_PGCOPY_HEADER)
+    for row in rows:
+        buffer.write(struct.pack(">h", len(row)))
+        for value in row:
+            buffer.write(_copy_field(value))
+    buffer.write(_PGCOPY_TRAILER)
+    buffer.seek(0)
+    return buffer
+
 
 def store_embedding(
     conversation_id: str,
@@ -63,7 +108,8 @@ def store_embeddings_batch(
     """
     Store multiple conversation embeddings in a single batch operation.
 
-    ~50x faster than individual inserts for large batches.
+    Streams vectors to a temp table with binary COPY (no text formatting),
+    then upserts into conversation_embeddings in one statement.
 
     Args:
         results: List of EmbeddingResult objects (only successful ones stored)
@@ -79,107 +125,186 @@ def store_embeddings_batch(
     if not successful_results:
         return 0
 
-    with get_connection() as conn:
-        with conn.cursor() as cur:
-            # Prepare rows for batch insert
-            rows = []
-            for result in successful_results:
-                if len(result.embedding) != EMBEDDING_DIMENSIONS:
-                    logger.warning(
-                        f"Skipping embedding for {result.conversation_id}: "
-                        f"expected {EMBEDDING_DIMENSIONS} dimensions, got {len(result.embedding)}"
-                    )
-                    continue
-
-                # Format embedding as pgvector array string
-                embedding_str = "[" + ",".join(str(x) for x in result.embedding) + "]"
-
-                rows.append(
-                    (
-                        result.conversation_id,
-                        embedding_str,
-                        pipeline_run_id,
-                        model_version,
-                    )
-                )
+    # Dedupe by conversation (last wins) - one upsert can't touch a row twice
+    by_conversation = {}
+    for result in successful_results:
+        if len(result.embedding) != EMBEDDING_DIMENSIONS:
+            logger.warning(
+                f"Skipping embedding for {result.conversation_id}: "
+                f"expected {EMBEDDING_DIMENSIONS} dimensions, got {len(result.embedding)}"
+            )
+            continue
+        by_conversation[result.conversation_id] = result.embedding
+
+    if not by_conversation:
+        return 0
 
-            if not rows:
-                return 0
+    # Binary COPY stream: conversation_id, embedding, pipeline_run_id, model_version
+    run_id = struct.pack(">i", pipeline_run_id) if pipeline_run_id is not None else None
+    model = model_version.encode("utf-8")
+    buffer = _copy_buffer(
+        (str(conversation_id).encode("utf-8"), encode_vector(embedding), run_id, model)
+        for conversation_id, embedding in by_conversation.items()
+    )
 
-            # Batch upsert
-            sql = """
+    with get_connection() as conn:
+        with conn.cursor() as cur:
+            # COPY can't upsert: stage into a temp table, then merge
+            cur.execute("""
+                CREATE TEMP TABLE conversation_embeddings_stage (
+                    conversation_id VARCHAR(255),
+                    embedding vector(1536),
+                    pipeline_run_id INTEGER,
+                    model_version VARCHAR(50)
+                ) ON COMMIT DROP
+            """)
+            cur.copy_expert(
+                """
+                COPY conversation_embeddings_stage (
+                    conversation_id, embedding, pipeline_run_id, model_version
+                ) FROM STDIN WITH (FORMAT binary)
+            """,
+                buffer,
+            )
+            cur.execute("""
                 INSERT INTO conversation_embeddings (
                     conversation_id, embedding, pipeline_run_id, model_version
-                ) VALUES %s
+                )
+                SELECT conversation_id, embedding, pipeline_run_id, model_version
+                FROM conversation_embeddings_stage
                 ON CONFLICT (conversation_id, pipeline_run_id) DO UPDATE SET
                     embedding = EXCLUDED.embedding,
                     model_version = EXCLUDED.model_version,
                     created_at = NOW()
-            """
-
-            # Custom template to cast embedding string to vector type
-            execute_values(
-                cur,
-                sql,
-                rows,
-                template="(%s, %s::vector, %s, %s)",
-            )
+            """)
             conn.commit()
 
-            logger.info(f"Stored {len(rows)} embeddings for run {pipeline_run_id}")
-            return len(rows)
+    logger.info(f"Stored {len(by_conversation)} embeddings for run {pipeline_run_id}")
+    return len(by_conversation)
 
 
-def get_embeddings_for_run(
+def load_embedding_matrix_for_run(
     pipeline_run_id: int,
-) -> List[dict]:
+    fetch_size: int = LOAD_FETCH_SIZE,
+) -> Tuple[List[str], np.ndarray]:
     """
-    Get all embeddings for a pipeline run.
+    Load all embeddings for a pipeline run as a contiguous float32 matrix.
+
+    Streams binary vectors (vector_send) through a server-side cursor, so
+    large runs never materialize the full result set or per-float objects.
 
     Args:
         pipeline_run_id: Pipeline run ID
+        fetch_size: Rows fetched per round-trip
 
     Returns:
-        List of dicts with conversation_id and embedding
+        (conversation_ids, matrix) where matrix[i] is the embedding of
+        conversation_ids[i], ordered by conversation_id. Matrix shape is
+        (n, dims), or (0, 0) if the run has no embeddings.
     """
+    conversation_ids: List[str] = []
+    blocks: List[np.ndarray] = []
+    dims: Optional[int] = None
+
     with get_connection() as conn:
-        with conn.cursor() as cur:
+        with conn.cursor(name=f"run_embeddings_{uuid.uuid4().hex}") as cur:
+            cur.itersize = fetch_size
             cur.execute(
                 """
-                SELECT conversation_id, embedding::text
+                SELECT conversation_id, vector_send(embedding)
                 FROM conversation_embeddings
                 WHERE pipeline_run_id = %s
                 ORDER BY conversation_id
             """,
                 (pipeline_run_id,),
             )
+            while True:
+                rows = cur.fetchmany(fetch_size)
+                if not rows:
+                    break
+
+                if dims is None:
+                    dims = _VECTOR_HEADER.unpack_from(rows[0][1])[0]
+                payloads = []
+                for conversation_id, data in rows:
+                    row_dims = _VECTOR_HEADER.unpack_from(data)[0]
+                    if row_dims != dims:
+                        logger.error(
+                            f"Skipping embedding for {conversation_id}: "
+                            f"expected {dims} dimensions, got {row_dims}"
+                        )
+                        continue
+                    conversation_ids.append(conversation_id)
+                    payloads.append(bytes(data)[_VECTOR_HEADER.size:])
+
+                block = np.frombuffer(b"".join(payloads), dtype=">f4")
+                blocks.append(block.reshape(len(payloads), dims).astype(np.float32))
+
+    if not conversation_ids:
+        return [], np.empty((0, 0), dtype=np.float32)
+
+    return conversation_ids, np.concatenate(blocks) if len(blocks) > 1 else blocks[0]
+
+
+def load_latest_embeddings(
+    conversation_ids: List[str],
+    model_version: str = "text-embedding-3-small",
+) -> Dict[str, np.ndarray]:
+    """
+    Load the most recent stored embedding of each conversation, across runs.
+
+    Args:
+        conversation_ids: Conversation IDs to look up
+        model_version: Embedding model the vectors must come from
+
+    Returns:
+        Dict of conversation_id -> float32 embedding for the conversations
+        that have one
+    """
+    if not conversation_ids:
+        return {}
+
+    with get_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                """
+                SELECT DISTINCT ON (conversation_id)
+                    conversation_id, vector_send(embedding)
+                FROM conversation_embeddings
+                WHERE conversation_id = ANY(%s)
+                  AND model_version = %s
+                ORDER BY conversation_id, created_at DESC
+            """,
+                (list(conversation_ids), model_version),
+            )
             rows = cur.fetchall()
 
-    results = []
-    for row in rows:
-        # Parse pgvector string back to list
-        embedding_str = row[1]
-        try:
-            if embedding_str.startswith("[") and embedding_str.endswith("]"):
-                embedding = [float(x) for x in embedding_str[1:-1].split(",")]
-            else:
-                logger.warning(
-                    f"Unexpected pgvector format for {row[0]}: "
-                    f"expected '[...]', got '{embedding_str[:50]}...'"
-                )
-                embedding = []
-        except (ValueError, AttributeError) as e:
-            logger.error(f"Failed to parse embedding for {row[0]}: {e}")
-            embedding = []
+    return {conversation_id: decode_vector(data) for conversation_id, data in rows}
+
 
-        results.append(
-            {
-                "conversation_id": row[0],
-                "embedding": embedding,
-            }
-        )
+def get_embeddings_for_run(
+    pipeline_run_id: int,
+) -> List[dict]:
+    """
+    Get all embeddings for a pipeline run.
 
-    return results
+    Prefer load_embedding_matrix_for_run for large runs; this wraps it for
+    callers that need plain lists.
+
+    Args:
+        pipeline_run_id: Pipeline run ID
+
+    Returns:
+        List of dicts with conversation_id and embedding
+    """
+    conversation_ids, matrix = load_embedding_matrix_for_run(pipeline_run_id)
+    return [
+        {
+            "conversation_id": conversation_id,
+            "embedding": row.tolist(),
+        }
+        for conversation_id, row in zip(conversation_ids, matrix)
+    ]
 
 
 def count_embeddings_for_run(pipeline_run_id: int) -> int:
@@ -204,3 +329,100 @@ def count_embeddings_for_run(pipeline_run_id: int) -> int:
             )
             result = cur.fetchone()
             return result[0] if result else 0
+
+
+def load_cached_embeddings(
+    content_hashes: List[str],
+    model_version: str,
+    dimensions: int,
+) -> Dict[str, List[float]]:
+    """
+    Look up cached embeddings by content hash in one query.
+
+    Args:
+        content_hashes: SHA-256 hashes of the prepared embedding texts
+        model_version: Embedding model the vectors must come from
+        dimensions: Vector dimensions the vectors must have
+
+    Returns:
+        Dict of content_hash -> embedding for the hashes that are cached
+    """
+    if not content_hashes:
+        return {}
+
+    with get_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                """
+                SELECT content_hash, vector_send(embedding)
+                FROM embedding_cache
+                WHERE model_version = %s
+                  AND dimensions = %s
+                  AND content_hash = ANY(%s)
+            """,
+                (model_version, dimensions, list(content_hashes)),
+            )
+            rows = cur.fetchall()
+
+    return {content_hash: decode_vector(data).tolist() for content_hash, data in rows}
+
+
+def store_cached_embeddings(
+    embeddings: Dict[str, List[float]],
+    model_version: str,
+    dimensions: int,
+) -> int:
+    """
+    Add embeddings to the content-addressed cache via binary COPY.
+
+    Existing entries are left untouched (same content, same model, same vector).
+
+    Args:
+        embeddings: Dict of content_hash -> embedding
+        model_version: Model used to generate the embeddings
+        dimensions: Vector dimensions
+
+    Returns:
+        Number of embeddings written
+    """
+    entries = {h: e for h, e in embeddings.items() if len(e) == dimensions}
+    if not entries:
+        return 0
+
+    model = model_version.encode("utf-8")
+    dims = struct.pack(">i", dimensions)
+    buffer = _copy_buffer(
+        (content_hash.encode("ascii"), model, dims, encode_vector(embedding))
+        for content_hash, embedding in entries.items()
+    )
+
+    with get_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute("""
+                CREATE TEMP TABLE embedding_cache_stage (
+                    content_hash CHAR(64),
+                    model_version VARCHAR(50),
+                    dimensions INTEGER,
+                    embedding vector
+                ) ON COMMIT DROP
+            """)
+            cur.copy_expert(
+                """
+                COPY embedding_cache_stage (
+                    content_hash, model_version, dimensions, embedding
+                ) FROM STDIN WITH (FORMAT binary)
+            """,
+                buffer,
+            )
+            cur.execute("""
+                INSERT INTO embedding_cache (
+                    content_hash, model_version, dimensions, embedding
+                )
+                SELECT content_hash, model_version, dimensions, embedding
+                FROM embedding_cache_stage
+                ON CONFLICT (content_hash, model_version, dimensions) DO NOTHING
+            """)
+            conn.commit()
+
+    logger.debug(f"Cached {len(entries)} embeddings")
+    return len(entries)
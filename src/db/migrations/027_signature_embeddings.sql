@@ -0,0 +1,26 @@
+-- Migration 027: Persisted signature embeddings for embedding-based canonicalization
+--
+-- ThemeExtractor.canonicalize_via_embedding previously re-embedded every
+-- existing theme_aggregates signature on every call (one OpenAI round-trip
+-- per row). Embeddings are now stored once per signature description and
+-- reused; nearest-neighbour lookup is a single vectorized NumPy operation.
+--
+-- Rows are keyed by description_hash, the SHA-256 of the text that was
+-- embedded ("<signature words>: <product_area> <component>"). When an
+-- aggregate's product_area or component changes its description hash
+-- changes too, so the new description is embedded on next use and the old
+-- row is simply no longer referenced.
+
+CREATE TABLE IF NOT EXISTS signature_embeddings (
+    description_hash CHAR(64) NOT NULL,
+    model_version VARCHAR(50) NOT NULL DEFAULT 'text-embedding-3-small',
+    issue_signature TEXT NOT NULL,     -- For observability; lookups use description_hash
+    embedding vector(1536) NOT NULL,
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+    PRIMARY KEY (description_hash, model_version)
+);
+
+CREATE INDEX IF NOT EXISTS idx_signature_embeddings_signature
+    ON signature_embeddings(issue_signature);
+
+COMMENT ON TABLE signature_embeddings IS 'Cached embeddings of theme signature descriptions for canonicalization (one row per signature description per model)';
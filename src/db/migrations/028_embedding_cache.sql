@@ -0,0 +1,31 @@
+-- Migration 028: Content-addressed conversation embedding cache
+--
+-- Embedding generation (#106) re-embedded every actionable conversation in
+-- every pipeline run, even when the same digest text had been embedded in an
+-- earlier run. Embeddings are now cached by the SHA-256 of the prepared text
+-- (the exact string sent to the embeddings API), scoped per model and
+-- dimensions, so reruns and backfills only pay for new text.
+--
+-- The cache is keyed by content, not conversation: two conversations with the
+-- same prepared text share a row, and a conversation whose digest changes gets
+-- a new row on next use. Rows are never updated in place.
+
+CREATE TABLE IF NOT EXISTS embedding_cache (
+    content_hash CHAR(64) NOT NULL,
+    model_version VARCHAR(50) NOT NULL,
+    dimensions INTEGER NOT NULL,
+    embedding vector NOT NULL,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+    PRIMARY KEY (content_hash, model_version, dimensions)
+);
+
+COMMENT ON TABLE embedding_cache IS 'Embeddings keyed by (SHA-256 of embedded text, model, dimensions), shared across pipeline runs';
+
+-- Stage summary: how many conversations were served from the cache
+ALTER TABLE pipeline_runs ADD COLUMN IF NOT EXISTS
+    embedding_cache_hits INTEGER DEFAULT 0;
+ALTER TABLE pipeline_runs ADD COLUMN IF NOT EXISTS
+    embedding_cache_misses INTEGER DEFAULT 0;
+
+COMMENT ON COLUMN pipeline_runs.embedding_cache_hits IS 'Conversations whose embedding was reused from embedding_cache';
+COMMENT ON COLUMN pipeline_runs.embedding_cache_misses IS 'Conversations whose embedding required an API call';
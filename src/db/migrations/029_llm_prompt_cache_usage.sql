@@ -0,0 +1,16 @@
+-- Migration 029: Per-stage LLM token usage for pipeline runs
+--
+-- Theme extraction prompts are now laid out so every request in a run starts
+-- with the same static block (product context, signature guidance, field
+-- spec), which the OpenAI API can serve from its prompt prefix cache. To make
+-- the effect visible, the theme phase records token usage per LLM stage,
+-- including the prompt tokens the provider reported as cached:
+--
+--   {"theme_extraction": {"calls": 120, "prompt_tokens": 1450000,
+--                         "cached_tokens": 1290000, "completion_tokens": 48000},
+--    "canonicalization": {...}}
+
+ALTER TABLE pipeline_runs ADD COLUMN IF NOT EXISTS
+    llm_usage JSONB DEFAULT '{}'::jsonb;
+
+COMMENT ON COLUMN pipeline_runs.llm_usage IS 'Token usage per LLM stage (calls, prompt_tokens, cached_tokens, completion_tokens)';
@@ -0,0 +1,19 @@
+-- Migration 030: Full-text index on research_embeddings for hybrid search
+--
+-- Vector-only search ranks exact feature names and error strings poorly
+-- ("Error 403", "SmartLoop"). UnifiedSearchService.search(mode="hybrid")
+-- runs a lexical candidate query against this column in parallel with the
+-- ANN query and fuses both rankings with reciprocal-rank fusion.
+--
+-- Title terms are weighted above body terms (A vs B) for ts_rank_cd.
+
+ALTER TABLE research_embeddings ADD COLUMN IF NOT EXISTS
+    content_tsv TSVECTOR GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', COALESCE(title, '')), 'A') ||
+        setweight(to_tsvector('english', COALESCE(content, '')), 'B')
+    ) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_research_embeddings_content_tsv
+    ON research_embeddings USING GIN (content_tsv);
+
+COMMENT ON COLUMN research_embeddings.content_tsv IS 'Weighted title/content tsvector for lexical candidates in hybrid search';
@@ -1,7 +1,7 @@
 """Pydantic models for database entities."""
 
 from datetime import datetime
-from typing import List, Literal, Optional
+from typing import Dict, List, Literal, Optional
 from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator
@@ -173,7 +173,7 @@ class PipelineRun(BaseModel):
     auto_create_stories: bool = False
 
     # Phase tracking
-    current_phase: str = "classification"  # classification, embedding_generation, facet_extraction, theme_extraction, pm_review, story_creation, completed
+    current_phase: str = "classification"  # classification, embedding_generation, facet_extraction, theme_extraction, overlapped_stages, pm_review, story_creation, completed
 
     # Results - Classification phase
     conversations_fetched: int = 0
@@ -184,6 +184,8 @@ class PipelineRun(BaseModel):
     # Results - Embedding generation phase (#106)
     embeddings_generated: int = 0
     embeddings_failed: int = 0
+    embedding_cache_hits: int = 0
+    embedding_cache_misses: int = 0
 
     # Results - Facet extraction phase (#107)
     facets_extracted: int = 0
@@ -193,6 +195,7 @@ class PipelineRun(BaseModel):
     themes_extracted: int = 0
     themes_new: int = 0
     themes_filtered: int = 0  # Themes rejected by quality gates (#104)
+    llm_usage: Dict[str, Dict[str, int]] = Field(default_factory=dict)  # Per LLM stage token usage
 
     # Results - Story creation phase
     stories_created: int = 0
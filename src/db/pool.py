@@ -0,0 +1,496 @@
+"""
+Process-wide PostgreSQL connection pool.
+
+Replaces the connect-per-call pattern in get_connection() and the FastAPI
+get_db dependencies. Every psycopg2.connect() pays a TCP + auth handshake;
+the pool keeps warm connections around and hands them out to both the
+pipeline (background threads) and API request handlers.
+
+Features:
+- Configurable min/max size (blocking checkout with timeout when exhausted)
+- Health check (SELECT 1) for connections idle longer than a threshold
+- Max-lifetime recycling so long-lived connections are periodically replaced
+- Idle trimming down to min_size
+- Checkout metrics: hits, misses, waits, wait time, timeouts
+
+Configuration (environment):
+    DB_POOL_ENABLED                 "false" disables pooling (connect per call)
+    DB_POOL_MIN_SIZE                Connections kept open when idle (default 1)
+    DB_POOL_MAX_SIZE                Maximum open connections (default 20)
+    DB_POOL_TIMEOUT                 Seconds to wait for a free connection (default 30)
+    DB_POOL_MAX_LIFETIME            Seconds before a connection is recycled (default 1800)
+    DB_POOL_MAX_IDLE                Seconds an idle connection above min_size is kept (default 300)
+    DB_POOL_HEALTH_CHECK_INTERVAL   Idle seconds after which checkout runs SELECT 1 (default 30)
+"""
+
+import logging
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from typing import Callable, Deque, Dict, Generator, Optional
+
+import psycopg2
+import psycopg2.extensions
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MIN_SIZE = 1
+DEFAULT_MAX_SIZE = 20
+DEFAULT_TIMEOUT = 30.0
+DEFAULT_MAX_LIFETIME = 1800.0
+DEFAULT_MAX_IDLE = 300.0
+DEFAULT_HEALTH_CHECK_INTERVAL = 30.0
+
+
+class PoolError(Exception):
+    """Raised when the pool cannot provide a connection."""
+    pass
+
+
+class PoolTimeout(PoolError):
+    """Raised when no connection became available within the timeout."""
+    pass
+
+
+@dataclass
+class PoolStats:
+    """Snapshot of pool state and checkout metrics."""
+
+    size: int = 0                    # Open connections (idle + in use)
+    idle: int = 0
+    in_use: int = 0
+    min_size: int = 0
+    max_size: int = 0
+    requests: int = 0                # Total checkouts requested
+    hits: int = 0                    # Checkouts served by a warm idle connection
+    misses: int = 0                  # Checkouts that opened a new connection
+    waits: int = 0                   # Checkouts that had to wait for a free slot
+    wait_time_ms: float = 0.0        # Cumulative time spent waiting
+    max_wait_ms: float = 0.0
+    timeouts: int = 0
+    recycled: int = 0                # Connections closed for exceeding max lifetime
+    health_check_failures: int = 0
+    discarded: int = 0               # Connections closed as broken/closed on return
+    trimmed: int = 0                 # Idle connections closed above min_size
+
+    @property
+    def hit_rate(self) -> float:
+        served = self.hits + self.misses
+        return self.hits / served if served else 0.0
+
+    def to_dict(self) -> dict:
+        data = asdict(self)
+        data["hit_rate"] = round(self.hit_rate, 4)
+        data["wait_time_ms"] = round(self.wait_time_ms, 2)
+        data["max_wait_ms"] = round(self.max_wait_ms, 2)
+        return data
+
+
+@dataclass
+class _PooledConnection:
+    conn: object
+    created_at: float
+    last_used: float
+
+
+class ConnectionPool:
+    """
+    Thread-safe psycopg2 connection pool.
+
+    Connections are returned to the pool in a clean state: any open
+    transaction is rolled back, cursor_factory and autocommit are reset.
+    Broken or closed connections are discarded rather than reused.
+    """
+
+    def __init__(
+        self,
+        dsn: str,
+        min_size: int = DEFAULT_MIN_SIZE,
+        max_size: int = DEFAULT_MAX_SIZE,
+        timeout: float = DEFAULT_TIMEOUT,
+        max_lifetime: float = DEFAULT_MAX_LIFETIME,
+        max_idle: float = DEFAULT_MAX_IDLE,
+        health_check_interval: float = DEFAULT_HEALTH_CHECK_INTERVAL,
+        connect: Optional[Callable[[str], object]] = None,
+    ):
+        """
+        Initialize the pool. No connections are opened until first use
+        (or an explicit warm()).
+
+        Args:
+            dsn: PostgreSQL connection string
+            min_size: Connections kept open when idle
+            max_size: Maximum number of open connections
+            timeout: Seconds to wait for a connection before PoolTimeout
+            max_lifetime: Seconds after which a connection is recycled (0 = never)
+            max_idle: Seconds an idle connection above min_size is kept (0 = forever)
+            health_check_interval: Idle seconds after which checkout validates
+                the connection with SELECT 1 (0 = always check)
+            connect: Connection factory (defaults to psycopg2.connect)
+        """
+        if max_size < 1:
+            raise ValueError("max_size must be >= 1")
+        if min_size < 0 or min_size > max_size:
+            raise ValueError("min_size must be between 0 and max_size")
+
+        self.dsn = dsn
+        self.min_size = min_size
+        self.max_size = max_size
+        self.timeout = timeout
+        self.max_lifetime = max_lifetime
+        self.max_idle = max_idle
+        self.health_check_interval = health_check_interval
+        self._connect = connect or psycopg2.connect
+
+        self._cond = threading.Condition()
+        self._idle: Deque[_PooledConnection] = deque()
+        self._in_use: Dict[int, _PooledConnection] = {}
+        self._size = 0  # Open + reserved (being opened) connections
+        self._closed = False
+        self._stats = PoolStats(min_size=min_size, max_size=max_size)
+
+    # ------------------------------------------------------------------
+    # Checkout / return
+    # ------------------------------------------------------------------
+
+    def getconn(self, timeout: Optional[float] = None) -> object:
+        """
+        Check out a connection, blocking up to `timeout` seconds if the
+        pool is exhausted.
+
+        Raises:
+            PoolTimeout: No connection became available in time
+            PoolError: The pool has been closed
+        """
+        timeout = self.timeout if timeout is None else timeout
+        start = time.monotonic()
+        deadline = start + timeout
+        waited = False
+        entry: Optional[_PooledConnection] = None
+
+        with self._cond:
+            self._stats.requests += 1
+            while True:
+                if self._closed:
+                    raise PoolError("Connection pool is closed")
+                if self._idle:
+                    # LIFO keeps the warmest connections in rotation and lets
+                    # the rest age out via idle trimming
+                    entry = self._idle.pop()
+                    break
+                if self._size < self.max_size:
+                    self._size += 1  # Reserve a slot; connect outside the lock
+                    break
+                waited = True
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self._stats.timeouts += 1
+                    raise PoolTimeout(
+                        f"No database connection available within {timeout:.1f}s "
+                        f"(max_size={self.max_size})"
+                    )
+                self._cond.wait(remaining)
+
+            if waited:
+                wait_ms = (time.monotonic() - start) * 1000
+                self._stats.waits += 1
+                self._stats.wait_time_ms += wait_ms
+                self._stats.max_wait_ms = max(self._stats.max_wait_ms, wait_ms)
+
+        if entry is not None and not self._is_usable(entry):
+            self._close_quietly(entry.conn)
+            entry = None  # Slot stays reserved; replace with a fresh connection
+
+        if entry is None:
+            try:
+                conn = self._connect(self.dsn)
+            except Exception:
+                with self._cond:
+                    self._size -= 1
+                    self._cond.notify()
+                raise
+            now = time.monotonic()
+            entry = _PooledConnection(conn=conn, created_at=now, last_used=now)
+            hit = False
+        else:
+            hit = True
+
+        with self._cond:
+            if hit:
+                self._stats.hits += 1
+            else:
+                self._stats.misses += 1
+            self._in_use[id(entry.conn)] = entry
+        return entry.conn
+
+    def putconn(self, conn: object, discard: bool = False) -> None:
+        """
+        Return a connection to the pool.
+
+        The connection is reset (rollback of any open transaction, default
+        cursor_factory, autocommit off). Connections that are closed, broken,
+        past max_lifetime, or explicitly discarded are closed instead.
+        """
+        with self._cond:
+            entry = self._in_use.pop(id(conn), None)
+        if entry is None:
+            # Not ours (or returned twice); close it rather than leak it
+            self._close_quietly(conn)
+            return
+
+        now = time.monotonic()
+        reason = None
+        if discard:
+            reason = "discarded"
+        elif self._is_closed(conn):
+            reason = "discarded"
+        elif self.max_lifetime and now - entry.created_at >= self.max_lifetime:
+            reason = "recycled"
+        else:
+            try:
+                self._reset(conn)
+            except Exception as e:
+                logger.debug(f"Discarding pooled connection after failed reset: {e}")
+                reason = "discarded"
+
+        to_close = []
+        with self._cond:
+            if reason or self._closed:
+                self._size -= 1
+                if reason == "recycled":
+                    self._stats.recycled += 1
+                elif reason == "discarded":
+                    self._stats.discarded += 1
+                to_close.append(conn)
+            else:
+                entry.last_used = now
+                self._idle.append(entry)
+            to_close.extend(self._trim_idle_locked(now))
+            self._cond.notify()
+
+        for c in to_close:
+            self._close_quietly(c)
+
+    @contextmanager
+    def connection(self, timeout: Optional[float] = None) -> Generator:
+        """Context manager that checks out a connection and always returns it."""
+        conn = self.getconn(timeout=timeout)
+        try:
+            yield conn
+        finally:
+            self.putconn(conn)
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def warm(self) -> int:
+        """
+        Open connections until min_size are idle. Returns the number opened.
+
+        Errors are propagated so callers can decide whether a cold pool is fatal.
+        """
+        opened = 0
+        while True:
+            with self._cond:
+                if self._closed or self._size >= self.min_size:
+                    return opened
+                self._size += 1
+            try:
+                conn = self._connect(self.dsn)
+            except Exception:
+                with self._cond:
+                    self._size -= 1
+                    self._cond.notify()
+                raise
+            now = time.monotonic()
+            with self._cond:
+                self._idle.append(_PooledConnection(conn=conn, created_at=now, last_used=now))
+                self._cond.notify()
+            opened += 1
+
+    def close(self) -> None:
+        """Close all idle connections and refuse further checkouts.
+
+        Connections currently checked out are closed when returned.
+        """
+        with self._cond:
+            self._closed = True
+            idle = list(self._idle)
+            self._idle.clear()
+            self._size -= len(idle)
+            self._cond.notify_all()
+        for entry in idle:
+            self._close_quietly(entry.conn)
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def stats(self) -> PoolStats:
+        """Return a snapshot of pool state and metrics."""
+        with self._cond:
+            snapshot = PoolStats(**asdict(self._stats))
+            snapshot.idle = len(self._idle)
+            snapshot.in_use = len(self._in_use)
+            snapshot.size = self._size
+        return snapshot
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _is_usable(self, entry: _PooledConnection) -> bool:
+        """Validate an idle connection before handing it out."""
+        now = time.monotonic()
+        if self._is_closed(entry.conn):
+            with self._cond:
+                self._stats.discarded += 1
+            return False
+        if self.max_lifetime and now - entry.created_at >= self.max_lifetime:
+            with self._cond:
+                self._stats.recycled += 1
+            return False
+        if now - entry.last_used >= self.health_check_interval:
+            try:
+                with entry.conn.cursor() as cur:
+                    cur.execute("SELECT 1")
+                    cur.fetchone()
+                entry.conn.rollback()
+            except Exception as e:
+                logger.info(f"Pooled connection failed health check, reconnecting: {e}")
+                with self._cond:
+                    self._stats.health_check_failures += 1
+                return False
+        return True
+
+    def _trim_idle_locked(self, now: float) -> list:
+        """Pop idle connections above min_size that exceeded max_idle. Caller holds lock."""
+        if not self.max_idle:
+            return []
+        trimmed = []
+        # Oldest idle connections sit at the left of the deque
+        while (
+            self._idle
+            and self._size > self.min_size
+            and now - self._idle[0].last_used >= self.max_idle
+        ):
+            trimmed.append(self._idle.popleft().conn)
+            self._size -= 1
+            self._stats.trimmed += 1
+        return trimmed
+
+    @staticmethod
+    def _is_closed(conn: object) -> bool:
+        closed = getattr(conn, "closed", 1)
+        return not isinstance(closed, int) or closed != 0
+
+    @staticmethod
+    def _reset(conn: object) -> None:
+        """Return a connection to its pristine state."""
+        status = conn.info.transaction_status
+        if status == psycopg2.extensions.TRANSACTION_STATUS_UNKNOWN:
+            raise PoolError("connection in unknown transaction state")
+        if status != psycopg2.extensions.TRANSACTION_STATUS_IDLE:
+            conn.rollback()
+        if conn.autocommit:
+            conn.autocommit = False
+        conn.cursor_factory = psycopg2.extensions.cursor
+
+    @staticmethod
+    def _close_quietly(conn: object) -> None:
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+
+# ----------------------------------------------------------------------
+# Process-wide pool
+# ----------------------------------------------------------------------
+
+_pool: Optional[ConnectionPool] = None
+_pool_pid: Optional[int] = None
+_pool_lock = threading.Lock()
+
+
+def _env_int(name: str, default: int, minimum: int, maximum: int) -> int:
+    try:
+        value = int(os.getenv(name, str(default)))
+    except ValueError:
+        logger.warning(f"Invalid {name}, using default {default}")
+        value = default
+    return max(minimum, min(maximum, value))
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        value = float(os.getenv(name, str(default)))
+    except ValueError:
+        logger.warning(f"Invalid {name}, using default {default}")
+        value = default
+    return max(0.0, value)
+
+
+def is_pool_enabled() -> bool:
+    """Pooling is on unless DB_POOL_ENABLED is explicitly false."""
+    return os.getenv("DB_POOL_ENABLED", "true").lower() not in ("false", "0", "no")
+
+
+def get_pool() -> ConnectionPool:
+    """
+    Return the process-wide pool, creating it on first use.
+
+    The pool is re-created after fork() so child processes never share
+    sockets with their parent.
+    """
+    global _pool, _pool_pid
+
+    pid = os.getpid()
+    if _pool is not None and _pool_pid == pid and not _pool.closed:
+        return _pool
+
+    with _pool_lock:
+        if _pool is not None and _pool_pid == pid and not _pool.closed:
+            return _pool
+
+        from .connection import get_connection_string
+
+        max_size = _env_int("DB_POOL_MAX_SIZE", DEFAULT_MAX_SIZE, 1, 200)
+        _pool = ConnectionPool(
+            get_connection_string(),
+            min_size=_env_int("DB_POOL_MIN_SIZE", DEFAULT_MIN_SIZE, 0, max_size),
+            max_size=max_size,
+            timeout=_env_float("DB_POOL_TIMEOUT", DEFAULT_TIMEOUT),
+            max_lifetime=_env_float("DB_POOL_MAX_LIFETIME", DEFAULT_MAX_LIFETIME),
+            max_idle=_env_float("DB_POOL_MAX_IDLE", DEFAULT_MAX_IDLE),
+            health_check_interval=_env_float(
+                "DB_POOL_HEALTH_CHECK_INTERVAL", DEFAULT_HEALTH_CHECK_INTERVAL
+            ),
+        )
+        _pool_pid = pid
+        logger.info(
+            f"Database connection pool created "
+            f"(min={_pool.min_size}, max={_pool.max_size})"
+        )
+        return _pool
+
+
+def close_pool() -> None:
+    """Close the process-wide pool (e.g. on API shutdown)."""
+    global _pool, _pool_pid
+    with _pool_lock:
+        if _pool is not None and _pool_pid == os.getpid():
+            _pool.close()
+        _pool = None
+        _pool_pid = None
+
+
+def get_pool_stats() -> Optional[dict]:
+    """Metrics for the process-wide pool, or None if pooling is off or unused."""
+    if not is_pool_enabled() or _pool is None or _pool_pid != os.getpid():
+        return None
+    return _pool.stats().to_dict()
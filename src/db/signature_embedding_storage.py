@@ -0,0 +1,106 @@
+"""
+Database storage for theme signature embeddings.
+
+Stores embeddings in the signature_embeddings table (migration 027) so
+embedding-based canonicalization only embeds a signature description once.
+Rows are keyed by the SHA-256 of the embedded description text.
+"""
+
+import logging
+from typing import Dict, List, Tuple
+
+from psycopg2.extras import execute_values
+
+try:
+    from .connection import get_connection
+except ImportError:
+    from db.connection import get_connection
+
+logger = logging.getLogger(__name__)
+
+
+def load_signature_embeddings(
+    description_hashes: List[str],
+    model_version: str,
+) -> Dict[str, List[float]]:
+    """
+    Load stored embeddings for the given description hashes in one query.
+
+    Args:
+        description_hashes: SHA-256 hashes of signature descriptions
+        model_version: Embedding model the vectors must come from
+
+    Returns:
+        Dict of description_hash -> embedding
+    """
+    if not description_hashes:
+        return {}
+
+    with get_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                """
+                SELECT description_hash, embedding::text
+                FROM signature_embeddings
+                WHERE model_version = %s
+                  AND description_hash = ANY(%s)
+            """,
+                (model_version, list(description_hashes)),
+            )
+            rows = cur.fetchall()
+
+    results = {}
+    for description_hash, embedding_str in rows:
+        try:
+            results[description_hash] = [float(x) for x in embedding_str[1:-1].split(",")]
+        except (ValueError, TypeError) as e:
+            logger.warning(f"Skipping unparseable signature embedding {description_hash}: {e}")
+    return results
+
+
+def store_signature_embeddings(
+    rows: List[Tuple[str, str, List[float]]],
+    model_version: str,
+) -> int:
+    """
+    Upsert signature embeddings in a single batch.
+
+    Args:
+        rows: List of (description_hash, signature, embedding) tuples
+        model_version: Embedding model used
+
+    Returns:
+        Number of rows written
+    """
+    if not rows:
+        return 0
+
+    values = [
+        (
+            description_hash,
+            model_version,
+            signature,
+            "[" + ",".join(str(x) for x in embedding) + "]",
+        )
+        for description_hash, signature, embedding in rows
+    ]
+
+    with get_connection() as conn:
+        with conn.cursor() as cur:
+            execute_values(
+                cur,
+                """
+                INSERT INTO signature_embeddings (
+                    description_hash, model_version, issue_signature, embedding
+                ) VALUES %s
+                ON CONFLICT (description_hash, model_version) DO UPDATE SET
+                    issue_signature = EXCLUDED.issue_signature,
+                    embedding = EXCLUDED.embedding,
+                    updated_at = NOW()
+            """,
+                values,
+                template="(%s, %s, %s, %s::vector)",
+            )
+
+    logger.debug(f"Stored {len(values)} signature embeddings")
+    return len(values)
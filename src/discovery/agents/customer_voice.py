@@ -5,7 +5,8 @@ NOT through predefined categories, NOT using the existing theme vocabulary.
 The artifact contracts validate output structure, not the agent's cognitive process.
 
 Two-pass LLM strategy:
-  1. Per-batch analysis: open-ended pattern recognition (~20 conversations per batch)
+  1. Per-batch analysis: open-ended pattern recognition (~20 conversations per batch),
+     with up to batch_concurrency batches in flight at once
   2. Synthesis pass: dedup and cross-reference findings across batches
 
 Per Issue #215: This is the primary capability thesis test. If this agent can't
@@ -17,6 +18,7 @@ import json
 import logging
 import os
 import re
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
@@ -53,6 +55,8 @@ class ExplorerConfig:
     model: str = "gpt-4o-mini"
     temperature: float = 0.7
     max_chars_per_conversation: int = 2000
+    batch_concurrency: int = 4  # batch analysis calls in flight at once
+    max_total_tokens: Optional[int] = None  # stop dispatching batches past this
 
 
 class CustomerVoiceExplorer:
@@ -81,7 +85,8 @@ class CustomerVoiceExplorer:
 
         Per-batch errors are caught and recorded (batch skipped, conversations
         counted as conversations_skipped), so one LLM failure doesn't abort
-        the whole run.
+        the whole run. Batches that are never dispatched because
+        max_total_tokens was reached are recorded the same way.
 
         Returns an ExplorerResult with findings and coverage metadata.
         """
@@ -113,26 +118,21 @@ class CustomerVoiceExplorer:
             for i in range(0, len(conversations), self.config.batch_size)
         ]
 
+        total_usage = {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0}
+        outcomes = self._analyze_batches(batches, total_usage)
+
+        # Reassemble in batch order so batch_index in the synthesis prompt is stable
         all_batch_findings: List[List[Dict[str, Any]]] = []
         reviewed_count = 0
         skipped_count = 0
-        total_usage = {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0}
         batch_errors = []
-
-        for batch_idx, batch in enumerate(batches):
-            try:
-                findings, usage = self._analyze_batch(batch, batch_idx)
+        for batch_idx, (batch, (findings, error)) in enumerate(zip(batches, outcomes)):
+            if error is None:
                 all_batch_findings.append(findings)
                 reviewed_count += len(batch)
-                for key in total_usage:
-                    total_usage[key] += usage.get(key, 0)
-            except Exception as e:
-                logger.warning(
-                    "Batch %d failed (%d conversations skipped): %s",
-                    batch_idx, len(batch), e,
-                )
+            else:
                 skipped_count += len(batch)
-                batch_errors.append(f"Batch {batch_idx}: {e}")
+                batch_errors.append(f"Batch {batch_idx}: {error}")
 
         # Synthesis pass
         if all_batch_findings:
@@ -264,6 +264,81 @@ class CustomerVoiceExplorer:
     # Internal methods
     # ========================================================================
 
+    def _analyze_batches(
+        self,
+        batches: List[List[RawConversation]],
+        total_usage: Dict[str, int],
+    ) -> List[tuple]:
+        """Run _analyze_batch over all batches with bounded concurrency.
+
+        At most batch_concurrency calls are in flight. Usage is added to
+        total_usage on this thread as each call completes, and no new batch
+        is dispatched once total_tokens reaches max_total_tokens (calls
+        already in flight still finish and are counted).
+
+        Returns one (findings, error) tuple per batch, in batch order.
+        error is None on success.
+        """
+        outcomes: List[Optional[tuple]] = [None] * len(batches)
+        budget = self.config.max_total_tokens
+
+        def budget_exhausted() -> bool:
+            return budget is not None and total_usage["total_tokens"] >= budget
+
+        def record(batch_idx: int, run) -> None:
+            try:
+                findings, usage = run()
+            except Exception as e:
+                logger.warning(
+                    "Batch %d failed (%d conversations skipped): %s",
+                    batch_idx, len(batches[batch_idx]), e,
+                )
+                outcomes[batch_idx] = ([], e)
+                return
+            for key in total_usage:
+                total_usage[key] += usage.get(key, 0)
+            outcomes[batch_idx] = (findings, None)
+
+        max_workers = min(max(1, self.config.batch_concurrency), len(batches))
+        next_idx = 0
+
+        if max_workers == 1:
+            while next_idx < len(batches) and not budget_exhausted():
+                batch_idx = next_idx
+                record(batch_idx, lambda: self._analyze_batch(batches[batch_idx], batch_idx))
+                next_idx += 1
+        else:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                in_flight = {}
+                while True:
+                    while (
+                        next_idx < len(batches)
+                        and len(in_flight) < max_workers
+                        and not budget_exhausted()
+                    ):
+                        future = executor.submit(
+                            self._analyze_batch, batches[next_idx], next_idx
+                        )
+                        in_flight[future] = next_idx
+                        next_idx += 1
+                    if not in_flight:
+                        break
+                    done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        record(in_flight.pop(future), future.result)
+
+        if next_idx < len(batches):
+            logger.warning(
+                "Token budget of %d reached after %d tokens; %d of %d batches not analyzed",
+                budget, total_usage["total_tokens"], len(batches) - next_idx, len(batches),
+            )
+            for batch_idx in range(next_idx, len(batches)):
+                outcomes[batch_idx] = (
+                    [], f"skipped, token budget of {budget} exhausted"
+                )
+
+        return outcomes
+
     def _analyze_batch(
         self,
         batch: List[RawConversation],
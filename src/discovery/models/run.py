@@ -82,6 +82,13 @@ class RunConfig(BaseModel):
         default=True,
         description="Auto-pull target repo to latest default branch before exploration",
     )
+    explorer_timeout_seconds: float = Field(
+        default=900.0,
+        gt=0,
+        description="Time limit for each Stage 0 explorer (they run concurrently). "
+        "Explorers that fail or time out are left out of the merge; the stage "
+        "fails only if every explorer does.",
+    )
 
 
 class AgentInvocation(BaseModel):
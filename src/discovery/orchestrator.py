@@ -10,11 +10,14 @@ import json
 import logging
 import os
 import traceback
+from concurrent.futures import ThreadPoolExecutor, wait
+from contextlib import contextmanager, nullcontext
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, ContextManager, Dict, List, Optional, Tuple
 from uuid import UUID
 
+from src.db.connection import get_connection
 from src.discovery.agents.analytics_explorer import AnalyticsExplorer
 from src.discovery.agents.codebase_data_access import CodebaseReader
 from src.discovery.agents.codebase_explorer import CodebaseExplorer
@@ -152,7 +155,13 @@ class DiscoveryOrchestrator:
         convo_id: str,
         run_config: RunConfig,
     ):
-        """Stage 0: Run all 4 explorers, merge results, submit checkpoint."""
+        """Stage 0: Run all 4 explorers concurrently, merge results, submit checkpoint.
+
+        Explorers are independent, so the stage takes as long as the slowest
+        one (bounded by run_config.explorer_timeout_seconds). Explorers that
+        fail or time out are recorded as failed invocations and left out of
+        the merge; the stage fails only if none of them succeeds.
+        """
         # Determine target repo for codebase/research exploration
         target_repo = run_config.target_repo_path or self.repo_root
         scope_dirs = run_config.scope_dirs or ["src/"]
@@ -193,70 +202,141 @@ class DiscoveryOrchestrator:
                     sync_result.repo_path,
                 )
 
-        conversation_reader = ConversationReader(self.db)
         codebase_reader = CodebaseReader(target_repo, scope_dirs=scope_dirs)
         research_reader = ResearchReader(
             doc_paths=doc_paths, repo_root=target_repo
         )
         posthog_reader = PostHogReader(**self.posthog_data)
 
+        @contextmanager
+        def customer_voice_explorer():
+            # Own pooled connection, held until the explorer thread finishes:
+            # a timed-out explorer keeps running in the background and must
+            # never touch self.db or the orchestrator's open transaction.
+            with get_connection() as conn:
+                yield CustomerVoiceExplorer(
+                    reader=ConversationReader(conn), openai_client=self.client
+                )
+
+        analytics_explorer = AnalyticsExplorer(
+            reader=posthog_reader, openai_client=self.client
+        )
+        codebase_explorer = CodebaseExplorer(
+            reader=codebase_reader, openai_client=self.client
+        )
+        research_explorer = ResearchExplorer(
+            reader=research_reader, openai_client=self.client
+        )
+
         explorers = [
-            (
-                "customer_voice",
-                CustomerVoiceExplorer(
-                    reader=conversation_reader, openai_client=self.client
-                ),
-            ),
-            (
-                "analytics",
-                AnalyticsExplorer(
-                    reader=posthog_reader, openai_client=self.client
-                ),
-            ),
-            (
-                "codebase",
-                CodebaseExplorer(
-                    reader=codebase_reader, openai_client=self.client
-                ),
-            ),
-            (
-                "research",
-                ResearchExplorer(
-                    reader=research_reader, openai_client=self.client
-                ),
-            ),
+            ("customer_voice", customer_voice_explorer),
+            ("analytics", lambda: nullcontext(analytics_explorer)),
+            ("codebase", lambda: nullcontext(codebase_explorer)),
+            ("research", lambda: nullcontext(research_explorer)),
         ]
 
         stage_exec = self.storage.get_active_stage(run_id)
         agent_names = []
 
         checkpoints = []
-        for name, explorer in explorers:
-            logger.info("Run %s: running %s explorer", run_id, name)
-            started_at = datetime.now(timezone.utc)
-            result = explorer.explore()
-            checkpoint = explorer.build_checkpoint_artifacts(result)
+        failures = []
+        outcomes = self._run_explorers(
+            run_id, explorers, run_config.explorer_timeout_seconds
+        )
+        for name, started_at, result, checkpoint, error in outcomes:
+            if error is not None:
+                failures.append(f"{name}: {error}")
+                self._record_invocation(
+                    run_id, stage_exec.id, name, {}, started_at,
+                    status=AgentStatus.FAILED, error=str(error),
+                )
+                continue
             checkpoints.append(checkpoint)
             agent_names.append(name)
             self._record_invocation(
                 run_id, stage_exec.id, name, result.token_usage, started_at
             )
 
+        if not checkpoints:
+            raise RuntimeError(f"All explorers failed: {'; '.join(failures)}")
+
         merged = merge_explorer_results(checkpoints)
 
         self.storage.update_participating_agents(stage_exec.id, agent_names)
 
         logger.info(
-            "Run %s: exploration complete — %d findings from %d explorers",
+            "Run %s: exploration complete — %d findings from %d explorers "
+            "(%d failed)",
             run_id,
             len(merged.get("findings", [])),
             len(checkpoints),
+            len(failures),
         )
 
         return self.service.submit_checkpoint(
             convo_id, run_id, "merged", artifacts=merged
         )
 
+    def _run_explorers(
+        self,
+        run_id: UUID,
+        explorers: List[Tuple[str, Callable[[], ContextManager[Any]]]],
+        timeout_seconds: float,
+    ) -> List[Tuple[str, datetime, Any, Optional[Dict[str, Any]], Optional[Exception]]]:
+        """Run explorers on worker threads and wait for all of them or the timeout.
+
+        Args:
+            explorers: (name, open_explorer) pairs. open_explorer() returns a
+                context manager yielding the explorer; it is entered on the
+                worker thread and exited when that explorer finishes, so any
+                resources it holds (e.g. a DB connection) live as long as the
+                explorer does, even past the timeout.
+
+        Returns:
+            One (name, started_at, result, checkpoint, error) per explorer, in
+            input order. error is set (and result/checkpoint are None) when the
+            explorer raised or did not finish in time. Timed-out explorers
+            cannot be interrupted; their threads finish in the background and
+            their results are discarded.
+        """
+
+        def explore(name, open_explorer):
+            logger.info("Run %s: running %s explorer", run_id, name)
+            with open_explorer() as explorer:
+                result = explorer.explore()
+                return result, explorer.build_checkpoint_artifacts(result)
+
+        started_at = datetime.now(timezone.utc)
+        executor = ThreadPoolExecutor(
+            max_workers=len(explorers), thread_name_prefix="explorer"
+        )
+        try:
+            futures = [
+                executor.submit(explore, name, open_explorer)
+                for name, open_explorer in explorers
+            ]
+            wait(futures, timeout=timeout_seconds)
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        outcomes = []
+        for (name, _), future in zip(explorers, futures):
+            if not future.done():
+                error = TimeoutError(
+                    f"{name} explorer did not finish within {timeout_seconds:g}s"
+                )
+            else:
+                error = future.exception()
+            if error is not None:
+                logger.warning(
+                    "Run %s: %s explorer failed: %s", run_id, name, error
+                )
+                outcomes.append((name, started_at, None, None, error))
+            else:
+                result, checkpoint = future.result()
+                outcomes.append((name, started_at, result, checkpoint, None))
+        return outcomes
+
     def _run_opportunity_framing(self, run_id: UUID, convo_id: str):
         """Stage 1: OpportunityPM synthesizes explorer findings into briefs."""
         pm = OpportunityPM(openai_client=self.client)
@@ -1063,14 +1143,17 @@ class DiscoveryOrchestrator:
         agent_name: str,
         token_usage: Dict[str, int],
         started_at: datetime,
+        status: AgentStatus = AgentStatus.COMPLETED,
+        error: Optional[str] = None,
     ) -> None:
-        """Record a completed agent invocation to the database."""
+        """Record a finished (completed or failed) agent invocation to the database."""
         completed_at = datetime.now(timezone.utc)
         invocation = AgentInvocation(
             stage_execution_id=stage_execution_id,
             run_id=run_id,
             agent_name=agent_name,
-            status=AgentStatus.COMPLETED,
+            status=status,
+            error=error,
             token_usage=TokenUsage(
                 prompt_tokens=token_usage.get("prompt_tokens", 0),
                 completion_tokens=token_usage.get("completion_tokens", 0),
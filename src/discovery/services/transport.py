@@ -10,8 +10,10 @@ import logging
 import os
 import random
 import string
+import threading
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Protocol
+from typing import Any, Dict, List, Optional, Protocol, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -112,6 +114,26 @@ class InMemoryTransport:
         return cid
 
 
+# Bytes just before the indexed offset kept to detect in-place rewrites
+_TAIL_CHECK_BYTES = 64
+
+
+@dataclass
+class _TurnIndex:
+    """Parsed prefix of one conversation file.
+
+    turns holds every complete line up to offset, positions maps a turn id to
+    its first index in turns, and identity/tail let the next read check that
+    the prefix is still the same bytes before parsing only what was appended.
+    """
+
+    identity: Tuple[int, int]
+    offset: int = 0
+    tail: bytes = b""
+    turns: List[Dict[str, Any]] = field(default_factory=list)
+    positions: Dict[str, int] = field(default_factory=dict)
+
+
 class AgenterminalTransport:
     """Agenterminal-backed conversation transport.
 
@@ -122,12 +144,19 @@ class AgenterminalTransport:
     Does NOT depend on MCP — directly reads/writes the NDJSON files for
     use from Python services. MCP is for Claude Code agents; this is for
     the orchestration layer.
+
+    read_turns keeps a per-conversation index of the parsed file, so each
+    call parses only lines appended since the previous one and since_id is
+    a dict lookup. The index is rebuilt from scratch when the file is
+    replaced, truncated or rewritten (e.g. by the Agenterminal UI).
     """
 
     def __init__(self, conversations_dir: Optional[str] = None):
         self.conversations_dir = conversations_dir or os.path.join(
             os.path.expanduser("~"), ".agenterminal", "conversations"
         )
+        self._indexes: Dict[str, _TurnIndex] = {}
+        self._lock = threading.Lock()
 
     def _file_path(self, conversation_id: str) -> str:
         safe_id = "".join(c for c in conversation_id if c.isalnum() or c in "_-")
@@ -171,31 +200,95 @@ class AgenterminalTransport:
         since_id: Optional[str] = None,
     ) -> List[Dict[str, Any]]:
         path = self._file_path(conversation_id)
-        if not os.path.exists(path):
+        try:
+            f = open(path, "rb")
+        except FileNotFoundError:
+            with self._lock:
+                self._indexes.pop(path, None)
             return []
 
-        turns = []
-        with open(path, "r") as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    turns.append(json.loads(line))
-                except json.JSONDecodeError:
-                    continue
+        with f, self._lock:
+            index, pending = self._refresh_index(path, f)
+            turns = index.turns
 
-        if since_id:
             start_idx = 0
-            for i, turn in enumerate(turns):
-                if turn.get("id") == since_id:
-                    start_idx = i + 1
-                    break
-            turns = turns[start_idx:]
-
-        return turns
+            if since_id:
+                if since_id in index.positions:
+                    start_idx = index.positions[since_id] + 1
+                else:
+                    for i, turn in enumerate(pending):
+                        if turn.get("id") == since_id:
+                            start_idx = len(turns) + i + 1
+                            break
+
+            # Copies, so callers can't mutate the cached turns
+            result = [dict(turn) for turn in turns[start_idx:]]
+            result.extend(dict(turn) for turn in pending[max(0, start_idx - len(turns)):])
+            return result
+
+    def _refresh_index(self, path: str, f) -> Tuple[_TurnIndex, List[Dict[str, Any]]]:
+        """Bring the cached index for path up to date with the open file.
+
+        Returns (index, pending) where pending holds turns parsed from a
+        trailing line without a newline yet. They are returned to the caller
+        but not indexed, since the writer may still be appending to it.
+        """
+        st = os.fstat(f.fileno())
+        identity = (st.st_dev, st.st_ino)
+        index = self._indexes.get(path)
+
+        if index is not None and (
+            index.identity != identity
+            or st.st_size < index.offset
+            or not self._tail_matches(f, index)
+        ):
+            logger.debug("Conversation file %s changed underneath index, rebuilding", path)
+            index = None
+        if index is None:
+            index = _TurnIndex(identity=identity)
+            self._indexes[path] = index
+
+        f.seek(index.offset)
+        data = f.read()
+        complete_end = data.rfind(b"\n") + 1
+
+        for raw_line in data[:complete_end].split(b"\n"):
+            turn = _parse_line(raw_line)
+            if turn is None:
+                continue
+            turn_id = turn.get("id")
+            if isinstance(turn_id, str) and turn_id not in index.positions:
+                index.positions[turn_id] = len(index.turns)
+            index.turns.append(turn)
+
+        if complete_end:
+            index.offset += complete_end
+            consumed_tail = index.tail + data[:complete_end]
+            index.tail = consumed_tail[-_TAIL_CHECK_BYTES:]
+
+        trailing = _parse_line(data[complete_end:])
+        return index, [trailing] if trailing is not None else []
+
+    @staticmethod
+    def _tail_matches(f, index: _TurnIndex) -> bool:
+        if not index.tail:
+            return True
+        f.seek(index.offset - len(index.tail))
+        return f.read(len(index.tail)) == index.tail
 
     def generate_conversation_id(self) -> str:
         """Generate a 7-char alphanumeric ID matching Agenterminal convention."""
         chars = string.ascii_uppercase + string.digits
         return "".join(random.choices(chars, k=7))
+
+
+def _parse_line(raw_line: bytes) -> Optional[Dict[str, Any]]:
+    """Parse one NDJSON line. Blank, undecodable or non-object lines return None."""
+    line = raw_line.strip()
+    if not line:
+        return None
+    try:
+        turn = json.loads(line.decode("utf-8"))
+    except (UnicodeDecodeError, json.JSONDecodeError):
+        return None
+    return turn if isinstance(turn, dict) else None
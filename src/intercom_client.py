@@ -23,6 +23,12 @@ import aiohttp
 import requests
 from pydantic import BaseModel
 
+try:
+    from src.conversation_archive import get_conversation_archive
+except ImportError:
+    # Scripts that put src/ itself on sys.path
+    from conversation_archive import get_conversation_archive
+
 logger = logging.getLogger(__name__)
 
 
@@ -48,6 +54,96 @@ class QualityFilterResult(BaseModel):
     reason: Optional[str] = None
 
 
+class AsyncRateLimiter:
+    """
+    Shared pacing for every async request made by one IntercomClient.
+
+    GCRA-style: each request reserves the next free slot on a single timeline,
+    so N concurrent coroutines together stay at the target rate and requests
+    are spaced evenly rather than sent in bursts. The slot interval is the
+    larger of:
+
+    - the configured INTERCOM_MAX_RPS (0 = no fixed limit)
+    - the quota left in Intercom's current window, spread evenly until reset
+      (X-RateLimit-Remaining / X-RateLimit-Reset)
+
+    A 429 moves the timeline past Retry-After, so every caller waits rather
+    than only the coroutine that was rejected.
+
+    No asyncio primitives are held, so one limiter can outlive the event loop
+    (the pipeline runs each phase under its own asyncio.run()).
+    """
+
+    def __init__(self, max_rps: float = 0.0):
+        self.max_rps = max_rps
+        self._next_slot = 0.0  # time.monotonic() of the next free slot
+        self._window_interval = 0.0  # Header-derived spacing for the current window
+        self._window_ends = 0.0
+
+        self.granted = 0
+        self.waited = 0
+        self.wait_seconds = 0.0
+        self.throttled = 0
+
+    @property
+    def interval(self) -> float:
+        """Current seconds between requests."""
+        configured = 1.0 / self.max_rps if self.max_rps > 0 else 0.0
+        if time.monotonic() < self._window_ends:
+            return max(configured, self._window_interval)
+        return configured
+
+    async def acquire(self) -> None:
+        """Wait for this request's slot."""
+        now = time.monotonic()
+        slot = max(now, self._next_slot)
+        self._next_slot = slot + self.interval
+        self.granted += 1
+
+        wait = slot - now
+        if wait > 0:
+            self.waited += 1
+            self.wait_seconds += wait
+            await asyncio.sleep(wait)
+
+    def update(self, headers) -> None:
+        """Spread the remaining window quota evenly until the window resets."""
+        try:
+            remaining = int(headers.get("X-RateLimit-Remaining"))
+            reset_at = float(headers.get("X-RateLimit-Reset"))
+        except (ValueError, TypeError):
+            return  # Headers absent or malformed: keep the current pacing
+
+        seconds_left = reset_at - time.time()
+        if seconds_left <= 0:
+            return
+
+        self._window_ends = time.monotonic() + seconds_left
+        if remaining <= 0:
+            self.pause(seconds_left)
+        else:
+            self._window_interval = seconds_left / remaining
+
+    def pause(self, seconds: float) -> None:
+        """Hold every caller for at least `seconds`."""
+        self._next_slot = max(self._next_slot, time.monotonic() + seconds)
+
+    def throttle(self, retry_after: float) -> None:
+        """Record a 429 and hold every caller until Retry-After has passed."""
+        self.throttled += 1
+        self.pause(retry_after)
+
+    def stats(self) -> dict:
+        """Grant, wait and 429 counters since the client was created."""
+        return {
+            "granted": self.granted,
+            "waited": self.waited,
+            "wait_seconds": self.wait_seconds,
+            "throttled": self.throttled,
+            "interval": self.interval,
+        }
+
+
 class IntercomClient:
     """Client for fetching and filtering Intercom conversations."""
 
@@ -102,6 +198,12 @@ class IntercomClient:
             "Intercom-Version": self.API_VERSION,
         })
 
+        # One limiter for all async detail and search calls from this client
+        self.rate_limiter = AsyncRateLimiter(self.MAX_RPS)
+
+        # Optional local copy of raw conversations (INTERCOM_ARCHIVE_PATH)
+        self.archive = get_conversation_archive()
+
     @staticmethod
     def _parse_retry_after(header_value: str) -> int:
         """
@@ -277,6 +379,10 @@ class IntercomClient:
         Retries on 429 (rate limit) and 5xx (server errors) with exponential backoff.
         Same retry logic as sync version but using aiohttp.
 
+        Every attempt first takes a slot from self.rate_limiter, and a 429 pauses
+        that limiter, so INTERCOM_MAX_RPS and Retry-After apply to the client as a
+        whole rather than per coroutine.
+
         Args:
             session: aiohttp ClientSession with auth headers
             method: HTTP method (GET or POST)
@@ -292,100 +398,48 @@ class IntercomClient:
         """
         url = f"{self.BASE_URL}{endpoint}"
 
-        # Issue #205: Enforce MAX_RPS rate limiting
-        if self.MAX_RPS > 0:
-            await asyncio.sleep(1.0 / self.MAX_RPS)
-
         for attempt in range(self.max_retries + 1):
+            # Issue #205: Enforce MAX_RPS, shared across all concurrent requests
+            await self.rate_limiter.acquire()
             try:
                 if method == "GET":
-                    async with session.get(url, params=params) as response:
-                        # Issue #205: Log rate limit headers for observability
-                        remaining = response.headers.get("X-RateLimit-Remaining")
-                        if remaining is not None:
-                            try:
-                                remaining_int = int(remaining)
-                                if remaining_int < 100:
-                                    logger.warning(
-                                        f"Rate limit low: {remaining_int} requests remaining on {endpoint}"
-                                    )
-                                else:
-                                    logger.debug(f"Rate limit remaining: {remaining_int} on {endpoint}")
-                            except (ValueError, TypeError):
-                                pass  # Ignore invalid header values
-
-                        if response.status in self.RETRYABLE_STATUS_CODES:
-                            if attempt < self.max_retries:
-                                # Issue #205: Handle 429 with Retry-After header
-                                if response.status == 429:
-                                    retry_after = response.headers.get("Retry-After")
-                                    if retry_after:
-                                        base_delay = self._parse_retry_after(retry_after)
-                                    else:
-                                        base_delay = self.RETRY_DELAY_BASE * (2 ** attempt)
-                                    delay = self._add_jitter(base_delay)
-                                    logger.warning(
-                                        f"Rate limited (429) on {endpoint}, waiting {delay:.1f}s "
-                                        f"(retry-after={retry_after}, attempt {attempt + 1}/{self.max_retries + 1})"
-                                    )
-                                else:
-                                    # 5xx errors: exponential backoff with jitter
-                                    base_delay = self.RETRY_DELAY_BASE * (2 ** attempt)
-                                    delay = self._add_jitter(base_delay)
-                                    logger.warning(
-                                        f"Intercom API error {response.status} on {endpoint}, "
-                                        f"retrying in {delay:.1f}s (attempt {attempt + 1}/{self.max_retries + 1})"
-                                    )
-                                await asyncio.sleep(delay)
-                                continue
-                            else:
-                                response.raise_for_status()
-                        response.raise_for_status()
-                        return await response.json()
+                    request = session.get(url, params=params)
                 else:
-                    async with session.post(url, json=json_data) as response:
-                        # Issue #205: Log rate limit headers for observability
-                        remaining = response.headers.get("X-RateLimit-Remaining")
-                        if remaining is not None:
-                            try:
-                                remaining_int = int(remaining)
-                                if remaining_int < 100:
-                                    logger.warning(
-                                        f"Rate limit low: {remaining_int} requests remaining on {endpoint}"
-                                    )
-                                else:
-                                    logger.debug(f"Rate limit remaining: {remaining_int} on {endpoint}")
-                            except (ValueError, TypeError):
-                                pass  # Ignore invalid header values
-
-                        if response.status in self.RETRYABLE_STATUS_CODES:
-                            if attempt < self.max_retries:
-                                # Issue #205: Handle 429 with Retry-After header
-                                if response.status == 429:
-                                    retry_after = response.headers.get("Retry-After")
-                                    if retry_after:
-                                        base_delay = self._parse_retry_after(retry_after)
-                                    else:
-                                        base_delay = self.RETRY_DELAY_BASE * (2 ** attempt)
-                                    delay = self._add_jitter(base_delay)
-                                    logger.warning(
-                                        f"Rate limited (429) on {endpoint}, waiting {delay:.1f}s "
-                                        f"(retry-after={retry_after}, attempt {attempt + 1}/{self.max_retries + 1})"
-                                    )
+                    request = session.post(url, json=json_data)
+
+                async with request as response:
+                    self._observe_rate_limit_headers(response.headers, endpoint)
+
+                    if response.status in self.RETRYABLE_STATUS_CODES:
+                        if attempt < self.max_retries:
+                            # Issue #205: Handle 429 with Retry-After header
+                            if response.status == 429:
+                                retry_after = response.headers.get("Retry-After")
+                                if retry_after:
+                                    base_delay = self._parse_retry_after(retry_after)
                                 else:
-                                    # 5xx errors: exponential backoff with jitter
                                     base_delay = self.RETRY_DELAY_BASE * (2 ** attempt)
-                                    delay = self._add_jitter(base_delay)
-                                    logger.warning(
-                                        f"Intercom API error {response.status} on {endpoint}, "
-                                        f"retrying in {delay:.1f}s (attempt {attempt + 1}/{self.max_retries + 1})"
-                                    )
-                                await asyncio.sleep(delay)
-                                continue
+                                delay = self._add_jitter(base_delay)
+                                logger.warning(
+                                    f"Rate limited (429) on {endpoint}, waiting {delay:.1f}s "
+                                    f"(retry-after={retry_after}, attempt {attempt + 1}/{self.max_retries + 1})"
+                                )
+                                # Every request from this client waits, not just this one
+                                self.rate_limiter.throttle(delay)
                             else:
-                                response.raise_for_status()
-                        response.raise_for_status()
-                        return await response.json()
+                                # 5xx errors: exponential backoff with jitter
+                                base_delay = self.RETRY_DELAY_BASE * (2 ** attempt)
+                                delay = self._add_jitter(base_delay)
+                                logger.warning(
+                                    f"Intercom API error {response.status} on {endpoint}, "
+                                    f"retrying in {delay:.1f}s (attempt {attempt + 1}/{self.max_retries + 1})"
+                                )
+                                await asyncio.sleep(delay)
+                            continue
+                        else:
+                            response.raise_for_status()
+                    response.raise_for_status()
+                    return await response.json()
 
             except aiohttp.ClientError as e:
                 if attempt < self.max_retries:
@@ -401,6 +455,23 @@ class IntercomClient:
 
         raise RuntimeError("Unexpected retry loop exit")
 
+    def _observe_rate_limit_headers(self, headers, endpoint: str) -> None:
+        """Log rate limit headers (Issue #205) and feed them to the shared limiter."""
+        remaining = headers.get("X-RateLimit-Remaining")
+        if remaining is not None:
+            try:
+                remaining_int = int(remaining)
+                if remaining_int < 100:
+                    logger.warning(
+                        f"Rate limit low: {remaining_int} requests remaining on {endpoint}"
+                    )
+                else:
+                    logger.debug(f"Rate limit remaining: {remaining_int} on {endpoint}")
+            except (ValueError, TypeError):
+                pass  # Ignore invalid header values
+
+        self.rate_limiter.update(headers)
+
     def _get_aiohttp_session(self) -> aiohttp.ClientSession:
         """Create an aiohttp session with proper headers and timeout.
 
@@ -541,13 +612,36 @@ class IntercomClient:
                     parsed = self.parse_conversation(raw_conv)
                     recovery_candidates.append((parsed, raw_conv, True))  # had_template=True
 
-    async def get_conversation_async(self, session: aiohttp.ClientSession, conv_id: str) -> dict:
+    async def get_conversation_async(
+        self,
+        session: aiohttp.ClientSession,
+        conv_id: str,
+        updated_at: Optional[int] = None,
+    ) -> dict:
         """Fetch a single conversation by ID (async version).
 
         Note: Requires an existing session to be passed in for efficiency
         when fetching multiple conversations.
+
+        When the conversation archive is enabled and `updated_at` (from the
+        search result) is given, an archived copy at least that new is returned
+        without calling the API. Fetched conversations are archived. Archive
+        I/O runs in a worker thread so SQLite never blocks the event loop.
         """
-        return await self._request_with_retry_async(session, "GET", f"/conversations/{conv_id}")
+        archived = await asyncio.to_thread(self._get_archived, conv_id, updated_at)
+        if archived is not None:
+            return archived
+
+        conv = await self._request_with_retry_async(session, "GET", f"/conversations/{conv_id}")
+        if self.archive is not None:
+            await asyncio.to_thread(self.archive.put, conv)
+        return conv
+
+    def _get_archived(self, conv_id: str, updated_at: Optional[int]) -> Optional[dict]:
+        """Archived copy of a conversation, or None if absent, stale or archiving is off."""
+        if self.archive is None or updated_at is None:
+            return None
+        return self.archive.get(conv_id, updated_at)
 
     async def search_by_date_range_async(
         self,
@@ -876,7 +970,14 @@ class IntercomClient:
                         "Accept": "application/json",
                         "Intercom-Version": self.API_VERSION,
                     }
+                    # Contact lookups share the client's quota with detail/search calls
+                    await self.rate_limiter.acquire()
                     async with session.get(url, headers=headers) as resp:
+                        self.rate_limiter.update(resp.headers)
+                        if resp.status == 429:
+                            self.rate_limiter.throttle(
+                                self._parse_retry_after(resp.headers.get("Retry-After", ""))
+                            )
                         if resp.status == 200:
                             data = await resp.json()
                             custom_attrs = data.get("custom_attributes", {})
@@ -985,9 +1086,16 @@ class IntercomClient:
                 parsed = self.parse_conversation(raw_conv)
                 yield parsed, raw_conv
 
-    def get_conversation(self, conv_id: str) -> dict:
-        """Fetch a single conversation by ID."""
-        return self._get(f"/conversations/{conv_id}")
+    def get_conversation(self, conv_id: str, updated_at: Optional[int] = None) -> dict:
+        """Fetch a single conversation by ID (archive first, see get_conversation_async)."""
+        archived = self._get_archived(conv_id, updated_at)
+        if archived is not None:
+            return archived
+
+        conv = self._get(f"/conversations/{conv_id}")
+        if self.archive is not None:
+            self.archive.put(conv)
+        return conv
 
     def search_conversations(
         self,
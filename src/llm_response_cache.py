@@ -0,0 +1,254 @@
+"""
+Persistent response cache for deterministic-input LLM calls.
+
+Resumed runs and historical backfills re-classify conversations whose Stage 1 /
+Stage 2 inputs are byte-for-byte identical to an earlier run. This cache stores
+the raw response content on disk (SQLite) keyed by a hash of the prompt
+template, model, request parameters and rendered messages, so those reruns
+skip the API entirely.
+
+Opt-in via environment:
+    LLM_RESPONSE_CACHE_PATH          SQLite file path (unset = cache disabled)
+    LLM_RESPONSE_CACHE_TTL_HOURS     Entry lifetime (default 720 = 30 days)
+    LLM_RESPONSE_CACHE_MAX_ENTRIES   Size bound; least recently used entries
+                                     are evicted beyond it (default 200000)
+
+The prompt template text is part of the key, so editing a prompt invalidates
+its entries without any manual version bump.
+
+Concurrency: one connection per cache guarded by a lock (classification calls
+it from many coroutines and from worker threads), WAL mode and a busy timeout
+so several pipeline processes can share the same file. The row count used for
+the size bound is tracked in memory and only re-counted when it crosses
+max_entries, so it is approximate when several processes write the same file.
+
+The cache never fails a request: SQLite errors are logged and treated as a
+miss (get) or a skipped write (put).
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL_HOURS = 720
+DEFAULT_MAX_ENTRIES = 200_000
+
+# Evict in chunks so steady-state inserts don't run a DELETE every time
+EVICTION_SLACK = 0.05
+
+
+def response_cache_key(
+    template: str,
+    model: str,
+    messages: List[Dict[str, str]],
+    params: Dict[str, Any],
+) -> str:
+    """
+    Content address for an LLM request.
+
+    Args:
+        template: Unrendered prompt template (its hash acts as the template version)
+        model: Model name
+        messages: Rendered chat messages
+        params: Request parameters that affect output (temperature, max_tokens, ...)
+    """
+    payload = json.dumps(
+        {
+            "template": hashlib.sha256(template.encode("utf-8")).hexdigest(),
+            "model": model,
+            "messages": messages,
+            "params": params,
+        },
+        sort_keys=True,
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class LLMResponseCache:
+    """SQLite-backed response cache with TTL, LRU size bound and hit-rate stats."""
+
+    def __init__(
+        self,
+        path: str,
+        ttl_hours: float = DEFAULT_TTL_HOURS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ):
+        """
+        Args:
+            path: SQLite database file (created if missing)
+            ttl_hours: Entries older than this are treated as misses and purged
+            max_entries: Maximum rows kept; least recently used are evicted
+        """
+        self.path = path
+        self.ttl_seconds = ttl_hours * 3600
+        self.max_entries = max_entries
+
+        self._lock = threading.Lock()
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path, timeout=30.0, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS llm_responses (
+                cache_key TEXT PRIMARY KEY,
+                response TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                last_used_at REAL NOT NULL
+            )
+        """)
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_llm_responses_last_used ON llm_responses(last_used_at)"
+        )
+        self._conn.commit()
+        self._approx_count = self._conn.execute("SELECT COUNT(*) FROM llm_responses").fetchone()[0]
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response for key, or None on miss/expiry."""
+        now = time.time()
+        with self._lock:
+            try:
+                row = self._conn.execute(
+                    "SELECT response, created_at FROM llm_responses WHERE cache_key = ?",
+                    (key,),
+                ).fetchone()
+                if row is None or now - row[1] > self.ttl_seconds:
+                    if row is not None:
+                        self._conn.execute("DELETE FROM llm_responses WHERE cache_key = ?", (key,))
+                        self._conn.commit()
+                        self._approx_count -= 1
+                    self.misses += 1
+                    return None
+
+                self._conn.execute(
+                    "UPDATE llm_responses SET last_used_at = ? WHERE cache_key = ?",
+                    (now, key),
+                )
+                self._conn.commit()
+            except sqlite3.Error as e:
+                self._rollback()
+                logger.warning(f"LLM response cache read failed, treating as miss: {e}")
+                self.misses += 1
+                return None
+            self.hits += 1
+            return row[0]
+
+    def put(self, key: str, response: str) -> None:
+        """Store a response, evicting least recently used entries past max_entries."""
+        now = time.time()
+        with self._lock:
+            try:
+                self._conn.execute(
+                    """
+                    INSERT OR REPLACE INTO llm_responses (cache_key, response, created_at, last_used_at)
+                    VALUES (?, ?, ?, ?)
+                """,
+                    (key, response, now, now),
+                )
+                # Replacements over-count; the exact COUNT below corrects it
+                self._approx_count += 1
+                if self._approx_count > self.max_entries:
+                    count = self._conn.execute("SELECT COUNT(*) FROM llm_responses").fetchone()[0]
+                    self._approx_count = count
+                    if count > self.max_entries:
+                        self._evict(count)
+                self._conn.commit()
+            except sqlite3.Error as e:
+                self._rollback()
+                logger.warning(f"LLM response cache write skipped: {e}")
+
+    def _rollback(self) -> None:
+        """Roll back a failed statement (lock held); the connection may be unusable."""
+        try:
+            self._conn.rollback()
+        except sqlite3.Error:
+            pass
+
+    def _evict(self, count: int) -> None:
+        """Drop expired rows, then least recently used rows down to the bound (lock held)."""
+        cursor = self._conn.execute(
+            "DELETE FROM llm_responses WHERE created_at < ?",
+            (time.time() - self.ttl_seconds,),
+        )
+        removed = cursor.rowcount
+        count -= removed
+
+        target = int(self.max_entries * (1 - EVICTION_SLACK))
+        if count > target:
+            cursor = self._conn.execute(
+                """
+                DELETE FROM llm_responses WHERE cache_key IN (
+                    SELECT cache_key FROM llm_responses
+                    ORDER BY last_used_at ASC
+                    LIMIT ?
+                )
+            """,
+                (count - target,),
+            )
+            removed += cursor.rowcount
+
+        self._approx_count -= removed
+        self.evictions += removed
+        logger.debug(f"LLM response cache evicted {removed} entries")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM llm_responses").fetchone()[0]
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit-rate statistics since this cache was opened."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_cache: Optional[LLMResponseCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_response_cache() -> Optional[LLMResponseCache]:
+    """
+    Process-wide cache configured from the environment.
+
+    Returns None when LLM_RESPONSE_CACHE_PATH is unset (the default).
+    """
+    global _cache
+    path = os.getenv("LLM_RESPONSE_CACHE_PATH")
+    if not path:
+        return None
+
+    with _cache_lock:
+        if _cache is None or _cache.path != path:
+            try:
+                ttl_hours = float(os.getenv("LLM_RESPONSE_CACHE_TTL_HOURS", str(DEFAULT_TTL_HOURS)))
+                max_entries = int(os.getenv("LLM_RESPONSE_CACHE_MAX_ENTRIES", str(DEFAULT_MAX_ENTRIES)))
+            except ValueError:
+                logger.warning("Invalid LLM response cache settings, using defaults")
+                ttl_hours, max_entries = DEFAULT_TTL_HOURS, DEFAULT_MAX_ENTRIES
+            try:
+                _cache = LLMResponseCache(path, ttl_hours=ttl_hours, max_entries=max_entries)
+            except sqlite3.Error as e:
+                logger.warning(f"LLM response cache disabled, cannot open {path}: {e}")
+                return None
+            logger.info(f"LLM response cache enabled at {path}")
+        return _cache
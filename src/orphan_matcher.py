@@ -6,8 +6,10 @@ Part of Phase 5 Story Grouping.
 """
 
 import logging
-from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, TYPE_CHECKING
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
+from uuid import UUID
 
 from signature_utils import SignatureRegistry, get_registry
 from story_tracking.models.orphan import MIN_GROUP_SIZE, Orphan, OrphanCreate, OrphanGraduationResult
@@ -57,6 +59,19 @@ class ExtractedTheme:
         return data
 
 
+@dataclass
+class _SignaturePlan:
+    """batch_match() actions for one canonical signature (entry indexes)."""
+
+    orphan: Optional[Orphan]
+    graduated_story: bool = False
+    created: Optional[int] = None
+    appended: List[int] = field(default_factory=list)
+    already_present: List[int] = field(default_factory=list)
+    graduating: Optional[int] = None
+    remaining: List[int] = field(default_factory=list)
+
+
 @dataclass
 class MatchResult:
     """
@@ -364,14 +379,21 @@ class OrphanMatcher:
         """
         Match multiple conversations in batch.
 
+        Produces the same MatchResults as calling match_and_accumulate() for
+        each conversation in order, with set-based I/O: one query loads the
+        orphans for every signature, one INSERT creates the new orphans and
+        one UPDATE appends conversations to them. Graduation and
+        post-graduation routing reuse the single-conversation paths, as does
+        any signature whose state changed underneath the batch (a concurrent
+        create or delete, or a failed graduation).
+
         Args:
             conversations: List of dicts with 'id' and theme fields
 
         Returns:
             List of MatchResults for each conversation
         """
-        results = []
-
+        entries = []
         for conv in conversations:
             theme = ExtractedTheme(
                 signature=conv.get("issue_signature", "unknown"),
@@ -383,25 +405,163 @@ class OrphanMatcher:
                 root_cause_hypothesis=conv.get("root_cause_hypothesis"),
                 excerpt=conv.get("excerpt"),
             )
+            entries.append((str(conv.get("id", "")), theme))
+
+        # Canonicalize up front and group entry indexes per signature (in order)
+        indexes_by_signature: Dict[str, List[int]] = {}
+        for i, (_, theme) in enumerate(entries):
+            canonical_signature = self.signature_registry.get_canonical(theme.signature)
+            indexes_by_signature.setdefault(canonical_signature, []).append(i)
+
+        results: List[Optional[MatchResult]] = [None] * len(entries)
+        existing = self.orphan_service.get_by_signatures(list(indexes_by_signature))
+
+        plans = {
+            signature: self._plan_signature(existing.get(signature), indexes, entries)
+            for signature, indexes in indexes_by_signature.items()
+        }
+        fallback: List[int] = []
+
+        # Creates: one INSERT; signatures created concurrently take the slow path
+        to_create = [
+            OrphanCreate(
+                signature=signature,
+                original_signature=(
+                    entries[plan.created][1].signature
+                    if entries[plan.created][1].signature != signature
+                    else None
+                ),
+                conversation_ids=[entries[plan.created][0]],
+                theme_data=entries[plan.created][1].to_theme_data(),
+            )
+            for signature, plan in plans.items()
+            if plan.created is not None
+        ]
+        created = self.orphan_service.create_bulk(to_create)
+        for orphan_create in to_create:
+            signature = orphan_create.signature
+            if signature in created:
+                plans[signature].orphan = created[signature]
+                results[plans[signature].created] = MatchResult(
+                    matched=True,
+                    orphan_id=str(created[signature].id),
+                    orphan_signature=signature,
+                    action="created",
+                )
+            else:
+                fallback.extend(indexes_by_signature.pop(signature))
+                del plans[signature]
+
+        # Appends: one UPDATE across all active orphans
+        additions = [
+            (plan.orphan, [(entries[i][0], entries[i][1].to_theme_data()) for i in plan.appended])
+            for plan in plans.values()
+            if plan.appended
+        ]
+        updated = self.orphan_service.add_conversations_bulk(additions)
+
+        for signature, plan in list(plans.items()):
+            if plan.graduated_story:
+                continue
+            if plan.appended:
+                if plan.orphan.id not in updated:
+                    # Orphan deleted underneath us; its "created" result already stands
+                    fallback.extend(
+                        i for i in indexes_by_signature.pop(signature) if i != plan.created
+                    )
+                    del plans[signature]
+                    continue
+                plan.orphan = updated[plan.orphan.id]
+            for i in plan.appended:
+                if i == plan.graduating:
+                    continue
+                results[i] = MatchResult(
+                    matched=True,
+                    orphan_id=str(plan.orphan.id),
+                    orphan_signature=plan.orphan.signature,
+                    action="updated",
+                )
+            for i in plan.already_present:
+                results[i] = MatchResult(
+                    matched=True,
+                    orphan_id=str(plan.orphan.id),
+                    orphan_signature=plan.orphan.signature,
+                    action="already_exists",
+                )
 
-            result = self.match_and_accumulate(
-                conversation_id=str(conv.get("id", "")),
+        # Graduations, then route the rest of each group to its story
+        for plan in plans.values():
+            remaining = plan.remaining
+            orphan = plan.orphan
+            if plan.graduating is not None:
+                result = self._graduate_orphan(orphan)
+                results[plan.graduating] = result
+                if result.action != "graduated":
+                    fallback.extend(remaining)
+                    continue
+                orphan = orphan.model_copy(update={
+                    "graduated_at": datetime.now(timezone.utc),
+                    "story_id": UUID(result.story_id),
+                })
+            for i in remaining:
+                conversation_id, theme = entries[i]
+                results[i] = self._add_to_graduated_story(orphan, conversation_id, theme)
+
+        for i in sorted(fallback):
+            conversation_id, theme = entries[i]
+            results[i] = self.match_and_accumulate(
+                conversation_id=conversation_id,
                 extracted_theme=theme,
             )
-            results.append(result)
 
         # Summary logging
-        created = sum(1 for r in results if r.action == "created")
-        updated = sum(1 for r in results if r.action == "updated")
-        graduated = sum(1 for r in results if r.action == "graduated")
+        created_count = sum(1 for r in results if r.action == "created")
+        updated_count = sum(1 for r in results if r.action == "updated")
+        graduated_count = sum(1 for r in results if r.action == "graduated")
 
         logger.info(
             f"Batch match complete: {len(results)} conversations processed "
-            f"({created} new orphans, {updated} updates, {graduated} graduations)"
+            f"({created_count} new orphans, {updated_count} updates, {graduated_count} graduations)"
         )
 
         return results
 
+    def _plan_signature(
+        self,
+        orphan: Optional[Orphan],
+        indexes: List[int],
+        entries: List[Tuple[str, ExtractedTheme]],
+    ) -> "_SignaturePlan":
+        """
+        Replay match_and_accumulate() for one signature's conversations in memory.
+
+        Stops at the conversation that would graduate the orphan; everything
+        after it flows to the new story.
+        """
+        plan = _SignaturePlan(orphan=orphan)
+
+        if orphan and orphan.graduated_at and orphan.story_id:
+            plan.graduated_story = True
+            plan.remaining = list(indexes)
+            return plan
+
+        conversation_ids = list(orphan.conversation_ids) if orphan else []
+        for position, i in enumerate(indexes):
+            conversation_id = entries[i][0]
+            if orphan is None and plan.created is None:
+                plan.created = i
+                conversation_ids.append(conversation_id)
+            elif conversation_id in conversation_ids:
+                plan.already_present.append(i)
+            else:
+                plan.appended.append(i)
+                conversation_ids.append(conversation_id)
+                if self.auto_graduate and len(conversation_ids) >= MIN_GROUP_SIZE:
+                    plan.graduating = i
+                    plan.remaining = list(indexes[position + 1:])
+                    break
+        return plan
+
     def graduate_all_ready(self) -> List[OrphanGraduationResult]:
         """
         Graduate all orphans that are ready.
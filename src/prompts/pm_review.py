@@ -83,6 +83,81 @@ Important:
 '''
 
 
+# Batched PM Review Prompt
+# Several small theme groups reviewed in one request (PMReviewService request
+# coalescing). Each group is judged independently with the same SAME_FIX test.
+PM_REVIEW_BATCH_PROMPT = '''You are a PM reviewing potential product tickets for Tailwind, a social media scheduling tool.
+
+## The SAME_FIX Test
+
+A group of conversations should become ONE ticket if and only if:
+
+1. **Same code change** - One PR would fix ALL of them
+2. **Same developer** - One person could own the entire fix
+3. **Same test** - One acceptance test would verify ALL are fixed
+
+## Product Context
+
+{product_context}
+
+## Groups Under Review
+
+There are {group_count} independent groups below. Review EACH group on its own;
+never move conversations between groups.
+
+{groups}
+
+## Your Task
+
+For each group, answer: **"Would ONE implementation fix ALL of these?"**
+
+## Response Format
+
+Respond with valid JSON only. No markdown code blocks.
+
+{{
+  "groups": [
+    {{
+      "signature": "the group's signature, exactly as given",
+      "decision": "keep_together" | "split",
+      "reasoning": "Brief explanation of your decision",
+      "same_fix_confidence": 0.0-1.0,
+      "sub_groups": [
+        // Only if decision is "split"
+        {{
+          "suggested_signature": "more_specific_signature_name",
+          "conversation_ids": ["id1", "id2"],
+          "rationale": "Why these belong together",
+          "symptom": "The specific symptom these share"
+        }}
+      ],
+      "orphans": [
+        {{
+          "conversation_id": "id",
+          "reason": "Why this doesn't fit"
+        }}
+      ]
+    }}
+  ]
+}}
+
+Important:
+- Return exactly one entry per group, in the order given
+- Within a group, each conversation_id MUST appear in exactly ONE place: either in ONE sub_group OR in orphans
+- If conversations have DIFFERENT symptoms (duplicates vs missing), they MUST be split
+- A sub-group needs at least 3 conversations to become a ticket (others become orphans)
+- Be specific in suggested signatures: `pinterest_duplicate_pins` not `pinterest_issue`
+'''
+
+# Section for one group inside PM_REVIEW_BATCH_PROMPT
+BATCH_GROUP_TEMPLATE = '''## Group {index}
+
+**Signature**: {signature}
+**Conversation Count**: {count}
+
+{conversations}'''
+
+
 # Conversation template for formatting individual conversations in the prompt
 # When diagnostic_summary and key_excerpts are available, they provide richer context
 # than the raw excerpt. The template uses {context_section} to insert either:
@@ -256,3 +331,33 @@ def build_pm_review_prompt(
         count=len(conversations),
         conversations=formatted_conversations,
     )
+
+
+def build_pm_review_batch_prompt(
+    groups: list[tuple[str, list[dict]]],
+    product_context: str = "",
+) -> str:
+    """
+    Build one PM review prompt covering several theme groups.
+
+    Args:
+        groups: (signature, conversation context dicts) per group, in order
+        product_context: Optional product documentation for context
+
+    Returns:
+        Complete formatted prompt string
+    """
+    sections = [
+        BATCH_GROUP_TEMPLATE.format(
+            index=i,
+            signature=signature,
+            count=len(conversations),
+            conversations=format_conversations_for_review(conversations),
+        )
+        for i, (signature, conversations) in enumerate(groups, 1)
+    ]
+    return PM_REVIEW_BATCH_PROMPT.format(
+        product_context=product_context or "Tailwind is a social media scheduling tool.",
+        group_count=len(groups),
+        groups="\n\n".join(sections),
+    )
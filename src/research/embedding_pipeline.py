@@ -12,13 +12,21 @@ If you change the model in config:
 1. All existing embeddings become incompatible with search queries
 2. You MUST re-run this pipeline (with force=True) to re-index all content
 3. Use the /api/research/stats endpoint to verify the current model
+
+Reindexing streams: adapters are read concurrently, each on its own database
+connection, and embedding requests go through one bounded pool shared by all
+adapters, so batch N+1 is being embedded while batch N is upserted. Every
+batch is committed as soon as it is stored; an interrupted run resumes where
+it stopped because the content hash check skips everything already written.
 """
 
 import hashlib
 import logging
 import time
+from collections import deque
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Iterator, List, Optional, Tuple
+from typing import Deque, Iterable, Iterator, List, Optional, Tuple
 
 import yaml
 from openai import OpenAI
@@ -41,6 +49,10 @@ VALID_EMBEDDING_MODELS = {
     "text-embedding-ada-002",
 }
 
+# Batches per adapter submitted for embedding but not yet upserted. Two keeps
+# the next request in flight while the current batch is written.
+MAX_BATCHES_IN_FLIGHT = 2
+
 
 class EmbeddingPipeline:
     """
@@ -56,6 +68,7 @@ class EmbeddingPipeline:
         embedding_dimensions: Optional[int] = None,
         batch_size: Optional[int] = None,
         config_path: Optional[Path] = None,
+        embedding_concurrency: Optional[int] = None,
     ):
         """
         Initialize the embedding pipeline.
@@ -69,6 +82,8 @@ class EmbeddingPipeline:
             embedding_dimensions: Vector dimensions (defaults to config)
             batch_size: Items per embedding API call (defaults to config)
             config_path: Path to configuration YAML (for testing)
+            embedding_concurrency: Max embedding requests in flight across
+                                   all adapters (defaults to config)
         """
         self._client = OpenAI()
         self._config = self._load_config(config_path or CONFIG_PATH)
@@ -79,6 +94,7 @@ class EmbeddingPipeline:
         self._embedding_dimensions = embedding_dimensions or embedding_config["dimensions"]
         # batch_size is pipeline-specific - search processes one query at a time
         self._batch_size = batch_size or embedding_config["batch_size"]
+        self._embedding_concurrency = embedding_concurrency or embedding_config["concurrency"]
 
         # Validate model name to catch config errors early
         if self._embedding_model not in VALID_EMBEDDING_MODELS:
@@ -92,6 +108,8 @@ class EmbeddingPipeline:
             raise ValueError(f"Invalid embedding dimensions: {self._embedding_dimensions}")
         if not (1 <= self._batch_size <= 1000):
             raise ValueError(f"Invalid batch_size: {self._batch_size}")
+        if not (1 <= self._embedding_concurrency <= 32):
+            raise ValueError(f"Invalid embedding concurrency: {self._embedding_concurrency}")
 
         logger.info(f"Embedding pipeline initialized with model: {self._embedding_model}")
 
@@ -113,6 +131,7 @@ class EmbeddingPipeline:
                 "model": "text-embedding-3-small",
                 "dimensions": 1536,
                 "batch_size": 100,
+                "concurrency": 4,
             },
         }
 
@@ -194,20 +213,33 @@ class EmbeddingPipeline:
         try:
             from src.db.connection import get_connection
 
-            with get_connection() as conn:
-                for adapter in adapters:
-                    source_type = adapter.get_source_type()
-                    processed_source_types.append(source_type)
-
-                    logger.info(f"Processing source: {source_type}")
+            # Fail the whole run up front if the database is unreachable
+            with get_connection():
+                pass
 
-                    try:
-                        processed, updated, failed = self._process_adapter(
-                            conn=conn,
+            with ThreadPoolExecutor(
+                max_workers=self._embedding_concurrency, thread_name_prefix="research-embed"
+            ) as embed_executor, ThreadPoolExecutor(
+                max_workers=len(adapters), thread_name_prefix="research-adapter"
+            ) as adapter_executor:
+                futures = []
+                for adapter in adapters:
+                    logger.info(f"Processing source: {adapter.get_source_type()}")
+                    futures.append((
+                        adapter.get_source_type(),
+                        adapter_executor.submit(
+                            self._process_adapter,
                             adapter=adapter,
                             force=force,
                             limit=limit,
-                        )
+                            embed_executor=embed_executor,
+                        ),
+                    ))
+
+                for source_type, future in futures:
+                    processed_source_types.append(source_type)
+                    try:
+                        processed, updated, failed = future.result()
                         total_processed += processed
                         total_updated += updated
                         total_failed += failed
@@ -245,49 +277,91 @@ class EmbeddingPipeline:
 
     def _process_adapter(
         self,
-        conn,
         adapter: SearchSourceAdapter,
         force: bool,
         limit: Optional[int],
+        embed_executor: Executor,
     ) -> Tuple[int, int, int]:
         """
-        Process a single adapter.
+        Stream one adapter through hash check, embedding and upsert.
+
+        Runs on its own connection. Changed items are embedded on
+        embed_executor with up to MAX_BATCHES_IN_FLIGHT batches outstanding;
+        the oldest batch is upserted (and committed) while newer ones are
+        still being embedded and extraction continues.
 
         Returns:
             Tuple of (processed, updated, failed) counts
         """
+        from src.db.connection import get_connection
+
         processed = 0
         updated = 0
         failed = 0
+        pending: Deque[Tuple[List[Tuple[SearchableContent, str]], Future]] = deque()
 
-        batch: List[SearchableContent] = []
+        def store_oldest() -> None:
+            nonlocal updated, failed
+            items, future = pending.popleft()
+            batch_updated, batch_failed = self._store_batch(conn, items, future.result())
+            updated += batch_updated
+            failed += batch_failed
 
-        for content in adapter.extract_all(limit=limit):
-            batch.append(content)
-            processed += 1
+        with get_connection() as conn:
+            try:
+                for batch in self._batches(adapter.extract_all(limit=limit)):
+                    processed += len(batch)
+
+                    items_with_hash = [
+                        (item, hashlib.sha256(item.content.encode('utf-8')).hexdigest())
+                        for item in batch
+                    ]
+                    # Check which items need updating
+                    items_to_embed = (
+                        items_with_hash if force
+                        else self._filter_unchanged(conn, items_with_hash)
+                    )
+                    if not items_to_embed:
+                        continue
+
+                    pending.append((
+                        items_to_embed,
+                        embed_executor.submit(
+                            self._generate_embeddings_batch,
+                            [item.content for item, _ in items_to_embed],
+                        ),
+                    ))
+                    while len(pending) >= MAX_BATCHES_IN_FLIGHT:
+                        store_oldest()
 
+                while pending:
+                    store_oldest()
+            finally:
+                # Don't leave embedding requests queued for a failed adapter
+                for _, future in pending:
+                    future.cancel()
+
+        return processed, updated, failed
+
+    def _batches(self, contents: Iterable[SearchableContent]) -> Iterator[List[SearchableContent]]:
+        """Group extracted content into embedding batches of batch_size."""
+        batch: List[SearchableContent] = []
+        for content in contents:
+            batch.append(content)
             if len(batch) >= self._batch_size:
-                batch_updated, batch_failed = self._process_batch(conn, batch, force)
-                updated += batch_updated
-                failed += batch_failed
+                yield batch
                 batch = []
-
-        # Process remaining items
         if batch:
-            batch_updated, batch_failed = self._process_batch(conn, batch, force)
-            updated += batch_updated
-            failed += batch_failed
+            yield batch
 
-        return processed, updated, failed
-
-    def _process_batch(
+    def _store_batch(
         self,
         conn,
-        batch: List[SearchableContent],
-        force: bool,
+        items_to_embed: List[Tuple[SearchableContent, str]],
+        embeddings: List[Optional[List[float]]],
     ) -> Tuple[int, int]:
         """
-        Process a batch of content items.
+        Upsert one embedded batch.
 
         Returns:
             Tuple of (updated, failed) counts
@@ -295,26 +369,7 @@ class EmbeddingPipeline:
         updated = 0
         failed = 0
 
-        # Compute content hashes
-        items_with_hash = []
-        for item in batch:
-            content_hash = hashlib.sha256(item.content.encode('utf-8')).hexdigest()
-            items_with_hash.append((item, content_hash))
-
-        if not force:
-            # Check which items need updating
-            items_to_embed = self._filter_unchanged(conn, items_with_hash)
-        else:
-            items_to_embed = items_with_hash
-
-        if not items_to_embed:
-            return 0, 0
-
-        # Generate embeddings in batch
         try:
-            texts = [item.content for item, _ in items_to_embed]
-            embeddings = self._generate_embeddings_batch(texts)
-
             # Prepare data for upsert
             rows = []
             for (item, content_hash), embedding in zip(items_to_embed, embeddings):
@@ -339,7 +394,8 @@ class EmbeddingPipeline:
 
         except Exception as e:
             logger.error(f"Batch processing failed: {e}")
-            failed = len(items_to_embed)
+            conn.rollback()
+            return 0, len(items_to_embed)
 
         return updated, failed
 
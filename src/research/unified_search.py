@@ -11,12 +11,25 @@ If you change the model in config:
 1. All existing embeddings become incompatible with search queries
 2. You MUST re-run the embedding pipeline to re-index all content
 3. Use the /api/research/stats endpoint to verify the current model
+
+Query embeddings are cached in-process (LRU with a TTL, keyed by model,
+dimensions and whitespace-normalized text), and search_many() answers several
+queries with one embedding request and one database round-trip.
+
+search(mode="hybrid") adds a lexical candidate query over the content_tsv
+full-text index (migration 030), run in parallel with the ANN query, and
+merges both rankings with reciprocal-rank fusion so exact feature names and
+error strings rank well.
 """
 
 import logging
 import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Sequence, Tuple
 
 import yaml
 from openai import OpenAI
@@ -43,6 +56,45 @@ VALID_EMBEDDING_MODELS = {
 }
 
 
+# Approximate embedding model token limit, in characters
+MAX_QUERY_CHARS = 8000 * 4
+
+SEARCH_MODES = ("vector", "hybrid")
+
+
+def _normalize_query(text: str) -> str:
+    """Cache key text: whitespace collapsed and truncated to the embedding limit."""
+    return " ".join(text.split())[:MAX_QUERY_CHARS]
+
+
+def _vector_literal(embedding: List[float]) -> str:
+    """pgvector text representation of an embedding."""
+    return "[" + ",".join(str(x) for x in embedding) + "]"
+
+
+def reciprocal_rank_fusion(
+    rankings: Sequence[List[UnifiedSearchResult]],
+    k: int = 60,
+) -> List[UnifiedSearchResult]:
+    """
+    Merge ranked result lists by reciprocal-rank fusion.
+
+    Each result scores sum(1 / (k + rank)) over the lists it appears in
+    (rank starting at 1). Ties go to the higher cosine similarity.
+    """
+    scores: Dict[int, float] = {}
+    results: Dict[int, UnifiedSearchResult] = {}
+    for ranking in rankings:
+        for rank, result in enumerate(ranking, 1):
+            scores[result.id] = scores.get(result.id, 0.0) + 1.0 / (k + rank)
+            results.setdefault(result.id, result)
+    return sorted(
+        results.values(),
+        key=lambda r: (scores[r.id], r.similarity),
+        reverse=True,
+    )
+
+
 class EmbeddingServiceError(Exception):
     """Raised when embedding generation fails."""
     pass
@@ -101,6 +153,15 @@ class UnifiedSearchService:
         if not (1 <= self._embedding_dimensions <= 4096):
             raise ValueError(f"Invalid embedding dimensions: {self._embedding_dimensions}")
 
+        # Query embedding cache, shared by concurrent theme extraction workers
+        cache_config = self._config["query_cache"]
+        self._query_cache_max_entries = cache_config["max_entries"]
+        self._query_cache_ttl_seconds = cache_config["ttl_seconds"]
+        self._query_cache: "OrderedDict[Tuple[str, int, str], Tuple[float, List[float]]]" = OrderedDict()
+        self._query_cache_lock = threading.Lock()
+        self._query_cache_hits = 0
+        self._query_cache_misses = 0
+
         logger.info(f"Search service initialized with model: {self._embedding_model}")
 
     def _load_config(self, path: Path) -> dict:
@@ -132,6 +193,14 @@ class UnifiedSearchService:
                 "min_similarity": 0.7,
                 "max_suggestions": 5,
             },
+            "query_cache": {
+                "max_entries": 2048,
+                "ttl_seconds": 3600,
+            },
+            "hybrid": {
+                "candidates": 50,
+                "rrf_k": 60,
+            },
         }
 
         if path.exists():
@@ -169,21 +238,69 @@ class UnifiedSearchService:
         Raises:
             EmbeddingServiceError: If embedding generation fails
         """
-        try:
-            # Truncate very long text to avoid token limits
-            max_chars = 8000 * 4  # Approximate token limit
-            if len(text) > max_chars:
-                text = text[:max_chars]
-
-            response = self._client.embeddings.create(
-                model=self._embedding_model,
-                input=text,
-                dimensions=self._embedding_dimensions,
-            )
-            return response.data[0].embedding
-        except Exception as e:
-            logger.error(f"Failed to generate embedding: {e}")
-            raise EmbeddingServiceError(f"Embedding generation failed: {e}")
+        return self.get_embeddings([text])[0]
+
+    def get_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """
+        Get embedding vectors for several texts, in order.
+
+        Cached query embeddings are reused; all remaining texts are embedded
+        with a single API request.
+
+        Raises:
+            EmbeddingServiceError: If embedding generation fails
+        """
+        keys = [self._query_cache_key(text) for text in texts]
+        embeddings: Dict[Tuple[str, int, str], List[float]] = {}
+        now = time.monotonic()
+
+        with self._query_cache_lock:
+            for key in keys:
+                if key in embeddings:
+                    continue
+                entry = self._query_cache.get(key)
+                if entry is not None and now - entry[0] <= self._query_cache_ttl_seconds:
+                    self._query_cache.move_to_end(key)
+                    embeddings[key] = entry[1]
+                    self._query_cache_hits += 1
+                else:
+                    self._query_cache.pop(key, None)
+                    self._query_cache_misses += 1
+
+        missing = list(dict.fromkeys(key for key in keys if key not in embeddings))
+        if missing:
+            try:
+                response = self._client.embeddings.create(
+                    model=self._embedding_model,
+                    input=[key[2] for key in missing],
+                    dimensions=self._embedding_dimensions,
+                )
+                vectors = [item.embedding for item in sorted(response.data, key=lambda d: d.index)]
+            except Exception as e:
+                logger.error(f"Failed to generate embedding: {e}")
+                raise EmbeddingServiceError(f"Embedding generation failed: {e}")
+
+            with self._query_cache_lock:
+                for key, vector in zip(missing, vectors):
+                    embeddings[key] = vector
+                    self._query_cache[key] = (now, vector)
+                    self._query_cache.move_to_end(key)
+                while len(self._query_cache) > self._query_cache_max_entries:
+                    self._query_cache.popitem(last=False)
+
+        return [embeddings[key] for key in keys]
+
+    def _query_cache_key(self, text: str) -> Tuple[str, int, str]:
+        return (self._embedding_model, self._embedding_dimensions, _normalize_query(text))
+
+    def query_cache_stats(self) -> dict:
+        """Query embedding cache hits, misses and current size."""
+        with self._query_cache_lock:
+            return {
+                "hits": self._query_cache_hits,
+                "misses": self._query_cache_misses,
+                "size": len(self._query_cache),
+            }
 
     def search(
         self,
@@ -192,6 +309,7 @@ class UnifiedSearchService:
         offset: int = 0,
         source_types: Optional[List[str]] = None,
         min_similarity: float = 0.5,
+        mode: str = "vector",
     ) -> List[UnifiedSearchResult]:
         """
         Search for content semantically similar to query.
@@ -202,12 +320,18 @@ class UnifiedSearchService:
             offset: Results to skip for pagination
             source_types: Filter by source types (e.g., ['coda_page', 'intercom'])
             min_similarity: Minimum similarity threshold
+            mode: "vector" (cosine similarity only) or "hybrid" (lexical and
+                  vector candidates merged by reciprocal-rank fusion;
+                  min_similarity then applies to vector candidates only)
 
         Returns:
-            List of search results ordered by similarity
+            List of search results ordered by similarity (by fused rank in hybrid mode)
 
         Note: Returns empty list on errors (graceful degradation)
         """
+        if mode not in SEARCH_MODES:
+            raise ValueError(f"Invalid search mode: {mode}. Valid modes: {SEARCH_MODES}")
+
         try:
             # Enforce server-side limits
             config = self._config["search"]
@@ -217,6 +341,16 @@ class UnifiedSearchService:
             # Get query embedding
             query_embedding = self.get_embedding(query)
 
+            if mode == "hybrid":
+                return self._hybrid_search(
+                    query=query,
+                    embedding=query_embedding,
+                    limit=limit,
+                    offset=offset,
+                    source_types=source_types,
+                    min_similarity=min_similarity,
+                )
+
             return self._vector_search(
                 embedding=query_embedding,
                 limit=limit,
@@ -234,6 +368,55 @@ class UnifiedSearchService:
             logger.error(f"Unexpected error in search: {e}")
             return []
 
+    def search_many(
+        self,
+        queries: List[str],
+        limit: int = 20,
+        source_types: Optional[List[str]] = None,
+        min_similarity: float = 0.5,
+    ) -> List[List[UnifiedSearchResult]]:
+        """
+        Run several semantic searches at once.
+
+        All query embeddings come from one (cached) embedding request and all
+        vector lookups from one database round-trip.
+
+        Args:
+            queries: Search query texts
+            limit: Maximum results per query
+            source_types: Filter by source types (e.g., ['coda_page', 'intercom'])
+            min_similarity: Minimum similarity threshold
+
+        Returns:
+            One result list per query, in query order, each ordered by similarity
+
+        Note: Returns empty lists on errors (graceful degradation)
+        """
+        if not queries:
+            return []
+
+        try:
+            # Enforce server-side limits
+            config = self._config["search"]
+            limit = min(limit, config["max_limit"])
+            min_similarity = max(min_similarity, config["server_min_similarity"])
+
+            embeddings = self.get_embeddings(queries)
+
+            return self._vector_search_many(
+                embeddings=embeddings,
+                limit=limit,
+                source_types=source_types,
+                min_similarity=min_similarity,
+            )
+        except EmbeddingServiceError as e:
+            logger.warning(f"Embedding service unavailable: {e}")
+        except DatabaseError as e:
+            logger.error(f"Database error in search: {e}")
+        except Exception as e:
+            logger.error(f"Unexpected error in search: {e}")
+        return [[] for _ in queries]
+
     def _vector_search(
         self,
         embedding: List[float],
@@ -313,23 +496,197 @@ class UnifiedSearchService:
                     cur.execute(query, final_params)
                     rows = cur.fetchall()
 
-                    return [
-                        UnifiedSearchResult(
-                            id=row[0],
-                            source_type=row[1],
-                            source_id=row[2],
-                            title=row[3] or "Untitled",
-                            snippet=self._create_snippet(row[4]),
-                            similarity=float(row[5]),
-                            url=self._build_url(row[1], row[2]),
-                            metadata=row[6] or {},
-                        )
-                        for row in rows
-                    ]
+                    return [self._row_to_result(row) for row in rows]
+        except Exception as e:
+            logger.error(f"Vector search failed: {e}")
+            raise DatabaseError(f"Vector search failed: {e}")
+
+    def _vector_search_many(
+        self,
+        embeddings: List[List[float]],
+        limit: int,
+        source_types: Optional[List[str]] = None,
+        min_similarity: float = 0.5,
+    ) -> List[List[UnifiedSearchResult]]:
+        """
+        Top-`limit` vector matches for each embedding in one query.
+
+        The embeddings are passed as one text[] parameter and each is searched
+        in a LATERAL subquery, so every lookup still uses the per-query
+        ORDER BY ... LIMIT plan of _vector_search().
+        """
+        try:
+            from src.db.connection import get_connection
+
+            source_filter = ""
+            if source_types:
+                placeholders = ", ".join(["%s"] * len(source_types))
+                source_filter = f"AND e.source_type IN ({placeholders})"
+
+            query = f"""
+                SELECT
+                    q.idx,
+                    r.id,
+                    r.source_type,
+                    r.source_id,
+                    r.title,
+                    r.content,
+                    r.similarity,
+                    r.metadata
+                FROM unnest(%s::text[]) WITH ORDINALITY AS q(vec, idx)
+                CROSS JOIN LATERAL (
+                    SELECT
+                        e.id,
+                        e.source_type,
+                        e.source_id,
+                        e.title,
+                        e.content,
+                        1 - (e.embedding <=> q.vec::vector) as similarity,
+                        e.metadata
+                    FROM research_embeddings e
+                    WHERE e.embedding IS NOT NULL
+                      AND 1 - (e.embedding <=> q.vec::vector) >= %s
+                      {source_filter}
+                    ORDER BY e.embedding <=> q.vec::vector
+                    LIMIT %s
+                ) r
+                ORDER BY q.idx, r.similarity DESC
+            """
+            params = [[_vector_literal(embedding) for embedding in embeddings], min_similarity]
+            params.extend(source_types or [])
+            params.append(limit)
+
+            results: List[List[UnifiedSearchResult]] = [[] for _ in embeddings]
+            with get_connection() as conn:
+                with conn.cursor() as cur:
+                    cur.execute(query, params)
+                    for row in cur.fetchall():
+                        results[row[0] - 1].append(self._row_to_result(row[1:]))
+            return results
         except Exception as e:
             logger.error(f"Vector search failed: {e}")
             raise DatabaseError(f"Vector search failed: {e}")
 
+    def _hybrid_search(
+        self,
+        query: str,
+        embedding: List[float],
+        limit: int,
+        offset: int = 0,
+        source_types: Optional[List[str]] = None,
+        min_similarity: float = 0.5,
+    ) -> List[UnifiedSearchResult]:
+        """
+        Lexical + vector candidates fused with reciprocal-rank fusion.
+
+        Both candidate queries run in parallel on separate pooled connections.
+        Vector candidates come from a plain ORDER BY ... LIMIT over the ANN
+        index and are then held to min_similarity; lexical candidates are
+        full-text matches ranked by ts_rank_cd and kept regardless of cosine
+        similarity, which is what lets exact terms through.
+        """
+        config = self._config["hybrid"]
+        depth = max(config["candidates"], limit + offset)
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            lexical_future = executor.submit(
+                self._lexical_candidates, query, embedding, depth, source_types
+            )
+            vector_future = executor.submit(
+                self._vector_candidates, embedding, depth, source_types
+            )
+            lexical = lexical_future.result()
+            vector = [r for r in vector_future.result() if r.similarity >= min_similarity]
+
+        fused = reciprocal_rank_fusion([lexical, vector], k=config["rrf_k"])
+        return fused[offset:offset + limit]
+
+    def _lexical_candidates(
+        self,
+        query: str,
+        embedding: List[float],
+        limit: int,
+        source_types: Optional[List[str]] = None,
+    ) -> List[UnifiedSearchResult]:
+        """Full-text matches on content_tsv, best ts_rank_cd first."""
+        source_filter = ""
+        if source_types:
+            placeholders = ", ".join(["%s"] * len(source_types))
+            source_filter = f"AND source_type IN ({placeholders})"
+
+        # Cosine similarity is clamped at 0 (results require 0-1) because
+        # lexical matches can point away from the query vector
+        sql = f"""
+            SELECT
+                id,
+                source_type,
+                source_id,
+                title,
+                content,
+                GREATEST(1 - (embedding <=> %s::vector), 0) as similarity,
+                metadata
+            FROM research_embeddings, websearch_to_tsquery('english', %s) AS q
+            WHERE content_tsv @@ q
+              {source_filter}
+            ORDER BY ts_rank_cd(content_tsv, q, 32) DESC, id
+            LIMIT %s
+        """
+        return self._fetch_results(sql, [embedding, query] + (source_types or []) + [limit])
+
+    def _vector_candidates(
+        self,
+        embedding: List[float],
+        limit: int,
+        source_types: Optional[List[str]] = None,
+    ) -> List[UnifiedSearchResult]:
+        """Nearest neighbours by cosine distance, without a similarity floor."""
+        source_filter = ""
+        if source_types:
+            placeholders = ", ".join(["%s"] * len(source_types))
+            source_filter = f"AND source_type IN ({placeholders})"
+
+        sql = f"""
+            SELECT
+                id,
+                source_type,
+                source_id,
+                title,
+                content,
+                GREATEST(1 - (embedding <=> %s::vector), 0) as similarity,
+                metadata
+            FROM research_embeddings
+            WHERE embedding IS NOT NULL
+              {source_filter}
+            ORDER BY embedding <=> %s::vector
+            LIMIT %s
+        """
+        return self._fetch_results(sql, [embedding] + (source_types or []) + [embedding, limit])
+
+    def _fetch_results(self, sql: str, params: list) -> List[UnifiedSearchResult]:
+        try:
+            from src.db.connection import get_connection
+
+            with get_connection() as conn:
+                with conn.cursor() as cur:
+                    cur.execute(sql, params)
+                    return [self._row_to_result(row) for row in cur.fetchall()]
+        except Exception as e:
+            logger.error(f"Hybrid candidate search failed: {e}")
+            raise DatabaseError(f"Hybrid candidate search failed: {e}")
+
+    def _row_to_result(self, row) -> UnifiedSearchResult:
+        """Build a result from (id, source_type, source_id, title, content, similarity, metadata)."""
+        return UnifiedSearchResult(
+            id=row[0],
+            source_type=row[1],
+            source_id=row[2],
+            title=row[3] or "Untitled",
+            snippet=self._create_snippet(row[4]),
+            similarity=float(row[5]),
+            url=self._build_url(row[1], row[2]),
+            metadata=row[6] or {},
+        )
+
     def search_similar(
         self,
         source_type: str,
@@ -502,6 +859,27 @@ class UnifiedSearchService:
             min_similarity=0.5,
         )
 
+    def search_for_context_many(
+        self,
+        queries: List[str],
+        max_results: Optional[int] = None,
+    ) -> List[List[UnifiedSearchResult]]:
+        """
+        Batched search_for_context() for a group of conversations.
+
+        Returns:
+            One list of research results per query, in query order
+        """
+        config = self._config["context_augmentation"]
+        max_results = max_results or config["max_results"]
+
+        return self.search_many(
+            queries=[query[:500] for query in queries],  # Limit query length
+            limit=max_results,
+            source_types=["coda_page", "coda_theme"],  # Exclude intercom
+            min_similarity=0.5,
+        )
+
     def suggest_evidence(
         self,
         query: str,
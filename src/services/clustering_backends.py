@@ -0,0 +1,337 @@
+"""
+Embedding clustering backends for HybridClusteringService (Stage 1).
+
+The original Stage 1 built a dense n x n cosine distance matrix and ran
+AgglomerativeClustering on it: O(n²) memory (~800 MB at 10k conversations)
+and unusable at 100k+. Backends:
+
+- ExactAgglomerativeBackend: the original algorithm, kept for small runs.
+- PartitionedAgglomerativeBackend: memory-bounded. Mini-batch k-means splits
+  the (normalized) embeddings into partitions of at most `partition_size`,
+  each partition is clustered exactly with the same linkage/threshold, and
+  sub-clusters from different partitions whose centroids are close are
+  merged when the exact linkage criterion between them still holds.
+  Peak memory is O(partition_size² + n·d) instead of O(n²).
+
+select_backend() picks the exact path up to `max_exact_size` conversations
+and the partitioned one above it.
+"""
+
+import logging
+import os
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from sklearn.cluster import AgglomerativeClustering, MiniBatchKMeans
+from sklearn.metrics.pairwise import cosine_similarity
+
+logger = logging.getLogger(__name__)
+
+BACKEND_AUTO = "auto"
+BACKEND_EXACT = "exact"
+BACKEND_PARTITIONED = "partitioned"
+
+# Above this many conversations, "auto" switches to the partitioned backend.
+# 5000 x 5000 float64 distances is ~200 MB; beyond that memory grows quadratically.
+DEFAULT_MAX_EXACT_SIZE = int(os.getenv("HYBRID_CLUSTERING_MAX_EXACT", "5000"))
+DEFAULT_BACKEND = os.getenv("HYBRID_CLUSTERING_BACKEND", BACKEND_AUTO)
+
+# Max conversations clustered exactly in one partition (~32 MB of distances)
+DEFAULT_PARTITION_SIZE = 2000
+
+# Nearest sub-cluster centroids considered as merge candidates across partitions
+MERGE_CANDIDATES_PER_CLUSTER = 10
+
+# Row block size for blocked similarity computations
+BLOCK_SIZE = 1024
+
+
+class ClusteringBackend(ABC):
+    """Clusters an embedding matrix into flat labels."""
+
+    name: str = ""
+
+    def __init__(self, distance_threshold: float, linkage: str):
+        self.distance_threshold = distance_threshold
+        self.linkage = linkage
+
+    @abstractmethod
+    def cluster(self, embeddings: np.ndarray) -> np.ndarray:
+        """
+        Cluster embeddings by cosine distance.
+
+        Args:
+            embeddings: Numpy array of shape (n_conversations, embedding_dim)
+
+        Returns:
+            Array of cluster labels (one per conversation)
+        """
+        pass
+
+    @abstractmethod
+    def estimate_peak_bytes(self, n: int, dim: int, itemsize: int = 4) -> int:
+        """
+        Analytic peak memory of cluster() for an n x dim embedding matrix.
+
+        Args:
+            itemsize: Bytes per element of the embeddings (embeddings.dtype.itemsize)
+        """
+        pass
+
+
+class ExactAgglomerativeBackend(ClusteringBackend):
+    """Agglomerative clustering on a precomputed dense cosine distance matrix."""
+
+    name = BACKEND_EXACT
+
+    def cluster(self, embeddings: np.ndarray) -> np.ndarray:
+        if len(embeddings) < 2:
+            # Single conversation gets its own cluster
+            return np.array([0] * len(embeddings))
+
+        # Cosine distance (1 - similarity), computed in place to avoid a second n x n copy
+        distance_matrix = cosine_similarity(embeddings)
+        np.subtract(1, distance_matrix, out=distance_matrix)
+
+        clustering = AgglomerativeClustering(
+            n_clusters=None,  # Let distance_threshold determine cluster count
+            metric="precomputed",
+            linkage=self.linkage,
+            distance_threshold=self.distance_threshold,
+        )
+        return clustering.fit_predict(distance_matrix)
+
+    def estimate_peak_bytes(self, n: int, dim: int, itemsize: int = 4) -> int:
+        # Embeddings plus the dense distance matrix, which cosine_similarity
+        # returns in the input's float dtype
+        return n * dim * itemsize + n * n * itemsize
+
+
+class PartitionedAgglomerativeBackend(ClusteringBackend):
+    """
+    Mini-batch k-means pre-grouping followed by exact agglomerative refinement.
+
+    Approximation: two conversations can only share a cluster if they land in
+    the same partition or their sub-clusters are merged in the cross-partition
+    pass, which only considers each sub-cluster's nearest centroids.
+    """
+
+    name = BACKEND_PARTITIONED
+
+    def __init__(
+        self,
+        distance_threshold: float,
+        linkage: str,
+        partition_size: int = DEFAULT_PARTITION_SIZE,
+        merge_candidates: int = MERGE_CANDIDATES_PER_CLUSTER,
+        random_state: int = 0,
+    ):
+        super().__init__(distance_threshold, linkage)
+        self.partition_size = max(2, partition_size)
+        self.merge_candidates = merge_candidates
+        self.random_state = random_state
+        self._exact = ExactAgglomerativeBackend(distance_threshold, linkage)
+
+    def cluster(self, embeddings: np.ndarray) -> np.ndarray:
+        n = len(embeddings)
+        if n <= self.partition_size:
+            return self._exact.cluster(embeddings)
+
+        vectors = np.asarray(embeddings, dtype=np.float32)
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        vectors = vectors / norms
+
+        partitions = self._partition(vectors, np.arange(n))
+
+        # Exact refinement within each partition
+        labels = np.empty(n, dtype=np.int64)
+        cluster_partition: List[int] = []
+        next_label = 0
+        for partition_id, indices in enumerate(partitions):
+            local = self._exact.cluster(vectors[indices])
+            labels[indices] = local + next_label
+            count = int(local.max()) + 1
+            cluster_partition.extend([partition_id] * count)
+            next_label += count
+
+        labels = self._merge_across_partitions(vectors, labels, np.asarray(cluster_partition))
+
+        logger.debug(
+            f"Partitioned clustering: {n} conversations in {len(partitions)} partitions -> "
+            f"{next_label} sub-clusters -> {len(np.unique(labels))} clusters"
+        )
+        return labels
+
+    def estimate_peak_bytes(self, n: int, dim: int, itemsize: int = 4) -> int:
+        if n <= self.partition_size:
+            return self._exact.estimate_peak_bytes(n, dim, itemsize)
+        # Normalized float32 copy plus one float32 partition's distance matrix
+        return n * dim * 4 + self.partition_size * self.partition_size * 4
+
+    def _partition(self, vectors: np.ndarray, indices: np.ndarray) -> List[np.ndarray]:
+        """Recursively split indices with mini-batch k-means until each part fits."""
+        if len(indices) <= self.partition_size:
+            return [indices]
+
+        n_parts = int(np.ceil(len(indices) / self.partition_size))
+        kmeans = MiniBatchKMeans(
+            n_clusters=n_parts,
+            batch_size=BLOCK_SIZE,
+            n_init=3,
+            random_state=self.random_state,
+        )
+        assignments = kmeans.fit_predict(vectors[indices])
+        groups = [indices[assignments == k] for k in range(n_parts)]
+        groups = [g for g in groups if len(g)]
+
+        if len(groups) < 2:
+            # Degenerate data (e.g. identical vectors): fall back to fixed-size chunks
+            return [
+                indices[start:start + self.partition_size]
+                for start in range(0, len(indices), self.partition_size)
+            ]
+
+        parts = []
+        for group in groups:
+            parts.extend(self._partition(vectors, group))
+        return parts
+
+    def _merge_across_partitions(
+        self,
+        vectors: np.ndarray,
+        labels: np.ndarray,
+        cluster_partition: np.ndarray,
+    ) -> np.ndarray:
+        """Merge sub-clusters from different partitions that satisfy the linkage criterion."""
+        n_clusters = len(cluster_partition)
+        members: Dict[int, np.ndarray] = {}
+        order = np.argsort(labels, kind="stable")
+        boundaries = np.searchsorted(labels[order], np.arange(n_clusters + 1))
+        for label in range(n_clusters):
+            members[label] = order[boundaries[label]:boundaries[label + 1]]
+
+        centroids = np.zeros((n_clusters, vectors.shape[1]), dtype=np.float32)
+        np.add.at(centroids, labels, vectors)
+        norms = np.linalg.norm(centroids, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        centroids /= norms
+
+        candidates = self._candidate_pairs(centroids, cluster_partition)
+        if not candidates:
+            return labels
+
+        parent = list(range(n_clusters))
+
+        def find(x: int) -> int:
+            while parent[x] != x:
+                parent[x] = parent[parent[x]]
+                x = parent[x]
+            return x
+
+        merges = 0
+        for _, a, b in candidates:
+            root_a, root_b = find(a), find(b)
+            if root_a == root_b:
+                continue
+            if self._linkage_distance(vectors, members[root_a], members[root_b]) <= self.distance_threshold:
+                parent[root_b] = root_a
+                members[root_a] = np.concatenate([members[root_a], members.pop(root_b)])
+                merges += 1
+
+        if not merges:
+            return labels
+
+        roots = np.array([find(label) for label in range(n_clusters)])
+        # Relabel densely so labels stay 0..k-1
+        _, dense = np.unique(roots[labels], return_inverse=True)
+        return dense
+
+    def _candidate_pairs(
+        self,
+        centroids: np.ndarray,
+        cluster_partition: np.ndarray,
+    ) -> List[Tuple[float, int, int]]:
+        """Nearest cross-partition centroid pairs within threshold, closest first."""
+        k = min(self.merge_candidates, len(centroids) - 1)
+        if k <= 0:
+            return []
+
+        pairs = set()
+        scored = []
+        for start in range(0, len(centroids), BLOCK_SIZE):
+            block = centroids[start:start + BLOCK_SIZE]
+            distances = 1 - block @ centroids.T
+            for offset in range(len(block)):
+                distances[offset, start + offset] = np.inf
+            nearest = np.argpartition(distances, k - 1, axis=1)[:, :k]
+            for offset, row in enumerate(nearest):
+                a = start + offset
+                for b in row:
+                    b = int(b)
+                    distance = float(distances[offset, b])
+                    if distance > self.distance_threshold:
+                        continue
+                    if cluster_partition[a] == cluster_partition[b]:
+                        continue  # Already decided by exact clustering
+                    key = (min(a, b), max(a, b))
+                    if key not in pairs:
+                        pairs.add(key)
+                        scored.append((distance, key[0], key[1]))
+
+        scored.sort()
+        return scored
+
+    def _linkage_distance(self, vectors: np.ndarray, a: np.ndarray, b: np.ndarray) -> float:
+        """Linkage distance between two member sets, computed in row blocks."""
+        worst = -np.inf
+        best = np.inf
+        total = 0.0
+        for start in range(0, len(a), BLOCK_SIZE):
+            distances = 1 - vectors[a[start:start + BLOCK_SIZE]] @ vectors[b].T
+            worst = max(worst, float(distances.max()))
+            best = min(best, float(distances.min()))
+            total += float(distances.sum(dtype=np.float64))
+
+        if self.linkage == "single":
+            return best
+        if self.linkage == "average":
+            return total / (len(a) * len(b))
+        return worst
+
+
+def select_backend(
+    n_conversations: int,
+    distance_threshold: float,
+    linkage: str,
+    backend: str = BACKEND_AUTO,
+    max_exact_size: int = DEFAULT_MAX_EXACT_SIZE,
+    partition_size: Optional[int] = None,
+) -> ClusteringBackend:
+    """
+    Choose a clustering backend for a run.
+
+    Args:
+        n_conversations: Number of embeddings to cluster
+        distance_threshold: Cosine distance threshold
+        linkage: Linkage method ("average", "complete", "single")
+        backend: "auto", "exact" or "partitioned"
+        max_exact_size: Largest run "auto" clusters with the exact backend
+        partition_size: Partition size for the partitioned backend
+
+    Returns:
+        ClusteringBackend instance
+    """
+    if backend == BACKEND_AUTO:
+        backend = BACKEND_EXACT if n_conversations <= max_exact_size else BACKEND_PARTITIONED
+
+    if backend == BACKEND_EXACT:
+        return ExactAgglomerativeBackend(distance_threshold, linkage)
+    if backend == BACKEND_PARTITIONED:
+        return PartitionedAgglomerativeBackend(
+            distance_threshold,
+            linkage,
+            partition_size=partition_size or min(DEFAULT_PARTITION_SIZE, max_exact_size),
+        )
+    raise ValueError(f"Unknown clustering backend: {backend}")
@@ -2,13 +2,16 @@
 EmbeddingService: Generate and store conversation embeddings for hybrid clustering.
 
 Uses OpenAI text-embedding-3-small (1536 dimensions) for semantic similarity.
-Supports batched API calls for efficiency and async operation.
+Supports batched API calls for efficiency and async operation, and an
+optional content-addressed cache (embedding_cache table) so text embedded in
+an earlier run is not re-embedded.
 """
 
 import asyncio
+import hashlib
 import logging
 from dataclasses import dataclass
-from typing import Callable, List, Optional
+from typing import Callable, Dict, List, Optional, Tuple
 
 from openai import AsyncOpenAI, OpenAI
 
@@ -55,6 +58,11 @@ def _sanitize_error_message(error: Exception) -> str:
     return f"Embedding generation failed ({error_type})"
 
 
+def content_hash(text: str) -> str:
+    """Cache key for a prepared embedding text (SHA-256 hex digest)."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
 @dataclass
 class EmbeddingResult:
     """Result of embedding generation for a single conversation."""
@@ -74,6 +82,8 @@ class BatchEmbeddingResult:
     total_processed: int
     total_success: int
     total_failed: int
+    cache_hits: int = 0
+    cache_misses: int = 0
 
 
 class EmbeddingService:
@@ -88,6 +98,7 @@ class EmbeddingService:
         self,
         batch_size: int = DEFAULT_BATCH_SIZE,
         model: str = EMBEDDING_MODEL,
+        use_cache: bool = False,
     ):
         """
         Initialize the embedding service.
@@ -95,9 +106,12 @@ class EmbeddingService:
         Args:
             batch_size: Number of texts to embed per API call (default 50)
             model: OpenAI embedding model to use
+            use_cache: Reuse/store conversation embeddings in embedding_cache,
+                keyed by (model, dimensions, hash of the prepared text)
         """
         self.batch_size = batch_size
         self.model = model
+        self.use_cache = use_cache
         self._sync_client: Optional[OpenAI] = None
         self._async_client: Optional[AsyncOpenAI] = None
 
@@ -307,13 +321,22 @@ class EmbeddingService:
             texts.append(text)
             conv_ids.append(conv_id)
 
+        # Serve previously embedded text from the cache; only misses go to the API
+        cached: List[EmbeddingResult] = []
+        new_embeddings: Dict[str, List[float]] = {}
+        if self.use_cache and texts:
+            cached, texts, conv_ids = await self._split_cached(texts, conv_ids)
+        cache_misses = len(texts) if self.use_cache else 0
+
         if not texts:
             return BatchEmbeddingResult(
-                successful=successful,
+                successful=cached,
                 failed=failed,
                 total_processed=len(conversations),
-                total_success=0,
+                total_success=len(cached),
                 total_failed=len(failed),
+                cache_hits=len(cached),
+                cache_misses=cache_misses,
             )
 
         # Generate embeddings in batches
@@ -353,6 +376,8 @@ class EmbeddingService:
 
                     # Map embeddings back to conversation IDs using sorted order
                     for data in sorted_data:
+                        if self.use_cache:
+                            new_embeddings[content_hash(batch_texts[data.index])] = data.embedding
                         successful.append(
                             EmbeddingResult(
                                 conversation_id=batch_ids[data.index],
@@ -391,14 +416,73 @@ class EmbeddingService:
                     )
                 )
 
+        if new_embeddings:
+            await self._store_cached(new_embeddings)
+
         return BatchEmbeddingResult(
-            successful=successful,
+            successful=cached + successful,
             failed=failed,
             total_processed=len(conversations),
-            total_success=len(successful),
+            total_success=len(cached) + len(successful),
             total_failed=len(failed),
+            cache_hits=len(cached),
+            cache_misses=cache_misses,
         )
 
+    async def _split_cached(
+        self,
+        texts: List[str],
+        conv_ids: List[str],
+    ) -> Tuple[List[EmbeddingResult], List[str], List[str]]:
+        """
+        Split prepared texts into cache hits and texts that still need embedding.
+
+        A failed cache lookup is not fatal: every text is treated as a miss.
+
+        Returns:
+            (cached results, miss texts, miss conversation IDs)
+        """
+        from src.db.embedding_storage import load_cached_embeddings
+
+        hashes = [content_hash(text) for text in texts]
+        try:
+            found = await asyncio.to_thread(
+                load_cached_embeddings, list(set(hashes)), self.model, EMBEDDING_DIMENSIONS
+            )
+        except Exception as e:
+            logger.warning(f"Embedding cache lookup failed, embedding all texts: {e}")
+            found = {}
+
+        cached: List[EmbeddingResult] = []
+        miss_texts: List[str] = []
+        miss_ids: List[str] = []
+        for text, text_hash, conv_id in zip(texts, hashes, conv_ids):
+            if text_hash in found:
+                cached.append(
+                    EmbeddingResult(
+                        conversation_id=conv_id,
+                        embedding=found[text_hash],
+                        success=True,
+                    )
+                )
+            else:
+                miss_texts.append(text)
+                miss_ids.append(conv_id)
+
+        logger.info(f"Embedding cache: {len(cached)} hits, {len(miss_texts)} misses")
+        return cached, miss_texts, miss_ids
+
+    async def _store_cached(self, embeddings: Dict[str, List[float]]) -> None:
+        """Add newly generated embeddings to the cache (best effort)."""
+        from src.db.embedding_storage import store_cached_embeddings
+
+        try:
+            await asyncio.to_thread(
+                store_cached_embeddings, embeddings, self.model, EMBEDDING_DIMENSIONS
+            )
+        except Exception as e:
+            logger.warning(f"Failed to store {len(embeddings)} embeddings in cache: {e}")
+
     def generate_conversation_embeddings_sync(
         self,
         conversations: List[dict],
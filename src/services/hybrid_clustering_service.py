@@ -26,17 +26,24 @@ Dependencies:
 """
 
 import logging
+import os
 import re
+import threading
+import time
+import tracemalloc
 from collections import defaultdict
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
-from sklearn.cluster import AgglomerativeClustering
-from sklearn.metrics.pairwise import cosine_similarity
 
-from src.db.embedding_storage import get_embeddings_for_run
+from src.db.embedding_storage import load_embedding_matrix_for_run
 from src.db.facet_storage import get_facets_for_run
+from src.services.clustering_backends import (
+    DEFAULT_BACKEND,
+    DEFAULT_MAX_EXACT_SIZE,
+    select_backend,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -45,6 +52,14 @@ logger = logging.getLogger(__name__)
 DEFAULT_DISTANCE_THRESHOLD = 0.55
 DEFAULT_LINKAGE = "complete"
 
+# Measure Stage 1 peak memory with tracemalloc instead of the backend's
+# analytic estimate. Tracing is process-wide and slows every allocation
+# (~30% on large partitioned runs), so it is off by default.
+DEFAULT_TRACE_MEMORY = os.getenv("HYBRID_CLUSTERING_TRACE_MEMORY", "false").lower() == "true"
+
+# tracemalloc has a single global peak; only one run may trace at a time
+_TRACE_LOCK = threading.Lock()
+
 
 @dataclass
 class HybridCluster:
@@ -76,6 +91,13 @@ class ClusteringResult:
     # Distribution stats for logging/monitoring
     cluster_size_distribution: Dict[int, int] = field(default_factory=dict)  # size -> count
 
+    # Stage 1 cost: backend used ("exact"/"partitioned"), wall time, peak memory
+    # (the backend's analytic estimate unless traced with tracemalloc)
+    clustering_backend: Optional[str] = None
+    clustering_duration_ms: float = 0.0
+    clustering_peak_memory_mb: float = 0.0
+    clustering_memory_traced: bool = False
+
     @property
     def success(self) -> bool:
         return len(self.errors) == 0 and self.total_conversations > 0
@@ -94,6 +116,9 @@ class HybridClusteringService:
         self,
         distance_threshold: float = DEFAULT_DISTANCE_THRESHOLD,
         linkage: str = DEFAULT_LINKAGE,
+        backend: str = DEFAULT_BACKEND,
+        max_exact_size: int = DEFAULT_MAX_EXACT_SIZE,
+        trace_memory: bool = DEFAULT_TRACE_MEMORY,
     ):
         """
         Initialize the hybrid clustering service.
@@ -103,9 +128,17 @@ class HybridClusteringService:
                                Lower = more clusters, higher = fewer clusters.
                                Default 0.5 was validated on 127 conversations.
             linkage: Linkage method for clustering ("average", "complete", "single").
+            backend: Embedding clustering backend ("auto", "exact", "partitioned").
+                     "auto" uses the exact O(n²) path up to max_exact_size.
+            max_exact_size: Largest run clustered exactly when backend is "auto".
+            trace_memory: Measure Stage 1 peak memory with tracemalloc
+                          (slow, process-wide) instead of estimating it.
         """
         self.distance_threshold = distance_threshold
         self.linkage = linkage
+        self.backend = backend
+        self.max_exact_size = max_exact_size
+        self.trace_memory = trace_memory
 
     def cluster_for_run(
         self,
@@ -132,20 +165,20 @@ class HybridClusteringService:
 
         # Load embeddings and facets from DB
         try:
-            embeddings_data = get_embeddings_for_run(pipeline_run_id)
+            embedding_ids, embeddings = load_embedding_matrix_for_run(pipeline_run_id)
             facets_data = get_facets_for_run(pipeline_run_id)
         except Exception as e:
             result.errors.append(f"Database error: {e}")
             logger.error(f"Database error loading data for run {pipeline_run_id}: {e}", exc_info=True)
             return result
 
-        if not embeddings_data:
+        if not embedding_ids:
             result.errors.append(f"No embeddings found for pipeline run {pipeline_run_id}")
             logger.warning(f"No embeddings found for pipeline run {pipeline_run_id}")
             return result
 
-        # Build lookup maps
-        embeddings_by_conv = {e["conversation_id"]: e["embedding"] for e in embeddings_data}
+        # Build lookup maps (conversation_id -> row in the embedding matrix)
+        embeddings_by_conv = {cid: row for row, cid in enumerate(embedding_ids)}
         facets_by_conv = {f["conversation_id"]: f for f in facets_data}
 
         # Find conversations with both embeddings and facets
@@ -173,13 +206,11 @@ class HybridClusteringService:
         complete_conv_ids.sort()
 
         # Prepare embedding matrix (ordered by complete_conv_ids)
-        embedding_matrix = np.array([
-            embeddings_by_conv[cid] for cid in complete_conv_ids
-        ])
+        embedding_matrix = embeddings[[embeddings_by_conv[cid] for cid in complete_conv_ids]]
 
         # Stage 1: Embedding clustering
         try:
-            cluster_labels = self._cluster_embeddings(embedding_matrix)
+            cluster_labels = self._measure_embedding_clustering(embedding_matrix, result)
         except Exception as e:
             result.errors.append(f"Embedding clustering failed: {e}")
             logger.error(f"Embedding clustering failed: {e}", exc_info=True)
@@ -209,52 +240,92 @@ class HybridClusteringService:
 
         return result
 
+    def _select_backend(self, n_conversations: int):
+        return select_backend(
+            n_conversations,
+            distance_threshold=self.distance_threshold,
+            linkage=self.linkage,
+            backend=self.backend,
+            max_exact_size=self.max_exact_size,
+        )
+
     def _cluster_embeddings(
         self,
         embeddings: np.ndarray,
+        result: Optional[ClusteringResult] = None,
     ) -> np.ndarray:
         """
-        Stage 1: Cluster embeddings using agglomerative clustering.
+        Stage 1: Cluster embeddings by cosine distance.
 
-        Uses cosine distance which works well for text embeddings.
+        Delegates to a clustering backend chosen by run size (see
+        clustering_backends): exact agglomerative clustering for small runs,
+        partitioned agglomerative clustering above max_exact_size.
 
         Args:
             embeddings: Numpy array of shape (n_conversations, embedding_dim)
+            result: Optional result to record the backend used on
 
         Returns:
             Array of cluster labels (one per conversation)
 
         Performance Notes:
-            - Memory: O(n²) due to precomputed distance matrix
-            - 10k conversations: ~800 MB peak memory
-            - 100k+ conversations: Consider batching or alternative algorithms
+            - Exact: O(n²) memory for the precomputed distance matrix
+              (~200 MB at 5k conversations, ~800 MB at 10k)
+            - Partitioned: O(partition_size² + n·d) memory
             - Validated on 127 conversations (prototype dataset)
         """
-        if len(embeddings) < 2:
-            # Single conversation gets its own cluster
-            return np.array([0] * len(embeddings))
-
-        # Compute cosine distance matrix (1 - similarity)
-        similarity_matrix = cosine_similarity(embeddings)
-        distance_matrix = 1 - similarity_matrix
-
-        # Agglomerative clustering with precomputed distances
-        clustering = AgglomerativeClustering(
-            n_clusters=None,  # Let distance_threshold determine cluster count
-            metric="precomputed",
-            linkage=self.linkage,
-            distance_threshold=self.distance_threshold,
-        )
-
-        labels = clustering.fit_predict(distance_matrix)
+        backend = self._select_backend(len(embeddings))
+        if result is not None:
+            result.clustering_backend = backend.name
+        labels = backend.cluster(embeddings)
 
         logger.debug(
-            f"Embedding clustering: {len(embeddings)} conversations -> "
+            f"Embedding clustering ({backend.name}): {len(embeddings)} conversations -> "
             f"{len(set(labels))} clusters (threshold={self.distance_threshold})"
         )
 
         return labels
 
+    def _measure_embedding_clustering(
+        self,
+        embeddings: np.ndarray,
+        result: ClusteringResult,
+    ) -> np.ndarray:
+        """
+        Run Stage 1 and record backend, duration and peak memory on the result.
+
+        Peak memory is the backend's analytic estimate. With trace_memory it
+        is measured with tracemalloc instead, but only if no other caller
+        (or concurrent run) is already tracing; otherwise the estimate is used.
+        """
+        traced = (
+            self.trace_memory
+            and not tracemalloc.is_tracing()
+            and _TRACE_LOCK.acquire(blocking=False)
+        )
+        if traced:
+            tracemalloc.start()
+        start = time.perf_counter()
+        try:
+            labels = self._cluster_embeddings(embeddings, result)
+        finally:
+            result.clustering_duration_ms = (time.perf_counter() - start) * 1000
+            if traced:
+                _, peak = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+                _TRACE_LOCK.release()
+
+        if traced:
+            peak_bytes = peak
+        else:
+            n, dim = embeddings.shape
+            peak_bytes = self._select_backend(n).estimate_peak_bytes(
+                n, dim, embeddings.dtype.itemsize
+            )
+        result.clustering_peak_memory_mb = peak_bytes / (1024 * 1024)
+        result.clustering_memory_traced = traced
+        return labels
+
     def _create_hybrid_subclusters(
         self,
         conversation_ids: List[str],
@@ -777,6 +848,12 @@ class HybridClusteringService:
             f"{result.hybrid_clusters_count} hybrid clusters"
         )
         logger.info(f"Cluster size distribution: {dist_summary}")
+        logger.info(
+            f"Embedding clustering backend={result.clustering_backend}: "
+            f"{result.clustering_duration_ms:.0f}ms, "
+            f"peak memory {result.clustering_peak_memory_mb:.1f} MB "
+            f"({'traced' if result.clustering_memory_traced else 'estimated'})"
+        )
 
         if result.fallback_conversations:
             logger.warning(
@@ -840,7 +917,7 @@ class HybridClusteringService:
 
         # Stage 1: Embedding clustering
         try:
-            cluster_labels = self._cluster_embeddings(embedding_matrix)
+            cluster_labels = self._measure_embedding_clustering(embedding_matrix, result)
         except Exception as e:
             result.errors.append(f"Embedding clustering failed: {e}")
             return result
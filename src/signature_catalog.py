@@ -0,0 +1,151 @@
+"""
+Run-scoped cache of theme_aggregates signatures.
+
+ThemeExtractor.get_existing_signatures used to run an unbounded
+SELECT over theme_aggregates on every call, and pipeline theme extraction
+calls it after every single extraction (plus once more per canonicalization).
+SignatureCatalog loads the table once, indexes it by signature and by
+product area, and answers membership in O(1).
+
+Invalidation: at most every `revalidate_seconds` the catalog runs a
+single-row fingerprint query (row count, total occurrences, max id,
+latest last_seen_at). If the fingerprint changed, the catalog reloads.
+Call invalidate() to force a reload on next access.
+"""
+
+import logging
+import threading
+import time
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+# How often (seconds) to check whether theme_aggregates changed
+DEFAULT_REVALIDATE_SECONDS = 30.0
+
+
+class SignatureCatalog:
+    """
+    Cached, indexed snapshot of theme_aggregates signatures.
+
+    Thread-safe: theme extraction reads the catalog from many worker threads.
+    """
+
+    def __init__(self, revalidate_seconds: float = DEFAULT_REVALIDATE_SECONDS):
+        self.revalidate_seconds = revalidate_seconds
+        self._lock = threading.Lock()
+        self._rows: Optional[list[dict]] = None  # Ordered by occurrence_count DESC
+        self._by_signature: dict[str, dict] = {}
+        self._ordered_by_area: dict[Optional[str], list[dict]] = {}
+        self._fingerprint: Optional[tuple] = None
+        self._checked_at = 0.0
+
+        # Observability
+        self.loads = 0
+
+    def invalidate(self) -> None:
+        """Force a reload on next access."""
+        with self._lock:
+            self._rows = None
+            self._fingerprint = None
+
+    def contains(self, signature: str) -> bool:
+        """O(1) membership check against theme_aggregates."""
+        self._ensure_fresh()
+        with self._lock:
+            return signature in self._by_signature
+
+    def get(self, signature: str) -> Optional[dict]:
+        """Return the catalog entry for a signature, if any."""
+        self._ensure_fresh()
+        with self._lock:
+            return self._by_signature.get(signature)
+
+    def signatures(self, product_area: Optional[str] = None) -> list[dict]:
+        """
+        All catalog signatures, ordered like the original query.
+
+        With product_area, signatures from that area come first (then by
+        occurrence count); otherwise ordered by occurrence count only.
+        The returned list is shared - callers must not mutate it.
+        """
+        self._ensure_fresh()
+        with self._lock:
+            ordered = self._ordered_by_area.get(product_area)
+            if ordered is None:
+                rows = self._rows or []
+                if product_area is None:
+                    ordered = rows
+                else:
+                    # Stable partition keeps occurrence_count DESC within each group
+                    ordered = (
+                        [r for r in rows if r["product_area"] == product_area]
+                        + [r for r in rows if r["product_area"] != product_area]
+                    )
+                self._ordered_by_area[product_area] = ordered
+            return ordered
+
+    def _ensure_fresh(self) -> None:
+        with self._lock:
+            loaded = self._rows is not None
+            due = time.monotonic() - self._checked_at >= self.revalidate_seconds
+
+        if loaded and not due:
+            return
+
+        try:
+            from .db.connection import get_connection
+        except ImportError:
+            from db.connection import get_connection
+
+        try:
+            with get_connection() as conn:
+                with conn.cursor() as cur:
+                    cur.execute("""
+                        SELECT COUNT(*), COALESCE(SUM(occurrence_count), 0),
+                               MAX(id), MAX(last_seen_at)
+                        FROM theme_aggregates
+                    """)
+                    fingerprint = tuple(cur.fetchone())
+
+                    with self._lock:
+                        self._checked_at = time.monotonic()
+                        if self._rows is not None and fingerprint == self._fingerprint:
+                            return
+
+                    cur.execute("""
+                        SELECT issue_signature, product_area, component, occurrence_count
+                        FROM theme_aggregates
+                        ORDER BY occurrence_count DESC
+                    """)
+                    rows = [
+                        {
+                            "signature": row[0],
+                            "product_area": row[1],
+                            "component": row[2],
+                            "count": row[3],
+                        }
+                        for row in cur.fetchall()
+                    ]
+        except Exception as e:
+            if not loaded:
+                raise
+            # Keep serving the last good snapshot; retry after the next interval
+            logger.warning(f"Signature catalog revalidation failed, using cached snapshot: {e}")
+            with self._lock:
+                self._checked_at = time.monotonic()
+            return
+
+        by_signature = {}
+        for row in rows:
+            # Keep the highest-count row when a signature appears more than once
+            by_signature.setdefault(row["signature"], row)
+
+        with self._lock:
+            self._rows = rows
+            self._by_signature = by_signature
+            self._ordered_by_area = {}
+            self._fingerprint = fingerprint
+            self.loads += 1
+
+        logger.info(f"Loaded signature catalog: {len(rows)} signatures from theme_aggregates")
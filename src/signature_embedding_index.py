@@ -0,0 +1,189 @@
+"""
+Vector index of theme signature embeddings for embedding-based canonicalization.
+
+canonicalize_via_embedding used to embed every existing signature on every
+call, so canonicalization cost grew linearly (in API round-trips) with the
+theme_aggregates catalog. This index embeds each signature description once,
+persists it in signature_embeddings (migration 027), keeps the vectors in a
+normalized float32 matrix, and answers nearest-neighbour queries with a
+single matrix-vector product.
+
+Usage:
+    index = SignatureEmbeddingIndex(embed_batch=extractor.get_embeddings)
+    index.ensure(existing_signatures)  # Loads/embeds only unseen descriptions
+    best_sig, similarity = index.nearest(query_embedding, existing_signatures)
+"""
+
+import hashlib
+import logging
+import threading
+from typing import Callable, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MODEL = "text-embedding-3-small"
+
+# Max inputs per embeddings request when backfilling unseen signatures
+EMBED_BATCH_SIZE = 256
+
+
+def describe_signature(sig_info: dict) -> str:
+    """Text embedded for an existing signature (matches the original canonicalization format)."""
+    return f"{sig_info['signature'].replace('_', ' ')}: {sig_info['product_area']} {sig_info['component']}"
+
+
+def description_hash(description: str) -> str:
+    """Content address for a signature description."""
+    return hashlib.sha256(description.encode("utf-8")).hexdigest()
+
+
+class SignatureEmbeddingIndex:
+    """
+    In-memory matrix of signature description embeddings backed by Postgres.
+
+    Thread-safe: theme extraction canonicalizes from many worker threads.
+    """
+
+    def __init__(
+        self,
+        embed_batch: Callable[[List[str]], List[List[float]]],
+        model: str = DEFAULT_MODEL,
+        persist: bool = True,
+    ):
+        """
+        Args:
+            embed_batch: Embeds a list of texts in one request, preserving order
+            model: Embedding model name (stored vectors are scoped per model)
+            persist: If True, load from / store to the signature_embeddings table
+        """
+        self._embed_batch = embed_batch
+        self.model = model
+        self.persist = persist
+
+        self._lock = threading.Lock()
+        self._rows: dict[str, int] = {}  # description_hash -> matrix row
+        self._matrix: Optional[np.ndarray] = None
+        self._count = 0
+
+        # Observability
+        self.embedded = 0  # Descriptions embedded via API
+        self.loaded = 0    # Descriptions loaded from the database
+
+    def __len__(self) -> int:
+        return self._count
+
+    def ensure(self, signatures: List[dict]) -> None:
+        """
+        Make sure every signature description is in the index.
+
+        Missing descriptions are loaded from the database in one query; any
+        still missing are embedded in batched API calls and persisted.
+        """
+        wanted = {}
+        with self._lock:
+            for sig_info in signatures:
+                desc = describe_signature(sig_info)
+                key = description_hash(desc)
+                if key not in self._rows and key not in wanted:
+                    wanted[key] = (sig_info["signature"], desc)
+
+        if not wanted:
+            return
+
+        found = {}
+        if self.persist:
+            try:
+                try:
+                    from .db.signature_embedding_storage import load_signature_embeddings
+                except ImportError:
+                    from db.signature_embedding_storage import load_signature_embeddings
+                found = load_signature_embeddings(list(wanted), self.model)
+                self.loaded += len(found)
+            except Exception as e:
+                logger.warning(f"Could not load stored signature embeddings: {e}")
+
+        missing = [key for key in wanted if key not in found]
+        new_rows = []
+        for start in range(0, len(missing), EMBED_BATCH_SIZE):
+            chunk = missing[start:start + EMBED_BATCH_SIZE]
+            vectors = self._embed_batch([wanted[key][1] for key in chunk])
+            for key, vector in zip(chunk, vectors):
+                found[key] = vector
+                new_rows.append((key, wanted[key][0], vector))
+        self.embedded += len(new_rows)
+
+        if new_rows:
+            logger.info(f"Embedded {len(new_rows)} new signature descriptions")
+            if self.persist:
+                try:
+                    try:
+                        from .db.signature_embedding_storage import store_signature_embeddings
+                    except ImportError:
+                        from db.signature_embedding_storage import store_signature_embeddings
+                    store_signature_embeddings(new_rows, self.model)
+                except Exception as e:
+                    logger.warning(f"Could not persist signature embeddings: {e}")
+
+        self._add(found)
+
+    def nearest(
+        self,
+        query_embedding: List[float],
+        signatures: List[dict],
+    ) -> Tuple[Optional[str], float]:
+        """
+        Find the most similar signature among candidates by cosine similarity.
+
+        Candidates must have been passed to ensure() first; any that are not
+        indexed are skipped. Ties resolve to the earliest candidate.
+
+        Returns:
+            (best_signature, similarity), or (None, 0.0) if there are no candidates
+        """
+        query = np.asarray(query_embedding, dtype=np.float32)
+        norm = np.linalg.norm(query)
+        if norm == 0:
+            return None, 0.0
+        query = query / norm
+
+        with self._lock:
+            candidate_sigs = []
+            rows = []
+            for sig_info in signatures:
+                row = self._rows.get(description_hash(describe_signature(sig_info)))
+                if row is not None:
+                    candidate_sigs.append(sig_info["signature"])
+                    rows.append(row)
+            if not rows:
+                return None, 0.0
+            similarities = self._matrix[np.asarray(rows)] @ query
+
+        best = int(np.argmax(similarities))
+        return candidate_sigs[best], float(similarities[best])
+
+    def _add(self, vectors: dict) -> None:
+        """Append normalized vectors to the matrix, growing capacity geometrically."""
+        with self._lock:
+            vectors = {k: v for k, v in vectors.items() if k not in self._rows}
+            if not vectors:
+                return
+
+            block = np.asarray(list(vectors.values()), dtype=np.float32)
+            norms = np.linalg.norm(block, axis=1, keepdims=True)
+            norms[norms == 0] = 1.0
+            block /= norms
+
+            needed = self._count + len(block)
+            if self._matrix is None:
+                self._matrix = np.empty((max(needed, 64), block.shape[1]), dtype=np.float32)
+            elif needed > self._matrix.shape[0]:
+                grown = np.empty((max(needed, self._matrix.shape[0] * 2), self._matrix.shape[1]), dtype=np.float32)
+                grown[:self._count] = self._matrix[:self._count]
+                self._matrix = grown
+
+            self._matrix[self._count:needed] = block
+            for offset, key in enumerate(vectors):
+                self._rows[key] = self._count + offset
+            self._count = needed
@@ -9,6 +9,7 @@ Reference: docs/architecture/dual-format-story-architecture.md
 
 import glob
 import logging
+import os
 import re
 import shlex
 import subprocess
@@ -28,6 +29,7 @@ from .codebase_security import (
     validate_path,
     validate_repo_name,
 )
+from .codebase_index import CodebaseIndex, is_indexable_keyword
 from .domain_classifier import DomainClassifier, ClassificationResult
 
 logger = logging.getLogger(__name__)
@@ -168,6 +170,7 @@ class SyncResult:
     success: bool
     fetch_duration_ms: int = 0
     pull_duration_ms: int = 0
+    index_duration_ms: int = 0
     error: Optional[str] = None
     synced_at: datetime = field(default_factory=datetime.utcnow)
 
@@ -246,17 +249,24 @@ class CodebaseContextProvider:
         static = provider.get_static_context("auth")
     """
 
-    def __init__(self, repos_path: Optional[Path] = None):
+    def __init__(self, repos_path: Optional[Path] = None, index_dir: Optional[Path] = None):
         """
         Initialize the codebase context provider.
 
         Args:
             repos_path: Optional override for repository base path.
                        Defaults to REPO_BASE_PATH from environment.
+            index_dir: Optional directory for per-repo keyword indexes.
+                       Defaults to CODEBASE_INDEX_DIR from environment
+                       (unset = keyword search reads files directly).
         """
         self.repos_path = repos_path or REPO_BASE_PATH
         logger.info(f"CodebaseContextProvider initialized with repos_path: {self.repos_path}")
 
+        env_index_dir = os.environ.get("CODEBASE_INDEX_DIR")
+        self.index_dir = index_dir or (Path(env_index_dir) if env_index_dir else None)
+        self._indexes: Dict[str, CodebaseIndex] = {}
+
         # Validate that repos path exists
         if not self.repos_path.exists():
             logger.warning(f"Repos path does not exist: {self.repos_path}")
@@ -378,11 +388,14 @@ class CodebaseContextProvider:
                     error=f"Git pull failed: {pull_result.stderr[:200]}",
                 )
 
+            index_duration_ms = self._refresh_index(repo_path)
+
             logger.info(
                 f"Repository {repo_name} synced successfully",
                 extra={
                     "fetch_duration_ms": fetch_duration_ms,
                     "pull_duration_ms": pull_duration_ms,
+                    "index_duration_ms": index_duration_ms,
                 },
             )
 
@@ -391,6 +404,7 @@ class CodebaseContextProvider:
                 success=True,
                 fetch_duration_ms=fetch_duration_ms,
                 pull_duration_ms=pull_duration_ms,
+                index_duration_ms=index_duration_ms,
             )
 
         except subprocess.TimeoutExpired as e:
@@ -413,6 +427,55 @@ class CodebaseContextProvider:
                 error=str(e),
             )
 
+    def _get_index(self, repo_path: Path, create: bool = False) -> Optional[CodebaseIndex]:
+        """
+        Return the keyword index for a repository, if indexing is enabled.
+
+        Args:
+            repo_path: Repository root
+            create: Open (and create) the index file even if it has never been built
+
+        Returns:
+            CodebaseIndex, or None if indexing is disabled or the index was never built
+        """
+        if self.index_dir is None:
+            return None
+
+        key = str(repo_path)
+        index = self._indexes.get(key)
+        if index is None:
+            index_path = Path(self.index_dir) / f"{repo_path.name}.sqlite"
+            if not create and not index_path.exists():
+                return None
+            try:
+                index = CodebaseIndex(repo_path, index_path)
+            except Exception as e:
+                logger.warning(f"Codebase index unavailable at {index_path}: {e}")
+                return None
+            self._indexes[key] = index
+
+        if index.indexed_commit is None and not create:
+            return None
+        return index
+
+    def _refresh_index(self, repo_path: Path) -> int:
+        """
+        Update the keyword index after a successful sync (best effort).
+
+        Returns:
+            Index refresh duration in ms (0 if indexing is disabled or failed)
+        """
+        index = self._get_index(repo_path, create=True)
+        if index is None:
+            return 0
+
+        try:
+            index.refresh()
+        except Exception as e:
+            logger.warning(f"Codebase index refresh failed for {repo_path.name}: {e}")
+            return 0
+        return index.last_build_ms
+
     def explore_for_theme(
         self,
         theme_data: Dict,
@@ -1298,44 +1361,52 @@ class CodebaseContextProvider:
         # This ensures we always search the most relevant files first
         ranked_files = self._rank_files_for_search(files)
 
-        for file_path in ranked_files[:MAX_FILES_TO_KEYWORD_SEARCH]:
-            if not validate_path(file_path):
-                continue
+        files_to_search = [
+            file_path for file_path in ranked_files[:MAX_FILES_TO_KEYWORD_SEARCH]
+            if validate_path(file_path)
+        ]
+
+        # Keyword counts for indexed files come from the persistent index;
+        # everything else (untracked files, multi-word keywords) is read from disk
+        index = self._get_index(repo_path)
+        indexed_matches: Dict[str, Dict[str, Tuple[int, int]]] = {}
+        rel_paths: Dict[str, str] = {}
+        if index is not None:
+            lookup_terms = []
+            for keyword in keywords:
+                terms = [keyword] if is_indexable_keyword(keyword) else re.findall(r"\w+", keyword)
+                lookup_terms.extend(t for t in terms if t not in lookup_terms)
+            try:
+                candidates = {
+                    file_path: Path(file_path).relative_to(repo_path).as_posix()
+                    for file_path in files_to_search
+                }
+                in_index = index.indexed_paths(candidates.values())
+                rel_paths = {fp: rel for fp, rel in candidates.items() if rel in in_index}
+                for term in lookup_terms:
+                    indexed_matches[term] = index.lookup(term, rel_paths.values())
+            except Exception as e:
+                logger.warning(f"Codebase index query failed, reading files instead: {e}")
+                indexed_matches = {}
+                rel_paths = {}
 
+        for file_path in files_to_search:
             try:
-                # Check file size before reading (security: prevent DoS from large files)
-                file_size = Path(file_path).stat().st_size
-                if file_size > MAX_FILE_SIZE_BYTES:
-                    logger.debug(
-                        f"Skipping large file: {file_path} ({file_size} bytes > {MAX_FILE_SIZE_BYTES})"
+                if file_path in rel_paths:
+                    keyword_hits = self._match_keywords_from_index(
+                        file_path, rel_paths[file_path], keywords, indexed_matches
                     )
-                    continue
+                else:
+                    keyword_hits = self._match_keywords_in_file(file_path, keywords)
 
-                # Read file content
-                with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read()
+                if keyword_hits is None:
+                    continue
 
-                # Count keyword matches
                 # IMPORTANT: matched_keywords stores the NORMALIZED keyword string (from keywords list),
                 # not raw text from file. This ensures intersection with keyword_sources always works.
-                match_count = 0
-                matched_keywords = []
-                line_numbers = []
-
-                for keyword in keywords:
-                    # Case-insensitive search
-                    pattern = re.compile(re.escape(keyword), re.IGNORECASE)
-                    matches = list(pattern.finditer(content))
-
-                    if matches:
-                        match_count += len(matches)
-                        matched_keywords.append(keyword)  # Normalized keyword, not raw file text
-
-                        # Get line numbers for first match
-                        if matches:
-                            first_match_pos = matches[0].start()
-                            line_num = content[:first_match_pos].count('\n') + 1
-                            line_numbers.append(line_num)
+                match_count = sum(count for _, count, _ in keyword_hits)
+                matched_keywords = [keyword for keyword, _, _ in keyword_hits]
+                line_numbers = [line_num for _, _, line_num in keyword_hits]
 
                 if match_count > 0:
                     # Make path relative to repo for cleaner display
@@ -1405,6 +1476,73 @@ class CodebaseContextProvider:
 
         return references, relevance_metadata
 
+    def _match_keywords_in_file(
+        self,
+        file_path: str,
+        keywords: List[str],
+    ) -> Optional[List[Tuple[str, int, int]]]:
+        """
+        Case-insensitive keyword matches in a file read from disk.
+
+        Args:
+            file_path: Absolute file path (already validated)
+            keywords: Keywords to search for
+
+        Returns:
+            List of (keyword, match_count, first_match_line) for matching keywords,
+            or None if the file is too large to search
+        """
+        # Check file size before reading (security: prevent DoS from large files)
+        file_size = Path(file_path).stat().st_size
+        if file_size > MAX_FILE_SIZE_BYTES:
+            logger.debug(
+                f"Skipping large file: {file_path} ({file_size} bytes > {MAX_FILE_SIZE_BYTES})"
+            )
+            return None
+
+        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
+            content = f.read()
+
+        hits = []
+        for keyword in keywords:
+            pattern = re.compile(re.escape(keyword), re.IGNORECASE)
+            matches = list(pattern.finditer(content))
+            if matches:
+                # Line number of first match
+                line_num = content[:matches[0].start()].count('\n') + 1
+                hits.append((keyword, len(matches), line_num))
+        return hits
+
+    def _match_keywords_from_index(
+        self,
+        file_path: str,
+        rel_path: str,
+        keywords: List[str],
+        indexed_matches: Dict[str, Dict[str, Tuple[int, int]]],
+    ) -> Optional[List[Tuple[str, int, int]]]:
+        """
+        Keyword matches for an indexed file, in the same form as _match_keywords_in_file.
+
+        Single-token keywords are answered from the index. Other keywords (e.g.
+        "pin scheduler") read the file, but only if every token in them occurs
+        in the file according to the index.
+        """
+        hits = []
+        for keyword in keywords:
+            if keyword in indexed_matches:
+                hit = indexed_matches[keyword].get(rel_path)
+                if hit:
+                    hits.append((keyword, hit[0], hit[1]))
+                continue
+
+            parts = re.findall(r"\w+", keyword)
+            if all(rel_path in indexed_matches.get(part, {}) for part in parts):
+                file_hits = self._match_keywords_in_file(file_path, [keyword])
+                if file_hits is None:
+                    return None
+                hits.extend(file_hits)
+        return hits
+
     def _extract_snippets(self, file_references: List[FileReference]) -> List[CodeSnippet]:
         """
         Extract code snippets from file references.
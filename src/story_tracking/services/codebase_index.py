@@ -0,0 +1,332 @@
+"""
+Codebase Keyword Index
+
+Persistent token → (file, count, first line) inverted index for one synced
+repository, so CodebaseContextProvider keyword search is an index query
+instead of reading and regex-scanning up to MAX_FILES_TO_KEYWORD_SEARCH files
+for every theme.
+
+Tokens are maximal runs of word characters (\\w+), lowercased. A keyword made
+only of word characters can never match across a token boundary, so its
+case-insensitive substring matches in a file are exactly its occurrences
+inside that file's tokens. Counts and first-match lines from the index are
+therefore identical to the regex scan they replace.
+
+The index is built once from `git ls-files` and then updated incrementally
+from `git diff --name-only` between the indexed commit and the synced HEAD.
+
+Reference: docs/architecture/dual-format-story-architecture.md
+"""
+
+import logging
+import re
+import sqlite3
+import subprocess
+import threading
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .codebase_security import validate_git_command_args
+
+logger = logging.getLogger(__name__)
+
+TOKEN_PATTERN = re.compile(r"\w+")
+
+# Keep in sync with codebase_context_provider (files above this are never searched)
+MAX_INDEXED_FILE_BYTES = 10 * 1024 * 1024
+
+GIT_INDEX_TIMEOUT_SECONDS = 60
+
+# Postings per executemany() during builds
+INSERT_BATCH_SIZE = 5000
+
+
+def is_indexable_keyword(keyword: str) -> bool:
+    """True if the keyword can be answered from the index alone (single \\w+ token)."""
+    return TOKEN_PATTERN.fullmatch(keyword) is not None
+
+
+def tokenize(content: str) -> Dict[str, Tuple[int, int]]:
+    """
+    Map each lowercased token in content to (occurrences, first line number).
+    """
+    postings: Dict[str, List[int]] = {}
+    line = 1
+    last_pos = 0
+    for match in TOKEN_PATTERN.finditer(content):
+        start = match.start()
+        line += content.count("\n", last_pos, start)
+        last_pos = start
+        token = match.group().lower()
+        entry = postings.get(token)
+        if entry is None:
+            postings[token] = [1, line]
+        else:
+            entry[0] += 1
+    return {token: (count, first_line) for token, (count, first_line) in postings.items()}
+
+
+class CodebaseIndex:
+    """
+    SQLite-backed inverted index for a single repository.
+
+    Usage:
+        index = CodebaseIndex(repo_path, index_dir / "aero.sqlite")
+        index.refresh()  # Full build first time, incremental afterwards
+        matches = index.lookup("scheduler", ["src/scheduler/api.py"])
+    """
+
+    def __init__(self, repo_path: Path, index_path: Path):
+        self.repo_path = Path(repo_path)
+        self.index_path = Path(index_path)
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # One connection shared by concurrent story-creation workers
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(str(self.index_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS meta (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS files (
+                path TEXT PRIMARY KEY
+            );
+            CREATE TABLE IF NOT EXISTS tokens (
+                token TEXT PRIMARY KEY
+            );
+            CREATE TABLE IF NOT EXISTS postings (
+                token TEXT NOT NULL,
+                path TEXT NOT NULL,
+                count INTEGER NOT NULL,
+                first_line INTEGER NOT NULL,
+                PRIMARY KEY (token, path)
+            ) WITHOUT ROWID;
+            CREATE INDEX IF NOT EXISTS idx_postings_path ON postings(path);
+        """)
+        self._conn.commit()
+
+        self.last_build_ms = 0
+        self.queries = 0
+        self.query_ms_total = 0.0
+
+    # ----------------------------------------------------------------------
+    # Maintenance
+    # ----------------------------------------------------------------------
+
+    @property
+    def indexed_commit(self) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM meta WHERE key = 'commit'").fetchone()
+        return row[0] if row else None
+
+    def refresh(self) -> Dict[str, Any]:
+        """
+        Bring the index up to the repository's current HEAD.
+
+        Returns:
+            stats() after the refresh, plus mode ("unchanged", "incremental", "full")
+        """
+        head = self._git_output(["log", "-1", "--format=%H"]).strip()
+        indexed = self.indexed_commit
+
+        start = time.time()
+        if indexed == head:
+            mode = "unchanged"
+        else:
+            changed = None
+            if indexed:
+                try:
+                    changed = self._changed_paths(indexed, head)
+                except (RuntimeError, subprocess.SubprocessError) as e:
+                    logger.warning(f"Incremental index update failed, rebuilding: {e}")
+            if changed is None:
+                mode = "full"
+                self.build(head)
+            else:
+                mode = "incremental"
+                self.update(changed, head)
+        self.last_build_ms = int((time.time() - start) * 1000)
+
+        stats = self.stats()
+        stats["mode"] = mode
+        logger.info(
+            f"Codebase index {mode} for {self.repo_path.name}: "
+            f"{stats['files']} files, {stats['tokens']} tokens, "
+            f"{stats['size_bytes'] / 1_000_000:.1f} MB in {self.last_build_ms}ms "
+            f"(avg query {stats['avg_query_ms']:.1f}ms over {stats['queries']} queries)"
+        )
+        return stats
+
+    def build(self, commit: str) -> None:
+        """Rebuild the whole index from the tracked files at commit."""
+        paths = [p for p in self._git_output(["ls-files", "-z"]).split("\0") if p]
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM postings")
+            self._conn.execute("DELETE FROM files")
+            self._conn.execute("DELETE FROM tokens")
+            self._index_files(paths)
+            self._set_commit(commit)
+
+    def update(self, changed_paths: Iterable[str], commit: str) -> None:
+        """Re-index changed files (deleted files are dropped)."""
+        changed_paths = list(changed_paths)
+        with self._lock, self._conn:
+            for path in changed_paths:
+                self._conn.execute("DELETE FROM postings WHERE path = ?", (path,))
+                self._conn.execute("DELETE FROM files WHERE path = ?", (path,))
+            self._index_files(changed_paths)
+            self._set_commit(commit)
+
+    def _index_files(self, paths: Iterable[str]) -> None:
+        """Tokenize files from disk and insert their postings (caller commits)."""
+        rows: List[Tuple[str, str, int, int]] = []
+        for rel_path in paths:
+            file_path = self.repo_path / rel_path
+            try:
+                if not file_path.is_file() or file_path.stat().st_size > MAX_INDEXED_FILE_BYTES:
+                    continue
+                content = file_path.read_text(encoding="utf-8", errors="ignore")
+            except OSError as e:
+                logger.debug(f"Could not index {file_path}: {e}")
+                continue
+
+            self._conn.execute("INSERT OR REPLACE INTO files (path) VALUES (?)", (rel_path,))
+            for token, (count, first_line) in tokenize(content).items():
+                rows.append((token, rel_path, count, first_line))
+            if len(rows) >= INSERT_BATCH_SIZE:
+                self._insert_postings(rows)
+                rows = []
+        self._insert_postings(rows)
+
+    def _insert_postings(self, rows: List[Tuple[str, str, int, int]]) -> None:
+        if not rows:
+            return
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO postings (token, path, count, first_line) VALUES (?, ?, ?, ?)",
+            rows,
+        )
+        self._conn.executemany(
+            "INSERT OR IGNORE INTO tokens (token) VALUES (?)",
+            ((row[0],) for row in rows),
+        )
+
+    def _set_commit(self, commit: str) -> None:
+        self._conn.execute(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES ('commit', ?)", (commit,)
+        )
+
+    def _changed_paths(self, old_commit: str, new_commit: str) -> List[str]:
+        output = self._git_output(
+            ["diff", "--name-only", "--no-renames", "-z", old_commit, new_commit]
+        )
+        return [p for p in output.split("\0") if p]
+
+    def _git_output(self, args: List[str]) -> str:
+        git_args = ["git", "-C", str(self.repo_path)] + args
+        if not validate_git_command_args(git_args):
+            raise RuntimeError(f"Invalid git arguments: {git_args}")
+        result = subprocess.run(
+            git_args,
+            capture_output=True,
+            text=True,
+            timeout=GIT_INDEX_TIMEOUT_SECONDS,
+            shell=False,
+        )
+        if result.returncode != 0:
+            raise RuntimeError(f"git {args[0]} failed: {result.stderr[:200]}")
+        return result.stdout
+
+    # ----------------------------------------------------------------------
+    # Queries
+    # ----------------------------------------------------------------------
+
+    def indexed_paths(self, rel_paths: Iterable[str]) -> set:
+        """Subset of rel_paths present in the index."""
+        rel_paths = list(rel_paths)
+        if not rel_paths:
+            return set()
+        found = set()
+        with self._lock:
+            for chunk in _chunks(rel_paths, 500):
+                placeholders = ",".join("?" * len(chunk))
+                found.update(
+                    row[0] for row in self._conn.execute(
+                        f"SELECT path FROM files WHERE path IN ({placeholders})", chunk
+                    )
+                )
+        return found
+
+    def lookup(self, keyword: str, rel_paths: Iterable[str]) -> Dict[str, Tuple[int, int]]:
+        """
+        Case-insensitive substring matches of a single-token keyword.
+
+        Args:
+            keyword: Keyword accepted by is_indexable_keyword()
+            rel_paths: Repository-relative paths to restrict the search to
+
+        Returns:
+            {rel_path: (match_count, first_match_line)} for files with matches
+        """
+        start = time.perf_counter()
+        needle = keyword.lower()
+        rel_paths = list(rel_paths)
+        results: Dict[str, List[int]] = defaultdict(lambda: [0, 0])
+
+        with self._lock:
+            tokens = [
+                row[0] for row in self._conn.execute(
+                    "SELECT token FROM tokens WHERE instr(token, ?) > 0", (needle,)
+                )
+            ]
+            if tokens and rel_paths:
+                path_placeholders = ",".join("?" * len(rel_paths))
+                for token_chunk in _chunks(tokens, 500):
+                    token_placeholders = ",".join("?" * len(token_chunk))
+                    rows = self._conn.execute(
+                        f"""
+                        SELECT token, path, count, first_line FROM postings
+                        WHERE token IN ({token_placeholders}) AND path IN ({path_placeholders})
+                    """,
+                        token_chunk + rel_paths,
+                    )
+                    for token, path, count, first_line in rows:
+                        entry = results[path]
+                        entry[0] += count * token.count(needle)
+                        entry[1] = first_line if entry[1] == 0 else min(entry[1], first_line)
+
+            self.queries += 1
+            self.query_ms_total += (time.perf_counter() - start) * 1000
+        return {path: (count, first_line) for path, (count, first_line) in results.items()}
+
+    def stats(self) -> Dict[str, Any]:
+        """Index size, last build time and query latency."""
+        with self._lock:
+            files = self._conn.execute("SELECT COUNT(*) FROM files").fetchone()[0]
+            tokens = self._conn.execute("SELECT COUNT(*) FROM tokens").fetchone()[0]
+        size_bytes = sum(
+            p.stat().st_size
+            for p in self.index_path.parent.glob(self.index_path.name + "*")
+            if p.is_file()
+        )
+        return {
+            "commit": self.indexed_commit,
+            "files": files,
+            "tokens": tokens,
+            "size_bytes": size_bytes,
+            "build_ms": self.last_build_ms,
+            "queries": self.queries,
+            "avg_query_ms": self.query_ms_total / self.queries if self.queries else 0.0,
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def _chunks(items: List[str], size: int) -> Iterable[List[str]]:
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
@@ -93,6 +93,9 @@ NOISE_EXCLUSION_PATTERNS: List[str] = [
     "/compacted/",
 ]
 
+# Full 40-character commit SHA (git diff between indexed and synced commits)
+GIT_COMMIT_SHA_PATTERN = re.compile(r"[0-9a-f]{40}")
+
 # Regex patterns for redacting secrets in code content
 # Matches common secret assignment patterns:
 #   - api_key = "sk-1234..."     (quoted)
@@ -422,7 +425,7 @@ def validate_git_command_args(args: List[str]) -> bool:
     """
     # Allowlist of safe git commands and flags
     ALLOWED_GIT_ARGS = {
-        "git", "fetch", "pull", "status", "log", "diff", "branch",
+        "git", "fetch", "pull", "status", "log", "diff", "branch", "ls-files",
         "--all", "--ff-only", "--prune", "-C", "--depth", "--verbose", "-v",
     }
 
@@ -466,6 +469,10 @@ def validate_git_command_args(args: List[str]) -> bool:
         if arg.isdigit():
             continue
 
+        # Allow full commit SHAs (for diffs between synced commits)
+        if GIT_COMMIT_SHA_PATTERN.fullmatch(arg):
+            continue
+
         # Allow flags we haven't seen (still protected by shell=False)
         # but only if they start with - and have no suspicious content
         if arg.startswith("-"):
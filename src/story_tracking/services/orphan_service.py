@@ -8,7 +8,7 @@ over time until they reach the threshold for graduation to stories.
 import json
 import logging
 from datetime import datetime, timezone, timedelta
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from uuid import UUID
 
 from ..models import (
@@ -182,6 +182,30 @@ class OrphanService:
             row = cur.fetchone()
             return self._row_to_orphan(row) if row else None
 
+    def get_by_signatures(self, signatures: List[str]) -> Dict[str, Orphan]:
+        """Find orphans (active OR graduated) for many signatures in one query.
+
+        Bulk form of get_by_signature(); see its note on graduated orphans.
+
+        Returns:
+            Dict mapping signature -> orphan for the signatures that have one
+        """
+        if not signatures:
+            return {}
+
+        with self.db.cursor() as cur:
+            cur.execute("""
+                SELECT id, signature, original_signature, conversation_ids,
+                       theme_data, confidence_score, first_seen_at,
+                       last_updated_at, graduated_at, story_id
+                FROM story_orphans
+                WHERE signature = ANY(%s)
+            """, (list(signatures),))
+            return {
+                row["signature"]: self._row_to_orphan(row)
+                for row in cur.fetchall()
+            }
+
     def list_active(self, limit: int = 100) -> OrphanListResponse:
         """List all active (non-graduated) orphans."""
         with self.db.cursor() as cur:
@@ -283,6 +307,104 @@ class OrphanService:
             ),
         )
 
+    def create_bulk(self, orphans: List[OrphanCreate]) -> Dict[str, Orphan]:
+        """Create many orphans with one INSERT ... ON CONFLICT DO NOTHING.
+
+        Returns:
+            Dict mapping signature -> created orphan. Signatures that already
+            had an orphan are omitted; callers route those the way they route
+            a create_or_get() conflict.
+        """
+        if not orphans:
+            return {}
+
+        payload = [
+            {
+                "signature": orphan.signature,
+                "original_signature": orphan.original_signature,
+                "conversation_ids": orphan.conversation_ids,
+                "theme_data": orphan.theme_data or {},
+                "confidence_score": orphan.confidence_score,
+            }
+            for orphan in orphans
+        ]
+
+        with self.db.cursor() as cur:
+            cur.execute("""
+                INSERT INTO story_orphans (
+                    signature, original_signature, conversation_ids,
+                    theme_data, confidence_score
+                )
+                SELECT signature, original_signature, conversation_ids,
+                       theme_data, confidence_score
+                FROM jsonb_to_recordset(%s::jsonb) AS v(
+                    signature TEXT, original_signature TEXT, conversation_ids TEXT[],
+                    theme_data JSONB, confidence_score FLOAT
+                )
+                ON CONFLICT (signature) DO NOTHING
+                RETURNING id, signature, original_signature, conversation_ids,
+                          theme_data, confidence_score, first_seen_at,
+                          last_updated_at, graduated_at, story_id
+            """, (json.dumps(payload),))
+            return {
+                row["signature"]: self._row_to_orphan(row)
+                for row in cur.fetchall()
+            }
+
+    def add_conversations_bulk(
+        self,
+        additions: List[Tuple[Orphan, List[Tuple[str, Dict[str, Any]]]]],
+    ) -> Dict[UUID, Orphan]:
+        """
+        Add conversations to many orphans with one UPDATE.
+
+        Applies the same merge rules as add_conversations(), in order, to the
+        orphans as passed in (they are not re-read).
+
+        Args:
+            additions: (orphan, [(conversation_id, theme_data), ...]) pairs
+
+        Returns:
+            Dict mapping orphan id -> updated orphan. Orphans that no longer
+            exist are omitted.
+        """
+        payload = []
+        for orphan, conversations in additions:
+            merged_ids = list(orphan.conversation_ids)
+            merged_theme_data = orphan.theme_data.copy()
+            for conversation_id, theme_data in conversations:
+                if conversation_id not in merged_ids:
+                    merged_ids.append(conversation_id)
+                if theme_data:
+                    merged_theme_data = self._merge_theme_data(merged_theme_data, theme_data)
+            payload.append({
+                "id": str(orphan.id),
+                "conversation_ids": merged_ids,
+                "theme_data": merged_theme_data,
+            })
+
+        if not payload:
+            return {}
+
+        with self.db.cursor() as cur:
+            cur.execute("""
+                UPDATE story_orphans AS o
+                SET conversation_ids = v.conversation_ids,
+                    theme_data = v.theme_data,
+                    last_updated_at = NOW()
+                FROM jsonb_to_recordset(%s::jsonb) AS v(
+                    id UUID, conversation_ids TEXT[], theme_data JSONB
+                )
+                WHERE o.id = v.id
+                RETURNING o.id, o.signature, o.original_signature, o.conversation_ids,
+                          o.theme_data, o.confidence_score, o.first_seen_at,
+                          o.last_updated_at, o.graduated_at, o.story_id
+            """, (json.dumps(payload),))
+            return {
+                orphan.id: orphan
+                for orphan in (self._row_to_orphan(row) for row in cur.fetchall())
+            }
+
     def graduate(
         self,
         orphan_id: UUID,
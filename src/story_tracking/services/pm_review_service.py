@@ -7,16 +7,22 @@ Uses LLM to answer: "Would these conversations all be fixed by one implementatio
 Reference: docs/theme-quality-architecture.md (Improvement 2)
 """
 
+import asyncio
 import json
 import logging
 import time
+from contextlib import nullcontext
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
 
-from src.prompts.pm_review import PM_REVIEW_PROMPT, format_conversations_for_review
+from src.prompts.pm_review import (
+    PM_REVIEW_PROMPT,
+    build_pm_review_batch_prompt,
+    format_conversations_for_review,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -104,6 +110,45 @@ class PMReviewResult:
 # Default timeout for LLM calls (seconds)
 DEFAULT_TIMEOUT = 30.0
 
+# Async batch review defaults (review_groups_batch_async)
+DEFAULT_BATCH_CONCURRENCY = 8  # Concurrent LLM requests
+DEFAULT_RETRY_BUDGET = 10  # Retries shared by all requests in one batch
+RETRY_BASE_DELAY = 1.0  # Seconds, doubled per retry of the same request
+MAX_RETRY_DELAY = 10.0
+# Request coalescing: groups with at most this many conversations may share a
+# request (0 = every group gets its own request)
+DEFAULT_COALESCE_MAX_CONVERSATIONS = 0
+MAX_GROUPS_PER_REQUEST = 5
+
+SYSTEM_MESSAGE = "You are a PM reviewing product tickets. Respond only with valid JSON."
+
+
+class _RetryBudget:
+    """Retries shared by every request of one async batch."""
+
+    def __init__(self, retries: int):
+        self.remaining = retries
+        self.used = 0
+
+    def take(self) -> bool:
+        if self.remaining <= 0:
+            return False
+        self.remaining -= 1
+        self.used += 1
+        return True
+
+
+class _RequestTimer:
+    """Time spent in LLM attempts, excluding semaphore waits and retry backoff."""
+
+    def __init__(self):
+        self.elapsed = 0.0
+
+    @property
+    def start_time(self) -> float:
+        """Start time for _finish_result()/_error_result() matching the elapsed request time."""
+        return time.time() - self.elapsed
+
 
 class PMReviewService:
     """
@@ -131,6 +176,7 @@ class PMReviewService:
         self.temperature = temperature
         self.timeout = timeout
         self._client: Optional[OpenAI] = None
+        self._async_client: Optional[AsyncOpenAI] = None
 
     @property
     def client(self) -> OpenAI:
@@ -139,6 +185,13 @@ class PMReviewService:
             self._client = OpenAI()
         return self._client
 
+    @property
+    def async_client(self) -> AsyncOpenAI:
+        """Lazy-initialize async OpenAI client (batch review)."""
+        if self._async_client is None:
+            self._async_client = AsyncOpenAI()
+        return self._async_client
+
     def review_group(
         self,
         signature: str,
@@ -160,28 +213,9 @@ class PMReviewService:
 
         # Edge case: Single-conversation groups skip PM review
         if len(conversations) <= 1:
-            logger.debug(
-                f"Skipping PM review for '{signature}': only {len(conversations)} conversation(s)"
-            )
-            return PMReviewResult(
-                original_signature=signature,
-                conversation_count=len(conversations),
-                decision=ReviewDecision.KEEP_TOGETHER,
-                reasoning="Single-conversation group - PM review skipped",
-                model_used="",
-                review_duration_ms=0,
-            )
+            return self._skipped_result(signature, conversations)
 
-        # Build conversation text for prompt
-        conversations_text = self._format_conversations(conversations)
-
-        # Build prompt
-        prompt = PM_REVIEW_PROMPT.format(
-            product_context=product_context or "Tailwind is a social media scheduling tool.",
-            signature=signature,
-            count=len(conversations),
-            conversations=conversations_text,
-        )
+        prompt = self._build_prompt(signature, conversations, product_context)
 
         try:
             # Call LLM
@@ -189,49 +223,56 @@ class PMReviewService:
                 model=self.model,
                 temperature=self.temperature,
                 timeout=self.timeout,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are a PM reviewing product tickets. Respond only with valid JSON.",
-                    },
-                    {"role": "user", "content": prompt},
-                ],
+                messages=self._build_messages(prompt),
             )
 
             # Parse response
             response_text = response.choices[0].message.content.strip()
-            result = self._parse_response(
-                response_text,
-                signature,
-                conversations,
+            return self._finish_result(
+                self._parse_response(response_text, signature, conversations),
+                start_time,
             )
 
-            # Add metadata
-            duration_ms = int((time.time() - start_time) * 1000)
-            result.model_used = self.model
-            result.review_duration_ms = duration_ms
+        except Exception as e:
+            # Edge case: Invalid LLM response -> default to keep_together
+            return self._error_result(signature, conversations, e, start_time)
 
-            logger.info(
-                f"PM review for '{signature}': {result.decision.value} "
-                f"({len(conversations)} conversations, {duration_ms}ms)"
-            )
+    async def review_group_async(
+        self,
+        signature: str,
+        conversations: List[ConversationContext],
+        product_context: Optional[str] = None,
+        semaphore: Optional[asyncio.Semaphore] = None,
+        retry_budget: Optional[_RetryBudget] = None,
+    ) -> PMReviewResult:
+        """
+        Async version of review_group().
 
-            return result
+        Args:
+            signature: The issue_signature for this group
+            conversations: List of conversation contexts to review
+            product_context: Optional product documentation for context
+            semaphore: Optional semaphore bounding concurrent LLM requests
+            retry_budget: Optional shared retry budget (no retries if None)
 
-        except Exception as e:
-            # Edge case: Invalid LLM response -> default to keep_together
-            duration_ms = int((time.time() - start_time) * 1000)
-            logger.warning(
-                f"PM review failed for '{signature}': {e}. Defaulting to keep_together."
-            )
-            return PMReviewResult(
-                original_signature=signature,
-                conversation_count=len(conversations),
-                decision=ReviewDecision.KEEP_TOGETHER,
-                reasoning=f"PM review error (defaulting to keep_together): {str(e)}",
-                model_used=self.model,
-                review_duration_ms=duration_ms,
+        Returns:
+            PMReviewResult; review_duration_ms excludes time spent waiting
+            for the semaphore and backing off between retries
+        """
+        if len(conversations) <= 1:
+            return self._skipped_result(signature, conversations)
+
+        prompt = self._build_prompt(signature, conversations, product_context)
+
+        timer = _RequestTimer()
+        try:
+            response_text = await self._complete_async(prompt, retry_budget, semaphore, timer)
+            return self._finish_result(
+                self._parse_response(response_text, signature, conversations),
+                timer.start_time,
             )
+        except Exception as e:
+            return self._error_result(signature, conversations, e, timer.start_time)
 
     def review_groups_batch(
         self,
@@ -242,7 +283,7 @@ class PMReviewService:
         Review multiple theme groups.
 
         Processes groups sequentially. For high-volume scenarios,
-        consider using async processing.
+        use review_groups_batch_async().
 
         Args:
             groups: Dict mapping signature -> list of ConversationContext
@@ -277,6 +318,285 @@ class PMReviewService:
 
         return results
 
+    async def review_groups_batch_async(
+        self,
+        groups: Dict[str, List[ConversationContext]],
+        product_context: Optional[str] = None,
+        concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+        retry_budget: int = DEFAULT_RETRY_BUDGET,
+        coalesce_max_conversations: int = DEFAULT_COALESCE_MAX_CONVERSATIONS,
+    ) -> Dict[str, PMReviewResult]:
+        """
+        Review multiple theme groups concurrently.
+
+        Each request gets the service timeout. Failed requests are retried with
+        backoff until the batch-wide retry budget is spent; after that a group
+        defaults to keep_together as in review_group().
+
+        With coalesce_max_conversations > 0, groups of 2..N conversations are
+        packed (up to MAX_GROUPS_PER_REQUEST at a time) into one structured
+        prompt and the per-group decisions are unpacked from its response.
+        Groups missing from a packed response are reviewed on their own.
+
+        Args:
+            groups: Dict mapping signature -> list of ConversationContext
+            product_context: Optional product documentation for context
+            concurrency: Maximum concurrent LLM requests
+            retry_budget: Total retries allowed across the whole batch
+            coalesce_max_conversations: Largest group eligible for packing (0 = off)
+
+        Returns:
+            Dict mapping signature -> PMReviewResult, in input order
+        """
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+        budget = _RetryBudget(retry_budget)
+
+        packed: List[Tuple[str, List[ConversationContext]]] = []
+        tasks = []
+        for signature, conversations in groups.items():
+            if coalesce_max_conversations > 0 and 2 <= len(conversations) <= coalesce_max_conversations:
+                packed.append((signature, conversations))
+            else:
+                tasks.append(self._review_one_for_batch(
+                    signature, conversations, product_context, semaphore, budget
+                ))
+        for i in range(0, len(packed), MAX_GROUPS_PER_REQUEST):
+            tasks.append(self._review_coalesced_async(
+                packed[i:i + MAX_GROUPS_PER_REQUEST], product_context, semaphore, budget
+            ))
+
+        reviewed: Dict[str, PMReviewResult] = {}
+        for batch_results in await asyncio.gather(*tasks):
+            reviewed.update(batch_results)
+        results = {signature: reviewed[signature] for signature in groups}
+
+        logger.info(
+            f"Async batch PM review complete: {len(results)} groups "
+            f"({len(packed)} coalesced), "
+            f"{sum(1 for r in results.values() if r.passed)} kept, "
+            f"{sum(1 for r in results.values() if not r.passed)} split, "
+            f"{budget.used} retries"
+        )
+
+        return results
+
+    async def _review_one_for_batch(
+        self,
+        signature: str,
+        conversations: List[ConversationContext],
+        product_context: Optional[str],
+        semaphore: asyncio.Semaphore,
+        budget: _RetryBudget,
+    ) -> Dict[str, PMReviewResult]:
+        """review_group_async() with the same error isolation as review_groups_batch()."""
+        try:
+            result = await self.review_group_async(
+                signature, conversations, product_context, semaphore, budget
+            )
+        except Exception as e:
+            logger.error(f"Batch PM review error for '{signature}': {e}")
+            result = PMReviewResult(
+                original_signature=signature,
+                conversation_count=len(conversations),
+                decision=ReviewDecision.KEEP_TOGETHER,
+                reasoning=f"Batch review error: {str(e)}",
+                model_used=self.model,
+                review_duration_ms=0,
+            )
+        return {signature: result}
+
+    async def _review_coalesced_async(
+        self,
+        groups: List[Tuple[str, List[ConversationContext]]],
+        product_context: Optional[str],
+        semaphore: asyncio.Semaphore,
+        budget: _RetryBudget,
+    ) -> Dict[str, PMReviewResult]:
+        """
+        Review several small groups with one request.
+
+        Every group unpacked from the response gets the shared request's
+        duration as its review_duration_ms, since each decision took that long.
+        """
+        if len(groups) == 1:
+            signature, conversations = groups[0]
+            return await self._review_one_for_batch(
+                signature, conversations, product_context, semaphore, budget
+            )
+
+        prompt = build_pm_review_batch_prompt(
+            [(signature, self._conversation_dicts(conversations)) for signature, conversations in groups],
+            product_context or "",
+        )
+
+        results: Dict[str, PMReviewResult] = {}
+        timer = _RequestTimer()
+        try:
+            response_text = await self._complete_async(prompt, budget, semaphore, timer)
+            group_data = self._parse_batch_response(response_text)
+        except Exception as e:
+            logger.warning(
+                f"Coalesced PM review of {len(groups)} groups failed: {e}. "
+                f"Reviewing them individually."
+            )
+            group_data = {}
+
+        for signature, conversations in groups:
+            data = group_data.get(signature)
+            if data is None:
+                continue
+            try:
+                results[signature] = self._finish_result(
+                    self._parse_response(json.dumps(data), signature, conversations),
+                    timer.start_time,
+                )
+            except Exception as e:
+                logger.warning(
+                    f"Malformed coalesced PM review entry for '{signature}': {e}. "
+                    f"Reviewing it individually."
+                )
+
+        # Groups the packed response did not cover (or covered with a
+        # malformed entry) are reviewed on their own
+        missing = [(sig, convs) for sig, convs in groups if sig not in results]
+        for single in await asyncio.gather(*(
+            self._review_one_for_batch(sig, convs, product_context, semaphore, budget)
+            for sig, convs in missing
+        )):
+            results.update(single)
+        return results
+
+    async def _complete_async(
+        self,
+        prompt: str,
+        budget: Optional[_RetryBudget],
+        semaphore: Optional[asyncio.Semaphore] = None,
+        timer: Optional[_RequestTimer] = None,
+    ) -> str:
+        """
+        Run one chat completion, retrying failures while the budget allows.
+
+        The semaphore is held per attempt, not across retry backoff, so a
+        failing request does not take a concurrency slot from healthy ones.
+        Time spent inside attempts is added to timer.
+        """
+        attempt = 0
+        while True:
+            async with semaphore or nullcontext():
+                attempt_start = time.time()
+                try:
+                    response = await asyncio.wait_for(
+                        self.async_client.chat.completions.create(
+                            model=self.model,
+                            temperature=self.temperature,
+                            timeout=self.timeout,
+                            messages=self._build_messages(prompt),
+                        ),
+                        timeout=self.timeout,
+                    )
+                    return response.choices[0].message.content.strip()
+                except Exception as e:
+                    error = e
+                finally:
+                    if timer is not None:
+                        timer.elapsed += time.time() - attempt_start
+
+            if budget is None or not budget.take():
+                raise error
+            delay = min(RETRY_BASE_DELAY * (2 ** attempt), MAX_RETRY_DELAY)
+            attempt += 1
+            logger.warning(
+                f"PM review request failed: {error!r}. Retrying in {delay:.1f}s "
+                f"({budget.remaining} retries left in batch)"
+            )
+            await asyncio.sleep(delay)
+
+    def _parse_batch_response(self, response_text: str) -> Dict[str, Dict[str, Any]]:
+        """Map signature -> per-group decision dict from a coalesced response."""
+        if "```json" in response_text:
+            response_text = response_text.split("```json")[1].split("```")[0]
+        elif "```" in response_text:
+            response_text = response_text.split("```")[1].split("```")[0]
+
+        data = json.loads(response_text.strip())
+        return {
+            entry["signature"]: entry
+            for entry in data.get("groups", [])
+            if isinstance(entry, dict) and entry.get("signature")
+        }
+
+    def _build_prompt(
+        self,
+        signature: str,
+        conversations: List[ConversationContext],
+        product_context: Optional[str],
+    ) -> str:
+        """Single-group PM review prompt."""
+        return PM_REVIEW_PROMPT.format(
+            product_context=product_context or "Tailwind is a social media scheduling tool.",
+            signature=signature,
+            count=len(conversations),
+            conversations=self._format_conversations(conversations),
+        )
+
+    @staticmethod
+    def _build_messages(prompt: str) -> List[Dict[str, str]]:
+        return [
+            {"role": "system", "content": SYSTEM_MESSAGE},
+            {"role": "user", "content": prompt},
+        ]
+
+    def _skipped_result(
+        self,
+        signature: str,
+        conversations: List[ConversationContext],
+    ) -> PMReviewResult:
+        """Result for groups too small to review."""
+        logger.debug(
+            f"Skipping PM review for '{signature}': only {len(conversations)} conversation(s)"
+        )
+        return PMReviewResult(
+            original_signature=signature,
+            conversation_count=len(conversations),
+            decision=ReviewDecision.KEEP_TOGETHER,
+            reasoning="Single-conversation group - PM review skipped",
+            model_used="",
+            review_duration_ms=0,
+        )
+
+    def _finish_result(self, result: PMReviewResult, start_time: float) -> PMReviewResult:
+        """Add model and duration metadata to a parsed result."""
+        duration_ms = int((time.time() - start_time) * 1000)
+        result.model_used = self.model
+        result.review_duration_ms = duration_ms
+
+        logger.info(
+            f"PM review for '{result.original_signature}': {result.decision.value} "
+            f"({result.conversation_count} conversations, {duration_ms}ms)"
+        )
+        return result
+
+    def _error_result(
+        self,
+        signature: str,
+        conversations: List[ConversationContext],
+        error: Exception,
+        start_time: float,
+    ) -> PMReviewResult:
+        """Default keep_together result after a failed review."""
+        duration_ms = int((time.time() - start_time) * 1000)
+        logger.warning(
+            f"PM review failed for '{signature}': {error}. Defaulting to keep_together."
+        )
+        return PMReviewResult(
+            original_signature=signature,
+            conversation_count=len(conversations),
+            decision=ReviewDecision.KEEP_TOGETHER,
+            reasoning=f"PM review error (defaulting to keep_together): {str(error)}",
+            model_used=self.model,
+            review_duration_ms=duration_ms,
+        )
+
     def _format_conversations(self, conversations: List[ConversationContext]) -> str:
         """
         Format conversations for the prompt.
@@ -284,8 +604,12 @@ class PMReviewService:
         Delegates to format_conversations_for_review() in pm_review.py to avoid
         duplicate logic. Converts ConversationContext dataclass instances to dicts.
         """
-        # Convert ConversationContext dataclass to dict format expected by shared function
-        conv_dicts = [
+        return format_conversations_for_review(self._conversation_dicts(conversations))
+
+    @staticmethod
+    def _conversation_dicts(conversations: List[ConversationContext]) -> List[Dict[str, Any]]:
+        """Convert ConversationContext dataclasses to the dict format used by the prompts."""
+        return [
             {
                 "conversation_id": conv.conversation_id,
                 "user_intent": conv.user_intent or "Unknown",
@@ -304,7 +628,6 @@ class PMReviewService:
             }
             for conv in conversations
         ]
-        return format_conversations_for_review(conv_dicts)
 
     def _parse_response(
         self,
@@ -8,10 +8,13 @@ import json
 import logging
 import os
 import re
-from dataclasses import dataclass, field
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field, fields
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional
 from uuid import UUID
 
 from ..models import (
@@ -473,6 +476,74 @@ class QualityGateResult:
 DEFAULT_CONFIDENCE_THRESHOLD = 50.0
 DEFAULT_VALIDATION_ENABLED = True
 
+# Concurrent story creation (opt-in via STORY_CREATION_CONCURRENCY, default sequential).
+# Independent groups run on a thread pool; calls to each external provider are
+# capped separately so a wide pool does not trip OpenAI/Anthropic rate limits.
+DEFAULT_STORY_CREATION_CONCURRENCY = 1
+PROVIDER_CONCURRENCY_LIMITS = {
+    "openai": 8,  # PM review, story content, implementation context, confidence scoring
+    "codebase": 4,  # Domain classification (Anthropic) + local repo exploration
+}
+
+
+def _merge_processing_results(target: ProcessingResult, source: ProcessingResult) -> None:
+    """Add counters and extend lists of source into target."""
+    for f in fields(ProcessingResult):
+        value = getattr(source, f.name)
+        if isinstance(value, list):
+            getattr(target, f.name).extend(value)
+        else:
+            setattr(target, f.name, getattr(target, f.name) + value)
+
+
+class _GroupTurnstile:
+    """
+    Hands the shared DB connection from group to group in input order.
+
+    Groups run concurrently, but all services in process_* share one
+    connection and one transaction. A worker may use the DB only once every
+    earlier group has finished, so reads and writes happen in exactly the
+    order of the sequential path and ProcessingResult counts are unchanged.
+    LLM and codebase calls before a group's first DB access still overlap.
+    """
+
+    def __init__(self):
+        self._condition = threading.Condition()
+        self._local = threading.local()
+        self._next = 0
+        self._finished: set = set()
+
+    def bind(self, index: Optional[int]) -> None:
+        """Associate the current worker thread with a group (None = unbound)."""
+        self._local.index = index
+
+    def wait(self) -> None:
+        """Block until every group before the current thread's group has finished."""
+        index = getattr(self._local, "index", None)
+        if index is None:
+            return
+        with self._condition:
+            self._condition.wait_for(lambda: self._next >= index)
+
+    def finish(self, index: int) -> None:
+        with self._condition:
+            self._finished.add(index)
+            while self._next in self._finished:
+                self._next += 1
+            self._condition.notify_all()
+
+
+class _TurnstileService:
+    """Proxy that waits for the group's DB turn before any use of the wrapped service."""
+
+    def __init__(self, service: Any, turnstile: _GroupTurnstile):
+        self._service = service
+        self._turnstile = turnstile
+
+    def __getattr__(self, name: str) -> Any:
+        self._turnstile.wait()
+        return getattr(self._service, name)
+
 
 class StoryCreationService:
     """
@@ -502,6 +573,7 @@ class StoryCreationService:
         pm_review_enabled: bool = False,
         implementation_context_service: Optional["ImplementationContextService"] = None,
         multi_factor_scorer: Optional["MultiFactorScorer"] = None,
+        max_concurrency: Optional[int] = None,
     ):
         """
         Initialize the story creation service.
@@ -525,6 +597,8 @@ class StoryCreationService:
                               Required if pm_review_enabled=True.
             pm_review_enabled: If True, run PM review before story creation (default: False).
                               Feature flag for controlled rollout.
+            max_concurrency: Groups processed in parallel (default: STORY_CREATION_CONCURRENCY
+                            env var, else 1 = sequential).
         """
         self.story_service = story_service
         self.orphan_service = orphan_service
@@ -542,6 +616,19 @@ class StoryCreationService:
         self.pm_review_service = pm_review_service
         self.pm_review_enabled = pm_review_enabled
 
+        # Concurrent group processing
+        if max_concurrency is None:
+            max_concurrency = int(
+                os.getenv("STORY_CREATION_CONCURRENCY", str(DEFAULT_STORY_CREATION_CONCURRENCY))
+            )
+        self.max_concurrency = max(1, max_concurrency)
+        self._provider_slots = {
+            provider: threading.BoundedSemaphore(limit)
+            for provider, limit in PROVIDER_CONCURRENCY_LIMITS.items()
+        }
+        if self.max_concurrency > 1:
+            logger.info(f"Concurrent story creation enabled: {self.max_concurrency} groups in parallel")
+
         # Log quality gate configuration
         if confidence_scorer:
             logger.info(
@@ -707,6 +794,9 @@ class StoryCreationService:
         2. ConfidenceScorer evaluates group coherence
         3. Groups failing either gate are routed to orphan integration
 
+        With max_concurrency > 1, groups are processed on a thread pool
+        (see _process_groups); results are identical to the sequential path.
+
         Args:
             theme_groups: Dict mapping signature -> list of conversation dicts.
                 Each conversation dict should have:
@@ -725,78 +815,14 @@ class StoryCreationService:
         """
         result = ProcessingResult()
 
-        for signature, conv_dicts in theme_groups.items():
-            try:
-                # Convert dicts to ConversationData objects
-                conversations = [
-                    self._dict_to_conversation_data(d, signature)
-                    for d in conv_dicts
-                ]
-
-                # QUALITY GATES: Apply validation and scoring BEFORE deciding story vs orphan
-                gate_result = self._apply_quality_gates(signature, conversations, conv_dicts)
-
-                if not gate_result.passed:
-                    # Route to orphan integration (unified orphan logic)
-                    self._route_to_orphan_integration(
-                        signature=signature,
-                        conversations=conversations,
-                        failure_reason=gate_result.failure_reason or "Quality gate failed",
-                        result=result,
-                    )
-                    result.quality_gate_rejections += 1
-                    continue
-
-                # PM REVIEW GATE: Evaluate group coherence (after quality gates pass)
-                if self.pm_review_enabled and self.pm_review_service:
-                    pm_review_result = self._run_pm_review(signature, conversations)
-
-                    if pm_review_result.decision == ReviewDecision.SPLIT:
-                        # Handle split: process sub-groups and orphans
-                        self._handle_pm_split(
-                            pm_review_result,
-                            conversations,
-                            result,
-                            pipeline_run_id,
-                            gate_result.confidence_score,
-                        )
-                        result.pm_review_splits += 1
-                        continue
-                    elif pm_review_result.decision == ReviewDecision.REJECT:
-                        # All conversations are too different - route all to orphans
-                        self._route_to_orphan_integration(
-                            signature=signature,
-                            conversations=conversations,
-                            failure_reason=f"PM review rejected: {pm_review_result.reasoning}",
-                            result=result,
-                        )
-                        result.pm_review_rejects += 1
-                        continue
-                    else:
-                        # Keep together - continue to story creation
-                        result.pm_review_kept += 1
-                else:
-                    # PM review disabled or not available
-                    result.pm_review_skipped += 1
-
-                # Generate default PM result (keep_together)
-                pm_result = self._generate_pm_result(signature, len(conversations))
-
-                # Process using existing logic, passing confidence score from gates
-                self._process_single_result_with_pipeline_run(
-                    pm_result=pm_result,
-                    conversations=conversations,
-                    result=result,
-                    pipeline_run_id=pipeline_run_id,
-                    confidence_score=gate_result.confidence_score,
-                )
-
-            except (KeyboardInterrupt, SystemExit):
-                raise  # Never swallow these - let user/system interrupt
-            except Exception as e:
-                error_msg = f"Error processing theme group '{signature}': {e}"
-                logger.error(error_msg)
-                result.errors.append(error_msg)
+        self._process_groups(
+            list(theme_groups.items()),
+            lambda group, group_result: self._process_theme_group(
+                group[0], group[1], group_result, pipeline_run_id
+            ),
+            lambda group: f"theme group '{group[0]}'",
+            result,
+        )
 
         logger.info(
             f"Processed theme groups: {result.stories_created} stories created, "
@@ -809,6 +835,78 @@ class StoryCreationService:
 
         return result
 
+    def _process_theme_group(
+        self,
+        signature: str,
+        conv_dicts: List[Dict[str, Any]],
+        result: ProcessingResult,
+        pipeline_run_id: Optional[int] = None,
+    ) -> None:
+        """Apply quality gates and PM review to one theme group, then create its story or orphans."""
+        # Convert dicts to ConversationData objects
+        conversations = [
+            self._dict_to_conversation_data(d, signature)
+            for d in conv_dicts
+        ]
+
+        # QUALITY GATES: Apply validation and scoring BEFORE deciding story vs orphan
+        gate_result = self._apply_quality_gates(signature, conversations, conv_dicts)
+
+        if not gate_result.passed:
+            # Route to orphan integration (unified orphan logic)
+            self._route_to_orphan_integration(
+                signature=signature,
+                conversations=conversations,
+                failure_reason=gate_result.failure_reason or "Quality gate failed",
+                result=result,
+            )
+            result.quality_gate_rejections += 1
+            return
+
+        # PM REVIEW GATE: Evaluate group coherence (after quality gates pass)
+        if self.pm_review_enabled and self.pm_review_service:
+            pm_review_result = self._run_pm_review(signature, conversations)
+
+            if pm_review_result.decision == ReviewDecision.SPLIT:
+                # Handle split: process sub-groups and orphans
+                self._handle_pm_split(
+                    pm_review_result,
+                    conversations,
+                    result,
+                    pipeline_run_id,
+                    gate_result.confidence_score,
+                )
+                result.pm_review_splits += 1
+                return
+            elif pm_review_result.decision == ReviewDecision.REJECT:
+                # All conversations are too different - route all to orphans
+                self._route_to_orphan_integration(
+                    signature=signature,
+                    conversations=conversations,
+                    failure_reason=f"PM review rejected: {pm_review_result.reasoning}",
+                    result=result,
+                )
+                result.pm_review_rejects += 1
+                return
+            else:
+                # Keep together - continue to story creation
+                result.pm_review_kept += 1
+        else:
+            # PM review disabled or not available
+            result.pm_review_skipped += 1
+
+        # Generate default PM result (keep_together)
+        pm_result = self._generate_pm_result(signature, len(conversations))
+
+        # Process using existing logic, passing confidence score from gates
+        self._process_single_result_with_pipeline_run(
+            pm_result=pm_result,
+            conversations=conversations,
+            result=result,
+            pipeline_run_id=pipeline_run_id,
+            confidence_score=gate_result.confidence_score,
+        )
+
     def process_hybrid_clusters(
         self,
         clustering_result: Any,  # ClusteringResult from hybrid_clustering_service
@@ -850,20 +948,17 @@ class StoryCreationService:
         )
 
         # Process each hybrid cluster
-        for cluster in clustering_result.clusters:
-            try:
-                self._process_hybrid_cluster(
-                    cluster=cluster,
-                    conversation_data=conversation_data,
-                    result=result,
-                    pipeline_run_id=pipeline_run_id,
-                )
-            except (KeyboardInterrupt, SystemExit):
-                raise
-            except Exception as e:
-                error_msg = f"Error processing cluster '{cluster.cluster_id}': {e}"
-                logger.error(error_msg)
-                result.errors.append(error_msg)
+        self._process_groups(
+            list(clustering_result.clusters),
+            lambda cluster, group_result: self._process_hybrid_cluster(
+                cluster=cluster,
+                conversation_data=conversation_data,
+                result=group_result,
+                pipeline_run_id=pipeline_run_id,
+            ),
+            lambda cluster: f"cluster '{cluster.cluster_id}'",
+            result,
+        )
 
         # Handle fallback conversations (missing embeddings/facets)
         if clustering_result.fallback_conversations:
@@ -886,6 +981,75 @@ class StoryCreationService:
 
         return result
 
+    def _process_groups(
+        self,
+        groups: List[Any],
+        process_group: Callable[[Any, ProcessingResult], None],
+        describe: Callable[[Any], str],
+        result: ProcessingResult,
+    ) -> None:
+        """
+        Run process_group for every group, in parallel when max_concurrency > 1.
+
+        Each group fills its own ProcessingResult; these are merged into result
+        in input order, so counts, IDs and errors match the sequential path.
+        Story/orphan/evidence services are wrapped so DB access follows input
+        order (see _GroupTurnstile).
+
+        Args:
+            groups: Theme groups or hybrid clusters
+            process_group: Processes one group into the given ProcessingResult
+            describe: Group description for error messages
+            result: ProcessingResult to update
+        """
+
+        def run_one(group: Any, group_result: ProcessingResult) -> None:
+            try:
+                process_group(group, group_result)
+            except (KeyboardInterrupt, SystemExit):
+                raise  # Never swallow these - let user/system interrupt
+            except Exception as e:
+                error_msg = f"Error processing {describe(group)}: {e}"
+                logger.error(error_msg)
+                group_result.errors.append(error_msg)
+
+        if self.max_concurrency <= 1 or len(groups) <= 1:
+            for group in groups:
+                run_one(group, result)
+            return
+
+        turnstile = _GroupTurnstile()
+
+        def run_indexed(index: int, group: Any) -> ProcessingResult:
+            group_result = ProcessingResult()
+            turnstile.bind(index)
+            try:
+                run_one(group, group_result)
+            finally:
+                turnstile.bind(None)
+                turnstile.finish(index)
+            return group_result
+
+        service_attrs = ("story_service", "orphan_service", "evidence_service", "orphan_integration_service")
+        originals = {attr: getattr(self, attr) for attr in service_attrs}
+        for attr, service in originals.items():
+            if service is not None:
+                setattr(self, attr, _TurnstileService(service, turnstile))
+        try:
+            with ThreadPoolExecutor(max_workers=min(self.max_concurrency, len(groups))) as executor:
+                futures = [executor.submit(run_indexed, i, group) for i, group in enumerate(groups)]
+                for future in futures:
+                    _merge_processing_results(result, future.result())
+        finally:
+            for attr, service in originals.items():
+                setattr(self, attr, service)
+
+    @contextmanager
+    def _provider_slot(self, provider: str) -> Iterator[None]:
+        """Hold one of the provider's PROVIDER_CONCURRENCY_LIMITS slots."""
+        with self._provider_slots[provider]:
+            yield
+
     def _process_hybrid_cluster(
         self,
         cluster: Any,  # HybridCluster from hybrid_clustering_service
@@ -1469,10 +1633,11 @@ class StoryCreationService:
         if self.confidence_scorer:
             try:
                 # ConfidenceScorer expects {signature: [dicts]} format
-                scored_groups = self.confidence_scorer.score_groups(
-                    {signature: conv_dicts},
-                    verbose=False,
-                )
+                with self._provider_slot("openai"):
+                    scored_groups = self.confidence_scorer.score_groups(
+                        {signature: conv_dicts},
+                        verbose=False,
+                    )
 
                 if scored_groups:
                     scored_group = scored_groups[0]
@@ -1678,7 +1843,8 @@ class StoryCreationService:
             pm_contexts.append(pm_context)
 
         try:
-            return self.pm_review_service.review_group(signature, pm_contexts)
+            with self._provider_slot("openai"):
+                return self.pm_review_service.review_group(signature, pm_contexts)
         except Exception as e:
             # Edge case: Timeout or error during PM review -> mark as skipped
             logger.warning(f"PM review error for '{signature}': {e}")
@@ -2676,7 +2842,8 @@ class StoryCreationService:
         )
 
         try:
-            generated_content = self.content_generator.generate(content_input)
+            with self._provider_slot("openai"):
+                generated_content = self.content_generator.generate(content_input)
             logger.debug(
                 f"Generated story content for '{signature}': title='{generated_content.title[:50]}...'"
             )
@@ -2823,10 +2990,11 @@ class StoryCreationService:
             # Only explore if code_context missing or failed
             try:
                 logger.debug(f"Exploring codebase for {signature}")
-                exploration_result = self.codebase_provider.explore_for_theme(
-                    theme_data,
-                    self.target_repo,
-                )
+                with self._provider_slot("codebase"):
+                    exploration_result = self.codebase_provider.explore_for_theme(
+                        theme_data,
+                        self.target_repo,
+                    )
                 logger.info(
                     f"Codebase exploration complete for {signature}: "
                     f"{len(exploration_result.relevant_files)} files, "
@@ -3040,13 +3208,14 @@ class StoryCreationService:
             product_area_hint = theme_data.get("product_area")
 
             # Use classification-guided exploration
-            exploration_result, classification_result = (
-                self.codebase_provider.explore_with_classification(
-                    issue_text=issue_text,
-                    target_repo=self.target_repo,
-                    product_area_hint=product_area_hint,
+            with self._provider_slot("codebase"):
+                exploration_result, classification_result = (
+                    self.codebase_provider.explore_with_classification(
+                        issue_text=issue_text,
+                        target_repo=self.target_repo,
+                        product_area_hint=product_area_hint,
+                    )
                 )
-            )
 
             # Build code_context dict for storage
             # Issue #178: Pass product_area for mismatch detection
@@ -3125,10 +3294,11 @@ class StoryCreationService:
         try:
             logger.info("Generating implementation context via hybrid retrieval + synthesis")
 
-            context = self.implementation_context_service.generate(
-                story_title=title,
-                theme_data=theme_data,
-            )
+            with self._provider_slot("openai"):
+                context = self.implementation_context_service.generate(
+                    story_title=title,
+                    theme_data=theme_data,
+                )
 
             # Convert to dict for JSONB storage
             context_dict = context.model_dump()
@@ -5,10 +5,12 @@ Uses product context to extract structured themes that can be aggregated,
 tracked over time, and turned into actionable tickets.
 """
 
+import asyncio
 import json
 import logging
 import os
 import threading
+import weakref
 from dataclasses import dataclass, asdict, field
 from datetime import datetime
 from pathlib import Path
@@ -22,7 +24,7 @@ env_path = Path(__file__).parent.parent / ".env"
 if env_path.exists():
     load_dotenv(env_path)
 
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
 import numpy as np
 
 # Handle both module and script execution
@@ -41,6 +43,16 @@ def cosine_similarity(a: list[float], b: list[float]) -> float:
     return np.dot(a, b) / (np.linalg.norm(a) * np.linalg.norm(b))
 
 
+def _normalize_signature(signature: str) -> str:
+    """Lowercase snake_case form used for new (non-matched) signatures."""
+    return signature.lower().replace(" ", "_").replace("-", "_")
+
+
+def _embedding_description(proposed_signature: str, user_intent: str, symptoms: list[str]) -> str:
+    """Text embedded for a new issue in embedding-based canonicalization."""
+    return f"{proposed_signature.replace('_', ' ')}: {user_intent}. Symptoms: {', '.join(symptoms)}"
+
+
 def validate_signature_specificity(
     signature: str,
     symptoms: Optional[List[str]] = None,
@@ -133,6 +145,10 @@ def validate_signature_specificity(
     return True, None
 
 
+# Conversations per batched research search (one embedding request + one DB query)
+RESEARCH_PREFETCH_BATCH_SIZE = 100
+
+
 # Load product context
 PRODUCT_CONTEXT_PATH = Path(__file__).parent.parent / "context" / "product"
 
@@ -278,6 +294,12 @@ def prepare_conversation_for_extraction(
         return f"{first_text}\n\n{middle_text}\n\n{last_text}"
 
 
+# Theme extraction prompts are laid out for provider-side prompt prefix caching:
+# THEME_EXTRACTION_PROMPT holds everything that is the same for every
+# conversation in a run (product context, signature guidance, field spec) and is
+# rendered byte-identically for a given vocabulary and mode. THEME_CONVERSATION_PROMPT
+# follows it with the parts that vary: known themes (per URL product area), URL
+# and research context, then the conversation itself.
 THEME_EXTRACTION_PROMPT = """You are a product analyst for Tailwind, a social media scheduling tool focused on Pinterest, Instagram, and Facebook.
 
 Your job is to extract a structured "theme" from a customer support conversation. Themes help us:
@@ -285,18 +307,12 @@ Your job is to extract a structured "theme" from a customer support conversation
 2. Track trends over time
 3. Create actionable tickets for engineering/product
 
+The KNOWN THEMES list and the conversation come after these instructions.
+
 ## Product Context
 
 {product_context}
 
-{url_context_hint}
-
-{research_context}
-
-## KNOWN THEMES
-
-{known_themes}
-
 {signature_quality_examples}
 
 {strict_mode_instructions}
@@ -417,6 +433,23 @@ Extract these fields:
 - **solution_provided**: "User reconnected their Pinterest account via Settings > Connections, which refreshed the OAuth token and restored board access."
 - **resolution_category**: "workaround"
 
+## Instructions
+
+1. {match_instruction}
+2. Use your product knowledge to map user language to actual features
+3. Be specific in symptoms - these help engineers reproduce
+4. If unsure about a field, make your best inference
+
+"""
+
+THEME_CONVERSATION_PROMPT = """## KNOWN THEMES
+
+{known_themes}
+
+{url_context_hint}
+
+{research_context}
+
 ## Conversation
 
 Issue Type: {issue_type}
@@ -427,33 +460,26 @@ Churn Risk: {churn_risk}
 Message:
 {source_body}
 
-## Instructions
-
-1. {match_instruction}
-2. Use your product knowledge to map user language to actual features
-3. Be specific in symptoms - these help engineers reproduce
-4. If unsure about a field, make your best inference
-
 Respond with valid JSON only:
 """
 
 # Prompt variations for strict vs flexible mode
-STRICT_MODE_INSTRUCTIONS = """## STRICT MODE: You MUST select from the known themes above.
+STRICT_MODE_INSTRUCTIONS = """## STRICT MODE: You MUST select from the KNOWN THEMES list.
 
 If the conversation doesn't fit any theme well, use `unclassified_needs_review`.
 Do NOT create new theme signatures. Pick the closest match or unclassified."""
 
 FLEXIBLE_MODE_INSTRUCTIONS = """## Match First!
 
-Try to match to one of these existing themes before proposing a new one.
+Try to match to one of the KNOWN THEMES before proposing a new one.
 Only create a new theme if the issue is genuinely different from all known themes."""
 
-STRICT_SIGNATURE_INSTRUCTIONS = """You MUST use one of the known theme signatures above. Pick the closest match. If nothing fits, use `unclassified_needs_review`."""
+STRICT_SIGNATURE_INSTRUCTIONS = """You MUST use one of the KNOWN THEMES signatures. Pick the closest match. If nothing fits, use `unclassified_needs_review`."""
 
 FLEXIBLE_SIGNATURE_INSTRUCTIONS = """IMPORTANT - Create SPECIFIC, ACTIONABLE signatures:
 
 **Decision Process**:
-   a) First, check if this matches any KNOWN THEME above (same root issue, even if worded differently)
+   a) First, check if this matches any of the KNOWN THEMES (same root issue, even if worded differently)
    b) If yes, use that exact signature
    c) If no match, create a new canonical signature following these rules:
 
@@ -622,6 +648,8 @@ class ThemeExtractor:
                            If provided, extracts research context to enrich prompts.
         """
         self.client = OpenAI()
+        # Shared by every concurrent extract_async call (one connection pool)
+        self._async_client: Optional[AsyncOpenAI] = None
         self.model = model
         self._product_context = None
         self._existing_signatures = None
@@ -636,6 +664,69 @@ class ThemeExtractor:
         # Issue #152: Changed to RLock (reentrant) so the same thread can acquire
         # the lock multiple times (outer canonicalization scope + inner add_session_signature)
         self._session_lock = threading.RLock()
+        # extract_async serializes canonicalization per event loop instead,
+        # so waiting on it never blocks the loop (asyncio.Lock is loop-bound)
+        self._async_session_locks: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock]" = (
+            weakref.WeakKeyDictionary()
+        )
+        # Persisted signature embeddings for canonicalize_via_embedding (lazy)
+        self._signature_index = None
+        # Cached theme_aggregates signatures, loaded once per extractor (lazy)
+        self._signature_catalog = None
+        # Per-stage token usage, including prompt-cache hits (see usage_stats)
+        self._usage: dict[str, dict[str, int]] = {}
+        self._usage_lock = threading.Lock()
+        # Research context fetched ahead for a batch, keyed by source text
+        # (see prefetch_research_context); entries are consumed on use and
+        # the rest dropped by clear_prefetched_research() after the batch
+        self._prefetched_research: dict[str, str] = {}
+
+    @property
+    def async_client(self) -> AsyncOpenAI:
+        """Lazy-initialize async OpenAI client."""
+        if self._async_client is None:
+            self._async_client = AsyncOpenAI()
+        return self._async_client
+
+    def usage_stats(self) -> dict:
+        """
+        Token usage per LLM stage since this extractor was created.
+
+        Returns {stage: {"calls", "prompt_tokens", "cached_tokens",
+        "completion_tokens"}} for the "theme_extraction" and
+        "canonicalization" stages that have run. cached_tokens is the part of
+        prompt_tokens served from the provider's prompt prefix cache.
+        """
+        with self._usage_lock:
+            return {stage: dict(counts) for stage, counts in self._usage.items()}
+
+    def _record_usage(self, stage: str, response) -> None:
+        """Add one response's usage (including cached prompt tokens) to a stage."""
+        usage = getattr(response, "usage", None)
+        prompt_tokens = getattr(usage, "prompt_tokens", None)
+        completion_tokens = getattr(usage, "completion_tokens", None)
+        cached_tokens = getattr(getattr(usage, "prompt_tokens_details", None), "cached_tokens", None)
+
+        with self._usage_lock:
+            counts = self._usage.setdefault(stage, {
+                "calls": 0, "prompt_tokens": 0, "cached_tokens": 0, "completion_tokens": 0,
+            })
+            counts["calls"] += 1
+            # Usage is missing on some responses (and on test doubles)
+            if isinstance(prompt_tokens, int):
+                counts["prompt_tokens"] += prompt_tokens
+            if isinstance(completion_tokens, int):
+                counts["completion_tokens"] += completion_tokens
+            if isinstance(cached_tokens, int):
+                counts["cached_tokens"] += cached_tokens
+
+    def _async_session_lock(self) -> asyncio.Lock:
+        """Canonicalization lock for the running event loop."""
+        loop = asyncio.get_running_loop()
+        lock = self._async_session_locks.get(loop)
+        if lock is None:
+            lock = self._async_session_locks[loop] = asyncio.Lock()
+        return lock
 
     @property
     def vocabulary(self):
@@ -659,6 +750,9 @@ class ThemeExtractor:
         """
         Get research context from semantic search to augment theme extraction.
 
+        Uses the result of prefetch_research_context() when the conversation
+        was part of a prefetched batch.
+
         Args:
             conversation_text: Customer message text to use as search query
             max_results: Maximum research items to include
@@ -669,47 +763,114 @@ class ThemeExtractor:
         if not self._search_service:
             return ""
 
+        prefetched = self._prefetched_research.pop(conversation_text, None)
+        if prefetched is not None:
+            return prefetched
+
         try:
             # Search for relevant research (Coda only, not Intercom)
             results = self._search_service.search_for_context(
                 query=conversation_text[:500],  # Limit query length
                 max_results=max_results,
             )
+            return self._format_research_context(results)
+
+        except Exception as e:
+            # Graceful degradation - extraction continues without context
+            logger.warning(f"Research context unavailable: {e}")
+            return ""
+
+    def prefetch_research_context(
+        self,
+        conversations: list[Conversation],
+        conversation_digests: Optional[dict] = None,
+        conversation_full_texts: Optional[dict] = None,
+        use_full_conversation: bool = True,
+        max_results: int = 3,
+    ) -> int:
+        """
+        Fetch research context for a batch of conversations in one search.
 
-            if not results:
-                return ""
+        Embeds every conversation's source text in one request and runs all
+        vector lookups in one database round-trip (search_for_context_many),
+        so the following extract()/extract_async() calls for these
+        conversations skip their own search. Digests and full texts are keyed
+        by conversation id and select the source text exactly as extract() does.
 
-            # Format as context for the prompt
-            context_parts = ["## Related Research Insights\n"]
-            for i, result in enumerate(results, 1):
-                context_parts.append(
-                    f"{i}. **{result.title}** ({result.source_type})\n"
-                    f"   {result.snippet}\n"
+        Returns:
+            Number of distinct source texts with prefetched context
+        """
+        if not self._search_service or not conversations:
+            return 0
+
+        source_texts = list(dict.fromkeys(
+            self._select_source_text(
+                conv,
+                (conversation_digests or {}).get(conv.id),
+                (conversation_full_texts or {}).get(conv.id),
+                use_full_conversation,
+            )
+            for conv in conversations
+        ))
+
+        prefetched = 0
+        for start in range(0, len(source_texts), RESEARCH_PREFETCH_BATCH_SIZE):
+            chunk = source_texts[start:start + RESEARCH_PREFETCH_BATCH_SIZE]
+            try:
+                batch_results = self._search_service.search_for_context_many(
+                    queries=chunk,
+                    max_results=max_results,
                 )
+            except Exception as e:
+                # Graceful degradation - extract() falls back to per-conversation search
+                logger.warning(f"Research context prefetch failed: {e}")
+                break
 
-            logger.info(f"Added {len(results)} research context items to theme extraction")
-            return "\n".join(context_parts)
+            for source_text, results in zip(chunk, batch_results):
+                self._prefetched_research[source_text] = self._format_research_context(results)
+            prefetched += len(chunk)
+        return prefetched
 
-        except Exception as e:
-            # Graceful degradation - extraction continues without context
-            logger.warning(f"Research context unavailable: {e}")
+    def clear_prefetched_research(self) -> None:
+        """
+        Drop prefetched research context that no extraction consumed.
+
+        Conversations skipped after prefetch (stopped runs, filtered or
+        failed extractions) would otherwise keep their source text and
+        context in memory for the extractor's lifetime.
+        """
+        self._prefetched_research.clear()
+
+    @staticmethod
+    def _format_research_context(results) -> str:
+        """Format research search results as a prompt section."""
+        if not results:
             return ""
 
+        context_parts = ["## Related Research Insights\n"]
+        for i, result in enumerate(results, 1):
+            context_parts.append(
+                f"{i}. **{result.title}** ({result.source_type})\n"
+                f"   {result.snippet}\n"
+            )
+
+        logger.info(f"Added {len(results)} research context items to theme extraction")
+        return "\n".join(context_parts)
+
     def get_existing_signatures(self, product_area: str = None, include_session: bool = True) -> list[dict]:
         """
         Fetch existing signatures from database + current session for canonicalization.
 
+        Database signatures come from the run-scoped signature catalog, which
+        loads theme_aggregates once and revalidates cheaply instead of
+        re-querying the whole table on every call.
+
         Args:
             product_area: If provided, only fetch signatures from this area.
                          Falls back to all signatures for better matching.
             include_session: If True, include signatures from current extraction session.
                             This ensures new signatures can canonicalize against each other.
         """
-        try:
-            from .db.connection import get_connection
-        except ImportError:
-            from db.connection import get_connection
-
         signatures = []
 
         # Thread-safe: copy session signatures under lock (Issue #148)
@@ -728,42 +889,56 @@ class ThemeExtractor:
                     })
 
         try:
-            with get_connection() as conn:
-                with conn.cursor() as cur:
-                    # Fetch all signatures - no limit to avoid fragmentation
-                    # Bug fix: LIMIT 50 caused 83% singleton rate by excluding
-                    # most signatures from canonicalization candidates
-                    if product_area:
-                        # Prioritize same product area, but include all for fallback
-                        cur.execute("""
-                            SELECT issue_signature, product_area, component, occurrence_count
-                            FROM theme_aggregates
-                            ORDER BY
-                                CASE WHEN product_area = %s THEN 0 ELSE 1 END,
-                                occurrence_count DESC
-                        """, (product_area,))
-                    else:
-                        cur.execute("""
-                            SELECT issue_signature, product_area, component, occurrence_count
-                            FROM theme_aggregates
-                            ORDER BY occurrence_count DESC
-                        """)
-
-                    # Add DB signatures, avoiding duplicates with session
-                    session_sig_keys = set(session_sigs_snapshot.keys())
-                    for row in cur.fetchall():
-                        if row[0] not in session_sig_keys:
-                            signatures.append({
-                                "signature": row[0],
-                                "product_area": row[1],
-                                "component": row[2],
-                                "count": row[3]
-                            })
+            # All signatures - no limit to avoid fragmentation
+            # Bug fix: LIMIT 50 caused 83% singleton rate by excluding
+            # most signatures from canonicalization candidates.
+            # With product_area, same-area signatures come first.
+            db_signatures = self.signature_catalog.signatures(product_area)
+
+            # Add DB signatures, avoiding duplicates with session
+            for row in db_signatures:
+                if row["signature"] not in session_sigs_snapshot:
+                    signatures.append(dict(row))
         except Exception as e:
             logger.warning(f"Could not fetch existing signatures: {e}")
 
         return signatures
 
+    def has_signature(self, signature: str, product_area: str = None) -> bool:
+        """
+        O(1) check whether a signature is already known.
+
+        Equivalent to checking membership in get_existing_signatures(product_area)
+        without building the list: a session signature counts only if it is in
+        the same product area (it shadows any DB row of the same name);
+        otherwise any theme_aggregates signature counts.
+        """
+        with self._session_lock:
+            session_info = self._session_signatures.get(signature)
+        if session_info is not None:
+            return product_area is None or session_info.get("product_area") == product_area
+
+        try:
+            return self.signature_catalog.contains(signature)
+        except Exception as e:
+            logger.warning(f"Could not check existing signatures: {e}")
+            return False
+
+    @property
+    def signature_catalog(self):
+        """Lazy-load the run-scoped theme_aggregates signature catalog."""
+        if self._signature_catalog is None:
+            try:
+                from .signature_catalog import SignatureCatalog
+            except ImportError:
+                from signature_catalog import SignatureCatalog
+            self._signature_catalog = SignatureCatalog()
+        return self._signature_catalog
+
+    def invalidate_signature_catalog(self) -> None:
+        """Force the next signature lookup to reload theme_aggregates."""
+        self.signature_catalog.invalidate()
+
     def add_session_signature(self, signature: str, product_area: str, component: str) -> None:
         """
         Add a signature to the current session cache.
@@ -794,6 +969,33 @@ class ThemeExtractor:
         )
         return response.data[0].embedding
 
+    def get_embeddings(self, texts: list[str]) -> list[list[float]]:
+        """Get embeddings for several texts in a single API call (order preserved)."""
+        response = self.client.embeddings.create(
+            model="text-embedding-3-small",
+            input=texts,
+        )
+        return [item.embedding for item in sorted(response.data, key=lambda d: d.index)]
+
+    async def get_embedding_async(self, text: str) -> list[float]:
+        """Async version of get_embedding()."""
+        response = await self.async_client.embeddings.create(
+            model="text-embedding-3-small",
+            input=text,
+        )
+        return response.data[0].embedding
+
+    @property
+    def signature_index(self):
+        """Lazy-load the persisted signature embedding index."""
+        if self._signature_index is None:
+            try:
+                from .signature_embedding_index import SignatureEmbeddingIndex
+            except ImportError:
+                from signature_embedding_index import SignatureEmbeddingIndex
+            self._signature_index = SignatureEmbeddingIndex(embed_batch=self.get_embeddings)
+        return self._signature_index
+
     def canonicalize_via_embedding(
         self,
         proposed_signature: str,
@@ -807,37 +1009,69 @@ class ThemeExtractor:
 
         Compares the semantic meaning of the new issue against existing signatures.
         If similarity > threshold, reuses existing signature.
+
+        Existing signature embeddings come from the persisted signature index,
+        so only the new issue description is embedded per call (plus a single
+        batched request for any signatures the index has not seen yet).
         """
         existing = self.get_existing_signatures(product_area=product_area)
 
         # If no existing signatures, return normalized proposed
         if not existing:
-            return proposed_signature.lower().replace(" ", "_").replace("-", "_")
+            return _normalize_signature(proposed_signature)
 
-        # Create a description of the new issue for embedding
-        new_description = f"{proposed_signature.replace('_', ' ')}: {user_intent}. Symptoms: {', '.join(symptoms)}"
-        new_embedding = self.get_embedding(new_description)
+        new_embedding = self.get_embedding(
+            _embedding_description(proposed_signature, user_intent, symptoms)
+        )
 
-        best_match = None
-        best_similarity = 0.0
+        self.signature_index.ensure(existing)
+        return self._pick_embedding_match(proposed_signature, new_embedding, existing, threshold)
 
-        for sig_info in existing:
-            # Create description for existing signature
-            existing_desc = f"{sig_info['signature'].replace('_', ' ')}: {sig_info['product_area']} {sig_info['component']}"
-            existing_embedding = self.get_embedding(existing_desc)
+    async def canonicalize_via_embedding_async(
+        self,
+        proposed_signature: str,
+        user_intent: str,
+        symptoms: list[str],
+        product_area: str = None,
+        threshold: float = 0.85,
+    ) -> str:
+        """
+        Async version of canonicalize_via_embedding().
 
-            similarity = cosine_similarity(new_embedding, existing_embedding)
+        The issue description is embedded with the async client. Signature
+        lookups and index maintenance (DB reads, batched embedding of unseen
+        signatures) run in a worker thread.
+        """
+        existing = await asyncio.to_thread(
+            self.get_existing_signatures, product_area=product_area
+        )
+
+        if not existing:
+            return _normalize_signature(proposed_signature)
 
-            if similarity > best_similarity:
-                best_similarity = similarity
-                best_match = sig_info['signature']
+        new_embedding = await self.get_embedding_async(
+            _embedding_description(proposed_signature, user_intent, symptoms)
+        )
+
+        await asyncio.to_thread(self.signature_index.ensure, existing)
+        return self._pick_embedding_match(proposed_signature, new_embedding, existing, threshold)
+
+    def _pick_embedding_match(
+        self,
+        proposed_signature: str,
+        new_embedding: list[float],
+        existing: list[dict],
+        threshold: float,
+    ) -> str:
+        """Reuse the nearest existing signature if it clears the threshold."""
+        best_match, best_similarity = self.signature_index.nearest(new_embedding, existing)
 
         if best_similarity >= threshold:
             logger.info(f"Embedding match: {best_match} (similarity={best_similarity:.3f}, was: {proposed_signature})")
             return best_match
         else:
             logger.info(f"New signature: {proposed_signature} (best match: {best_match} at {best_similarity:.3f})")
-            return proposed_signature.lower().replace(" ", "_").replace("-", "_")
+            return _normalize_signature(proposed_signature)
 
     def canonicalize_signature(
         self,
@@ -859,7 +1093,7 @@ class ThemeExtractor:
 
         # If no existing signatures, just return the proposed one (normalized)
         if not existing:
-            return proposed_signature.lower().replace(" ", "_").replace("-", "_")
+            return _normalize_signature(proposed_signature)
 
         # Use embedding-based approach if requested
         if not use_llm:
@@ -868,9 +1102,65 @@ class ThemeExtractor:
             )
 
         # LLM-based canonicalization (original approach)
+        response = self.client.chat.completions.create(
+            **self._canonicalization_request(
+                existing, proposed_signature, product_area, component, user_intent, symptoms
+            )
+        )
+        return self._resolve_canonicalization(response, proposed_signature)
+
+    async def canonicalize_signature_async(
+        self,
+        proposed_signature: str,
+        product_area: str,
+        component: str,
+        user_intent: str,
+        symptoms: list[str],
+        use_llm: bool = True,
+    ) -> str:
+        """
+        Async version of canonicalize_signature().
+
+        The canonicalization LLM call uses the shared async client; the
+        signature lookup runs in a worker thread because it may hit the DB.
+        """
+        existing = await asyncio.to_thread(
+            self.get_existing_signatures, product_area=product_area
+        )
+
+        if not existing:
+            return _normalize_signature(proposed_signature)
+
+        if not use_llm:
+            return await self.canonicalize_via_embedding_async(
+                proposed_signature, user_intent, symptoms, product_area=product_area
+            )
+
+        response = await self.async_client.chat.completions.create(
+            **self._canonicalization_request(
+                existing, proposed_signature, product_area, component, user_intent, symptoms
+            )
+        )
+        return self._resolve_canonicalization(response, proposed_signature)
+
+    def _canonicalization_request(
+        self,
+        existing: list[dict],
+        proposed_signature: str,
+        product_area: str,
+        component: str,
+        user_intent: str,
+        symptoms: list[str],
+    ) -> dict:
+        """Chat completion arguments for LLM signature canonicalization."""
+        # Signatures from this session change on every call; list them after the
+        # theme_aggregates ones so the prompt prefix stays cacheable.
+        with self._session_lock:
+            session = set(self._session_signatures)
+        ordered = sorted(existing, key=lambda s: s["signature"] in session)
         sig_list = "\n".join(
             f"- {s['signature']} ({s['product_area']}/{s['component']})"
-            for s in existing
+            for s in ordered
         )
 
         prompt = SIGNATURE_CANONICALIZATION_PROMPT.format(
@@ -882,7 +1172,7 @@ class ThemeExtractor:
             symptoms=", ".join(symptoms) if symptoms else "none specified",
         )
 
-        response = self.client.chat.completions.create(
+        return dict(
             model=self.model,
             messages=[
                 {"role": "system", "content": "You normalize issue signatures. Respond with valid JSON only."},
@@ -892,6 +1182,9 @@ class ThemeExtractor:
             response_format={"type": "json_object"},
         )
 
+    def _resolve_canonicalization(self, response, proposed_signature: str) -> str:
+        """Final signature from a canonicalization response."""
+        self._record_usage("canonicalization", response)
         result = json.loads(response.choices[0].message.content)
         final_sig = result.get("signature", proposed_signature)
         matched = result.get("matched_existing", False)
@@ -939,6 +1232,161 @@ class ThemeExtractor:
                                   If False, fall back to customer_digest or source_body.
                                   Set to False for backward compatibility or cost savings.
         """
+        source_text = self._select_source_text(
+            conv, customer_digest, full_conversation, use_full_conversation
+        )
+        # Get research context for enrichment (if search service available)
+        research_context = self.get_research_context(source_text)
+        prompt, source_text = self._build_extraction_prompt(
+            conv, source_text, research_context, strict_mode
+        )
+
+        response = self.client.chat.completions.create(**self._extraction_request(prompt))
+        result, fields = self._interpret_extraction(
+            conv, response, source_text, auto_add_to_vocabulary
+        )
+
+        # Phase 2: Canonicalize signature
+        # - If vocabulary matched an existing theme, use as-is (already canonical)
+        # - If LLM created a new signature, canonicalize against existing signatures
+        #   to prevent duplicates like analytics_stats_accuracy vs analytics_performance_accuracy
+        #
+        # Issue #152: Serialize canonicalization to prevent race condition where
+        # concurrent extractions create near-duplicate signatures. The lock ensures
+        # thread B sees thread A's signature before deciding to create a new one.
+        with self._session_lock:
+            if self.use_vocabulary and fields["matched_existing"]:
+                # Vocabulary already handled matching - use as-is
+                final_signature = fields["proposed_signature"]
+            elif canonicalize:
+                # Canonicalize new signatures against existing ones in theme_aggregates
+                # This runs for both vocabulary mode (new signatures) and non-vocabulary mode
+                final_signature = self.canonicalize_signature(
+                    proposed_signature=fields["proposed_signature"],
+                    product_area=fields["product_area"],
+                    component=fields["component"],
+                    user_intent=fields["user_intent"],
+                    symptoms=fields["symptoms"],
+                    use_llm=not use_embedding,
+                )
+            else:
+                final_signature = fields["proposed_signature"]
+
+            # Add to session cache for batch canonicalization
+            # This allows subsequent extractions to canonicalize against this signature
+            self.add_session_signature(final_signature, fields["product_area"], fields["component"])
+
+        return self._build_theme(conv, result, fields, final_signature)
+
+    async def extract_async(
+        self,
+        conv: Conversation,
+        canonicalize: bool = True,
+        use_embedding: bool = False,
+        auto_add_to_vocabulary: bool = False,
+        strict_mode: bool = False,
+        customer_digest: Optional[str] = None,
+        full_conversation: Optional[str] = None,
+        use_full_conversation: bool = True,
+    ) -> Theme:
+        """
+        Async version of extract() for parallel processing (Issue #148).
+
+        Same parameters and output as extract(). The theme and canonicalization
+        LLM calls go through one shared AsyncOpenAI client, so N concurrent
+        extractions hold N in-flight requests rather than N worker threads, and
+        cancelling the task cancels the request. Blocking lookups (research
+        search, signature catalog reads) run in worker threads.
+
+        Canonicalization is serialized with a per-event-loop asyncio.Lock, the
+        async counterpart of the _session_lock used by extract(). Run sync and
+        async extractions on the same extractor from one side only.
+        """
+        source_text = self._select_source_text(
+            conv, customer_digest, full_conversation, use_full_conversation
+        )
+        research_context = ""
+        if self._search_service:
+            research_context = self._prefetched_research.pop(source_text, None)
+            if research_context is None:
+                research_context = await asyncio.to_thread(self.get_research_context, source_text)
+        prompt, source_text = self._build_extraction_prompt(
+            conv, source_text, research_context, strict_mode
+        )
+
+        response = await self.async_client.chat.completions.create(
+            **self._extraction_request(prompt)
+        )
+        result, fields = self._interpret_extraction(
+            conv, response, source_text, auto_add_to_vocabulary
+        )
+
+        # Phase 2: Canonicalize signature (see extract())
+        async with self._async_session_lock():
+            if self.use_vocabulary and fields["matched_existing"]:
+                final_signature = fields["proposed_signature"]
+            elif canonicalize:
+                final_signature = await self.canonicalize_signature_async(
+                    proposed_signature=fields["proposed_signature"],
+                    product_area=fields["product_area"],
+                    component=fields["component"],
+                    user_intent=fields["user_intent"],
+                    symptoms=fields["symptoms"],
+                    use_llm=not use_embedding,
+                )
+            else:
+                final_signature = fields["proposed_signature"]
+
+            self.add_session_signature(final_signature, fields["product_area"], fields["component"])
+
+        return self._build_theme(conv, result, fields, final_signature)
+
+    def _select_source_text(
+        self,
+        conv: Conversation,
+        customer_digest: Optional[str],
+        full_conversation: Optional[str],
+        use_full_conversation: bool,
+    ) -> str:
+        """Pick the conversation text to extract from (see extract() Args)."""
+        # Determine source text for extraction (Issue #144 - Smart Digest)
+        # Priority order when use_full_conversation=True:
+        #   1. full_conversation (all messages, richest context)
+        #   2. customer_digest (first + most specific, good fallback)
+        #   3. source_body (first message only, minimal context)
+        # When use_full_conversation=False, skip full_conversation
+        source_text = ""
+
+        if use_full_conversation and full_conversation and len(full_conversation.strip()) > 10:
+            # Apply smart truncation for edge cases exceeding token limits
+            source_text = prepare_conversation_for_extraction(full_conversation.strip())
+            logger.debug(f"Conv {conv.id}: Using full conversation ({len(source_text)} chars)")
+        elif customer_digest and len(customer_digest.strip()) > 10:
+            # Issue #139: Fall back to customer digest
+            source_text = customer_digest.strip()
+            logger.debug(f"Conv {conv.id}: Using customer_digest ({len(source_text)} chars)")
+        else:
+            # Minimal fallback: first message only
+            source_text = conv.source_body or ""
+            if customer_digest is not None or full_conversation is not None:
+                logger.debug(f"Conv {conv.id}: Falling back to source_body")
+
+        return source_text
+
+    def _build_extraction_prompt(
+        self,
+        conv: Conversation,
+        source_text: str,
+        research_context: str,
+        strict_mode: bool,
+    ) -> Tuple[str, str]:
+        """
+        Render the extraction prompt: the static prefix followed by
+        THEME_CONVERSATION_PROMPT for this conversation.
+
+        Returns (prompt, source_text); source_text is truncated if the prompt
+        would exceed the token guard.
+        """
         # Check for URL context to boost product area matching
         url_matched_product_area = None
         url_context_hint = ""
@@ -954,7 +1402,6 @@ The user was on a page related to **{url_matched_product_area}** when they start
 
         # Get known themes from vocabulary (if enabled)
         known_themes = ""
-        signature_quality_examples = ""
         if self.use_vocabulary and self.vocabulary:
             # If we have URL context, prioritize themes from that product area
             if url_matched_product_area:
@@ -965,7 +1412,49 @@ The user was on a page related to **{url_matched_product_area}** when they start
             else:
                 known_themes = self.vocabulary.format_for_prompt(max_themes=50)
 
-            # Include signature quality examples
+        prefix = self.extraction_prompt_prefix(strict_mode)
+
+        def render(source_body: str) -> str:
+            return prefix + THEME_CONVERSATION_PROMPT.format(
+                known_themes=known_themes or "(No known themes yet - create new signatures as needed)",
+                url_context_hint=url_context_hint,
+                research_context=research_context,
+                issue_type=conv.issue_type,
+                sentiment=conv.sentiment,
+                priority=conv.priority,
+                churn_risk=conv.churn_risk,
+                source_body=source_body,
+            )
+
+        prompt = render(source_text)
+
+        # Token usage guard (R2): Estimate tokens and warn/truncate if needed
+        # gpt-4o-mini has 128K context window; leave headroom for response
+        MAX_PROMPT_CHARS = 400_000  # ~100K tokens at 4 chars/token
+        if len(prompt) > MAX_PROMPT_CHARS:
+            logger.warning(
+                f"Prompt exceeds {MAX_PROMPT_CHARS} chars ({len(prompt)} chars), truncating source_text"
+            )
+            # Recalculate with truncated source_text
+            # Estimate non-source overhead and leave room for it
+            overhead = len(prompt) - len(source_text)
+            max_source_chars = MAX_PROMPT_CHARS - overhead - 1000  # 1K buffer
+            if max_source_chars > 0:
+                source_text = source_text[:max_source_chars]
+                prompt = render(source_text)
+
+        return prompt, source_text
+
+    def extraction_prompt_prefix(self, strict_mode: bool = False) -> str:
+        """
+        Static head of every theme extraction prompt for this vocabulary and mode.
+
+        Contains nothing conversation-specific, so consecutive requests share a
+        byte-identical prefix that the provider can serve from its prompt cache.
+        """
+        # Include signature quality examples
+        signature_quality_examples = ""
+        if self.use_vocabulary and self.vocabulary:
             signature_quality_examples = self.vocabulary.format_signature_examples()
 
         # Select prompt variations based on strict mode
@@ -980,82 +1469,18 @@ The user was on a page related to **{url_matched_product_area}** when they start
             match_instruction = "**Match first**: Strongly prefer matching to known themes. Only create new if truly different."
             new_theme_reasoning = ". If proposing new, explain why none of the known themes fit"
 
-        # Determine source text for extraction (Issue #144 - Smart Digest)
-        # Priority order when use_full_conversation=True:
-        #   1. full_conversation (all messages, richest context)
-        #   2. customer_digest (first + most specific, good fallback)
-        #   3. source_body (first message only, minimal context)
-        # When use_full_conversation=False, skip full_conversation
-        source_text = ""
-        using_full_conversation = False
-
-        if use_full_conversation and full_conversation and len(full_conversation.strip()) > 10:
-            # Apply smart truncation for edge cases exceeding token limits
-            source_text = prepare_conversation_for_extraction(full_conversation.strip())
-            using_full_conversation = True
-            logger.debug(f"Conv {conv.id}: Using full conversation ({len(source_text)} chars)")
-        elif customer_digest and len(customer_digest.strip()) > 10:
-            # Issue #139: Fall back to customer digest
-            source_text = customer_digest.strip()
-            logger.debug(f"Conv {conv.id}: Using customer_digest ({len(source_text)} chars)")
-        else:
-            # Minimal fallback: first message only
-            source_text = conv.source_body or ""
-            if customer_digest is not None or full_conversation is not None:
-                logger.debug(f"Conv {conv.id}: Falling back to source_body")
-
-        # Get research context for enrichment (if search service available)
-        research_context = self.get_research_context(source_text)
-
-        # Phase 1: Extract theme details (with vocabulary-aware prompt)
-        prompt = THEME_EXTRACTION_PROMPT.format(
+        return THEME_EXTRACTION_PROMPT.format(
             product_context=self.product_context[:30000],  # Increased from 10K to 30K (Issue #144)
-            url_context_hint=url_context_hint,
-            research_context=research_context,
-            known_themes=known_themes or "(No known themes yet - create new signatures as needed)",
             signature_quality_examples=signature_quality_examples,
             strict_mode_instructions=strict_mode_instructions,
             signature_instructions=signature_instructions,
             match_instruction=match_instruction,
             new_theme_reasoning=new_theme_reasoning,
-            issue_type=conv.issue_type,
-            sentiment=conv.sentiment,
-            priority=conv.priority,
-            churn_risk=conv.churn_risk,
-            source_body=source_text,
         )
 
-        # Token usage guard (R2): Estimate tokens and warn/truncate if needed
-        # gpt-4o-mini has 128K context window; leave headroom for response
-        MAX_PROMPT_CHARS = 400_000  # ~100K tokens at 4 chars/token
-        if len(prompt) > MAX_PROMPT_CHARS:
-            logger.warning(
-                f"Prompt exceeds {MAX_PROMPT_CHARS} chars ({len(prompt)} chars), truncating source_text"
-            )
-            # Recalculate with truncated source_text
-            # Estimate non-source overhead and leave room for it
-            overhead = len(prompt) - len(source_text)
-            max_source_chars = MAX_PROMPT_CHARS - overhead - 1000  # 1K buffer
-            if max_source_chars > 0:
-                source_text = source_text[:max_source_chars]
-                prompt = THEME_EXTRACTION_PROMPT.format(
-                    product_context=self.product_context[:30000],
-                    url_context_hint=url_context_hint,
-                    research_context=research_context,
-                    known_themes=known_themes or "(No known themes yet - create new signatures as needed)",
-                    signature_quality_examples=signature_quality_examples,
-                    strict_mode_instructions=strict_mode_instructions,
-                    signature_instructions=signature_instructions,
-                    match_instruction=match_instruction,
-                    new_theme_reasoning=new_theme_reasoning,
-                    issue_type=conv.issue_type,
-                    sentiment=conv.sentiment,
-                    priority=conv.priority,
-                    churn_risk=conv.churn_risk,
-                    source_body=source_text,
-                )
-
-        response = self.client.chat.completions.create(
+    def _extraction_request(self, prompt: str) -> dict:
+        """Chat completion arguments for the theme extraction call."""
+        return dict(
             model=self.model,
             messages=[
                 {"role": "system", "content": "You are a product analyst. Respond with valid JSON only."},
@@ -1065,6 +1490,21 @@ The user was on a page related to **{url_matched_product_area}** when they start
             response_format={"type": "json_object"},
         )
 
+    def _interpret_extraction(
+        self,
+        conv: Conversation,
+        response,
+        source_text: str,
+        auto_add_to_vocabulary: bool,
+    ) -> Tuple[dict, dict]:
+        """
+        Parse the extraction response and apply vocabulary matching.
+
+        Returns (raw result, fields) where fields holds proposed_signature,
+        product_area, component, user_intent, symptoms, matched_existing
+        and match_reasoning.
+        """
+        self._record_usage("theme_extraction", response)
         result = json.loads(response.choices[0].message.content)
 
         proposed_signature = result.get("issue_signature", "unknown_issue")
@@ -1113,35 +1553,31 @@ The user was on a page related to **{url_matched_product_area}** when they start
                     )
                     logger.info(f"Auto-added to vocabulary: {proposed_signature}")
 
-        # Phase 2: Canonicalize signature
-        # - If vocabulary matched an existing theme, use as-is (already canonical)
-        # - If LLM created a new signature, canonicalize against existing signatures
-        #   to prevent duplicates like analytics_stats_accuracy vs analytics_performance_accuracy
-        #
-        # Issue #152: Serialize canonicalization to prevent race condition where
-        # concurrent extractions create near-duplicate signatures. The lock ensures
-        # thread B sees thread A's signature before deciding to create a new one.
-        with self._session_lock:
-            if self.use_vocabulary and matched_existing:
-                # Vocabulary already handled matching - use as-is
-                final_signature = proposed_signature
-            elif canonicalize:
-                # Canonicalize new signatures against existing ones in theme_aggregates
-                # This runs for both vocabulary mode (new signatures) and non-vocabulary mode
-                final_signature = self.canonicalize_signature(
-                    proposed_signature=proposed_signature,
-                    product_area=product_area,
-                    component=component,
-                    user_intent=user_intent,
-                    symptoms=symptoms,
-                    use_llm=not use_embedding,
-                )
-            else:
-                final_signature = proposed_signature
+        fields = {
+            "proposed_signature": proposed_signature,
+            "product_area": product_area,
+            "component": component,
+            "user_intent": user_intent,
+            "symptoms": symptoms,
+            "matched_existing": matched_existing,
+            "match_reasoning": match_reasoning,
+        }
+        return result, fields
 
-            # Add to session cache for batch canonicalization
-            # This allows subsequent extractions to canonicalize against this signature
-            self.add_session_signature(final_signature, product_area, component)
+    def _build_theme(
+        self,
+        conv: Conversation,
+        result: dict,
+        fields: dict,
+        final_signature: str,
+    ) -> Theme:
+        """Validate the Smart Digest and resolution fields and assemble the Theme."""
+        product_area = fields["product_area"]
+        component = fields["component"]
+        user_intent = fields["user_intent"]
+        symptoms = fields["symptoms"]
+        matched_existing = fields["matched_existing"]
+        match_reasoning = fields["match_reasoning"]
 
         # Extract Smart Digest fields (Issue #144)
         # These are populated when full_conversation is used and LLM returns them
@@ -1230,45 +1666,6 @@ The user was on a page related to **{url_matched_product_area}** when they start
             resolution_category=resolution_category,
         )
 
-    async def extract_async(
-        self,
-        conv: Conversation,
-        canonicalize: bool = True,
-        use_embedding: bool = False,
-        auto_add_to_vocabulary: bool = False,
-        strict_mode: bool = False,
-        customer_digest: Optional[str] = None,
-        full_conversation: Optional[str] = None,
-        use_full_conversation: bool = True,
-    ) -> Theme:
-        """
-        Async version of extract() for parallel processing (Issue #148).
-
-        Runs the sync extract() method in a thread pool to enable concurrent
-        theme extraction without blocking the event loop.
-
-        Same parameters and behavior as extract().
-
-        Note: This uses asyncio.to_thread rather than native async OpenAI calls
-        to minimize code duplication and risk. The sync extract() method is
-        well-tested; wrapping it preserves that reliability while enabling
-        parallelism through semaphore-controlled concurrency.
-        """
-        import asyncio
-
-        # Run sync extract in thread pool
-        return await asyncio.to_thread(
-            self.extract,
-            conv,
-            canonicalize=canonicalize,
-            use_embedding=use_embedding,
-            auto_add_to_vocabulary=auto_add_to_vocabulary,
-            strict_mode=strict_mode,
-            customer_digest=customer_digest,
-            full_conversation=full_conversation,
-            use_full_conversation=use_full_conversation,
-        )
-
     def extract_batch(
         self,
         conversations: list[Conversation],
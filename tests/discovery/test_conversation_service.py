@@ -8,8 +8,10 @@ Uses InMemoryTransport and InMemoryStorage to isolate from real backends.
 """
 
 import json
+import os
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
+from unittest.mock import patch
 from uuid import UUID, uuid4
 
 import pytest
@@ -37,7 +39,8 @@ from src.discovery.services.state_machine import (
     DiscoveryStateMachine,
     InvalidTransitionError,
 )
-from src.discovery.services.transport import InMemoryTransport
+from src.discovery.services import transport as transport_module
+from src.discovery.services.transport import AgenterminalTransport, InMemoryTransport
 
 
 # ============================================================================
@@ -773,6 +776,90 @@ class TestTransportIsolation:
         assert turns[0]["id"] == turn_id
 
 
+class TestAgenterminalTransport:
+    """NDJSON transport keeps an index and parses only appended lines."""
+
+    @pytest.fixture
+    def agenterminal(self, tmp_path):
+        transport = AgenterminalTransport(conversations_dir=str(tmp_path))
+        transport.create_conversation("ABC1234")
+        return transport
+
+    def _append(self, transport, *lines):
+        with open(transport._file_path("ABC1234"), "a") as f:
+            f.write("".join(lines))
+
+    def test_since_id_reads_only_later_turns(self, agenterminal):
+        ids = [agenterminal.post_turn("ABC1234", "agent", f"turn {i}") for i in range(5)]
+
+        assert [t["text"] for t in agenterminal.read_turns("ABC1234")] == [
+            f"turn {i}" for i in range(5)
+        ]
+        assert [t["id"] for t in agenterminal.read_turns("ABC1234", since_id=ids[2])] == ids[3:]
+        assert agenterminal.read_turns("ABC1234", since_id=ids[4]) == []
+        # Unknown since_id returns everything, as before
+        assert len(agenterminal.read_turns("ABC1234", since_id="missing")) == 5
+
+    def test_parses_only_appended_lines(self, agenterminal):
+        agenterminal.post_turn("ABC1234", "agent", "first")
+        agenterminal.read_turns("ABC1234")
+
+        agenterminal.post_turn("ABC1234", "agent", "second")
+        with patch(
+            "src.discovery.services.transport._parse_line",
+            wraps=transport_module._parse_line,
+        ) as parse:
+            turns = agenterminal.read_turns("ABC1234")
+
+        assert [t["text"] for t in turns] == ["first", "second"]
+        parsed = [call.args[0] for call in parse.call_args_list if call.args[0].strip()]
+        assert len(parsed) == 1 and b"second" in parsed[0]
+
+    def test_partial_and_invalid_lines(self, agenterminal):
+        self._append(
+            agenterminal,
+            json.dumps({"id": "a", "text": "one"}) + "\n",
+            "not json\n",
+            json.dumps({"id": "b", "text": "two"}),  # writer mid-append, no newline
+        )
+        assert [t["id"] for t in agenterminal.read_turns("ABC1234")] == ["a", "b"]
+        assert agenterminal.read_turns("ABC1234", since_id="b") == []
+
+        self._append(agenterminal, "\n" + json.dumps({"id": "c", "text": "three"}) + "\n")
+        assert [t["id"] for t in agenterminal.read_turns("ABC1234")] == ["a", "b", "c"]
+        assert [t["id"] for t in agenterminal.read_turns("ABC1234", since_id="a")] == ["b", "c"]
+
+    def test_rebuilds_after_external_rewrite(self, agenterminal):
+        path = agenterminal._file_path("ABC1234")
+        agenterminal.post_turn("ABC1234", "agent", "original one")
+        agenterminal.post_turn("ABC1234", "agent", "original two")
+        agenterminal.read_turns("ABC1234")
+
+        # Same-size rewrite in place (e.g. the UI editing a turn)
+        with open(path, "r+") as f:
+            content = f.read()
+            f.seek(0)
+            f.write(content.replace("original two", "rewritten 2!"))
+        assert [t["text"] for t in agenterminal.read_turns("ABC1234")][-1] == "rewritten 2!"
+
+        # Truncated and replaced with fewer turns
+        with open(path, "w") as f:
+            f.write(json.dumps({"id": "x", "text": "fresh"}) + "\n")
+        assert [t["text"] for t in agenterminal.read_turns("ABC1234")] == ["fresh"]
+
+        # Replaced by a new file (atomic rename)
+        tmp = path + ".tmp"
+        with open(tmp, "w") as f:
+            f.write(json.dumps({"id": "y", "text": "renamed"}) + "\n")
+        os.replace(tmp, path)
+        assert [t["text"] for t in agenterminal.read_turns("ABC1234")] == ["renamed"]
+
+    def test_returned_turns_are_copies(self, agenterminal):
+        agenterminal.post_turn("ABC1234", "agent", "hello")
+        agenterminal.read_turns("ABC1234")[0]["text"] = "mutated"
+        assert agenterminal.read_turns("ABC1234")[0]["text"] == "hello"
+
+
 # ============================================================================
 # Artifact persistence (Issue #256)
 # ============================================================================
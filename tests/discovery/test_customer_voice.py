@@ -8,6 +8,8 @@ Uses mock OpenAI client + mock ConversationReader.
 """
 
 import json
+import threading
+import time
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
@@ -21,6 +23,7 @@ from src.discovery.agents.customer_voice import (
     ExplorerConfig,
     _split_messages,
 )
+from src.discovery.agents.prompts import SYNTHESIS_SYSTEM
 from src.discovery.models.enums import ConfidenceLevel
 from src.discovery.agents.data_access import RawConversation
 
@@ -217,7 +220,7 @@ class TestErrorHandling:
         explorer = CustomerVoiceExplorer(
             reader=reader,
             openai_client=mock_client,
-            config=ExplorerConfig(batch_size=3),
+            config=ExplorerConfig(batch_size=3, batch_concurrency=1),
         )
         result = explorer.explore()
 
@@ -270,6 +273,113 @@ class TestErrorHandling:
         assert len(result.batch_errors) == 1
 
 
+# ============================================================================
+# Concurrent batch analysis
+# ============================================================================
+
+
+def _batch_routing_client(delays=None, barrier=None):
+    """Mock client answering each batch with a finding named after its first conversation."""
+    mock_client = MagicMock()
+
+    def create(model, messages, **kwargs):
+        user = messages[1]["content"]
+        if messages[0]["content"] == SYNTHESIS_SYSTEM:
+            return _make_synthesis_response()
+        first_id = user.split("[", 1)[1].split("]", 1)[0]
+        if barrier is not None:
+            barrier.wait()
+        time.sleep((delays or {}).get(first_id, 0))
+        return _make_batch_response(findings=[{
+            "pattern_name": f"pattern_{first_id}",
+            "description": "d",
+            "evidence_conversation_ids": [first_id],
+            "confidence": "medium",
+        }])
+
+    mock_client.chat.completions.create.side_effect = create
+    return mock_client
+
+
+class TestConcurrentBatches:
+    def test_batches_run_concurrently_and_reassemble_in_order(self):
+        convos = [_make_conversation(conversation_id=f"conv_{i:03d}") for i in range(6)]
+        reader = MockReader(conversations=convos, count=6)
+        # All three batches must be in flight together to pass the barrier;
+        # batch 0 then finishes last.
+        mock_client = _batch_routing_client(
+            delays={"conv_000": 0.2}, barrier=threading.Barrier(3, timeout=5)
+        )
+
+        explorer = CustomerVoiceExplorer(
+            reader=reader,
+            openai_client=mock_client,
+            config=ExplorerConfig(batch_size=2, batch_concurrency=3),
+        )
+        with patch.object(
+            explorer, "_synthesize", wraps=explorer._synthesize
+        ) as synth:
+            result = explorer.explore()
+
+        batch_findings = synth.call_args.args[0]
+        assert [b[0]["pattern_name"] for b in batch_findings] == [
+            "pattern_conv_000", "pattern_conv_002", "pattern_conv_004",
+        ]
+        assert result.coverage["conversations_reviewed"] == 6
+        # 3 batches + synthesis, 150 tokens each
+        assert result.token_usage == {
+            "prompt_tokens": 400, "completion_tokens": 200, "total_tokens": 600,
+        }
+
+    def test_token_budget_stops_new_batches(self):
+        convos = [_make_conversation(conversation_id=f"conv_{i:03d}") for i in range(5)]
+        reader = MockReader(conversations=convos, count=5)
+        mock_client = _batch_routing_client()
+
+        explorer = CustomerVoiceExplorer(
+            reader=reader,
+            openai_client=mock_client,
+            config=ExplorerConfig(
+                batch_size=1, batch_concurrency=1, max_total_tokens=300
+            ),
+        )
+        result = explorer.explore()
+
+        # Two batches reach the budget; synthesis still runs over them
+        assert mock_client.chat.completions.create.call_count == 3
+        assert result.token_usage["total_tokens"] == 450
+        assert result.coverage["conversations_reviewed"] == 2
+        assert result.coverage["conversations_skipped"] == 3
+        assert len(result.batch_errors) == 3
+        assert all("token budget" in e for e in result.batch_errors)
+        assert result.batch_errors[0].startswith("Batch 2:")
+
+    def test_concurrent_failures_keep_batch_indices(self):
+        convos = [_make_conversation(conversation_id=f"conv_{i:03d}") for i in range(8)]
+        reader = MockReader(conversations=convos, count=8)
+        mock_client = _batch_routing_client()
+        route = mock_client.chat.completions.create.side_effect
+
+        def create(model, messages, **kwargs):
+            if "[conv_005]" in messages[1]["content"]:
+                raise Exception("LLM timeout")
+            return route(model, messages, **kwargs)
+
+        mock_client.chat.completions.create.side_effect = create
+
+        explorer = CustomerVoiceExplorer(
+            reader=reader,
+            openai_client=mock_client,
+            config=ExplorerConfig(batch_size=1, batch_concurrency=4),
+        )
+        result = explorer.explore()
+
+        assert result.batch_errors == ["Batch 5: LLM timeout"]
+        assert result.coverage["conversations_reviewed"] == 7
+        assert result.coverage["conversations_skipped"] == 1
+        assert result.token_usage["total_tokens"] == 8 * 150
+
+
 # ============================================================================
 # Coverage invariant
 # ============================================================================
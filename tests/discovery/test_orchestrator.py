@@ -6,6 +6,7 @@ handles errors gracefully, and returns accurate run status.
 Uses InMemoryStorage + InMemoryTransport with mocked agent methods.
 """
 
+import threading
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 from unittest.mock import MagicMock, patch
@@ -15,6 +16,7 @@ import pytest
 
 from src.discovery.agents.base import ExplorerResult
 from src.discovery.models.enums import (
+    AgentStatus,
     BuildExperimentDecision,
     ConfidenceLevel,
     FeasibilityAssessment,
@@ -164,6 +166,15 @@ def _mock_ranking_result():
 # ============================================================================
 
 
+@pytest.fixture(autouse=True)
+def pooled_connection():
+    """Stand-in for the pooled connection the customer voice explorer reads from."""
+    conn = MagicMock(name="pooled_connection")
+    with patch("src.discovery.orchestrator.get_connection") as mock_get_connection:
+        mock_get_connection.return_value.__enter__.return_value = conn
+        yield conn
+
+
 @pytest.mark.slow
 class TestDiscoveryOrchestrator:
     """Tests for the orchestrator wiring all stages together."""
@@ -380,16 +391,14 @@ class TestDiscoveryOrchestrator:
         mock_analytics_cls,
         mock_customer_cls,
     ):
-        """When an explorer raises, run is marked FAILED with error details."""
+        """When every explorer raises, run is marked FAILED with error details."""
         orchestrator, storage, _ = self._create_orchestrator()
 
-        # First explorer succeeds, second raises
-        mock_customer_cls.return_value.explore.return_value = _mock_explorer_result(
-            SourceType.INTERCOM, "pain", "conv-1"
-        )
         mock_analytics_cls.return_value.explore.side_effect = RuntimeError(
             "PostHog API timeout"
         )
+        for mock_cls in (mock_customer_cls, mock_codebase_cls, mock_research_cls):
+            mock_cls.return_value.explore.side_effect = RuntimeError("unavailable")
 
         run = orchestrator.run()
 
@@ -398,6 +407,120 @@ class TestDiscoveryOrchestrator:
         assert run.errors[0]["stage"] == "exploration"
         assert "PostHog API timeout" in run.errors[0]["message"]
 
+    @patch("src.discovery.orchestrator.CustomerVoiceExplorer")
+    @patch("src.discovery.orchestrator.AnalyticsExplorer")
+    @patch("src.discovery.orchestrator.CodebaseExplorer")
+    @patch("src.discovery.orchestrator.ResearchExplorer")
+    @patch("src.discovery.orchestrator.OpportunityPM")
+    @patch("src.discovery.orchestrator.ConversationReader")
+    @patch("src.discovery.orchestrator.CodebaseReader")
+    @patch("src.discovery.orchestrator.ResearchReader")
+    @patch("src.discovery.orchestrator.PostHogReader")
+    def test_explorers_run_concurrently_with_partial_failure(
+        self,
+        mock_posthog_reader_cls,
+        mock_research_reader_cls,
+        mock_codebase_reader_cls,
+        mock_conversation_reader_cls,
+        mock_opp_pm_cls,
+        mock_research_cls,
+        mock_codebase_cls,
+        mock_analytics_cls,
+        mock_customer_cls,
+    ):
+        """Explorers overlap; failed and timed-out ones are left out of the merge."""
+        orchestrator, storage, _ = self._create_orchestrator()
+
+        all_started = threading.Barrier(3, timeout=5)
+        release_hung = threading.Event()
+
+        def succeeding(source, pattern, sid):
+            def explore():
+                all_started.wait()  # Only passes if the explorers run concurrently
+                return _mock_explorer_result(source, pattern, sid)
+            return explore
+
+        for mock_cls, source, pattern, sid in [
+            (mock_customer_cls, SourceType.INTERCOM, "pain", "conv-1"),
+            (mock_codebase_cls, SourceType.CODEBASE, "debt", "file-1"),
+        ]:
+            mock_cls.return_value.explore.side_effect = succeeding(source, pattern, sid)
+            mock_cls.return_value.build_checkpoint_artifacts.return_value = {
+                "schema_version": 1,
+                "agent_name": "mock_explorer",
+                "findings": [_explorer_finding(source, pattern, sid)],
+                "coverage": {
+                    "time_window_days": 14,
+                    "conversations_available": 10,
+                    "conversations_reviewed": 10,
+                    "conversations_skipped": 0,
+                    "model": "gpt-4o-mini",
+                    "findings_count": 1,
+                },
+            }
+
+        def fails():
+            all_started.wait()
+            raise RuntimeError("PostHog API timeout")
+
+        mock_analytics_cls.return_value.explore.side_effect = fails
+        mock_research_cls.return_value.explore.side_effect = lambda: release_hung.wait(5)
+
+        # Stop the run right after Stage 0
+        mock_opp_pm_cls.return_value.frame_opportunities.side_effect = ValueError("stop")
+
+        try:
+            run = orchestrator.run(config=RunConfig(explorer_timeout_seconds=0.5))
+        finally:
+            release_hung.set()
+
+        assert run.errors[0]["stage"] == "opportunity_framing"
+
+        stages = storage.get_stage_executions_for_run(run.id)
+        exploration = [s for s in stages if s.stage == StageType.EXPLORATION][0]
+        assert exploration.participating_agents == ["customer_voice", "codebase"]
+        assert len(exploration.artifacts["findings"]) == 2
+
+        explorer_invocations = {
+            inv.agent_name: inv for inv in storage.agent_invocations
+            if inv.agent_name in ("customer_voice", "analytics", "codebase", "research")
+        }
+        assert explorer_invocations["customer_voice"].status == AgentStatus.COMPLETED
+        assert explorer_invocations["analytics"].status == AgentStatus.FAILED
+        assert "PostHog API timeout" in explorer_invocations["analytics"].error
+        assert explorer_invocations["research"].status == AgentStatus.FAILED
+        assert "did not finish" in explorer_invocations["research"].error
+
+    @patch("src.discovery.orchestrator.CustomerVoiceExplorer")
+    @patch("src.discovery.orchestrator.AnalyticsExplorer")
+    @patch("src.discovery.orchestrator.CodebaseExplorer")
+    @patch("src.discovery.orchestrator.ResearchExplorer")
+    @patch("src.discovery.orchestrator.ConversationReader")
+    @patch("src.discovery.orchestrator.CodebaseReader")
+    @patch("src.discovery.orchestrator.ResearchReader")
+    @patch("src.discovery.orchestrator.PostHogReader")
+    def test_conversation_reader_uses_own_pooled_connection(
+        self,
+        mock_posthog_reader_cls,
+        mock_research_reader_cls,
+        mock_codebase_reader_cls,
+        mock_conversation_reader_cls,
+        mock_research_cls,
+        mock_codebase_cls,
+        mock_analytics_cls,
+        mock_customer_cls,
+        pooled_connection,
+    ):
+        """Explorer threads never share the orchestrator's connection."""
+        orchestrator, _, _ = self._create_orchestrator()
+        for mock_cls in (mock_customer_cls, mock_analytics_cls, mock_codebase_cls, mock_research_cls):
+            mock_cls.return_value.explore.side_effect = RuntimeError("stop")
+
+        orchestrator.run()
+
+        mock_conversation_reader_cls.assert_called_once_with(pooled_connection)
+        assert mock_conversation_reader_cls.call_args.args[0] is not orchestrator.db
+
     @patch("src.discovery.orchestrator.CustomerVoiceExplorer")
     @patch("src.discovery.orchestrator.AnalyticsExplorer")
     @patch("src.discovery.orchestrator.CodebaseExplorer")
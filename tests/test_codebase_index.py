@@ -0,0 +1,144 @@
+"""
+Tests for the persistent keyword index behind CodebaseContextProvider keyword search.
+"""
+
+import subprocess
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from src.story_tracking.services.codebase_context_provider import CodebaseContextProvider
+from src.story_tracking.services.codebase_index import (
+    CodebaseIndex,
+    is_indexable_keyword,
+    tokenize,
+)
+
+
+def _git(repo: Path, *args: str) -> str:
+    result = subprocess.run(
+        ["git", "-C", str(repo), *args], capture_output=True, text=True, check=True
+    )
+    return result.stdout.strip()
+
+
+def _commit(repo: Path, message: str) -> str:
+    _git(repo, "add", "-A")
+    _git(repo, "-c", "user.name=t", "-c", "user.email=t@t", "commit", "-qm", message)
+    return _git(repo, "rev-parse", "HEAD")
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """Small git repo inside a patched REPO_BASE_PATH."""
+    repos = tmp_path / "repos"
+    repo = repos / "aero"
+    (repo / "src").mkdir(parents=True)
+    (repo / "src" / "scheduler.py").write_text(
+        "class PinScheduler:\n"
+        "    # schedule pins\n"
+        "    def schedule(self):\n"
+        "        return 'Schedule'\n"
+    )
+    (repo / "src" / "auth.py").write_text("def login():\n    token = refresh_token()\n")
+    _git(repo, "init", "-q")
+    _commit(repo, "initial")
+
+    with patch("src.story_tracking.services.codebase_security.REPO_BASE_PATH", repos):
+        yield repo
+
+
+class TestTokenize:
+    def test_counts_and_first_lines(self):
+        postings = tokenize("Foo bar\nfoo_baz\n\nFOO")
+
+        assert postings["foo"] == (2, 1)
+        assert postings["foo_baz"] == (1, 2)
+        assert postings["bar"] == (1, 1)
+
+    def test_indexable_keywords_are_single_tokens(self):
+        assert is_indexable_keyword("scheduler")
+        assert is_indexable_keyword("csv_import")
+        assert not is_indexable_keyword("pin scheduler")
+        assert not is_indexable_keyword("auth-service")
+
+
+class TestCodebaseIndex:
+    def test_full_build_then_lookup(self, repo, tmp_path):
+        index = CodebaseIndex(repo, tmp_path / "index" / "aero.sqlite")
+
+        stats = index.refresh()
+
+        assert stats["mode"] == "full"
+        assert stats["files"] == 2
+        assert stats["size_bytes"] > 0
+        # "schedule" occurs inside PinScheduler, schedule, schedule and 'Schedule'
+        assert index.lookup("Schedule", ["src/scheduler.py", "src/auth.py"]) == {
+            "src/scheduler.py": (4, 1),
+        }
+        assert index.lookup("token", ["src/auth.py"]) == {"src/auth.py": (2, 2)}
+        assert index.lookup("token", ["src/scheduler.py"]) == {}
+
+    def test_refresh_is_incremental_between_commits(self, repo, tmp_path):
+        index = CodebaseIndex(repo, tmp_path / "index" / "aero.sqlite")
+        index.refresh()
+
+        (repo / "src" / "auth.py").unlink()
+        (repo / "src" / "boards.py").write_text("\n\nboard_token = 1\n")
+        head = _commit(repo, "change")
+
+        stats = index.refresh()
+
+        assert stats["mode"] == "incremental"
+        assert stats["commit"] == head
+        assert index.indexed_paths(["src/auth.py", "src/boards.py"]) == {"src/boards.py"}
+        assert index.lookup("token", ["src/auth.py", "src/boards.py"]) == {"src/boards.py": (1, 3)}
+        assert index.refresh()["mode"] == "unchanged"
+
+    def test_persists_across_instances(self, repo, tmp_path):
+        path = tmp_path / "index" / "aero.sqlite"
+        CodebaseIndex(repo, path).refresh()
+
+        assert CodebaseIndex(repo, path).refresh()["mode"] == "unchanged"
+
+
+class TestProviderUsesIndex:
+    """Keyword search results are identical with and without the index."""
+
+    KEYWORDS = ["scheduler", "token", "schedule pins", "login"]
+
+    def _search(self, provider, repo):
+        files = [str(p) for p in sorted((repo / "src").glob("*.py"))]
+        return provider._search_for_keywords(repo, files, self.KEYWORDS)
+
+    def test_index_matches_file_scan(self, repo, tmp_path):
+        scan = CodebaseContextProvider(repos_path=repo.parent)
+        indexed = CodebaseContextProvider(repos_path=repo.parent, index_dir=tmp_path / "index")
+        indexed._refresh_index(repo)
+
+        with patch("builtins.open", wraps=open) as mock_open:
+            indexed_result = self._search(indexed, repo)
+            # Only the file containing both "schedule" and "pins" is read
+            opened = [Path(c.args[0]).name for c in mock_open.call_args_list]
+        assert opened == ["scheduler.py"]
+
+        assert indexed_result == self._search(scan, repo)
+        assert indexed._get_index(repo).stats()["queries"] == 5
+
+    def test_unindexed_files_fall_back_to_disk(self, repo, tmp_path):
+        provider = CodebaseContextProvider(repos_path=repo.parent, index_dir=tmp_path / "index")
+        provider._refresh_index(repo)
+        (repo / "src" / "untracked.py").write_text("token token token token\n")
+
+        references, _ = self._search(provider, repo)
+
+        assert references[0].path == "src/untracked.py"
+        assert references[0].relevance.startswith("4 matches")
+
+    def test_index_disabled_by_default(self, repo, monkeypatch):
+        monkeypatch.delenv("CODEBASE_INDEX_DIR", raising=False)
+        provider = CodebaseContextProvider(repos_path=repo.parent)
+
+        assert provider._refresh_index(repo) == 0
+        assert provider._get_index(repo) is None
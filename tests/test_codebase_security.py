@@ -340,6 +340,14 @@ class TestGitCommandValidation:
         assert validate_git_command_args(["git", "checkout", "main"]) is False
         assert validate_git_command_args(["git", "rm", "-rf", "."]) is False
 
+    def test_allow_index_commands(self):
+        """Should allow ls-files and diffs between full commit SHAs (keyword index)."""
+        old, new = "a" * 40, "0123456789abcdef0123456789abcdef01234567"
+        assert validate_git_command_args(["git", "ls-files", "-z"]) is True
+        assert validate_git_command_args(["git", "diff", "--name-only", old, new]) is True
+        assert validate_git_command_args(["git", "diff", "HEAD~1"]) is False
+        assert validate_git_command_args(["git", "diff", "a" * 39]) is False
+
     def test_allow_numeric_arguments(self):
         """Should allow numeric arguments for flags like --depth."""
         assert validate_git_command_args(["git", "fetch", "--depth", "5"]) is True
@@ -0,0 +1,112 @@
+"""
+Tests for ConfidenceScorer embedding reuse.
+
+Stored conversation embeddings replace excerpt embedding calls, and every
+remaining text in a group is embedded with one batched API call.
+"""
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+
+pytestmark = pytest.mark.medium
+
+from src.confidence_scorer import ConfidenceScorer
+
+
+def _vector(seed: int) -> list:
+    return np.random.default_rng(seed).normal(size=8).tolist()
+
+
+def _embedding_response(texts):
+    response = MagicMock()
+    response.data = [
+        MagicMock(index=i, embedding=_vector(abs(hash(text)) % 10_000))
+        for i, text in enumerate(texts)
+    ]
+    return response
+
+
+@pytest.fixture
+def scorer():
+    with patch("src.confidence_scorer.OpenAI"):
+        scorer = ConfidenceScorer()
+    scorer.client.embeddings.create.side_effect = (
+        lambda model, input: _embedding_response(input)
+    )
+    return scorer
+
+
+@pytest.fixture
+def conversations():
+    return [
+        {
+            "id": f"conv_{i}",
+            "excerpt": f"My pins were posted twice ({i})",
+            "user_intent": f"Stop duplicate pins {i}",
+            "symptoms": ["duplicate pins"],
+            "product_area": "publishing",
+            "component": "pinterest",
+        }
+        for i in range(4)
+    ]
+
+
+class TestStoredEmbeddings:
+    """Embeddings come from conversation_embeddings where available."""
+
+    def test_stored_vectors_skip_excerpt_embedding(self, scorer, conversations):
+        stored = {"conv_0": np.array(_vector(1), dtype=np.float32),
+                  "conv_1": np.array(_vector(2), dtype=np.float32)}
+
+        with patch(
+            "src.db.embedding_storage.load_latest_embeddings", return_value=stored
+        ) as mock_load:
+            scorer.score_groups({"sig": conversations})
+
+        mock_load.assert_called_once_with(
+            ["conv_0", "conv_1", "conv_2", "conv_3"], "text-embedding-3-small"
+        )
+        assert scorer.client.embeddings.create.call_count == 1
+        embedded = scorer.client.embeddings.create.call_args.kwargs["input"]
+        assert conversations[0]["excerpt"] not in embedded
+        assert conversations[2]["excerpt"] in embedded
+        assert all(conv["user_intent"] in embedded for conv in conversations)
+
+    def test_storage_failure_falls_back_to_single_batch(self, scorer, conversations):
+        with patch(
+            "src.db.embedding_storage.load_latest_embeddings",
+            side_effect=Exception("connection refused"),
+        ):
+            scorer.score_groups({"sig": conversations})
+            scorer.score_groups({"sig": conversations})
+
+        assert scorer.use_stored_embeddings is False
+        # Second scoring is served entirely from the cache
+        assert scorer.client.embeddings.create.call_count == 1
+        assert len(scorer.client.embeddings.create.call_args.kwargs["input"]) == 8
+
+
+class TestSimilarity:
+    """Vectorized similarity matches the pairwise definition."""
+
+    def test_mean_pairwise_cosine(self, scorer, conversations):
+        vectors = [np.array(_vector(i), dtype=np.float32) for i in range(4)]
+        stored = {conv["id"]: vec for conv, vec in zip(conversations, vectors)}
+
+        expected = np.mean([
+            np.dot(vectors[i], vectors[j]) / (np.linalg.norm(vectors[i]) * np.linalg.norm(vectors[j]))
+            for i in range(4) for j in range(i + 1, 4)
+        ])
+
+        assert scorer._calc_embedding_similarity(conversations, stored) == pytest.approx(expected, rel=1e-5)
+
+    def test_embedding_cache_is_bounded(self, scorer):
+        scorer.embedding_cache_size = 2
+        scorer.use_stored_embeddings = False
+
+        for text in ["a", "b", "c"]:
+            scorer._get_embedding(text)
+
+        assert list(scorer._embedding_cache) == ["b", "c"]
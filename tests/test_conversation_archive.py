@@ -0,0 +1,169 @@
+"""
+Tests for the local raw-conversation archive used by IntercomClient detail fetches.
+"""
+
+import sqlite3
+import sys
+from contextlib import asynccontextmanager
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.conversation_archive import ConversationArchive, get_conversation_archive
+from src.intercom_client import IntercomClient
+
+
+def make_conversation(updated_at, body="Broken pins"):
+    return {
+        "id": "conv_1",
+        "updated_at": updated_at,
+        "conversation_parts": {"conversation_parts": [{"body": body}]},
+    }
+
+
+class TestConversationArchive:
+    """Compressed storage keyed by conversation id and updated_at."""
+
+    def test_round_trip_and_stats(self, tmp_path):
+        archive = ConversationArchive(str(tmp_path / "archive.db"))
+
+        assert archive.get("conv_1", 100) is None
+        assert archive.put(make_conversation(100))
+        assert archive.get("conv_1", 100) == make_conversation(100)
+
+        stats = archive.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+
+    def test_changed_conversation_is_a_miss(self, tmp_path):
+        archive = ConversationArchive(str(tmp_path / "archive.db"))
+        archive.put(make_conversation(100))
+
+        assert archive.get("conv_1", 200) is None
+
+    def test_newer_version_replaces_older(self, tmp_path):
+        archive = ConversationArchive(str(tmp_path / "archive.db"))
+        archive.put(make_conversation(200, body="new"))
+        archive.put(make_conversation(100, body="old"))  # Late write of a stale copy
+
+        assert archive.get("conv_1", 200)["conversation_parts"]["conversation_parts"][0]["body"] == "new"
+        assert len(archive) == 1
+
+    def test_conversation_without_updated_at_not_archived(self, tmp_path):
+        archive = ConversationArchive(str(tmp_path / "archive.db"))
+
+        assert not archive.put({"id": "conv_1"})
+        assert len(archive) == 0
+
+    def test_persists_across_instances(self, tmp_path):
+        path = str(tmp_path / "archive.db")
+        ConversationArchive(path).put(make_conversation(100))
+
+        assert ConversationArchive(path).get("conv_1", 100) is not None
+
+    def test_corrupt_body_is_a_miss(self, tmp_path):
+        archive = ConversationArchive(str(tmp_path / "archive.db"))
+        archive.put(make_conversation(100))
+        archive._conn.execute("UPDATE raw_conversations SET body = ?", (b"not zlib",))
+
+        assert archive.get("conv_1", 100) is None
+        assert archive.stats()["misses"] == 1
+
+    def test_sqlite_errors_are_a_miss_and_a_skipped_write(self, tmp_path):
+        archive = ConversationArchive(str(tmp_path / "archive.db"))
+        archive._conn = MagicMock()
+        archive._conn.execute.side_effect = sqlite3.OperationalError("database is locked")
+
+        assert archive.get("conv_1", 100) is None
+        assert archive.put(make_conversation(100)) is False
+
+
+class TestGetConversationArchive:
+    """Opt-in configuration from the environment."""
+
+    def test_disabled_by_default(self, monkeypatch):
+        monkeypatch.delenv("INTERCOM_ARCHIVE_PATH", raising=False)
+        assert get_conversation_archive() is None
+
+    def test_enabled_by_path(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("INTERCOM_ARCHIVE_PATH", str(tmp_path / "archive.db"))
+
+        archive = get_conversation_archive()
+
+        assert archive is not None
+        assert get_conversation_archive() is archive
+
+
+class TestIntercomClientUsesArchive:
+    """get_conversation_async only calls the API for missing or changed conversations."""
+
+    @pytest.fixture
+    def client(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("INTERCOM_ACCESS_TOKEN", "test_token")
+        monkeypatch.setenv("INTERCOM_ARCHIVE_PATH", str(tmp_path / "archive.db"))
+        return IntercomClient()
+
+    @staticmethod
+    def _session(conversation):
+        calls = []
+        response = AsyncMock()
+        response.status = 200
+        response.json = AsyncMock(return_value=conversation)
+
+        @asynccontextmanager
+        async def mock_get(url, *args, **kwargs):
+            calls.append(url)
+            yield response
+
+        session = MagicMock()
+        session.get = mock_get
+        return session, calls
+
+    @pytest.mark.asyncio
+    async def test_refetch_served_from_archive(self, client):
+        session, calls = self._session(make_conversation(100))
+
+        first = await client.get_conversation_async(session, "conv_1", updated_at=100)
+        second = await client.get_conversation_async(session, "conv_1", updated_at=100)
+
+        assert len(calls) == 1
+        assert first == second
+
+    @pytest.mark.asyncio
+    async def test_changed_conversation_is_refetched(self, client):
+        session, calls = self._session(make_conversation(100))
+        await client.get_conversation_async(session, "conv_1", updated_at=100)
+
+        await client.get_conversation_async(session, "conv_1", updated_at=200)
+
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_without_updated_at_always_fetches(self, client):
+        session, calls = self._session(make_conversation(100))
+
+        await client.get_conversation_async(session, "conv_1")
+        await client.get_conversation_async(session, "conv_1")
+
+        assert len(calls) == 2
+
+    def test_sync_get_conversation_uses_archive(self, client):
+        with patch.object(client, "_get", return_value=make_conversation(100)) as mock_get:
+            client.get_conversation("conv_1", updated_at=100)
+            client.get_conversation("conv_1", updated_at=100)
+
+        mock_get.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_archive_failure_falls_back_to_api(self, client):
+        session, calls = self._session(make_conversation(100))
+        client.archive._conn = MagicMock()
+        client.archive._conn.execute.side_effect = sqlite3.OperationalError("disk I/O error")
+
+        conversation = await client.get_conversation_async(session, "conv_1", updated_at=100)
+
+        assert conversation == make_conversation(100)
+        assert len(calls) == 1
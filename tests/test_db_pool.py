@@ -0,0 +1,299 @@
+"""
+Database Connection Pool Tests
+
+Tests for the process-wide psycopg2 connection pool used by get_connection()
+and the FastAPI get_db dependency.
+Run with: pytest tests/test_db_pool.py -v
+"""
+
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import psycopg2.extensions
+import pytest
+
+from src.db import pool as pool_module
+from src.db.pool import ConnectionPool, PoolError, PoolTimeout
+
+
+class FakeConnection:
+    """Minimal stand-in for a psycopg2 connection."""
+
+    def __init__(self, fail_health_check=False):
+        self.closed = 0
+        self.autocommit = False
+        self.cursor_factory = psycopg2.extensions.cursor
+        self.rollbacks = 0
+        self.commits = 0
+        self.fail_health_check = fail_health_check
+        self.info = MagicMock()
+        self.info.transaction_status = psycopg2.extensions.TRANSACTION_STATUS_IDLE
+
+    def cursor(self):
+        cur = MagicMock()
+        if self.fail_health_check:
+            cur.__enter__.return_value.execute.side_effect = psycopg2.OperationalError("gone")
+        return cur
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        self.rollbacks += 1
+        self.info.transaction_status = psycopg2.extensions.TRANSACTION_STATUS_IDLE
+
+    def close(self):
+        self.closed = 1
+
+
+def make_pool(**kwargs):
+    created = []
+
+    def connect(dsn):
+        conn = FakeConnection()
+        created.append(conn)
+        return conn
+
+    defaults = dict(min_size=0, max_size=2, timeout=0.2, health_check_interval=60)
+    defaults.update(kwargs)
+    return ConnectionPool("postgresql://test", connect=connect, **defaults), created
+
+
+class TestCheckout:
+    """Tests for basic checkout/return behavior."""
+
+    def test_reuses_returned_connection(self):
+        pool, created = make_pool()
+
+        conn1 = pool.getconn()
+        pool.putconn(conn1)
+        conn2 = pool.getconn()
+
+        assert conn1 is conn2
+        assert len(created) == 1
+        stats = pool.stats()
+        assert stats.misses == 1
+        assert stats.hits == 1
+        assert stats.in_use == 1
+
+    def test_timeout_when_exhausted(self):
+        pool, _ = make_pool(max_size=1, timeout=0.05)
+        pool.getconn()
+
+        with pytest.raises(PoolTimeout):
+            pool.getconn()
+
+        assert pool.stats().timeouts == 1
+
+    def test_waiter_gets_released_connection(self):
+        pool, created = make_pool(max_size=1, timeout=2)
+        conn = pool.getconn()
+        got = []
+
+        def waiter():
+            got.append(pool.getconn())
+
+        t = threading.Thread(target=waiter)
+        t.start()
+        time.sleep(0.05)
+        pool.putconn(conn)
+        t.join(timeout=2)
+
+        assert got == [conn]
+        assert len(created) == 1
+        stats = pool.stats()
+        assert stats.waits == 1
+        assert stats.wait_time_ms > 0
+
+    def test_connect_failure_releases_slot(self):
+        pool = ConnectionPool(
+            "postgresql://test",
+            max_size=1,
+            timeout=0.05,
+            connect=MagicMock(side_effect=[psycopg2.OperationalError("down"), FakeConnection()]),
+        )
+
+        with pytest.raises(psycopg2.OperationalError):
+            pool.getconn()
+
+        assert pool.getconn() is not None
+
+    def test_closed_pool_rejects_checkout(self):
+        pool, _ = make_pool()
+        pool.close()
+
+        with pytest.raises(PoolError):
+            pool.getconn()
+
+
+class TestReturnReset:
+    """Tests for connection state reset on return."""
+
+    def test_open_transaction_rolled_back(self):
+        pool, _ = make_pool()
+        conn = pool.getconn()
+        conn.info.transaction_status = psycopg2.extensions.TRANSACTION_STATUS_INTRANS
+
+        pool.putconn(conn)
+
+        assert conn.rollbacks == 1
+        assert pool.stats().idle == 1
+
+    def test_cursor_factory_and_autocommit_reset(self):
+        pool, _ = make_pool()
+        conn = pool.getconn()
+        conn.cursor_factory = object
+        conn.autocommit = True
+
+        pool.putconn(conn)
+
+        assert conn.cursor_factory is psycopg2.extensions.cursor
+        assert conn.autocommit is False
+
+    def test_closed_connection_discarded(self):
+        pool, created = make_pool()
+        conn = pool.getconn()
+        conn.close()
+
+        pool.putconn(conn)
+
+        stats = pool.stats()
+        assert stats.idle == 0
+        assert stats.size == 0
+        assert stats.discarded == 1
+        assert pool.getconn() is not conn
+        assert len(created) == 2
+
+    def test_mock_connections_never_pooled(self):
+        """Non-psycopg2 objects (e.g. test mocks) are closed, not reused."""
+        pool = ConnectionPool("postgresql://test", connect=lambda dsn: MagicMock())
+        conn = pool.getconn()
+
+        pool.putconn(conn)
+
+        assert pool.stats().idle == 0
+
+
+class TestRecycling:
+    """Tests for lifetime recycling, health checks, and idle trimming."""
+
+    def test_max_lifetime_recycles_on_return(self):
+        pool, created = make_pool(max_lifetime=0.01)
+        conn = pool.getconn()
+        time.sleep(0.02)
+
+        pool.putconn(conn)
+
+        assert conn.closed
+        assert pool.stats().recycled == 1
+
+    def test_failed_health_check_reconnects(self):
+        pool, created = make_pool(health_check_interval=0)
+        conn = pool.getconn()
+        pool.putconn(conn)
+        conn.fail_health_check = True
+
+        new_conn = pool.getconn()
+
+        assert new_conn is not conn
+        assert conn.closed
+        stats = pool.stats()
+        assert stats.health_check_failures == 1
+        assert stats.size == 1
+
+    def test_idle_connections_trimmed_to_min_size(self):
+        pool, _ = make_pool(min_size=1, max_size=3, max_idle=0.01)
+        conns = [pool.getconn() for _ in range(3)]
+        for c in conns[:2]:
+            pool.putconn(c)
+        time.sleep(0.02)
+
+        pool.putconn(conns[2])
+
+        stats = pool.stats()
+        assert stats.size == 1
+        assert stats.trimmed == 2
+
+    def test_warm_opens_min_size(self):
+        pool, created = make_pool(min_size=2, max_size=4)
+
+        assert pool.warm() == 2
+        assert len(created) == 2
+        assert pool.stats().idle == 2
+
+
+class TestGetConnection:
+    """Tests for get_connection() as a drop-in context manager."""
+
+    @pytest.fixture
+    def fake_pool(self):
+        pool, created = make_pool()
+        with patch("src.db.connection.get_pool", return_value=pool):
+            with patch("src.db.connection.is_pool_enabled", return_value=True):
+                yield pool, created
+
+    def test_commits_and_returns_to_pool(self, fake_pool):
+        from src.db.connection import get_connection
+
+        pool, created = fake_pool
+        with get_connection() as conn:
+            pass
+
+        assert conn.commits == 1
+        assert pool.stats().idle == 1
+
+    def test_rolls_back_on_error(self, fake_pool):
+        from src.db.connection import get_connection
+
+        pool, created = fake_pool
+        with pytest.raises(ValueError):
+            with get_connection() as conn:
+                raise ValueError("boom")
+
+        assert conn.rollbacks == 1
+        assert conn.commits == 0
+        assert pool.stats().idle == 1
+
+    def test_cursor_factory_applied_then_reset(self, fake_pool):
+        from psycopg2.extras import RealDictCursor
+        from src.db.connection import get_connection
+
+        with get_connection(cursor_factory=RealDictCursor) as conn:
+            assert conn.cursor_factory is RealDictCursor
+
+        assert conn.cursor_factory is psycopg2.extensions.cursor
+
+    def test_pool_disabled_connects_per_call(self):
+        from src.db.connection import get_connection
+
+        fake = FakeConnection()
+        with patch("src.db.connection.is_pool_enabled", return_value=False):
+            with patch("src.db.connection.psycopg2.connect", return_value=fake):
+                with get_connection():
+                    pass
+
+        assert fake.commits == 1
+        assert fake.closed
+
+
+class TestProcessPool:
+    """Tests for the process-wide pool singleton."""
+
+    def test_env_configuration(self, monkeypatch):
+        monkeypatch.setenv("DB_POOL_MIN_SIZE", "2")
+        monkeypatch.setenv("DB_POOL_MAX_SIZE", "7")
+        monkeypatch.setenv("DB_POOL_MAX_LIFETIME", "60")
+        pool_module.close_pool()
+        try:
+            pool = pool_module.get_pool()
+            assert pool.min_size == 2
+            assert pool.max_size == 7
+            assert pool.max_lifetime == 60
+            assert pool_module.get_pool() is pool
+        finally:
+            pool_module.close_pool()
+
+    def test_stats_none_when_disabled(self, monkeypatch):
+        monkeypatch.setenv("DB_POOL_ENABLED", "false")
+        assert pool_module.get_pool_stats() is None
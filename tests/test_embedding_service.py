@@ -400,6 +400,136 @@ class TestAsyncConversationEmbeddings:
         assert "Embedding generation failed" in result.failed[0].error or "failed" in result.failed[0].error.lower()
 
 
+class TestEmbeddingCache:
+    """Test the content-addressed embedding cache shared across runs."""
+
+    @staticmethod
+    def _mock_client(dim_value=0.5):
+        """Async client that echoes one embedding per input text."""
+        async def create(model, input):
+            response = MagicMock()
+            response.data = [
+                MagicMock(index=i, embedding=[dim_value] * EMBEDDING_DIMENSIONS)
+                for i in range(len(input))
+            ]
+            return response
+
+        client = MagicMock()
+        client.embeddings.create = AsyncMock(side_effect=create)
+        return client
+
+    @pytest.mark.asyncio
+    async def test_cache_hits_skip_api_and_misses_are_stored(self):
+        """Cached texts are not re-embedded; new embeddings are written back."""
+        from src.services.embedding_service import content_hash
+
+        service = EmbeddingService(use_cache=True)
+        service._async_client = self._mock_client()
+        cached_vector = [0.1] * EMBEDDING_DIMENSIONS
+        conversations = [
+            {"id": "c1", "source_body": "seen before"},
+            {"id": "c2", "source_body": "brand new"},
+            {"id": "c3", "source_body": "  seen before  "},  # Same prepared text as c1
+        ]
+
+        with patch(
+            "src.db.embedding_storage.load_cached_embeddings",
+            return_value={content_hash("seen before"): cached_vector},
+        ) as mock_load, patch("src.db.embedding_storage.store_cached_embeddings") as mock_store:
+            result = await service.generate_conversation_embeddings_async(conversations)
+
+        assert result.cache_hits == 2
+        assert result.cache_misses == 1
+        assert result.total_success == 3
+        assert {r.conversation_id for r in result.successful} == {"c1", "c2", "c3"}
+        assert service._async_client.embeddings.create.call_args.kwargs["input"] == ["brand new"]
+
+        assert mock_load.call_args[0][1:] == ("text-embedding-3-small", EMBEDDING_DIMENSIONS)
+        stored = mock_store.call_args[0][0]
+        assert list(stored) == [content_hash("brand new")]
+
+    @pytest.mark.asyncio
+    async def test_all_hits_makes_no_api_call(self):
+        """A rerun over unchanged text pays for no embeddings."""
+        from src.services.embedding_service import content_hash
+
+        service = EmbeddingService(use_cache=True)
+        service._async_client = self._mock_client()
+
+        with patch(
+            "src.db.embedding_storage.load_cached_embeddings",
+            return_value={content_hash("Text"): [0.2] * EMBEDDING_DIMENSIONS},
+        ), patch("src.db.embedding_storage.store_cached_embeddings") as mock_store:
+            result = await service.generate_conversation_embeddings_async(
+                [{"id": "c1", "source_body": "Text"}]
+            )
+
+        assert result.cache_hits == 1
+        assert result.cache_misses == 0
+        assert result.total_success == 1
+        service._async_client.embeddings.create.assert_not_called()
+        mock_store.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_cache_lookup_failure_falls_back_to_api(self):
+        """A broken cache degrades to embedding everything."""
+        service = EmbeddingService(use_cache=True)
+        service._async_client = self._mock_client()
+
+        with patch(
+            "src.db.embedding_storage.load_cached_embeddings",
+            side_effect=Exception("relation does not exist"),
+        ), patch("src.db.embedding_storage.store_cached_embeddings", side_effect=Exception("down")):
+            result = await service.generate_conversation_embeddings_async(
+                [{"id": "c1", "source_body": "Text 1"}, {"id": "c2", "source_body": "Text 2"}]
+            )
+
+        assert result.cache_hits == 0
+        assert result.cache_misses == 2
+        assert result.total_success == 2
+
+    @pytest.mark.asyncio
+    async def test_cache_disabled_by_default(self):
+        """Without use_cache the database is never consulted."""
+        service = EmbeddingService()
+        service._async_client = self._mock_client()
+
+        with patch("src.db.embedding_storage.load_cached_embeddings") as mock_load:
+            result = await service.generate_conversation_embeddings_async(
+                [{"id": "c1", "source_body": "Text"}]
+            )
+
+        mock_load.assert_not_called()
+        assert result.cache_hits == 0
+        assert result.cache_misses == 0
+
+    def test_cache_storage_round_trip_uses_binary_vectors(self):
+        """Cache reads decode vector_send bytes; writes COPY binary rows."""
+        from src.db.embedding_storage import (
+            encode_vector,
+            load_cached_embeddings,
+            store_cached_embeddings,
+        )
+
+        cursor = MagicMock()
+        cursor.fetchall.return_value = [("h1", memoryview(encode_vector([0.5, 1.5])))]
+        captured = {}
+        cursor.copy_expert.side_effect = lambda sql, buf: captured.update(data=buf.read())
+        conn = MagicMock()
+        conn.cursor.return_value.__enter__.return_value = cursor
+        cm = MagicMock()
+        cm.__enter__.return_value = conn
+
+        with patch("src.db.embedding_storage.get_connection", return_value=cm):
+            loaded = load_cached_embeddings(["h1", "h2"], "m", 2)
+            written = store_cached_embeddings({"a" * 64: [1.0, 2.0], "b" * 64: [1.0]}, "m", 2)
+
+        assert loaded == {"h1": [0.5, 1.5]}
+        assert written == 1  # Wrong-dimension vector skipped
+        assert captured["data"].count(b"a" * 64) == 1
+        assert "DO NOTHING" in cursor.execute.call_args[0][0]
+
+
 class TestEmbeddingStorage:
     """Test embedding storage helpers."""
 
@@ -432,6 +562,139 @@ class TestEmbeddingStorage:
         assert successful_only[0].conversation_id == "c1"
 
 
+class TestBinaryEmbeddingTransfer:
+    """Test binary pgvector encoding for batch writes and run loads."""
+
+    @staticmethod
+    def _mock_connection(cursor):
+        conn = MagicMock()
+        conn.cursor.return_value.__enter__.return_value = cursor
+        cm = MagicMock()
+        cm.__enter__.return_value = conn
+        return cm, conn
+
+    @staticmethod
+    def _parse_copy(payload):
+        """Parse a PGCOPY binary stream into lists of raw field bytes."""
+        import struct
+
+        assert payload[:11] == b"PGCOPY\n\xff\r\n\x00"
+        pos = 19
+        tuples = []
+        while True:
+            (count,) = struct.unpack_from(">h", payload, pos)
+            pos += 2
+            if count == -1:
+                break
+            fields = []
+            for _ in range(count):
+                (length,) = struct.unpack_from(">i", payload, pos)
+                pos += 4
+                fields.append(None if length == -1 else payload[pos:pos + length])
+                pos += max(length, 0)
+            tuples.append(fields)
+        assert pos == len(payload)
+        return tuples
+
+    def test_vector_round_trip(self):
+        """encode_vector/decode_vector round-trip through pgvector's binary format."""
+        import numpy as np
+        from src.db.embedding_storage import decode_vector, encode_vector
+
+        data = encode_vector([0.5, -1.25, 3.0])
+
+        assert data[:4] == b"\x00\x03\x00\x00"
+        decoded = decode_vector(data)
+        assert decoded.dtype == np.float32
+        assert decoded.tolist() == [0.5, -1.25, 3.0]
+
+    def test_store_batch_streams_binary_copy(self):
+        """Batch storage COPYs binary rows into a stage table and upserts once."""
+        import struct
+        from src.db.embedding_storage import decode_vector, store_embeddings_batch
+
+        cursor = MagicMock()
+        captured = {}
+        cursor.copy_expert.side_effect = lambda sql, buf: captured.update(sql=sql, data=buf.read())
+        cm, conn = self._mock_connection(cursor)
+
+        results = [
+            EmbeddingResult("c1", [0.1] * EMBEDDING_DIMENSIONS, True),
+            EmbeddingResult("c2", [], False, "Error"),
+            EmbeddingResult("c3", [0.2] * 10, True),  # Wrong dimensions
+            EmbeddingResult("c1", [0.3] * EMBEDDING_DIMENSIONS, True),  # Duplicate, last wins
+            EmbeddingResult("c4", [0.4] * EMBEDDING_DIMENSIONS, True),
+        ]
+
+        with patch("src.db.embedding_storage.get_connection", return_value=cm):
+            stored = store_embeddings_batch(results, pipeline_run_id=7)
+
+        assert stored == 2
+        assert "FORMAT binary" in captured["sql"]
+        rows = self._parse_copy(captured["data"])
+        assert [r[0] for r in rows] == [b"c1", b"c4"]
+        assert decode_vector(rows[0][1])[0] == pytest.approx(0.3)
+        assert struct.unpack(">i", rows[0][2])[0] == 7
+        assert rows[0][3] == b"text-embedding-3-small"
+        upsert_sql = cursor.execute.call_args_list[-1][0][0]
+        assert "ON CONFLICT (conversation_id, pipeline_run_id)" in upsert_sql
+        conn.commit.assert_called_once()
+
+    def test_store_batch_null_run_id(self):
+        """A missing pipeline_run_id is written as a NULL field."""
+        from src.db.embedding_storage import store_embeddings_batch
+
+        cursor = MagicMock()
+        captured = {}
+        cursor.copy_expert.side_effect = lambda sql, buf: captured.update(data=buf.read())
+        cm, _ = self._mock_connection(cursor)
+
+        with patch("src.db.embedding_storage.get_connection", return_value=cm):
+            store_embeddings_batch([EmbeddingResult("c1", [0.1] * EMBEDDING_DIMENSIONS, True)])
+
+        assert self._parse_copy(captured["data"])[0][2] is None
+
+    def test_load_matrix_streams_binary_rows(self):
+        """Run loads decode vector_send bytes into one float32 matrix."""
+        import numpy as np
+        from src.db.embedding_storage import encode_vector, load_embedding_matrix_for_run
+
+        rows = [
+            ("a", memoryview(encode_vector([1.0, 0.0]))),
+            ("b", memoryview(encode_vector([0.0, 2.0]))),
+            ("bad", memoryview(encode_vector([1.0, 2.0, 3.0]))),  # Wrong dims, skipped
+            ("c", memoryview(encode_vector([0.5, 0.5]))),
+        ]
+        cursor = MagicMock()
+        cursor.fetchmany.side_effect = [rows[:2], rows[2:], []]
+        cm, conn = self._mock_connection(cursor)
+
+        with patch("src.db.embedding_storage.get_connection", return_value=cm):
+            ids, matrix = load_embedding_matrix_for_run(3, fetch_size=2)
+
+        assert "vector_send" in cursor.execute.call_args[0][0]
+        assert conn.cursor.call_args.kwargs["name"].startswith("run_embeddings_")
+        assert ids == ["a", "b", "c"]
+        assert matrix.dtype == np.float32
+        assert matrix.flags["C_CONTIGUOUS"]
+        assert matrix.tolist() == [[1.0, 0.0], [0.0, 2.0], [0.5, 0.5]]
+
+    def test_load_matrix_empty_run(self):
+        """Runs without embeddings return an empty matrix."""
+        from src.db.embedding_storage import get_embeddings_for_run, load_embedding_matrix_for_run
+
+        cursor = MagicMock()
+        cursor.fetchmany.return_value = []
+        cm, _ = self._mock_connection(cursor)
+
+        with patch("src.db.embedding_storage.get_connection", return_value=cm):
+            ids, matrix = load_embedding_matrix_for_run(3)
+            assert get_embeddings_for_run(3) == []
+
+        assert ids == []
+        assert matrix.shape == (0, 0)
+
+
 class TestPipelineIntegration:
     """Test integration with pipeline flow."""
 
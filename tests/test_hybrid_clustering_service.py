@@ -354,14 +354,14 @@ class TestClusterWithData:
 class TestClusterForRun:
     """Test DB-backed clustering for pipeline runs."""
 
-    @patch("src.services.hybrid_clustering_service.get_embeddings_for_run")
+    @patch("src.services.hybrid_clustering_service.load_embedding_matrix_for_run")
     @patch("src.services.hybrid_clustering_service.get_facets_for_run")
     def test_cluster_for_run_basic(self, mock_facets, mock_embeddings):
         """cluster_for_run loads data from DB and clusters."""
-        mock_embeddings.return_value = [
-            {"conversation_id": "conv1", "embedding": [1.0, 0.0, 0.0]},
-            {"conversation_id": "conv2", "embedding": [1.0, 0.1, 0.0]},
-        ]
+        mock_embeddings.return_value = (
+            ["conv1", "conv2"],
+            np.array([[1.0, 0.0, 0.0], [1.0, 0.1, 0.0]], dtype=np.float32),
+        )
         mock_facets.return_value = [
             {"conversation_id": "conv1", "action_type": "bug_report", "direction": "excess"},
             {"conversation_id": "conv2", "action_type": "bug_report", "direction": "excess"},
@@ -378,11 +378,11 @@ class TestClusterForRun:
         mock_embeddings.assert_called_once_with(42)
         mock_facets.assert_called_once_with(42)
 
-    @patch("src.services.hybrid_clustering_service.get_embeddings_for_run")
+    @patch("src.services.hybrid_clustering_service.load_embedding_matrix_for_run")
     @patch("src.services.hybrid_clustering_service.get_facets_for_run")
     def test_cluster_for_run_no_embeddings(self, mock_facets, mock_embeddings):
         """Returns error when no embeddings found."""
-        mock_embeddings.return_value = []
+        mock_embeddings.return_value = ([], np.empty((0, 0), dtype=np.float32))
         mock_facets.return_value = []
 
         service = HybridClusteringService()
@@ -391,14 +391,14 @@ class TestClusterForRun:
         assert not result.success
         assert "No embeddings found" in result.errors[0]
 
-    @patch("src.services.hybrid_clustering_service.get_embeddings_for_run")
+    @patch("src.services.hybrid_clustering_service.load_embedding_matrix_for_run")
     @patch("src.services.hybrid_clustering_service.get_facets_for_run")
     def test_cluster_for_run_tracks_fallback(self, mock_facets, mock_embeddings):
         """Conversations without facets are tracked as fallback."""
-        mock_embeddings.return_value = [
-            {"conversation_id": "conv1", "embedding": [1.0, 0.0, 0.0]},
-            {"conversation_id": "conv2", "embedding": [0.0, 1.0, 0.0]},
-        ]
+        mock_embeddings.return_value = (
+            ["conv1", "conv2"],
+            np.array([[1.0, 0.0, 0.0], [0.0, 1.0, 0.0]], dtype=np.float32),
+        )
         mock_facets.return_value = [
             {"conversation_id": "conv1", "action_type": "bug_report", "direction": "excess"},
             # conv2 has no facets
@@ -411,7 +411,7 @@ class TestClusterForRun:
         assert "conv2" in result.fallback_conversations
         assert result.total_conversations == 1  # Only conv1 was clustered
 
-    @patch("src.services.hybrid_clustering_service.get_embeddings_for_run")
+    @patch("src.services.hybrid_clustering_service.load_embedding_matrix_for_run")
     @patch("src.services.hybrid_clustering_service.get_facets_for_run")
     def test_cluster_for_run_db_connection_error(self, mock_facets, mock_embeddings):
         """DB connection errors are caught and captured in result.errors."""
@@ -424,17 +424,17 @@ class TestClusterForRun:
         assert not result.success
         assert any("database error" in err.lower() for err in result.errors)
 
-    @patch("src.services.hybrid_clustering_service.get_embeddings_for_run")
+    @patch("src.services.hybrid_clustering_service.load_embedding_matrix_for_run")
     @patch("src.services.hybrid_clustering_service.get_facets_for_run")
     @patch("src.services.hybrid_clustering_service.HybridClusteringService._cluster_embeddings")
     def test_cluster_for_run_clustering_exception(
         self, mock_cluster, mock_facets, mock_embeddings
     ):
         """Clustering algorithm exceptions are caught and reported."""
-        mock_embeddings.return_value = [
-            {"conversation_id": "conv1", "embedding": [1.0, 0.0, 0.0]},
-            {"conversation_id": "conv2", "embedding": [0.0, 1.0, 0.0]},
-        ]
+        mock_embeddings.return_value = (
+            ["conv1", "conv2"],
+            np.array([[1.0, 0.0, 0.0], [0.0, 1.0, 0.0]], dtype=np.float32),
+        )
         mock_facets.return_value = [
             {"conversation_id": "conv1", "action_type": "bug_report", "direction": "excess"},
             {"conversation_id": "conv2", "action_type": "bug_report", "direction": "excess"},
@@ -581,3 +581,159 @@ class TestIntegrationWithPrototype:
 
         assert excess_conv_ids == {"dup1", "dup2"}
         assert deficit_conv_ids == {"miss1", "miss2"}
+
+
+class TestClusteringBackends:
+    """Test automatic backend selection and the memory-bounded backend."""
+
+    @staticmethod
+    def _topic_embeddings(n_topics=12, per_topic=30, dim=64, seed=0):
+        rng = np.random.default_rng(seed)
+        centers = rng.normal(size=(n_topics, dim))
+        points = np.repeat(centers, per_topic, axis=0)
+        points += rng.normal(scale=0.15, size=points.shape)
+        truth = np.repeat(np.arange(n_topics), per_topic)
+        order = rng.permutation(len(points))
+        return points[order], truth[order]
+
+    def test_auto_uses_exact_for_small_runs(self):
+        """Runs up to max_exact_size use the exact backend."""
+        service = HybridClusteringService(max_exact_size=10)
+        result = service.cluster_with_data(
+            [{"conversation_id": f"c{i}", "embedding": [1.0, float(i)]} for i in range(5)],
+            [{"conversation_id": f"c{i}", "action_type": "bug_report", "direction": "deficit"} for i in range(5)],
+        )
+
+        assert result.clustering_backend == "exact"
+
+    def test_auto_switches_to_partitioned_above_threshold(self):
+        """Runs above max_exact_size use the partitioned backend and report cost."""
+        embeddings, _ = self._topic_embeddings()
+        service = HybridClusteringService(max_exact_size=50)
+        result = service.cluster_with_data(
+            [{"conversation_id": f"c{i:04d}", "embedding": e.tolist()} for i, e in enumerate(embeddings)],
+            [{"conversation_id": f"c{i:04d}", "action_type": "bug_report", "direction": "deficit"}
+             for i in range(len(embeddings))],
+        )
+
+        assert result.success
+        assert result.clustering_backend == "partitioned"
+        assert result.clustering_duration_ms > 0
+        assert result.clustering_peak_memory_mb > 0
+        assert result.clustering_memory_traced is False
+        assert result.embedding_clusters_count == 12
+
+    def test_peak_memory_estimate_is_bounded_by_partition_size(self):
+        """Partitioned estimate grows with partition_size², not n²."""
+        from src.services.clustering_backends import (
+            ExactAgglomerativeBackend,
+            PartitionedAgglomerativeBackend,
+        )
+
+        exact = ExactAgglomerativeBackend(DEFAULT_DISTANCE_THRESHOLD, DEFAULT_LINKAGE)
+        partitioned = PartitionedAgglomerativeBackend(
+            DEFAULT_DISTANCE_THRESHOLD, DEFAULT_LINKAGE, partition_size=100,
+        )
+
+        assert exact.estimate_peak_bytes(1000, 8, 4) == 1000 * 8 * 4 + 1000 * 1000 * 4
+        assert exact.estimate_peak_bytes(1000, 8, 8) == 1000 * 8 * 8 + 1000 * 1000 * 8
+        assert partitioned.estimate_peak_bytes(1000, 8, 8) == 1000 * 8 * 4 + 100 * 100 * 4
+        assert partitioned.estimate_peak_bytes(50, 8, 8) == exact.estimate_peak_bytes(50, 8, 8)
+
+    def test_peak_memory_estimate_follows_embedding_dtype(self):
+        """A float32 run is estimated at half the memory of the same float64 run."""
+        service = HybridClusteringService()
+        float64 = np.random.default_rng(0).normal(size=(20, 8))
+        results = []
+        for embeddings in (float64, float64.astype(np.float32)):
+            result = ClusteringResult(0, len(embeddings), 0, 0)
+            service._measure_embedding_clustering(embeddings, result)
+            results.append(result)
+
+        assert results[0].clustering_backend == "exact"
+        assert results[1].clustering_peak_memory_mb == pytest.approx(
+            results[0].clustering_peak_memory_mb / 2
+        )
+
+    def test_trace_memory_is_opt_in(self):
+        """tracemalloc runs only when trace_memory is set, and is stopped afterwards."""
+        import tracemalloc
+
+        conversations = [{"conversation_id": f"c{i}", "embedding": [1.0, float(i)]} for i in range(5)]
+        facets = [{"conversation_id": f"c{i}", "action_type": "bug_report", "direction": "deficit"}
+                  for i in range(5)]
+
+        with patch("src.services.hybrid_clustering_service.tracemalloc.start") as start:
+            default = HybridClusteringService().cluster_with_data(conversations, facets)
+        start.assert_not_called()
+        assert default.clustering_memory_traced is False
+
+        traced = HybridClusteringService(trace_memory=True).cluster_with_data(conversations, facets)
+        assert traced.clustering_memory_traced is True
+        assert traced.clustering_peak_memory_mb > 0
+        assert not tracemalloc.is_tracing()
+
+    def test_trace_memory_leaves_existing_tracing_alone(self):
+        """An already-running tracemalloc session is not reset or stopped."""
+        import tracemalloc
+
+        conversations = [{"conversation_id": f"c{i}", "embedding": [1.0, float(i)]} for i in range(5)]
+        facets = [{"conversation_id": f"c{i}", "action_type": "bug_report", "direction": "deficit"}
+                  for i in range(5)]
+
+        tracemalloc.start()
+        try:
+            result = HybridClusteringService(trace_memory=True).cluster_with_data(conversations, facets)
+            assert tracemalloc.is_tracing()
+        finally:
+            tracemalloc.stop()
+
+        assert result.clustering_memory_traced is False
+        assert result.clustering_peak_memory_mb > 0
+
+    def test_partitioned_matches_exact_on_separated_topics(self):
+        """Partitioned clustering recovers the same groups as the exact backend."""
+        from sklearn.metrics import adjusted_rand_score
+        from src.services.clustering_backends import (
+            ExactAgglomerativeBackend,
+            PartitionedAgglomerativeBackend,
+        )
+
+        embeddings, truth = self._topic_embeddings()
+
+        exact = ExactAgglomerativeBackend(DEFAULT_DISTANCE_THRESHOLD, DEFAULT_LINKAGE).cluster(embeddings)
+        partitioned = PartitionedAgglomerativeBackend(
+            DEFAULT_DISTANCE_THRESHOLD, DEFAULT_LINKAGE, partition_size=40,
+        ).cluster(embeddings)
+
+        assert adjusted_rand_score(truth, exact) == 1.0
+        assert adjusted_rand_score(exact, partitioned) == 1.0
+        assert sorted(set(partitioned)) == list(range(len(set(partitioned))))
+
+    def test_partitioned_merges_topic_split_across_partitions(self):
+        """Sub-clusters of one topic in different partitions are merged back."""
+        from src.services.clustering_backends import PartitionedAgglomerativeBackend
+
+        embeddings, truth = self._topic_embeddings(n_topics=2, per_topic=40)
+        backend = PartitionedAgglomerativeBackend(
+            DEFAULT_DISTANCE_THRESHOLD, DEFAULT_LINKAGE, partition_size=30,
+        )
+        # Force every topic to straddle partitions
+        backend._partition = lambda vectors, indices: [indices[:30], indices[30:60], indices[60:]]
+
+        labels = backend.cluster(embeddings)
+
+        assert len(set(labels)) == 2
+        for topic in (0, 1):
+            assert len(set(labels[truth == topic])) == 1
+
+    def test_unknown_backend_reports_error(self):
+        """An unknown backend name surfaces as a clustering error."""
+        service = HybridClusteringService(backend="bogus")
+        result = service.cluster_with_data(
+            [{"conversation_id": "a", "embedding": [1.0, 0.0]}, {"conversation_id": "b", "embedding": [0.0, 1.0]}],
+            [{"conversation_id": "a"}, {"conversation_id": "b"}],
+        )
+
+        assert not result.success
+        assert "Unknown clustering backend" in result.errors[0]
@@ -306,10 +306,81 @@ class TestAsyncRateLimitHandling:
         with patch.dict("os.environ", {"INTERCOM_ACCESS_TOKEN": "test_token"}):
             return IntercomClient(max_retries=3)
 
-    @pytest.mark.skip(reason="Async implementation will be added with streaming batch feature")
     @pytest.mark.asyncio
     async def test_async_429_is_retried(self, client):
-        """Test that async path also retries on 429."""
-        # This test validates the async implementation handles 429
-        # The actual async implementation will be added with the feature
-        pass  # Placeholder - implementation will add async tests
+        """Async 429 pauses the shared limiter for Retry-After, then retries."""
+        from contextlib import asynccontextmanager
+
+        responses = [
+            make_mock_response(429, headers={"Retry-After": "5"}),
+            make_mock_response(200, headers={}),
+        ]
+        for response in responses:
+            response.status = response.status_code
+            response.json = AsyncMock(return_value={"data": "ok"})
+
+        @asynccontextmanager
+        async def mock_get(*args, **kwargs):
+            yield responses.pop(0)
+
+        mock_session = Mock()
+        mock_session.get = mock_get
+
+        with patch("src.intercom_client.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            result = await client._request_with_retry_async(mock_session, "GET", "/test")
+
+        assert result == {"data": "ok"}
+        assert client.rate_limiter.throttled == 1
+        # The retry waited for its limiter slot: Retry-After plus jitter
+        (delay,), _ = mock_sleep.call_args
+        assert 5 <= delay <= 5 * 1.5 + 1
+
+
+class TestAsyncRateLimiter:
+    """Shared token pacing for all async requests of one client."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_the_rate(self):
+        """N coroutines together get MAX_RPS, spaced evenly."""
+        import asyncio
+        from src.intercom_client import AsyncRateLimiter
+
+        limiter = AsyncRateLimiter(max_rps=10)
+        with patch("src.intercom_client.time.monotonic", return_value=1000.0), \
+                patch("src.intercom_client.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            await asyncio.gather(*(limiter.acquire() for _ in range(5)))
+
+        waits = sorted(call.args[0] for call in mock_sleep.call_args_list)
+        assert waits == pytest.approx([0.1, 0.2, 0.3, 0.4])
+        assert limiter.stats()["granted"] == 5
+        assert limiter.stats()["waited"] == 4
+
+    def test_no_limit_by_default(self):
+        from src.intercom_client import AsyncRateLimiter
+
+        assert AsyncRateLimiter().interval == 0.0
+
+    def test_headers_spread_remaining_quota(self):
+        """Remaining quota is spent evenly until the window resets."""
+        from src.intercom_client import AsyncRateLimiter
+
+        limiter = AsyncRateLimiter(max_rps=100)
+        limiter.update({"X-RateLimit-Remaining": "5", "X-RateLimit-Reset": str(int(time.time()) + 10)})
+
+        assert 1.5 < limiter.interval <= 2.0
+
+    def test_exhausted_quota_pauses_until_reset(self):
+        from src.intercom_client import AsyncRateLimiter
+
+        limiter = AsyncRateLimiter()
+        limiter.update({"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": str(int(time.time()) + 10)})
+
+        assert limiter._next_slot - time.monotonic() > 8
+
+    def test_missing_headers_keep_configured_rate(self):
+        from src.intercom_client import AsyncRateLimiter
+
+        limiter = AsyncRateLimiter(max_rps=4)
+        limiter.update({})
+
+        assert limiter.interval == 0.25
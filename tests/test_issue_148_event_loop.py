@@ -4,7 +4,7 @@ Tests for Issue #148: Event Loop Blocking During Theme Extraction
 Tests the async/parallel implementation that prevents event loop blocking:
 1. _run_pipeline_async() - Wraps sync pipeline execution in thread pool
 2. _run_theme_extraction_async() - Parallel theme extraction with semaphore control
-3. ThemeExtractor.extract_async() - Async wrapper for sync extract()
+3. ThemeExtractor.extract_async() - Native async extraction (AsyncOpenAI)
 4. Concurrency validation - Schema validation for rate limit compliance
 
 Issue #148: The pipeline previously blocked the event loop for 40-80+ minutes
@@ -261,6 +261,7 @@ class TestRunThemeExtractionAsync:
             ) as mock_extractor_class:
                 mock_extractor = Mock()
                 mock_extractor.extract_async = mock_extract_async
+                mock_extractor.usage_stats = Mock(return_value={})
                 mock_extractor.clear_session_signatures = Mock()
                 mock_extractor.get_existing_signatures = Mock(return_value=[])
                 mock_extractor_class.return_value = mock_extractor
@@ -349,6 +350,7 @@ class TestRunThemeExtractionAsync:
             ) as mock_extractor_class:
                 mock_extractor = Mock()
                 mock_extractor.extract_async = mock_extract_async
+                mock_extractor.usage_stats = Mock(return_value={})
                 mock_extractor.clear_session_signatures = Mock()
                 mock_extractor.get_existing_signatures = Mock(return_value=[])
                 mock_extractor_class.return_value = mock_extractor
@@ -447,6 +449,7 @@ class TestRunThemeExtractionAsync:
             ) as mock_extractor_class:
                 mock_extractor = Mock()
                 mock_extractor.extract_async = mock_extract_async
+                mock_extractor.usage_stats = Mock(return_value={})
                 mock_extractor.clear_session_signatures = Mock()
                 mock_extractor_class.return_value = mock_extractor
 
@@ -510,6 +513,7 @@ class TestRunThemeExtractionAsync:
             ) as mock_extractor_class:
                 mock_extractor = Mock()
                 mock_extractor.extract_async = mock_extract_async
+                mock_extractor.usage_stats = Mock(return_value={})
                 mock_extractor.clear_session_signatures = Mock()
                 mock_extractor.get_existing_signatures = Mock(return_value=[])
                 mock_extractor_class.return_value = mock_extractor
@@ -571,127 +575,413 @@ class TestRunThemeExtractionAsync:
             assert result["themes_filtered"] == 0
 
 
-# -----------------------------------------------------------------------------
-# ThemeExtractor.extract_async Tests
-# -----------------------------------------------------------------------------
+class TestThemeStoreWriter:
+    """Themes are written in batches while extraction is still running."""
+
+    @staticmethod
+    def _mock_db(rows):
+        mock_get_conn = MagicMock()
+        mock_conn = MagicMock()
+        mock_cursor = MagicMock()
+        mock_cursor.fetchall.return_value = rows
+        mock_conn.cursor.return_value.__enter__.return_value = mock_cursor
+        mock_get_conn.return_value.__enter__.return_value = mock_conn
+        return mock_get_conn, mock_conn, mock_cursor
+
+    @staticmethod
+    def _theme(conversation_id, mock_theme):
+        theme = Mock(**{k: getattr(mock_theme, k) for k in (
+            "issue_signature", "product_area", "component", "matched_existing",
+            "match_confidence", "user_intent", "symptoms", "affected_flow",
+            "root_cause_hypothesis", "diagnostic_summary", "key_excerpts",
+            "resolution_action", "root_cause", "solution_provided", "resolution_category",
+        )})
+        theme.conversation_id = conversation_id
+        theme.context_used = None
+        theme.context_gaps = None
+        return theme
 
+    @pytest.mark.asyncio
+    async def test_batches_are_stored_during_extraction(self, sample_conversations, mock_theme):
+        """The writer flushes full batches before the last extraction finishes."""
+        import src.api.routers.pipeline as pipeline_module
 
-class TestThemeExtractorExtractAsync:
-    """Tests for ThemeExtractor.extract_async() wrapper."""
+        finished = []
+        flushes = []
 
-    @pytest.mark.asyncio
-    async def test_delegates_to_sync_extract(self):
-        """Test that extract_async calls sync extract() with correct args."""
-        from src.theme_extractor import ThemeExtractor
+        async def mock_extract_async(conv, **kwargs):
+            await asyncio.sleep(0.02 * int(conv.id.split("_")[1]))  # Staggered completion
+            finished.append(conv.id)
+            return self._theme(conv.id, mock_theme)
 
-        extractor = ThemeExtractor()
+        def mock_store(themes, run_id):
+            flushes.append((len(themes), len(finished)))
+            return len(themes), 0, []
 
-        conv = Conversation(
-            id="test_conv",
-            created_at=datetime.now(timezone.utc),
-            source_body="Test message about login issues",
-            issue_type="bug_report",
-            sentiment="neutral",
-            priority="normal",
-            churn_risk=False,
-        )
+        rows = [
+            {
+                "id": conv.id,
+                "created_at": conv.created_at,
+                "source_body": conv.source_body,
+                "source_url": None,
+                "issue_type": "product_issue",
+                "sentiment": conv.sentiment,
+                "priority": conv.priority,
+                "churn_risk": conv.churn_risk,
+                "customer_digest": None,
+                "full_conversation": None,
+            }
+            for conv in sample_conversations
+        ]
+        mock_get_conn, _, _ = self._mock_db(rows)
+
+        with patch("src.db.connection.get_connection", mock_get_conn), \
+                patch("src.theme_extractor.ThemeExtractor") as mock_extractor_class, \
+                patch.object(pipeline_module, "THEME_STORE_BATCH_SIZE", 2), \
+                patch.object(pipeline_module, "_store_theme_batch", side_effect=mock_store):
+            mock_extractor = Mock()
+            mock_extractor.extract_async = mock_extract_async
+            mock_extractor.usage_stats = Mock(return_value={})
+            mock_extractor.has_signature = Mock(return_value=True)
+            mock_extractor_class.return_value = mock_extractor
 
-        mock_theme = Mock()
-
-        with patch.object(extractor, "extract", return_value=mock_theme) as mock_extract:
-            result = await extractor.extract_async(
-                conv,
-                canonicalize=True,
-                use_embedding=False,
-                auto_add_to_vocabulary=False,
-                strict_mode=True,
-                customer_digest="Test digest",
-                full_conversation="Full conversation text",
-                use_full_conversation=True,
+            result = await pipeline_module._run_theme_extraction_async(
+                run_id=1, stop_checker=lambda: False, concurrency=5
             )
 
-            # Verify sync extract was called with all args
-            mock_extract.assert_called_once_with(
-                conv,
-                canonicalize=True,
-                use_embedding=False,
-                auto_add_to_vocabulary=False,
-                strict_mode=True,
-                customer_digest="Test digest",
-                full_conversation="Full conversation text",
-                use_full_conversation=True,
+        assert [size for size, _ in flushes] == [2, 2, 1]
+        assert flushes[0][1] < len(sample_conversations)
+        assert result["themes_extracted"] == 5
+
+    def test_store_theme_batch_upserts_once_with_returning(self, mock_theme):
+        """One execute_values upsert per batch; context logs use the returned ids."""
+        import src.api.routers.pipeline as pipeline_module
+
+        themes = [self._theme("c1", mock_theme), self._theme("c2", mock_theme)]
+        themes[1].context_used = [{"source": "doc"}]
+        low = self._theme("c3", mock_theme)
+
+        mock_get_conn, mock_conn, _ = self._mock_db([])
+        quality = QualityCheckResult(passed=True, quality_score=0.8, reason=None, details={})
+
+        with patch("src.db.connection.get_connection", mock_get_conn), \
+                patch("src.theme_quality.filter_themes_by_quality",
+                      return_value=(themes, [low], ["Theme filtered (low): x"])), \
+                patch("src.theme_quality.check_theme_quality", return_value=quality), \
+                patch("psycopg2.extras.execute_values",
+                      side_effect=[[(10, "c1"), (11, "c2")], None]) as mock_execute_values:
+            stored, filtered, warnings = pipeline_module._store_theme_batch(themes + [low], run_id=7)
+
+        assert (stored, filtered) == (2, 1)
+        assert warnings == ["Theme filtered (low): x"]
+
+        theme_call, context_call = mock_execute_values.call_args_list
+        assert "RETURNING id, conversation_id" in theme_call[0][1]
+        assert theme_call.kwargs["fetch"] is True
+        assert [row[0] for row in theme_call[0][2]] == ["c1", "c2"]
+        assert [row[:3] for row in context_call[0][2]] == [(11, "c2", 7)]
+        mock_conn.commit.assert_called_once()
+
+
+class TestOverlappedStages:
+    """PIPELINE_OVERLAP_STAGES: downstream stages consume stored batches during classification."""
+
+    @staticmethod
+    def _row(conversation_id, issue_type="product_issue"):
+        return {
+            "id": conversation_id,
+            "created_at": datetime.now(timezone.utc),
+            "source_body": f"Body of {conversation_id}",
+            "source_url": None,
+            "issue_type": issue_type,
+            "sentiment": "frustrated",
+            "priority": "high",
+            "churn_risk": False,
+            "support_insights": {},
+            "customer_digest": None,
+            "full_conversation": None,
+        }
+
+    @pytest.mark.asyncio
+    async def test_stages_start_before_classification_finishes(self):
+        """Stored batches are dispatched immediately; the final sweep picks up the rest."""
+        import src.api.routers.pipeline as pipeline_module
+
+        rows = {
+            "c1": self._row("c1"),
+            "c2": self._row("c2"),
+            "c3": self._row("c3"),
+            "c4": self._row("c4"),  # Stored before a resume: only found by the sweep
+            "c5": self._row("c5", issue_type="account_issue"),  # Non-actionable conditional type
+        }
+        embedding_started = asyncio.Event()
+        embedded, faceted, themed = [], [], []
+
+        def fetch_rows(run_id, conversation_ids=None):
+            if conversation_ids is None:
+                return list(rows.values())
+            return [rows[c] for c in conversation_ids if c in rows]
+
+        async def classify(on_stored, **kwargs):
+            on_stored(["c1", "c2"])
+            # Embedding must start while classification is still running
+            await asyncio.wait_for(embedding_started.wait(), timeout=5)
+            on_stored(["c3", "c5", "not_actionable"])
+            return {"fetched": 5, "classified": 5, "stored": 5}
+
+        async def embed(service, conversations, run_id, stop_checker):
+            embedding_started.set()
+            embedded.extend(c["id"] for c in conversations)
+            return {
+                "embeddings_generated": len(conversations),
+                "embeddings_failed": 0,
+                "embedding_cache_hits": 0,
+                "embedding_cache_misses": len(conversations),
+            }
+
+        async def extract_facets(service, conversations, run_id, stop_checker):
+            faceted.extend(c["id"] for c in conversations)
+            return {"facets_extracted": len(conversations), "facets_failed": 0}
+
+        async def extract_themes(run_id, conversations, *args):
+            themed.extend(c.id for c in conversations)
+            return {
+                "themes_extracted": len(conversations),
+                "themes_new": 0,
+                "themes_filtered": 0,
+                "extraction_failed": 0,
+                "warnings": [],
+            }
+
+        with patch("src.classification_pipeline.run_pipeline_async", side_effect=classify), \
+                patch("src.services.embedding_service.EmbeddingService"), \
+                patch("src.services.facet_service.FacetExtractionService"), \
+                patch("src.theme_extractor.ThemeExtractor"), \
+                patch.object(pipeline_module, "OVERLAP_STAGE_BATCH_SIZE", 2), \
+                patch.object(pipeline_module, "_fetch_theme_candidate_rows", side_effect=fetch_rows), \
+                patch.object(pipeline_module, "_generate_and_store_embeddings", side_effect=embed), \
+                patch.object(pipeline_module, "_extract_and_store_facets", side_effect=extract_facets), \
+                patch.object(pipeline_module, "_extract_and_store_themes", side_effect=extract_themes), \
+                patch.object(pipeline_module, "_update_phase") as mock_update_phase:
+            result, embedding_result, facet_result, theme_result = await asyncio.wait_for(
+                pipeline_module._run_overlapped_pipeline_async(
+                    run_id=1, stop_checker=lambda: False, concurrency=5, days=7
+                ),
+                timeout=5,
             )
 
-            # Verify result is returned
-            assert result == mock_theme
+        assert result["stored"] == 5
+        assert embedded[:2] == ["c1", "c2"]
+        assert sorted(embedded) == sorted(faceted) == sorted(themed) == ["c1", "c2", "c3", "c4"]
+        assert embedding_result["embeddings_generated"] == 4
+        assert facet_result["facets_extracted"] == 4
+        assert theme_result["themes_extracted"] == 4
+        assert theme_result["conditional_filtered"] == 1
+        assert mock_update_phase.call_args.args[1] == "overlapped_stages"
+        assert mock_update_phase.call_args.kwargs["themes_extracted"] >= 1
 
     @pytest.mark.asyncio
-    async def test_runs_in_thread_pool_not_blocking(self):
-        """Test that extract_async doesn't block event loop."""
-        from src.theme_extractor import ThemeExtractor
+    async def test_stage_failure_cancels_classification(self):
+        """A failing stage aborts the DAG instead of leaving classification blocked."""
+        import src.api.routers.pipeline as pipeline_module
 
-        extractor = ThemeExtractor()
+        async def classify(on_stored, **kwargs):
+            for i in range(100):
+                on_stored([f"c{i}"])
+                await asyncio.sleep(0.01)
+            return {"stored": 100}
+
+        async def embed(*args):
+            raise RuntimeError("embedding API down")
+
+        with patch("src.classification_pipeline.run_pipeline_async", side_effect=classify), \
+                patch("src.services.embedding_service.EmbeddingService"), \
+                patch("src.services.facet_service.FacetExtractionService"), \
+                patch("src.theme_extractor.ThemeExtractor"), \
+                patch.object(pipeline_module, "OVERLAP_STAGE_BATCH_SIZE", 1), \
+                patch.object(pipeline_module, "_fetch_theme_candidate_rows",
+                             side_effect=lambda run_id, ids=None: [self._row(c) for c in ids or []]), \
+                patch.object(pipeline_module, "_generate_and_store_embeddings", side_effect=embed), \
+                patch.object(pipeline_module, "_extract_and_store_facets", new=AsyncMock(return_value={})), \
+                patch.object(pipeline_module, "_extract_and_store_themes", new=AsyncMock(return_value={})), \
+                patch.object(pipeline_module, "_update_phase"):
+            with pytest.raises(RuntimeError, match="embedding API down"):
+                await asyncio.wait_for(
+                    pipeline_module._run_overlapped_pipeline_async(
+                        run_id=1, stop_checker=lambda: False, concurrency=5
+                    ),
+                    timeout=5,
+                )
 
-        conv = Conversation(
-            id="test_conv",
-            created_at=datetime.now(timezone.utc),
-            source_body="Test message",
-            issue_type="bug_report",
-            sentiment="neutral",
-            priority="normal",
-            churn_risk=False,
+
+# -----------------------------------------------------------------------------
+# ThemeExtractor.extract_async Tests
+# -----------------------------------------------------------------------------
+
+
+def _llm_response(payload: dict) -> Mock:
+    """Mock chat completion whose message content is payload as JSON."""
+    import json
+
+    response = Mock()
+    response.choices = [Mock()]
+    response.choices[0].message.content = json.dumps(payload)
+    return response
+
+
+EXTRACTION_PAYLOAD = {
+    "issue_signature": "login_failure",
+    "product_area": "account",
+    "component": "auth",
+    "user_intent": "Log in",
+    "symptoms": ["login fails"],
+    "matched_existing": False,
+    "match_reasoning": "new",
+    "match_confidence": "high",
+    "diagnostic_summary": "Login broken",
+    "key_excerpts": [{"text": "can't log in", "relevance": "high"}],
+    "resolution_action": "user_education",
+    "resolution_category": "education",
+}
+
+CANONICALIZATION_PAYLOAD = {
+    "signature": "account_login_failure",
+    "matched_existing": True,
+    "reasoning": "same issue",
+}
+
+
+def _native_extractor():
+    """ThemeExtractor with mocked sync/async clients and one existing signature."""
+    from src.theme_extractor import ThemeExtractor
+
+    with patch("src.theme_extractor.OpenAI"):
+        extractor = ThemeExtractor(use_vocabulary=False)
+    extractor._product_context = "Product context"
+    extractor._signature_catalog = Mock()
+    extractor._signature_catalog.signatures.return_value = [{
+        "signature": "account_login_failure",
+        "product_area": "account",
+        "component": "auth",
+        "count": 3,
+    }]
+
+    def respond(**kwargs):
+        system = kwargs["messages"][0]["content"]
+        if "normalize issue signatures" in system:
+            return _llm_response(CANONICALIZATION_PAYLOAD)
+        return _llm_response(EXTRACTION_PAYLOAD)
+
+    async def respond_async(**kwargs):
+        await asyncio.sleep(0.05)
+        return respond(**kwargs)
+
+    extractor.client.chat.completions.create.side_effect = respond
+    extractor._async_client = MagicMock()
+    extractor._async_client.chat.completions.create = AsyncMock(side_effect=respond_async)
+    return extractor
+
+
+def _conversation(conv_id: str = "test_conv") -> Conversation:
+    return Conversation(
+        id=conv_id,
+        created_at=datetime.now(timezone.utc),
+        source_body="Test message about login issues",
+        issue_type="bug_report",
+        sentiment="neutral",
+        priority="normal",
+        churn_risk=False,
+    )
+
+
+class TestThemeExtractorExtractAsync:
+    """Tests for the native async ThemeExtractor.extract_async()."""
+
+    @pytest.mark.asyncio
+    async def test_matches_sync_extract(self):
+        """Same LLM responses produce the same Theme through both paths."""
+        sync_extractor = _native_extractor()
+        async_extractor = _native_extractor()
+        kwargs = dict(
+            strict_mode=True,
+            customer_digest="Customer digest text",
+            full_conversation="Full conversation text about login issues",
+            use_full_conversation=True,
         )
 
-        # Track event loop responsiveness
+        sync_theme = sync_extractor.extract(_conversation(), **kwargs)
+        async_theme = await async_extractor.extract_async(_conversation(), **kwargs)
+
+        sync_dict, async_dict = sync_theme.to_dict(), async_theme.to_dict()
+        sync_dict.pop("extracted_at")
+        async_dict.pop("extracted_at")
+        assert async_dict == sync_dict
+        assert async_theme.issue_signature == "account_login_failure"
+
+        # Identical requests, all sent through the async client
+        sync_calls = sync_extractor.client.chat.completions.create.call_args_list
+        async_calls = async_extractor._async_client.chat.completions.create.call_args_list
+        assert [c.kwargs for c in async_calls] == [c.kwargs for c in sync_calls]
+        async_extractor.client.chat.completions.create.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_does_not_block_event_loop_or_use_threads_for_llm(self):
+        """LLM calls are awaited on the loop rather than run in a worker thread."""
+        extractor = _native_extractor()
         event_loop_ticks = []
 
         async def tick_counter():
-            """Count event loop ticks."""
-            for i in range(10):
+            for i in range(5):
                 event_loop_ticks.append(i)
                 await asyncio.sleep(0.01)
 
-        def slow_extract(*args, **kwargs):
-            """Simulate slow extraction."""
-            import time
-            time.sleep(0.1)
-            return Mock()
-
-        with patch.object(extractor, "extract", side_effect=slow_extract):
-            # Run extraction and tick counter concurrently
+        with patch("src.theme_extractor.asyncio.to_thread", wraps=asyncio.to_thread) as to_thread:
             await asyncio.gather(
-                extractor.extract_async(conv),
+                extractor.extract_async(_conversation()),
                 tick_counter(),
             )
 
-            # Event loop should have remained responsive
-            assert len(event_loop_ticks) >= 5, (
-                f"Event loop only ticked {len(event_loop_ticks)} times"
-            )
+        assert len(event_loop_ticks) == 5
+        threaded = [c.args[0] for c in to_thread.call_args_list]
+        assert extractor.extract not in threaded
+        assert all(getattr(fn, "__name__", "") == "get_existing_signatures" for fn in threaded)
 
     @pytest.mark.asyncio
-    async def test_propagates_exceptions_from_sync_extract(self):
-        """Test that exceptions from sync extract are propagated."""
-        from src.theme_extractor import ThemeExtractor
+    async def test_canonicalization_is_serialized(self):
+        """Concurrent extractions canonicalize one at a time and share the session cache."""
+        extractor = _native_extractor()
+        in_flight = 0
+        max_in_flight = 0
+        original = extractor.canonicalize_signature_async
+
+        async def tracking(**kwargs):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            try:
+                return await original(**kwargs)
+            finally:
+                in_flight -= 1
+
+        with patch.object(extractor, "canonicalize_signature_async", side_effect=tracking):
+            themes = await asyncio.gather(
+                *(extractor.extract_async(_conversation(f"conv_{i}")) for i in range(10))
+            )
 
-        extractor = ThemeExtractor()
+        assert max_in_flight == 1
+        assert len(themes) == 10
+        assert extractor._session_signatures["account_login_failure"]["count"] == 10
 
-        conv = Conversation(
-            id="test_conv",
-            created_at=datetime.now(timezone.utc),
-            source_body="Test message",
-            issue_type="bug_report",
-            sentiment="neutral",
-            priority="normal",
-            churn_risk=False,
+    @pytest.mark.asyncio
+    async def test_propagates_exceptions_from_llm_call(self):
+        """Test that errors from the async LLM call are propagated."""
+        extractor = _native_extractor()
+        extractor._async_client.chat.completions.create = AsyncMock(
+            side_effect=ValueError("Extraction failed")
         )
 
-        def failing_extract(*args, **kwargs):
-            raise ValueError("Extraction failed")
-
-        with patch.object(extractor, "extract", side_effect=failing_extract):
-            with pytest.raises(ValueError, match="Extraction failed"):
-                await extractor.extract_async(conv)
+        with pytest.raises(ValueError, match="Extraction failed"):
+            await extractor.extract_async(_conversation())
 
 
 # -----------------------------------------------------------------------------
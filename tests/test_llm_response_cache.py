@@ -0,0 +1,197 @@
+"""
+Tests for the persistent LLM response cache used by Stage 1/Stage 2 classification.
+"""
+
+import asyncio
+import json
+import sqlite3
+import sys
+import threading
+from pathlib import Path
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.llm_response_cache import LLMResponseCache, get_response_cache, response_cache_key
+
+
+MESSAGES = [{"role": "user", "content": "classify this"}]
+PARAMS = {"model": "gpt-4o-mini", "temperature": 0.3}
+
+
+class TestResponseCacheKey:
+    """Key covers template, model, parameters and rendered messages."""
+
+    def test_identical_requests_share_key(self):
+        assert response_cache_key("T", "m", MESSAGES, PARAMS) == response_cache_key("T", "m", MESSAGES, dict(PARAMS))
+
+    @pytest.mark.parametrize(
+        "changed",
+        [
+            ("T2", "m", MESSAGES, PARAMS),
+            ("T", "m2", MESSAGES, PARAMS),
+            ("T", "m", [{"role": "user", "content": "other"}], PARAMS),
+            ("T", "m", MESSAGES, {**PARAMS, "temperature": 0.1}),
+        ],
+    )
+    def test_any_input_change_changes_key(self, changed):
+        assert response_cache_key(*changed) != response_cache_key("T", "m", MESSAGES, PARAMS)
+
+
+class TestLLMResponseCache:
+    """SQLite-backed storage, TTL, eviction and stats."""
+
+    def test_round_trip_and_stats(self, tmp_path):
+        cache = LLMResponseCache(str(tmp_path / "cache.db"))
+
+        assert cache.get("k") is None
+        cache.put("k", '{"a": 1}')
+        assert cache.get("k") == '{"a": 1}'
+
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 0.5
+
+    def test_persists_across_instances(self, tmp_path):
+        path = str(tmp_path / "cache.db")
+        LLMResponseCache(path).put("k", "v")
+
+        assert LLMResponseCache(path).get("k") == "v"
+
+    def test_expired_entries_are_misses(self, tmp_path):
+        cache = LLMResponseCache(str(tmp_path / "cache.db"), ttl_hours=1)
+
+        with patch("src.llm_response_cache.time.time", return_value=1000.0):
+            cache.put("k", "v")
+        with patch("src.llm_response_cache.time.time", return_value=1000.0 + 2 * 3600):
+            assert cache.get("k") is None
+
+        assert len(cache) == 0
+
+    def test_evicts_least_recently_used_past_bound(self, tmp_path):
+        cache = LLMResponseCache(str(tmp_path / "cache.db"), max_entries=3)
+
+        cache.put("a", "a")
+        cache.put("b", "b")
+        cache.put("c", "c")
+        cache.get("a")  # "a" is now more recently used than "b"
+        cache.put("d", "d")
+
+        assert len(cache) <= 3
+        assert cache.get("b") is None
+        assert cache.get("a") == "a"
+        assert cache.get("d") == "d"
+        assert cache.stats()["evictions"] >= 1
+
+    def test_put_counts_rows_only_past_bound(self, tmp_path):
+        cache = LLMResponseCache(str(tmp_path / "cache.db"), max_entries=100)
+        statements = []
+        cache._conn.set_trace_callback(statements.append)
+
+        for i in range(50):
+            cache.put(f"k{i}", "v")
+
+        assert not any("COUNT(*)" in statement for statement in statements)
+        assert len(cache) == 50
+
+    def test_sqlite_errors_are_a_miss_and_a_skipped_write(self, tmp_path):
+        cache = LLMResponseCache(str(tmp_path / "cache.db"))
+        cache._conn = Mock()
+        cache._conn.execute.side_effect = sqlite3.OperationalError("database is locked")
+
+        cache.put("k", "v")
+        assert cache.get("k") is None
+        assert cache.stats()["misses"] == 1
+
+    def test_concurrent_writers(self, tmp_path):
+        cache = LLMResponseCache(str(tmp_path / "cache.db"))
+
+        def write(worker):
+            for i in range(50):
+                cache.put(f"{worker}-{i}", "v")
+                cache.get(f"{worker}-{i}")
+
+        threads = [threading.Thread(target=write, args=(w,)) for w in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len(cache) == 400
+        assert cache.stats()["hits"] == 400
+
+
+class TestGetResponseCache:
+    """Opt-in configuration from the environment."""
+
+    def test_disabled_by_default(self, monkeypatch):
+        monkeypatch.delenv("LLM_RESPONSE_CACHE_PATH", raising=False)
+        assert get_response_cache() is None
+
+    def test_enabled_by_path(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("LLM_RESPONSE_CACHE_PATH", str(tmp_path / "llm.db"))
+        monkeypatch.setenv("LLM_RESPONSE_CACHE_MAX_ENTRIES", "10")
+
+        cache = get_response_cache()
+
+        assert cache is not None
+        assert cache.max_entries == 10
+        assert get_response_cache() is cache
+
+
+class TestClassificationUsesCache:
+    """classify_stage1_async answers repeated inputs from the cache."""
+
+    @pytest.fixture
+    def pipeline(self, monkeypatch):
+        monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+        from src import classification_pipeline
+        return classification_pipeline
+
+    @staticmethod
+    def _response(content):
+        return Mock(choices=[Mock(message=Mock(content=content))])
+
+    @pytest.mark.asyncio
+    async def test_stage1_rerun_skips_api(self, pipeline, monkeypatch, tmp_path):
+        monkeypatch.setenv("LLM_RESPONSE_CACHE_PATH", str(tmp_path / "llm.db"))
+        content = json.dumps({"conversation_type": "product_issue", "confidence": "high"})
+
+        with patch.object(pipeline, "async_client") as mock_client:
+            mock_client.chat.completions.create = AsyncMock(return_value=self._response(content))
+            first = await pipeline.classify_stage1_async("Broken pins", semaphore=asyncio.Semaphore(1))
+            second = await pipeline.classify_stage1_async("Broken pins", semaphore=asyncio.Semaphore(1))
+
+        assert mock_client.chat.completions.create.await_count == 1
+        assert first == second
+        assert second["conversation_type"] == "product_issue"
+        assert second["routing_team"] == "technical_support"
+
+    @pytest.mark.asyncio
+    async def test_unparseable_response_not_cached(self, pipeline, monkeypatch, tmp_path):
+        monkeypatch.setenv("LLM_RESPONSE_CACHE_PATH", str(tmp_path / "llm.db"))
+
+        with patch.object(pipeline, "async_client") as mock_client:
+            mock_client.chat.completions.create = AsyncMock(return_value=self._response("not json"))
+            await pipeline.classify_stage1_async("Broken pins", semaphore=asyncio.Semaphore(1))
+            await pipeline.classify_stage1_async("Broken pins", semaphore=asyncio.Semaphore(1))
+
+        assert mock_client.chat.completions.create.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_cache_failure_falls_back_to_api(self, pipeline, monkeypatch, tmp_path):
+        monkeypatch.setenv("LLM_RESPONSE_CACHE_PATH", str(tmp_path / "llm.db"))
+        content = json.dumps({"conversation_type": "product_issue", "confidence": "high"})
+        cache = get_response_cache()
+        cache._conn = Mock()
+        cache._conn.execute.side_effect = sqlite3.OperationalError("disk I/O error")
+
+        with patch.object(pipeline, "async_client") as mock_client:
+            mock_client.chat.completions.create = AsyncMock(return_value=self._response(content))
+            result = await pipeline.classify_stage1_async("Broken pins", semaphore=asyncio.Semaphore(1))
+
+        assert mock_client.chat.completions.create.await_count == 1
+        assert result["conversation_type"] == "product_issue"
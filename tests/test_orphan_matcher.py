@@ -401,7 +401,7 @@ class TestOrphanMatcherBatch:
         mock_signature_registry,
     ):
         """Test batch matching multiple conversations."""
-        mock_orphan_service.get_by_signature.return_value = None
+        mock_orphan_service.get_by_signatures.return_value = {}
         new_orphan = Orphan(
             id=uuid4(),
             signature="test",
@@ -414,8 +414,13 @@ class TestOrphanMatcherBatch:
             graduated_at=None,
             story_id=None,
         )
-        # Now uses create_or_get which returns (orphan, created) tuple
-        mock_orphan_service.create_or_get.return_value = (new_orphan, True)
+        mock_orphan_service.create_bulk.return_value = {"billing_issue": new_orphan}
+        mock_orphan_service.add_conversations_bulk.side_effect = lambda additions: {
+            orphan.id: orphan.model_copy(update={
+                "conversation_ids": orphan.conversation_ids + [cid for cid, _ in convs]
+            })
+            for orphan, convs in additions
+        }
 
         matcher = OrphanMatcher(
             mock_orphan_service,
@@ -442,6 +447,168 @@ class TestOrphanMatcherBatch:
 
         assert len(results) == 2
         assert all(r.matched for r in results)
+        assert [r.action for r in results] == ["created", "updated"]
+        mock_orphan_service.get_by_signature.assert_not_called()
+
+    def test_batch_match_conflict_falls_back(
+        self,
+        mock_orphan_service,
+        mock_story_service,
+        mock_signature_registry,
+        sample_orphan,
+    ):
+        """Signatures created concurrently are re-routed one conversation at a time."""
+        mock_orphan_service.get_by_signatures.return_value = {}
+        mock_orphan_service.create_bulk.return_value = {}
+        mock_orphan_service.add_conversations_bulk.return_value = {}
+        mock_orphan_service.get_by_signature.return_value = sample_orphan
+        mock_orphan_service.add_conversations.return_value = sample_orphan
+
+        matcher = OrphanMatcher(
+            mock_orphan_service,
+            mock_story_service,
+            mock_signature_registry,
+        )
+
+        results = matcher.batch_match([
+            {"id": "conv9", "issue_signature": "billing_cancellation"},
+        ])
+
+        assert [r.action for r in results] == ["updated"]
+        mock_orphan_service.add_conversations.assert_called_once()
+
+    def test_batch_match_equals_sequential(self, mock_story_service, sample_story):
+        """Bulk results match per-conversation match_and_accumulate."""
+        graduated_id = uuid4()
+        conversations = [
+            {"id": "a1", "issue_signature": "active"},
+            {"id": "n1", "issue_signature": "new"},
+            {"id": "g1", "issue_signature": "graduated"},
+            {"id": "a0", "issue_signature": "active"},  # already in orphan
+            {"id": "a2", "issue_signature": "active"},  # graduates
+            {"id": "n2", "issue_signature": "new"},
+            {"id": "a3", "issue_signature": "active"},  # flows to new story
+            {"id": "n1", "issue_signature": "new"},  # duplicate
+        ]
+
+        def seeded_service():
+            return _InMemoryOrphanService({
+                "active": _orphan("active", ["a0"]),
+                "graduated": _orphan("graduated", ["x", "y", "z"], story_id=graduated_id),
+            }, sample_story.id)
+
+        registry = Mock(spec=SignatureRegistry)
+        registry.get_canonical.side_effect = lambda sig: sig
+
+        sequential_service = seeded_service()
+        sequential = OrphanMatcher(
+            sequential_service, mock_story_service, registry, evidence_service=Mock()
+        )
+        expected = [
+            sequential.match_and_accumulate(
+                conv["id"], ExtractedTheme(signature=conv["issue_signature"])
+            )
+            for conv in conversations
+        ]
+
+        bulk_service = seeded_service()
+        bulk_evidence = Mock()
+        bulk = OrphanMatcher(
+            bulk_service, mock_story_service, registry, evidence_service=bulk_evidence
+        )
+        results = bulk.batch_match(conversations)
+
+        def comparable(result):
+            return (result.matched, result.orphan_signature, result.action,
+                    result.story_id, result.conversation_ids)
+
+        assert [comparable(r) for r in results] == [comparable(r) for r in expected]
+        assert [r.action for r in results] == [
+            "updated", "created", "added_to_story", "already_exists",
+            "graduated", "updated", "added_to_story", "already_exists",
+        ]
+        assert bulk_service.calls == [
+            "get_by_signatures", "create_bulk", "add_conversations_bulk", "graduate",
+        ]
+        assert bulk_evidence.add_conversation.call_count == 2
+        assert bulk_service.orphans["new"].conversation_ids == ["n1", "n2"]
+
+
+def _orphan(signature, conversation_ids, story_id=None):
+    return Orphan(
+        id=uuid4(),
+        signature=signature,
+        conversation_ids=conversation_ids,
+        theme_data={},
+        first_seen_at=datetime.now(),
+        last_updated_at=datetime.now(),
+        graduated_at=datetime.now() if story_id else None,
+        story_id=story_id,
+    )
+
+
+class _InMemoryOrphanService:
+    """Just enough of OrphanService to run both matcher paths against."""
+
+    def __init__(self, orphans, story_id):
+        self.orphans = orphans
+        self.story_id = story_id
+        self.calls = []
+
+    def get_by_signature(self, signature):
+        self.calls.append("get_by_signature")
+        return self.orphans.get(signature)
+
+    def get_by_signatures(self, signatures):
+        self.calls.append("get_by_signatures")
+        return {s: self.orphans[s] for s in signatures if s in self.orphans}
+
+    def create_or_get(self, orphan_create):
+        self.calls.append("create_or_get")
+        if orphan_create.signature in self.orphans:
+            return self.orphans[orphan_create.signature], False
+        orphan = _orphan(orphan_create.signature, list(orphan_create.conversation_ids))
+        self.orphans[orphan.signature] = orphan
+        return orphan, True
+
+    def create_bulk(self, orphan_creates):
+        self.calls.append("create_bulk")
+        created = {}
+        for orphan_create in orphan_creates:
+            orphan = _orphan(orphan_create.signature, list(orphan_create.conversation_ids))
+            self.orphans[orphan.signature] = created[orphan.signature] = orphan
+        return created
+
+    def add_conversations(self, orphan_id, conversation_ids, theme_data=None):
+        self.calls.append("add_conversations")
+        return self._append(orphan_id, conversation_ids)
+
+    def add_conversations_bulk(self, additions):
+        self.calls.append("add_conversations_bulk")
+        return {
+            orphan.id: self._append(orphan.id, [cid for cid, _ in conversations])
+            for orphan, conversations in additions
+        }
+
+    def _append(self, orphan_id, conversation_ids):
+        orphan = next(o for o in self.orphans.values() if o.id == orphan_id)
+        orphan.conversation_ids = orphan.conversation_ids + [
+            cid for cid in conversation_ids if cid not in orphan.conversation_ids
+        ]
+        return orphan.model_copy()
+
+    def graduate(self, orphan_id, story_service):
+        self.calls.append("graduate")
+        orphan = next(o for o in self.orphans.values() if o.id == orphan_id)
+        orphan.graduated_at = datetime.now()
+        orphan.story_id = self.story_id
+        return OrphanGraduationResult(
+            orphan_id=orphan.id,
+            story_id=self.story_id,
+            signature=orphan.signature,
+            conversation_count=orphan.conversation_count,
+            graduated_at=orphan.graduated_at,
+        )
 
 
 class TestOrphanMatcherGraduatedFlow:
@@ -5,6 +5,7 @@ Tests for OrphanService - Phase 5 Story Grouping.
 Run with: pytest tests/test_orphan_service.py -v
 """
 
+import json
 import pytest
 from datetime import datetime
 from pathlib import Path
@@ -532,6 +533,75 @@ class TestCreateOrGet:
             ))
 
 
+class TestBulkOperations:
+    """Tests for the set-based methods used by OrphanMatcher.batch_match."""
+
+    def test_get_by_signatures_single_query(self, mock_db, sample_orphan_row):
+        """Should fetch all signatures with one ANY() query."""
+        db, cursor = mock_db
+        cursor.fetchall.return_value = [sample_orphan_row]
+
+        service = OrphanService(db)
+        orphans = service.get_by_signatures(["Scheduler: Pin fails to post", "other"])
+
+        assert list(orphans) == ["Scheduler: Pin fails to post"]
+        assert cursor.execute.call_count == 1
+        assert "ANY(%s)" in cursor.execute.call_args[0][0]
+
+    def test_get_by_signatures_empty(self, mock_db):
+        """Should not query for an empty signature list."""
+        db, cursor = mock_db
+
+        assert OrphanService(db).get_by_signatures([]) == {}
+        cursor.execute.assert_not_called()
+
+    def test_create_bulk_omits_conflicts(self, mock_db, sample_orphan_row):
+        """Should insert all orphans at once and return only the created ones."""
+        db, cursor = mock_db
+        cursor.fetchall.return_value = [sample_orphan_row]
+
+        service = OrphanService(db)
+        created = service.create_bulk([
+            OrphanCreate(signature="Scheduler: Pin fails to post", conversation_ids=["conv1"]),
+            OrphanCreate(signature="already_exists", conversation_ids=["conv2"]),
+        ])
+
+        assert list(created) == ["Scheduler: Pin fails to post"]
+        sql, params = cursor.execute.call_args[0]
+        assert "ON CONFLICT (signature) DO NOTHING" in sql
+        assert [row["signature"] for row in json.loads(params[0])] == [
+            "Scheduler: Pin fails to post", "already_exists",
+        ]
+
+    def test_add_conversations_bulk_merges(self, mock_db, sample_orphan_row):
+        """Should merge ids and theme data in order, then write one UPDATE."""
+        db, cursor = mock_db
+        service = OrphanService(db)
+        orphan = service._row_to_orphan(sample_orphan_row)
+        cursor.fetchall.return_value = [
+            {**sample_orphan_row, "conversation_ids": ["conv1", "conv2", "conv3"]}
+        ]
+
+        updated = service.add_conversations_bulk([
+            (orphan, [
+                ("conv2", {"symptoms": ["pin not posting"]}),
+                ("conv3", {"symptoms": ["queue stuck"]}),
+            ]),
+        ])
+
+        assert updated[orphan.id].conversation_ids == ["conv1", "conv2", "conv3"]
+        assert cursor.execute.call_count == 1
+        payload = json.loads(cursor.execute.call_args[0][1][0])
+        assert payload == [{
+            "id": str(orphan.id),
+            "conversation_ids": ["conv1", "conv2", "conv3"],
+            "theme_data": {
+                **sample_orphan_row["theme_data"],
+                "symptoms": ["pin not posting", "scheduling error", "queue stuck"],
+            },
+        }]
+
+
 class TestThemeDataMerging:
     """Tests for theme data merging logic."""
 
@@ -1036,7 +1036,7 @@ class TestProcessStreamingBatch:
         # Track order of operations
         operation_order = []
 
-        mock_client.get_conversation_async = AsyncMock(side_effect=lambda session, id: (
+        mock_client.get_conversation_async = AsyncMock(side_effect=lambda session, id, updated_at=None: (
             operation_order.append(f"detail_fetch_{id}"),
             {"id": id, "conversation_parts": {"conversation_parts": []}}
         )[1])
@@ -1146,3 +1146,188 @@ class TestProcessStreamingBatch:
         # Should have 1 classified (the successful one)
         assert result["classified"] == 1
         assert result["stored"] == 1
+
+    @staticmethod
+    def _make_parsed(id):
+        p = MagicMock()
+        p.id = id
+        p.source_body = "test"
+        p.source_type = "conversation"
+        p.source_url = None
+        p.contact_email = None
+        p.contact_id = None
+        p.created_at = datetime.now()
+        return p
+
+    @pytest.mark.asyncio
+    async def test_slow_conversation_does_not_block_storage(self):
+        """Fast conversations are classified and stored while a slow fetch is in flight."""
+        from src.classification_pipeline import _process_streaming_batch
+
+        slow_release = asyncio.Event()
+        stored_ids = []
+
+        async def get_detail(session, id, updated_at=None):
+            if id == "slow":
+                await slow_release.wait()
+            return {"id": id, "conversation_parts": {"conversation_parts": []}}
+
+        mock_client = MagicMock()
+        mock_client.get_conversation_async = AsyncMock(side_effect=get_detail)
+
+        async def classify(parsed, raw_conv, semaphore):
+            return {
+                "conversation_id": parsed.id,
+                "stage1_result": {"conversation_type": "general_inquiry"},
+                "stage2_result": None,
+            }
+
+        def store(results, pipeline_run_id=None):
+            stored_ids.extend(r["conversation_id"] for r in results)
+            # Slow conversation is released once the fast ones are durably stored
+            if {"fast_1", "fast_2"} <= set(stored_ids):
+                loop.call_soon_threadsafe(slow_release.set)
+            return len(results)
+
+        loop = asyncio.get_running_loop()
+        batch = [
+            (self._make_parsed(id), {"id": id})
+            for id in ("slow", "fast_1", "fast_2")
+        ]
+
+        with patch("src.classification_pipeline.classify_conversation_async", side_effect=classify):
+            with patch("src.classification_pipeline.store_classification_results_batch", side_effect=store):
+                result = await asyncio.wait_for(
+                    _process_streaming_batch(
+                        batch=batch,
+                        recovery_candidates=[],
+                        client=mock_client,
+                        session=MagicMock(),
+                        semaphore=asyncio.Semaphore(10),
+                        concurrency=10,
+                        dry_run=False,
+                        pipeline_run_id=42,
+                        store_chunk_size=1,
+                    ),
+                    timeout=5,
+                )
+
+        assert stored_ids[-1] == "slow"
+        assert result["classified"] == 3
+        assert result["stored"] == 3
+
+    @pytest.mark.asyncio
+    async def test_on_stored_reports_each_written_chunk(self):
+        """on_stored receives conversation IDs after each chunk is written."""
+        from src.classification_pipeline import _process_streaming_batch
+
+        mock_client = MagicMock()
+        mock_client.get_conversation_async = AsyncMock(return_value={"id": "x"})
+        batch = [(self._make_parsed(f"conv_{i}"), {"id": f"conv_{i}"}) for i in range(5)]
+        written = []
+        notified = []
+
+        async def classify(parsed, raw_conv, semaphore):
+            return {
+                "conversation_id": parsed.id,
+                "stage1_result": {"conversation_type": "product_issue"},
+                "stage2_result": None,
+            }
+
+        def store(results, pipeline_run_id=None):
+            written.extend(r["conversation_id"] for r in results)
+            return len(results)
+
+        def on_stored(ids):
+            # Only called once the IDs are durably stored
+            assert set(ids) <= set(written)
+            notified.append(ids)
+
+        with patch("src.classification_pipeline.classify_conversation_async", side_effect=classify):
+            with patch("src.classification_pipeline.store_classification_results_batch", side_effect=store):
+                await _process_streaming_batch(
+                    batch=batch,
+                    recovery_candidates=[],
+                    client=mock_client,
+                    session=MagicMock(),
+                    semaphore=asyncio.Semaphore(10),
+                    concurrency=5,
+                    dry_run=False,
+                    pipeline_run_id=42,
+                    store_chunk_size=2,
+                    on_stored=on_stored,
+                )
+
+        assert [len(ids) for ids in notified] == [2, 2, 1]
+        assert sorted(sum(notified, [])) == sorted(written)
+
+    @pytest.mark.asyncio
+    async def test_storage_failure_propagates(self):
+        """A failed DB write aborts the batch so no checkpoint is saved past it."""
+        from src.classification_pipeline import _process_streaming_batch
+
+        mock_client = MagicMock()
+        mock_client.get_conversation_async = AsyncMock(return_value={"id": "x"})
+
+        batch = [(self._make_parsed(f"conv_{i}"), {"id": f"conv_{i}"}) for i in range(20)]
+
+        with patch("src.classification_pipeline.classify_conversation_async") as mock_classify:
+            mock_classify.return_value = {
+                "conversation_id": "x",
+                "stage1_result": {"conversation_type": "general_inquiry"},
+                "stage2_result": None,
+            }
+            with patch(
+                "src.classification_pipeline.store_classification_results_batch",
+                side_effect=RuntimeError("db down"),
+            ):
+                with pytest.raises(RuntimeError, match="db down"):
+                    await asyncio.wait_for(
+                        _process_streaming_batch(
+                            batch=batch,
+                            recovery_candidates=[],
+                            client=mock_client,
+                            session=MagicMock(),
+                            semaphore=asyncio.Semaphore(10),
+                            concurrency=2,
+                            dry_run=False,
+                            pipeline_run_id=42,
+                            queue_size=1,
+                            store_chunk_size=1,
+                        ),
+                        timeout=5,
+                    )
+
+    @pytest.mark.asyncio
+    async def test_dry_run_classifies_without_storing(self):
+        """Dry run flows through the pipeline but never writes."""
+        from src.classification_pipeline import _process_streaming_batch
+
+        mock_client = MagicMock()
+        mock_client.get_conversation_async = AsyncMock(return_value={"id": "x"})
+        batch = [(self._make_parsed(f"conv_{i}"), {"id": f"conv_{i}"}) for i in range(5)]
+
+        with patch("src.classification_pipeline.classify_conversation_async") as mock_classify:
+            mock_classify.return_value = {
+                "conversation_id": "x",
+                "stage1_result": {"conversation_type": "general_inquiry"},
+                "stage2_result": {"changed_from_stage_1": True},
+            }
+            with patch("src.classification_pipeline.store_classification_results_batch") as mock_store:
+                result = await _process_streaming_batch(
+                    batch=batch,
+                    recovery_candidates=[],
+                    client=mock_client,
+                    session=MagicMock(),
+                    semaphore=asyncio.Semaphore(10),
+                    concurrency=3,
+                    dry_run=True,
+                    pipeline_run_id=None,
+                    queue_size=1,
+                )
+
+        mock_store.assert_not_called()
+        assert result["classified"] == 5
+        assert result["stage2_run"] == 5
+        assert result["classification_changed"] == 5
+        assert result["stored"] == 0
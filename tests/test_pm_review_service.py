@@ -5,9 +5,10 @@ Tests for PMReviewService - Theme group coherence evaluation.
 Run with: pytest tests/test_pm_review_service.py -v
 """
 
+import asyncio
 import json
 import pytest
-from unittest.mock import Mock, MagicMock, patch
+from unittest.mock import AsyncMock, Mock, MagicMock, patch
 from datetime import datetime
 
 import sys
@@ -428,6 +429,194 @@ class TestReviewGroupsBatch:
         assert "error" in results["sig_2"].reasoning.lower()
 
 
+class TestReviewGroupsBatchAsync:
+    """Test review_groups_batch_async method."""
+
+    @staticmethod
+    def _response(payload):
+        response = Mock()
+        response.choices = [Mock(message=Mock(content=json.dumps(payload)))]
+        return response
+
+    @pytest.mark.asyncio
+    async def test_reviews_groups_concurrently(self, pm_review_service, sample_conversations):
+        """Test that requests overlap up to the concurrency limit."""
+        in_flight = 0
+        max_in_flight = 0
+
+        async def create(**kwargs):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return self._response({"decision": "keep_together", "reasoning": "Same issue"})
+
+        pm_review_service._async_client = Mock()
+        pm_review_service._async_client.chat.completions.create = AsyncMock(side_effect=create)
+
+        groups = {f"sig_{i}": sample_conversations for i in range(6)}
+        results = await pm_review_service.review_groups_batch_async(groups, concurrency=3)
+
+        assert list(results) == list(groups)
+        assert all(r.decision == ReviewDecision.KEEP_TOGETHER for r in results.values())
+        assert all(r.review_duration_ms >= 10 for r in results.values())
+        assert max_in_flight == 3
+
+    @pytest.mark.asyncio
+    async def test_retry_budget_shared_across_batch(self, pm_review_service, sample_conversations):
+        """Test that failures retry until the batch budget runs out, then default."""
+        pm_review_service._async_client = Mock()
+        pm_review_service._async_client.chat.completions.create = AsyncMock(
+            side_effect=Exception("API timeout")
+        )
+
+        groups = {"sig_1": sample_conversations, "sig_2": sample_conversations}
+        with patch("story_tracking.services.pm_review_service.asyncio.sleep", new=AsyncMock()):
+            results = await pm_review_service.review_groups_batch_async(groups, retry_budget=3)
+
+        # One attempt per group plus the 3 shared retries
+        assert pm_review_service._async_client.chat.completions.create.call_count == 5
+        for result in results.values():
+            assert result.decision == ReviewDecision.KEEP_TOGETHER
+            assert "error" in result.reasoning.lower()
+
+    @pytest.mark.asyncio
+    async def test_coalesces_small_groups(self, pm_review_service, sample_conversations):
+        """Test that small groups share one request and are unpacked per group."""
+        pm_review_service._async_client = Mock()
+        pm_review_service._async_client.chat.completions.create = AsyncMock(
+            return_value=self._response({
+                "groups": [
+                    {"signature": "sig_a", "decision": "keep_together", "reasoning": "Same"},
+                    {
+                        "signature": "sig_b",
+                        "decision": "split",
+                        "reasoning": "Different",
+                        "sub_groups": [
+                            {
+                                "suggested_signature": "sig_b_one",
+                                "conversation_ids": ["conv_1", "conv_2"],
+                                "rationale": "Duplicates",
+                            }
+                        ],
+                        "orphans": [{"conversation_id": "conv_3", "reason": "Other"}],
+                    },
+                ]
+            })
+        )
+
+        groups = {"sig_a": sample_conversations, "sig_b": sample_conversations}
+        results = await pm_review_service.review_groups_batch_async(
+            groups, coalesce_max_conversations=3
+        )
+
+        assert pm_review_service._async_client.chat.completions.create.call_count == 1
+        prompt = pm_review_service._async_client.chat.completions.create.call_args.kwargs["messages"][1]["content"]
+        assert "sig_a" in prompt and "sig_b" in prompt
+        assert results["sig_a"].decision == ReviewDecision.KEEP_TOGETHER
+        assert results["sig_b"].decision == ReviewDecision.SPLIT
+        assert results["sig_b"].sub_groups[0].suggested_signature == "sig_b_one"
+        assert results["sig_a"].model_used == "gpt-4o-mini"
+
+    @pytest.mark.asyncio
+    async def test_coalesced_missing_group_reviewed_individually(
+        self, pm_review_service, sample_conversations
+    ):
+        """Test that groups absent from a packed response get their own request."""
+        pm_review_service._async_client = Mock()
+        pm_review_service._async_client.chat.completions.create = AsyncMock(
+            side_effect=[
+                self._response({
+                    "groups": [{"signature": "sig_a", "decision": "keep_together", "reasoning": "Same"}]
+                }),
+                self._response({"decision": "keep_together", "reasoning": "Individually reviewed"}),
+            ]
+        )
+
+        groups = {"sig_a": sample_conversations, "sig_b": sample_conversations}
+        results = await pm_review_service.review_groups_batch_async(
+            groups, coalesce_max_conversations=3
+        )
+
+        assert pm_review_service._async_client.chat.completions.create.call_count == 2
+        assert results["sig_b"].reasoning == "Individually reviewed"
+        assert "**Signature**: sig_b" in (
+            pm_review_service._async_client.chat.completions.create.call_args.kwargs["messages"][1]["content"]
+        )
+
+    @pytest.mark.asyncio
+    async def test_coalesced_malformed_entry_reviewed_individually(
+        self, pm_review_service, sample_conversations
+    ):
+        """Test that one malformed packed entry does not fail the batch."""
+        pm_review_service._async_client = Mock()
+        pm_review_service._async_client.chat.completions.create = AsyncMock(
+            side_effect=[
+                self._response({
+                    "groups": [
+                        {"signature": "sig_a", "decision": "keep_together", "reasoning": "Same"},
+                        {"signature": "sig_b", "decision": None},
+                    ]
+                }),
+                self._response({"decision": "keep_together", "reasoning": "Individually reviewed"}),
+            ]
+        )
+
+        groups = {"sig_a": sample_conversations, "sig_b": sample_conversations}
+        results = await pm_review_service.review_groups_batch_async(
+            groups, coalesce_max_conversations=3
+        )
+
+        assert pm_review_service._async_client.chat.completions.create.call_count == 2
+        assert results["sig_a"].reasoning == "Same"
+        assert results["sig_b"].reasoning == "Individually reviewed"
+
+    @pytest.mark.asyncio
+    async def test_retry_backoff_releases_concurrency_slot(self, pm_review_service, sample_conversations):
+        """Test that a request backing off does not block other groups."""
+        calls = []
+
+        async def create(**kwargs):
+            signature = "sig_fail" if "sig_fail" in kwargs["messages"][1]["content"] else "sig_ok"
+            calls.append(signature)
+            if signature == "sig_fail" and calls.count("sig_fail") == 1:
+                raise Exception("API timeout")
+            return self._response({"decision": "keep_together", "reasoning": signature})
+
+        real_sleep = asyncio.sleep
+
+        async def backoff(delay):
+            # Yield long enough for sig_ok to run if the slot was released
+            for _ in range(10):
+                await real_sleep(0)
+
+        pm_review_service._async_client = Mock()
+        pm_review_service._async_client.chat.completions.create = AsyncMock(side_effect=create)
+
+        groups = {"sig_fail": sample_conversations, "sig_ok": sample_conversations}
+        with patch("story_tracking.services.pm_review_service.asyncio.sleep", new=backoff):
+            results = await pm_review_service.review_groups_batch_async(
+                groups, concurrency=1, retry_budget=1
+            )
+
+        assert calls == ["sig_fail", "sig_ok", "sig_fail"]
+        assert results["sig_fail"].reasoning == "sig_fail"
+
+    @pytest.mark.asyncio
+    async def test_single_conversation_groups_skip_llm(self, pm_review_service, sample_conversations):
+        """Test that single-conversation groups never reach the client."""
+        pm_review_service._async_client = Mock()
+        pm_review_service._async_client.chat.completions.create = AsyncMock()
+
+        results = await pm_review_service.review_groups_batch_async(
+            {"sig_1": sample_conversations[:1]}, coalesce_max_conversations=3
+        )
+
+        pm_review_service._async_client.chat.completions.create.assert_not_called()
+        assert results["sig_1"].review_duration_ms == 0
+
+
 class TestFormatConversations:
     """Test _format_conversations helper method."""
 
@@ -301,6 +301,184 @@ class TestUnifiedSearchService:
         assert "conv_456" in url
 
 
+class TestUnifiedSearchQueryBatching:
+    """Query embedding cache and batched multi-query search."""
+
+    @pytest.fixture
+    def service(self):
+        from research.unified_search import UnifiedSearchService
+
+        with patch("research.unified_search.OpenAI"):
+            service = UnifiedSearchService()
+
+        def create(model, input, dimensions):
+            response = Mock()
+            response.data = [
+                Mock(index=i, embedding=[float(len(text))] * 3) for i, text in enumerate(input)
+            ]
+            return response
+
+        service._client.embeddings.create.side_effect = create
+        return service
+
+    @pytest.fixture
+    def mock_cursor(self):
+        cursor = MagicMock()
+        conn = MagicMock()
+        conn.cursor.return_value.__enter__.return_value = cursor
+        with patch("src.db.connection.get_connection") as mock_get_connection:
+            mock_get_connection.return_value.__enter__.return_value = conn
+            yield cursor
+
+    def test_query_embedding_cached_by_normalized_text(self, service):
+        """Whitespace variants of a query share one embedding request."""
+        first = service.get_embedding("pins not  posting")
+        second = service.get_embedding("  pins not posting\n")
+
+        assert first == second
+        assert service._client.embeddings.create.call_count == 1
+        assert service.query_cache_stats() == {"hits": 1, "misses": 1, "size": 1}
+
+    def test_query_cache_is_bounded_and_expires(self, service):
+        service._query_cache_max_entries = 2
+        for text in ["a", "b", "c"]:
+            service.get_embedding(text)
+        assert [key[2] for key in service._query_cache] == ["b", "c"]
+
+        with patch("research.unified_search.time.monotonic", return_value=1e9):
+            service.get_embedding("c")
+        assert service._client.embeddings.create.call_count == 4
+
+    def test_get_embeddings_batches_misses(self, service):
+        service.get_embedding("cached")
+        vectors = service.get_embeddings(["cached", "new one", "new one", "other"])
+
+        assert vectors == [[6.0] * 3, [7.0] * 3, [7.0] * 3, [5.0] * 3]
+        assert service._client.embeddings.create.call_count == 2
+        assert service._client.embeddings.create.call_args.kwargs["input"] == ["new one", "other"]
+
+    def test_search_many_uses_one_embedding_call_and_one_query(self, service, mock_cursor):
+        mock_cursor.fetchall.return_value = [
+            (1, 10, "coda_page", "page_1", "Scheduler", "Scheduler research", 0.91, {}),
+            (1, 11, "coda_theme", "theme_2", "Queue", "Queue research", 0.72, None),
+            (3, 12, "coda_page", "page_3", None, "Billing research", 0.66, {}),
+        ]
+
+        results = service.search_many(
+            ["scheduler stuck", "unrelated", "billing"],
+            limit=2,
+            source_types=["coda_page", "coda_theme"],
+        )
+
+        assert service._client.embeddings.create.call_count == 1
+        assert mock_cursor.execute.call_count == 1
+        sql, params = mock_cursor.execute.call_args.args
+        assert "CROSS JOIN LATERAL" in sql
+        assert params[0] == ["[15.0,15.0,15.0]", "[9.0,9.0,9.0]", "[7.0,7.0,7.0]"]
+        assert params[2:] == ["coda_page", "coda_theme", 2]
+
+        assert [[r.id for r in group] for group in results] == [[10, 11], [], [12]]
+        assert results[2][0].title == "Untitled"
+
+    def test_search_many_degrades_to_empty_lists(self, service):
+        service._client.embeddings.create.side_effect = Exception("rate limited")
+
+        assert service.search_many(["a", "b"]) == [[], []]
+
+
+class TestHybridSearch:
+    """Lexical + vector retrieval fused with reciprocal-rank fusion."""
+
+    @staticmethod
+    def _result(id, similarity):
+        return UnifiedSearchResult(
+            id=id, source_type="coda_page", source_id=f"page_{id}", title=f"Page {id}",
+            snippet="", similarity=similarity, url="",
+        )
+
+    @staticmethod
+    def _row(id, similarity):
+        return (id, "coda_page", f"page_{id}", f"Page {id}", "content", similarity, {})
+
+    @pytest.fixture
+    def service(self):
+        from research.unified_search import UnifiedSearchService
+
+        with patch("research.unified_search.OpenAI"):
+            service = UnifiedSearchService()
+        service._client.embeddings.create.return_value = Mock(data=[Mock(index=0, embedding=[0.1] * 3)])
+        return service
+
+    def test_reciprocal_rank_fusion(self):
+        from research.unified_search import reciprocal_rank_fusion
+
+        lexical = [self._result(1, 0.2), self._result(2, 0.6)]
+        vector = [self._result(3, 0.9), self._result(2, 0.6), self._result(4, 0.5)]
+
+        fused = reciprocal_rank_fusion([lexical, vector], k=60)
+
+        # 2 is in both lists; 1 and 3 tie on score, 3 has higher similarity
+        assert [r.id for r in fused] == [2, 3, 1, 4]
+
+    def test_hybrid_mode_fuses_lexical_and_vector_candidates(self, service):
+        cursors = {}
+
+        def make_connection():
+            cursor = MagicMock()
+
+            def execute(sql, params):
+                kind = "lexical" if "websearch_to_tsquery" in sql else "vector"
+                cursors[kind] = (sql, params)
+                cursor.fetchall.return_value = (
+                    [self._row(7, 0.05), self._row(8, 0.62)] if kind == "lexical"
+                    else [self._row(8, 0.62), self._row(9, 0.55), self._row(10, 0.2)]
+                )
+
+            cursor.execute.side_effect = execute
+            conn = MagicMock()
+            conn.cursor.return_value.__enter__.return_value = cursor
+            context = MagicMock()
+            context.__enter__.return_value = conn
+            return context
+
+        with patch("src.db.connection.get_connection", side_effect=lambda: make_connection()):
+            results = service.search(
+                "Error 403", limit=5, source_types=["coda_page"], min_similarity=0.5, mode="hybrid"
+            )
+
+        # Exact-term hit 7 survives despite low similarity; vector-only 10 is below the floor
+        assert [r.id for r in results] == [8, 7, 9]
+        lexical_sql, lexical_params = cursors["lexical"]
+        assert lexical_params[1:] == ["Error 403", "coda_page", 50]
+        assert cursors["vector"][1][-1] == 50
+
+    def test_invalid_mode_rejected(self, service):
+        with pytest.raises(ValueError):
+            service.search("pins", mode="keyword")
+
+    def test_search_endpoint_passes_mode(self):
+        from src.api.routers.research import get_search_service
+
+        from src.research.models import UnifiedSearchResult as RouterSearchResult
+
+        mock_service = Mock()
+        mock_service.search.return_value = [
+            RouterSearchResult(**self._result(1, 0.8).model_dump())
+        ]
+        app.dependency_overrides[get_search_service] = lambda: mock_service
+        try:
+            client = TestClient(app)
+            response = client.get("/api/research/search", params={"q": "SmartLoop", "mode": "hybrid"})
+            invalid = client.get("/api/research/search", params={"q": "SmartLoop", "mode": "bm25"})
+        finally:
+            app.dependency_overrides.clear()
+
+        assert response.status_code == 200
+        assert response.json()["mode"] == "hybrid"
+        assert mock_service.search.call_args.kwargs["mode"] == "hybrid"
+        assert invalid.status_code == 422
+
+
 # -----------------------------------------------------------------------------
 # EmbeddingPipeline Tests
 # -----------------------------------------------------------------------------
@@ -345,6 +523,105 @@ class TestEmbeddingPipeline:
                 assert len(pipeline._adapters) == 3
 
 
+class TestStreamingReindex:
+    """Concurrent adapters and overlapped embed/upsert in EmbeddingPipeline.run()."""
+
+    @staticmethod
+    def _adapter(source_type, count, before_extract=None):
+        adapter = Mock(spec=SearchSourceAdapter)
+        adapter.get_source_type.return_value = source_type
+
+        def extract_all(limit=None):
+            if before_extract:
+                before_extract()
+            for i in range(count):
+                yield SearchableContent(
+                    source_type=source_type,
+                    source_id=f"{source_type}_{i}",
+                    title=f"Item {i}",
+                    content=f"{source_type} content {i}",
+                    url="https://example.com",
+                )
+
+        adapter.extract_all.side_effect = extract_all
+        return adapter
+
+    @pytest.fixture
+    def pipeline(self):
+        from research.embedding_pipeline import EmbeddingPipeline
+
+        with patch("research.embedding_pipeline.OpenAI"):
+            pipeline = EmbeddingPipeline(batch_size=2, embedding_concurrency=2)
+        pipeline._client.embeddings.create.side_effect = lambda model, input, dimensions: Mock(
+            data=[Mock(embedding=[0.1] * 3) for _ in input]
+        )
+        pipeline._filter_unchanged = Mock(side_effect=lambda conn, items: items)
+        with patch("src.db.connection.get_connection"):
+            yield pipeline
+
+    def test_adapters_read_concurrently(self, pipeline):
+        import threading
+
+        # Each extraction waits for the other to start (fails if sequential)
+        barrier = threading.Barrier(2, timeout=5)
+        pipeline.register_adapter(self._adapter("coda_page", 3, barrier.wait))
+        pipeline.register_adapter(self._adapter("coda_theme", 2, barrier.wait))
+        pipeline._upsert_embeddings = Mock()
+
+        result = pipeline.run()
+
+        assert result.status == "completed"
+        assert result.source_types == ["coda_page", "coda_theme"]
+        assert (result.items_processed, result.items_updated, result.items_failed) == (5, 5, 0)
+
+    def test_next_batch_embeds_while_previous_upserts(self, pipeline):
+        import threading
+
+        upsert_started = threading.Event()
+        overlapped = []
+        embed = pipeline._client.embeddings.create.side_effect
+
+        def create(model, input, dimensions):
+            if pipeline._client.embeddings.create.call_count == 2:
+                overlapped.append(upsert_started.wait(timeout=5))
+            return embed(model, input, dimensions)
+
+        pipeline._client.embeddings.create.side_effect = create
+        pipeline._upsert_embeddings = Mock(side_effect=lambda conn, rows: upsert_started.set())
+        pipeline.register_adapter(self._adapter("coda_page", 4))
+
+        result = pipeline.run()
+
+        assert overlapped == [True]
+        assert pipeline._upsert_embeddings.call_count == 2
+        assert result.items_updated == 4
+
+    def test_unchanged_items_skipped_and_each_batch_stored(self, pipeline):
+        done = {"coda_page_0", "coda_page_1", "coda_page_3"}
+        pipeline._filter_unchanged.side_effect = lambda conn, items: [
+            (item, h) for item, h in items if item.source_id not in done
+        ]
+        pipeline._upsert_embeddings = Mock()
+        pipeline.register_adapter(self._adapter("coda_page", 5))
+
+        result = pipeline.run()
+
+        stored = [
+            [row[1] for row in call.args[1]]
+            for call in pipeline._upsert_embeddings.call_args_list
+        ]
+        assert stored == [["coda_page_2"], ["coda_page_4"]]
+        assert (result.items_processed, result.items_updated) == (5, 2)
+
+    def test_failed_upsert_counts_batch_as_failed(self, pipeline):
+        pipeline._upsert_embeddings = Mock(side_effect=[Exception("deadlock"), None])
+        pipeline.register_adapter(self._adapter("coda_page", 4))
+
+        result = pipeline.run()
+
+        assert (result.items_updated, result.items_failed) == (2, 2)
+
+
 # -----------------------------------------------------------------------------
 # Integration Tests (with mocked DB)
 # -----------------------------------------------------------------------------
@@ -121,12 +121,13 @@ class TestThemeExtractionQueryUsesExplicitRunId:
         # Check that we have the NULL fallback pattern
         import re
 
-        # Find the _run_theme_extraction_async function (Issue #148 moved SQL here)
+        # Find the theme candidate query (shared by the theme phase and the overlapped stage DAG)
         theme_func_match = re.search(
-            r'async def _run_theme_extraction_async\([^)]+\)[^:]*:.*?(?=\nasync def |\ndef |\Z)',
+            r'def _fetch_theme_candidate_rows\(.*?(?=\nasync def |\ndef |\Z)',
             content,
             re.DOTALL
         )
+        assert theme_func_match, "Theme candidate query function not found"
         if theme_func_match:
             theme_func_content = theme_func_match.group(0)
             # Should have explicit run_id check
@@ -0,0 +1,171 @@
+"""
+Signature Catalog Tests
+
+Tests for the run-scoped theme_aggregates signature cache used by
+ThemeExtractor.get_existing_signatures and pipeline is_new detection.
+Run with: pytest tests/test_signature_catalog.py -v
+"""
+
+from contextlib import contextmanager
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.signature_catalog import SignatureCatalog
+from src.theme_extractor import ThemeExtractor
+
+
+class FakeAggregates:
+    """Fake theme_aggregates table behind get_connection()."""
+
+    def __init__(self, rows):
+        self.rows = rows  # (signature, product_area, component, count)
+        self.full_loads = 0
+        self.fingerprint_queries = 0
+        self.fail = False
+
+    def fingerprint(self):
+        return (len(self.rows), sum(r[3] for r in self.rows), len(self.rows), None)
+
+    @contextmanager
+    def get_connection(self):
+        if self.fail:
+            raise RuntimeError("db down")
+        cur = MagicMock()
+        state = {}
+
+        def execute(sql, params=None):
+            if "COUNT(*)" in sql:
+                self.fingerprint_queries += 1
+                state["result"] = [self.fingerprint()]
+            else:
+                self.full_loads += 1
+                state["result"] = sorted(self.rows, key=lambda r: -r[3])
+
+        cur.execute.side_effect = execute
+        cur.fetchone.side_effect = lambda: state["result"][0]
+        cur.fetchall.side_effect = lambda: state["result"]
+        conn = MagicMock()
+        conn.cursor.return_value.__enter__.return_value = cur
+        yield conn
+
+
+@pytest.fixture
+def table():
+    table = FakeAggregates([
+        ("pins_not_posting", "scheduling", "pins", 10),
+        ("billing_refund", "billing", "payments", 5),
+        ("smartloop_paused", "scheduling", "smartloop", 3),
+    ])
+    with patch("src.db.connection.get_connection", table.get_connection):
+        yield table
+
+
+class TestSignatureCatalog:
+    """Tests for loading, ordering, and invalidation."""
+
+    def test_loads_once_within_revalidate_interval(self, table):
+        catalog = SignatureCatalog(revalidate_seconds=60)
+
+        for _ in range(5):
+            assert catalog.contains("billing_refund")
+            catalog.signatures("billing")
+
+        assert table.full_loads == 1
+        assert table.fingerprint_queries == 1
+
+    def test_area_ordering_matches_query(self, table):
+        catalog = SignatureCatalog()
+
+        ordered = [s["signature"] for s in catalog.signatures("scheduling")]
+        unordered = [s["signature"] for s in catalog.signatures()]
+
+        assert ordered == ["pins_not_posting", "smartloop_paused", "billing_refund"]
+        assert unordered == ["pins_not_posting", "billing_refund", "smartloop_paused"]
+
+    def test_unchanged_fingerprint_skips_reload(self, table):
+        catalog = SignatureCatalog(revalidate_seconds=0)
+
+        catalog.contains("x")
+        catalog.contains("x")
+
+        assert table.fingerprint_queries == 2
+        assert table.full_loads == 1
+
+    def test_reloads_when_aggregates_change(self, table):
+        catalog = SignatureCatalog(revalidate_seconds=0)
+        assert not catalog.contains("new_sig")
+
+        table.rows.append(("new_sig", "billing", "payments", 1))
+
+        assert catalog.contains("new_sig")
+        assert table.full_loads == 2
+
+    def test_invalidate_forces_reload(self, table):
+        catalog = SignatureCatalog(revalidate_seconds=60)
+        catalog.contains("x")
+
+        catalog.invalidate()
+        catalog.contains("x")
+
+        assert table.full_loads == 2
+
+    def test_revalidation_failure_serves_cached_snapshot(self, table):
+        catalog = SignatureCatalog(revalidate_seconds=0)
+        catalog.contains("x")
+        table.fail = True
+
+        assert catalog.contains("billing_refund")
+
+    def test_initial_load_failure_raises(self, table):
+        table.fail = True
+        catalog = SignatureCatalog()
+
+        with pytest.raises(RuntimeError):
+            catalog.contains("x")
+
+
+class TestThemeExtractorCatalog:
+    """ThemeExtractor lookups go through the cached catalog."""
+
+    @pytest.fixture
+    def extractor(self, table):
+        with patch("src.theme_extractor.OpenAI"):
+            extractor = ThemeExtractor(use_vocabulary=False)
+        extractor.clear_session_signatures()
+        return extractor
+
+    def test_existing_signatures_no_requery(self, extractor, table):
+        for _ in range(10):
+            extractor.get_existing_signatures("scheduling")
+
+        assert table.full_loads == 1
+
+    def test_session_signatures_first_and_deduplicated(self, extractor):
+        extractor.add_session_signature("billing_refund", "scheduling", "pins")
+
+        sigs = extractor.get_existing_signatures("scheduling")
+
+        assert sigs[0]["signature"] == "billing_refund"
+        assert [s["signature"] for s in sigs].count("billing_refund") == 1
+
+    def test_has_signature_matches_list_membership(self, extractor):
+        extractor.add_session_signature("session_only", "scheduling", "pins")
+        extractor.add_session_signature("billing_refund", "scheduling", "pins")
+
+        for signature in ["session_only", "billing_refund", "pins_not_posting", "unknown_sig"]:
+            for area in ["scheduling", "billing", None]:
+                expected = any(
+                    s["signature"] == signature
+                    for s in extractor.get_existing_signatures(area)
+                )
+                assert extractor.has_signature(signature, area) == expected, (signature, area)
+
+    def test_db_failure_degrades_gracefully(self, extractor, table):
+        table.fail = True
+        extractor.add_session_signature("session_only", "scheduling", "pins")
+
+        sigs = extractor.get_existing_signatures("scheduling")
+
+        assert [s["signature"] for s in sigs] == ["session_only"]
+        assert extractor.has_signature("pins_not_posting", "scheduling") is False
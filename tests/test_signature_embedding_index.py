@@ -0,0 +1,181 @@
+"""
+Signature Embedding Index Tests
+
+Tests for vector-indexed signature canonicalization: existing signatures are
+embedded once (batched), persisted, and matched with a single vectorized lookup.
+Run with: pytest tests/test_signature_embedding_index.py -v
+"""
+
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from signature_embedding_index import (
+    SignatureEmbeddingIndex,
+    describe_signature,
+    description_hash,
+)
+
+
+def sig(name, area="scheduling", component="pins"):
+    return {"signature": name, "product_area": area, "component": component, "count": 1}
+
+
+class FakeEmbedder:
+    """Deterministic embeddings keyed by text; counts API calls."""
+
+    def __init__(self, vectors):
+        self.vectors = vectors
+        self.calls = []
+
+    def __call__(self, texts):
+        self.calls.append(list(texts))
+        return [self.vectors[t] for t in texts]
+
+
+@pytest.fixture
+def signatures():
+    return [sig("pins_not_posting"), sig("billing_refund", "billing", "payments")]
+
+
+@pytest.fixture
+def embedder(signatures):
+    return FakeEmbedder({
+        describe_signature(signatures[0]): [1.0, 0.0, 0.0],
+        describe_signature(signatures[1]): [0.0, 1.0, 0.0],
+    })
+
+
+class TestEnsure:
+    """Tests for loading and embedding unseen signature descriptions."""
+
+    def test_embeds_all_missing_in_one_call(self, signatures, embedder):
+        index = SignatureEmbeddingIndex(embed_batch=embedder, persist=False)
+
+        index.ensure(signatures)
+
+        assert len(embedder.calls) == 1
+        assert len(embedder.calls[0]) == 2
+        assert len(index) == 2
+
+    def test_second_ensure_makes_no_calls(self, signatures, embedder):
+        index = SignatureEmbeddingIndex(embed_batch=embedder, persist=False)
+
+        index.ensure(signatures)
+        index.ensure(signatures)
+
+        assert len(embedder.calls) == 1
+
+    def test_changed_component_reembeds(self, signatures, embedder):
+        index = SignatureEmbeddingIndex(embed_batch=embedder, persist=False)
+        index.ensure(signatures)
+
+        moved = sig("pins_not_posting", component="boards")
+        embedder.vectors[describe_signature(moved)] = [0.0, 0.0, 1.0]
+        index.ensure([moved])
+
+        assert embedder.calls[-1] == [describe_signature(moved)]
+
+    def test_loads_from_storage_before_embedding(self, signatures, embedder):
+        stored = {description_hash(describe_signature(signatures[0])): [1.0, 0.0, 0.0]}
+
+        with patch(
+            "db.signature_embedding_storage.load_signature_embeddings",
+            return_value=stored,
+        ), patch("db.signature_embedding_storage.store_signature_embeddings") as mock_store:
+            index = SignatureEmbeddingIndex(embed_batch=embedder)
+            index.ensure(signatures)
+
+        assert embedder.calls == [[describe_signature(signatures[1])]]
+        rows = mock_store.call_args[0][0]
+        assert [r[1] for r in rows] == ["billing_refund"]
+        assert index.loaded == 1
+        assert index.embedded == 1
+
+    def test_storage_failure_degrades_to_memory(self, signatures, embedder):
+        with patch(
+            "db.signature_embedding_storage.load_signature_embeddings",
+            side_effect=Exception("no table"),
+        ), patch(
+            "db.signature_embedding_storage.store_signature_embeddings",
+            side_effect=Exception("no table"),
+        ):
+            index = SignatureEmbeddingIndex(embed_batch=embedder)
+            index.ensure(signatures)
+
+        assert len(index) == 2
+
+
+class TestNearest:
+    """Tests for vectorized nearest-neighbour lookup."""
+
+    def test_returns_best_match(self, signatures, embedder):
+        index = SignatureEmbeddingIndex(embed_batch=embedder, persist=False)
+        index.ensure(signatures)
+
+        best, similarity = index.nearest([0.1, 0.9, 0.0], signatures)
+
+        assert best == "billing_refund"
+        assert similarity == pytest.approx(0.9 / (0.82 ** 0.5), rel=1e-5)
+
+    def test_restricted_to_candidates(self, signatures, embedder):
+        index = SignatureEmbeddingIndex(embed_batch=embedder, persist=False)
+        index.ensure(signatures)
+
+        best, _ = index.nearest([0.0, 1.0, 0.0], signatures[:1])
+
+        assert best == "pins_not_posting"
+
+    def test_no_candidates(self, embedder):
+        index = SignatureEmbeddingIndex(embed_batch=embedder, persist=False)
+
+        assert index.nearest([1.0, 0.0, 0.0], []) == (None, 0.0)
+
+    def test_matrix_grows_beyond_initial_capacity(self):
+        many = [sig(f"sig_{i}") for i in range(100)]
+        vectors = {describe_signature(s): [float(i + 1), 1.0] for i, s in enumerate(many)}
+        index = SignatureEmbeddingIndex(embed_batch=FakeEmbedder(vectors), persist=False)
+
+        index.ensure(many[:10])
+        index.ensure(many)
+
+        assert len(index) == 100
+        best, _ = index.nearest([100.0, 1.0], many)
+        assert best == "sig_99"
+
+
+class TestThemeExtractorIntegration:
+    """canonicalize_via_embedding embeds only the new signature per call."""
+
+    def test_only_new_signature_embedded_on_repeat_calls(self, signatures, embedder):
+        from theme_extractor import ThemeExtractor
+
+        with patch("theme_extractor.OpenAI"):
+            extractor = ThemeExtractor(use_vocabulary=False)
+        extractor._signature_index = SignatureEmbeddingIndex(embed_batch=embedder, persist=False)
+        extractor.get_existing_signatures = MagicMock(return_value=signatures)
+        extractor.get_embedding = MagicMock(return_value=[0.99, 0.05, 0.0])
+
+        first = extractor.canonicalize_via_embedding("pins_broken", "post pins", ["fails"])
+        second = extractor.canonicalize_via_embedding("pins_broken_again", "post pins", ["fails"])
+
+        assert first == second == "pins_not_posting"
+        assert len(embedder.calls) == 1
+        assert extractor.get_embedding.call_count == 2
+
+    def test_below_threshold_returns_normalized_proposal(self, signatures, embedder):
+        from theme_extractor import ThemeExtractor
+
+        with patch("theme_extractor.OpenAI"):
+            extractor = ThemeExtractor(use_vocabulary=False)
+        extractor._signature_index = SignatureEmbeddingIndex(embed_batch=embedder, persist=False)
+        extractor.get_existing_signatures = MagicMock(return_value=signatures)
+        extractor.get_embedding = MagicMock(return_value=[0.0, 0.0, 1.0])
+
+        result = extractor.canonicalize_via_embedding("New Thing-Here", "x", [])
+
+        assert result == "new_thing_here"
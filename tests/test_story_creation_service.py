@@ -1526,6 +1526,111 @@ class TestProcessThemeGroups:
         assert len(result.errors) == 0
 
 
+class TestConcurrentStoryCreation:
+    """process_theme_groups with max_concurrency > 1 matches the sequential path."""
+
+    @staticmethod
+    def _theme_groups():
+        recent_time = datetime.now(timezone.utc) - timedelta(days=5)
+        groups = {}
+        for g in range(6):
+            # Every third group is a single conversation -> orphan
+            size = 1 if g % 3 == 0 else 3
+            groups[f"group_{g}"] = [
+                {
+                    "id": f"g{g}_c{c}",
+                    "product_area": "Scheduler",
+                    "component": "Pins",
+                    "user_intent": f"Intent for group {g}",
+                    "symptoms": ["error"],
+                    "excerpt": f"Excerpt {g}-{c}",
+                    "created_at": recent_time,
+                }
+                for c in range(size)
+            ]
+        return groups
+
+    @staticmethod
+    def _build_service(mock_story_service, mock_orphan_service, max_concurrency):
+        import threading
+        import time
+
+        mock_story_service.db = MagicMock()
+        created = []
+
+        def create_story(story_create):
+            created.append(story_create.title)
+            return Mock(id=uuid4())
+
+        mock_story_service.create.side_effect = create_story
+
+        active = {"now": 0, "max": 0}
+        lock = threading.Lock()
+
+        def score_groups(groups, verbose=False):
+            signature = next(iter(groups))
+            with lock:
+                active["now"] += 1
+                active["max"] = max(active["max"], active["now"])
+            # Earlier groups are slower, so they finish scoring last
+            time.sleep(0.05 * (6 - int(signature.split("_")[1])))
+            with lock:
+                active["now"] -= 1
+            return [Mock(confidence_score=80.0, platform_uniformity=1.0, product_area_match=True)]
+
+        scorer = Mock()
+        scorer.score_groups.side_effect = score_groups
+
+        service = StoryCreationService(
+            mock_story_service,
+            mock_orphan_service,
+            confidence_scorer=scorer,
+            validation_enabled=False,
+            dual_format_enabled=False,
+            max_concurrency=max_concurrency,
+        )
+        service.content_generator = None
+        return service, created, active
+
+    def test_results_identical_to_sequential(self, mock_story_service, mock_orphan_service):
+        sequential, sequential_created, _ = self._build_service(
+            mock_story_service, mock_orphan_service, max_concurrency=1
+        )
+        expected = sequential.process_theme_groups(self._theme_groups())
+
+        story_service = Mock(spec=StoryService)
+        orphan_service = Mock(spec=OrphanService)
+        orphan_service.get_by_signature.return_value = None
+        orphan_service.create_or_get.return_value = mock_orphan_service.create_or_get.return_value
+        concurrent, concurrent_created, active = self._build_service(
+            story_service, orphan_service, max_concurrency=4
+        )
+        actual = concurrent.process_theme_groups(self._theme_groups())
+
+        assert active["max"] > 1
+        assert actual.stories_created == expected.stories_created == 4
+        assert actual.orphans_created == expected.orphans_created == 2
+        assert actual.pm_review_skipped == expected.pm_review_skipped
+        assert actual.errors == expected.errors == []
+        # DB writes still happen in input order despite out-of-order scoring
+        assert concurrent_created == sequential_created
+        orphan_signatures = [c.args[0].signature for c in orphan_service.create_or_get.call_args_list]
+        assert orphan_signatures == ["group_0", "group_3"]
+
+    def test_group_error_is_recorded_in_order(self, mock_story_service, mock_orphan_service):
+        service, _, _ = self._build_service(mock_story_service, mock_orphan_service, max_concurrency=3)
+        groups = self._theme_groups()
+        groups["group_2"][0]["id"] = ""  # Empty conversation ID raises for this group only
+
+        result = service.process_theme_groups(groups)
+
+        assert len(result.errors) == 1
+        assert "theme group 'group_2'" in result.errors[0]
+        assert result.stories_created == 3
+        # Services are restored after the concurrent run
+        assert service.story_service is mock_story_service
+
+
 class TestDictToConversationData:
     """Tests for _dict_to_conversation_data helper."""
 
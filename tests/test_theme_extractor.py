@@ -1415,6 +1415,144 @@ class TestResolutionFieldValidation:
             assert theme.resolution_category == category, f"Failed for category: {category}"
 
 
+# =============================================================================
+# Test: Prompt cache layout and usage tracking
+# =============================================================================
+
+class TestPromptCacheLayout:
+    """Extraction prompts share a static prefix; usage reports cached tokens."""
+
+    @patch.object(ThemeExtractor, "product_context", new_callable=lambda: property(lambda self: "Test context"))
+    @patch.object(ThemeExtractor, "get_research_context", return_value="")
+    @patch.object(ThemeExtractor, "get_existing_signatures", return_value=[])
+    @patch("theme_extractor.OpenAI")
+    def test_prompts_share_static_prefix(
+        self,
+        mock_openai_class,
+        mock_get_signatures,
+        mock_research,
+        mock_context,
+        sample_conversation,
+        mock_llm_response_minimal,
+    ):
+        """Everything conversation-specific comes after the static prefix."""
+        mock_client = MagicMock()
+        mock_openai_class.return_value = mock_client
+        mock_client.chat.completions.create.return_value.choices = [
+            MagicMock(message=MagicMock(content=json.dumps(mock_llm_response_minimal)))
+        ]
+        other_conversation = sample_conversation.model_copy(update={
+            "id": "test_conv_456",
+            "source_body": "My invoice never arrived.",
+            "issue_type": "billing",
+        })
+
+        extractor = ThemeExtractor(use_vocabulary=False)
+        extractor.extract(sample_conversation, canonicalize=False)
+        extractor.extract(other_conversation, canonicalize=False)
+
+        prefix = extractor.extraction_prompt_prefix()
+        prompts = [
+            call.kwargs["messages"][1]["content"]
+            for call in mock_client.chat.completions.create.call_args_list
+        ]
+        for prompt, body in zip(prompts, ["My pins are not posting", "My invoice never arrived"]):
+            assert prompt.startswith(prefix)
+            assert body not in prefix and body in prompt[len(prefix):]
+        assert prompts[0] != prompts[1]
+
+    @patch("theme_extractor.OpenAI")
+    def test_usage_stats_track_cached_tokens(self, mock_openai_class):
+        """Cached prompt tokens are summed per stage; missing usage still counts the call."""
+        extractor = ThemeExtractor(use_vocabulary=False)
+
+        response = MagicMock()
+        response.usage.prompt_tokens = 1200
+        response.usage.completion_tokens = 80
+        response.usage.prompt_tokens_details.cached_tokens = 1024
+        extractor._record_usage("theme_extraction", response)
+        extractor._record_usage("theme_extraction", response)
+        extractor._record_usage("canonicalization", Mock(spec=[]))
+
+        assert extractor.usage_stats() == {
+            "theme_extraction": {
+                "calls": 2, "prompt_tokens": 2400, "cached_tokens": 2048, "completion_tokens": 160,
+            },
+            "canonicalization": {
+                "calls": 1, "prompt_tokens": 0, "cached_tokens": 0, "completion_tokens": 0,
+            },
+        }
+
+
+class TestResearchContextPrefetch:
+    """prefetch_research_context() replaces per-conversation research searches."""
+
+    @patch.object(ThemeExtractor, "product_context", new_callable=lambda: property(lambda self: "Test context"))
+    @patch.object(ThemeExtractor, "get_existing_signatures", return_value=[])
+    @patch("theme_extractor.OpenAI")
+    def test_prefetched_context_skips_search(
+        self,
+        mock_openai_class,
+        mock_get_signatures,
+        mock_context,
+        sample_conversation,
+        sample_full_conversation,
+        mock_llm_response_minimal,
+    ):
+        mock_client = MagicMock()
+        mock_openai_class.return_value = mock_client
+        mock_client.chat.completions.create.return_value.choices = [
+            MagicMock(message=MagicMock(content=json.dumps(mock_llm_response_minimal)))
+        ]
+        search_service = MagicMock()
+        search_service.search_for_context_many.return_value = [
+            [MagicMock(title="Pinterest OAuth research", source_type="coda_page", snippet="Tokens expire")],
+            [],
+        ]
+        other_conversation = sample_conversation.model_copy(update={
+            "id": "test_conv_456",
+            "source_body": "My invoice never arrived.",
+        })
+
+        extractor = ThemeExtractor(use_vocabulary=False, search_service=search_service)
+        prefetched = extractor.prefetch_research_context(
+            [sample_conversation, other_conversation],
+            conversation_full_texts={sample_conversation.id: sample_full_conversation},
+        )
+        extractor.extract(
+            sample_conversation, full_conversation=sample_full_conversation, canonicalize=False
+        )
+        extractor.extract(other_conversation, canonicalize=False)
+
+        assert prefetched == 2
+        queries = search_service.search_for_context_many.call_args.kwargs["queries"]
+        assert queries == [sample_full_conversation.strip(), "My invoice never arrived."]
+        search_service.search_for_context.assert_not_called()
+        prompts = [
+            call.kwargs["messages"][1]["content"]
+            for call in mock_client.chat.completions.create.call_args_list
+        ]
+        assert "Pinterest OAuth research" in prompts[0]
+        assert "Related Research Insights" not in prompts[1]
+
+        # Prefetched entries are consumed; a repeat falls back to a live search
+        search_service.search_for_context.return_value = []
+        extractor.extract(other_conversation, canonicalize=False)
+        search_service.search_for_context.assert_called_once()
+
+    def test_clear_drops_unconsumed_entries(self, sample_conversation):
+        search_service = MagicMock()
+        search_service.search_for_context_many.return_value = [[]]
+
+        extractor = ThemeExtractor(use_vocabulary=False, search_service=search_service)
+        extractor.prefetch_research_context([sample_conversation])
+        assert len(extractor._prefetched_research) == 1
+
+        extractor.clear_prefetched_research()
+
+        assert extractor._prefetched_research == {}
+
+
 # =============================================================================
 # Run tests standalone
 # =============================================================================